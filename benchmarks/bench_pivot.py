@@ -0,0 +1,76 @@
+"""
+Benchmark del kernel de pivoteo del Simplex tabular.
+
+Compara el pivoteo fila por fila (implementación original) con el kernel
+vectorizado de numpy y, si está instalado, con el kernel de Numba.
+
+Uso:
+    python -m benchmarks.bench_pivot [--filas 2000] [--columnas 4000] [--pivoteos 20] [--densidad 1.0]
+"""
+import argparse
+import time
+
+import numpy as np
+
+from services.pivot_kernels import NUMBA_DISPONIBLE, TOL_PIVOTE, pivotear_numba, pivotear_numpy, razon_minima
+
+
+def _pivotear_por_filas(tableau: np.ndarray, fila: int, col: int) -> None:
+    """Pivoteo original: un bucle de Python sobre las filas."""
+    tableau[fila, :] = tableau[fila, :] / tableau[fila, col]
+    for i in range(tableau.shape[0]):
+        if i != fila:
+            factor = tableau[i, col]
+            tableau[i, :] = tableau[i, :] - factor * tableau[fila, :]
+
+
+def _razon_minima_por_filas(columna: np.ndarray, rhs: np.ndarray) -> int:
+    """Test de razón mínima original: un bucle de Python sobre las filas."""
+    ratios = np.full(columna.shape[0], np.inf)
+    for i in range(columna.shape[0]):
+        if columna[i] > TOL_PIVOTE:
+            ratios[i] = rhs[i] / columna[i]
+    return int(np.argmin(ratios))
+
+
+def _medir(nombre, tableau_base, pivotes, razon, pivoteo) -> float:
+    tableau = tableau_base.copy()
+    inicio = time.perf_counter()
+    for col in pivotes:
+        fila = razon(tableau[:-1, col], tableau[:-1, -1])
+        pivoteo(tableau, fila, col)
+    segundos = time.perf_counter() - inicio
+    print(f"{nombre:<22} {segundos:8.3f} s  ({1000 * segundos / len(pivotes):7.2f} ms/pivoteo)")
+    return segundos
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--filas", type=int, default=2000)
+    parser.add_argument("--columnas", type=int, default=4000)
+    parser.add_argument("--pivoteos", type=int, default=20)
+    parser.add_argument("--densidad", type=float, default=1.0, help="Fracción de coeficientes no nulos")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    tableau = rng.random((args.filas + 1, args.columnas + 1))
+    tableau[tableau > args.densidad] = 0.0
+    tableau += np.eye(args.filas + 1, args.columnas + 1)
+    pivotes = rng.choice(args.filas, size=args.pivoteos, replace=False)
+
+    print(f"Tableau {args.filas + 1}x{args.columnas + 1}, densidad {args.densidad:g}, {args.pivoteos} pivoteos")
+    base = _medir("bucle por filas", tableau, pivotes, _razon_minima_por_filas, _pivotear_por_filas)
+    vect = _medir("numpy vectorizado", tableau, pivotes, razon_minima, pivotear_numpy)
+    print(f"{'aceleración numpy':<22} {base / vect:8.1f}x")
+
+    if NUMBA_DISPONIBLE:
+        # Primera llamada para compilar fuera de la medición
+        pivotear_numba(tableau[:3, :3].copy(), 0, 0)
+        nb = _medir("numba", tableau, pivotes, razon_minima, pivotear_numba)
+        print(f"{'aceleración numba':<22} {base / nb:8.1f}x")
+    else:
+        print("numba no está instalado: se omite el kernel compilado")
+
+
+if __name__ == "__main__":
+    main()
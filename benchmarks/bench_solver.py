@@ -0,0 +1,148 @@
+"""
+Benchmark de los motores del solver sobre familias de problemas generados.
+
+Para cada familia, tamaño y método mide iteraciones, tiempo (el mínimo de
+`--repeticiones` corridas), memoria pico (con tracemalloc, en una corrida
+aparte) y pivoteos por segundo. Los resultados se pueden guardar como
+baseline JSON y comparar contra uno anterior para detectar regresiones.
+
+Uso:
+    python -m benchmarks.bench_solver [--familias densa transporte] [--tamanos chico mediano]
+                                      [--metodos tabular revised] [--repeticiones 3] [--semilla 0]
+                                      [--guardar baseline.json] [--comparar baseline.json]
+                                      [--tolerancia 0.25]
+
+Con `--comparar` el proceso termina con código 1 si algún caso cambió de
+status o de iteraciones, o si tardó más que (1 + tolerancia) veces el baseline.
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Any, Dict, List
+
+import numpy as np
+
+from benchmarks.lp_families import FAMILIAS, TAMANOS, generar
+from services.simplex_service import resolver_simplex_tabular
+
+METODOS = ("tabular", "revised", "dual", "barrier")
+# Diferencias de tiempo por debajo de este umbral (segundos) se consideran ruido
+RUIDO_SEGUNDOS = 0.005
+
+
+def medir_caso(familia: str, tamano: str, metodo: str, repeticiones: int, semilla: int) -> Dict[str, Any]:
+    """Resuelve un caso y retorna sus métricas."""
+    problema = generar(familia, tamano, semilla)
+    argumentos = problema.argumentos()
+    opciones = {"method": metodo, "history": "none", "max_iterations": 100_000}
+
+    tiempos = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        resultado = resolver_simplex_tabular(*argumentos, **opciones)
+        tiempos.append(time.perf_counter() - inicio)
+
+    tracemalloc.start()
+    resolver_simplex_tabular(*argumentos, **opciones)
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    segundos = min(tiempos)
+    return {
+        **problema.dimensiones,
+        "status": resultado["status"],
+        "esperado": problema.esperado,
+        "iteraciones": resultado["iteraciones"],
+        "segundos": segundos,
+        "memoria_pico_mb": pico / 2 ** 20,
+        "pivoteos_por_segundo": resultado["iteraciones"] / segundos if segundos > 0 else 0.0,
+    }
+
+
+def comparar(actual: Dict[str, Any], base: Dict[str, Any], tolerancia: float) -> List[str]:
+    """Retorna la descripción de cada regresión de `actual` respecto de `base`."""
+    regresiones = []
+    for clave, caso in actual.items():
+        previo = base.get(clave)
+        if previo is None:
+            continue
+        if caso["status"] != previo["status"]:
+            regresiones.append(f"{clave}: status {previo['status']} -> {caso['status']}")
+        elif caso["iteraciones"] != previo["iteraciones"]:
+            regresiones.append(f"{clave}: iteraciones {previo['iteraciones']} -> {caso['iteraciones']}")
+        if (caso["segundos"] > (1 + tolerancia) * previo["segundos"]
+                and caso["segundos"] - previo["segundos"] > RUIDO_SEGUNDOS):
+            regresiones.append(
+                f"{clave}: tiempo {previo['segundos'] * 1000:.1f} ms -> {caso['segundos'] * 1000:.1f} ms "
+                f"({caso['segundos'] / previo['segundos']:.2f}x)"
+            )
+    return regresiones
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--familias", nargs="+", choices=list(FAMILIAS), default=list(FAMILIAS))
+    parser.add_argument("--tamanos", nargs="+", choices=list(TAMANOS), default=["chico", "mediano"])
+    parser.add_argument("--metodos", nargs="+", choices=METODOS, default=["tabular", "revised"])
+    parser.add_argument("--repeticiones", type=int, default=3)
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("--guardar", help="Archivo JSON donde guardar los resultados (baseline)")
+    parser.add_argument("--comparar", help="Baseline JSON contra el que comparar")
+    parser.add_argument("--tolerancia", type=float, default=0.25, help="Aumento relativo de tiempo admitido")
+    args = parser.parse_args()
+
+    base = None
+    if args.comparar:
+        with open(args.comparar, encoding="utf-8") as f:
+            base = json.load(f)["casos"]
+
+    casos: Dict[str, Any] = {}
+    print(f"{'caso':<32} {'m x n':>9} {'status':>12} {'iter':>7} {'ms':>9} {'MB':>7} {'piv/s':>9} {'vs base':>8}")
+    for familia in args.familias:
+        for tamano in args.tamanos:
+            for metodo in args.metodos:
+                clave = f"{familia}/{tamano}/{metodo}"
+                caso = medir_caso(familia, tamano, metodo, args.repeticiones, args.semilla)
+                casos[clave] = caso
+                relativo = ""
+                if base and clave in base and base[clave]["segundos"] > 0:
+                    relativo = f"{caso['segundos'] / base[clave]['segundos']:.2f}x"
+                marca = "" if caso["status"] == caso["esperado"] else " (!)"
+                print(
+                    f"{clave:<32} {caso['filas']:>4}x{caso['columnas']:<4} {caso['status'] + marca:>12} "
+                    f"{caso['iteraciones']:>7} {caso['segundos'] * 1000:>9.1f} {caso['memoria_pico_mb']:>7.1f} "
+                    f"{caso['pivoteos_por_segundo']:>9.0f} {relativo:>8}"
+                )
+
+    if args.guardar:
+        salida = {
+            "meta": {
+                "fecha": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                "python": platform.python_version(),
+                "numpy": np.__version__,
+                "plataforma": platform.platform(),
+                "semilla": args.semilla,
+                "repeticiones": args.repeticiones,
+            },
+            "casos": casos,
+        }
+        with open(args.guardar, "w", encoding="utf-8") as f:
+            json.dump(salida, f, indent=2, sort_keys=True)
+        print(f"Resultados guardados en {args.guardar}")
+
+    if base is not None:
+        regresiones = comparar(casos, base, args.tolerancia)
+        if regresiones:
+            print(f"\n{len(regresiones)} regresiones respecto de {args.comparar}:")
+            for r in regresiones:
+                print(f"  - {r}")
+            sys.exit(1)
+        print(f"\nSin regresiones respecto de {args.comparar}.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""
+Familias de problemas de Programación Lineal para los benchmarks.
+
+Cada generador recibe un tamaño y un `np.random.Generator` (con semilla, para
+que las corridas sean reproducibles) y retorna un `ProblemaLP` con los
+argumentos de `resolver_simplex_tabular` y el status esperado.
+"""
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List
+
+import numpy as np
+
+from services.sparse_matrix import MatrizDispersa
+
+
+@dataclass
+class ProblemaLP:
+    problem_type: str
+    C: List[float]
+    LI: Any
+    LD: List[float]
+    O: List[str]
+    esperado: str = "optimo"
+    dimensiones: Dict[str, int] = field(default_factory=dict)
+
+    def argumentos(self) -> tuple:
+        return (self.problem_type, self.C, self.LI, self.LD, self.O)
+
+
+def _desde_punto(A: np.ndarray, rng: np.random.Generator, frac_mayor_igual: float) -> tuple:
+    """
+    Lados derechos y operadores factibles para un punto x0 > 0: las filas '<='
+    quedan con holgura positiva y las '>=' por debajo de A·x0.
+    """
+    x0 = rng.uniform(0.5, 1.5, A.shape[1])
+    Ax0 = A @ x0
+    mayor_igual = rng.random(A.shape[0]) < frac_mayor_igual
+    holgura = rng.uniform(0.05, 0.5, A.shape[0]) * np.abs(Ax0)
+    LD = np.where(mayor_igual, Ax0 - holgura, Ax0 + holgura)
+    O = np.where(mayor_igual, ">=", "<=")
+    return LD.tolist(), O.tolist()
+
+
+def densa(m: int, n: int, rng: np.random.Generator) -> ProblemaLP:
+    """Minimización con costos positivos y matriz densa; 30% de filas '>=' (requiere Fase 1)."""
+    A = rng.uniform(1.0, 10.0, (m, n))
+    LD, O = _desde_punto(A, rng, 0.3)
+    return ProblemaLP("minimization", rng.uniform(1.0, 10.0, n).tolist(), A.tolist(), LD, O)
+
+
+def dispersa(m: int, n: int, rng: np.random.Generator, densidad: float = 0.05) -> ProblemaLP:
+    """Como `densa` pero con ~`densidad` de no nulos, entregada como `MatrizDispersa`."""
+    A = rng.uniform(1.0, 10.0, (m, n)) * (rng.random((m, n)) < densidad)
+    # Al menos un no nulo por fila y por columna
+    A[np.arange(m), rng.integers(0, n, m)] = rng.uniform(1.0, 10.0, m)
+    A[rng.integers(0, m, n), np.arange(n)] = rng.uniform(1.0, 10.0, n)
+    LD, O = _desde_punto(A, rng, 0.3)
+    filas, columnas = np.nonzero(A)
+    LI = MatrizDispersa.desde_coo(filas, columnas, A[filas, columnas], A.shape)
+    return ProblemaLP("minimization", rng.uniform(1.0, 10.0, n).tolist(), LI, LD, O)
+
+
+def degenerada(m: int, n: int, rng: np.random.Generator) -> ProblemaLP:
+    """
+    Maximización con la mitad de las filas con LD = 0: muchos vértices
+    degenerados y pivoteos de paso nulo.
+    """
+    A = rng.integers(0, 4, (m, n)).astype(float)
+    A[np.arange(m), rng.integers(0, n, m)] += 1.0
+    A[-1] = rng.uniform(1.0, 3.0, n)  # Fila densa con LD > 0: acota todas las columnas
+    LD = rng.uniform(10.0, 100.0, m)
+    LD[rng.random(m) < 0.5] = 0.0
+    LD[-1] = 10.0 * n
+    return ProblemaLP("maximization", rng.uniform(1.0, 10.0, n).tolist(), A.tolist(), LD.tolist(), ["<="] * m)
+
+
+def transporte(k: int, rng: np.random.Generator) -> ProblemaLP:
+    """k orígenes y k destinos: oferta '<=' y demanda '>=' con oferta total suficiente."""
+    demanda = rng.integers(10, 50, k).astype(float)
+    oferta = rng.integers(10, 50, k).astype(float)
+    oferta *= 1.2 * demanda.sum() / oferta.sum()
+    A = np.zeros((2 * k, k * k))
+    for i in range(k):
+        A[i, i * k:(i + 1) * k] = 1.0  # Lo que sale del origen i
+        A[k + i, i::k] = 1.0           # Lo que llega al destino i
+    LD = np.concatenate([oferta, demanda]).tolist()
+    O = ["<="] * k + [">="] * k
+    return ProblemaLP("minimization", rng.uniform(1.0, 20.0, k * k).tolist(), A.tolist(), LD, O)
+
+
+def asignacion(k: int, rng: np.random.Generator) -> ProblemaLP:
+    """Asignación k×k con igualdades: altamente degenerada (k de 2k-1 básicas valen 1)."""
+    A = np.zeros((2 * k, k * k))
+    for i in range(k):
+        A[i, i * k:(i + 1) * k] = 1.0
+        A[k + i, i::k] = 1.0
+    return ProblemaLP("minimization", rng.uniform(1.0, 20.0, k * k).tolist(), A.tolist(), [1.0] * (2 * k), ["="] * (2 * k))
+
+
+def infactible(m: int, n: int, rng: np.random.Generator) -> ProblemaLP:
+    """`densa` más un par de filas contradictorias (Σx <= 1 y Σx >= 2)."""
+    problema = densa(m - 2, n, rng)
+    problema.LI = problema.LI + [[1.0] * n, [1.0] * n]
+    problema.LD = problema.LD + [1.0, 2.0]
+    problema.O = problema.O + ["<=", ">="]
+    problema.esperado = "infactible"
+    return problema
+
+
+def no_acotada(m: int, n: int, rng: np.random.Generator) -> ProblemaLP:
+    """Maximización factible con una columna de coeficientes <= 0 y costo positivo."""
+    A = rng.uniform(1.0, 10.0, (m, n))
+    A[:, rng.integers(n)] = -rng.uniform(0.0, 1.0, m)
+    LD = rng.uniform(10.0, 100.0, m).tolist()
+    return ProblemaLP("maximization", rng.uniform(1.0, 10.0, n).tolist(), A.tolist(), LD, ["<="] * m, esperado="no acotado")
+
+
+# Tamaños por familia: (m, n) para las generales, k para transporte y asignación
+TAMANOS: Dict[str, Dict[str, Any]] = {
+    "chico": {"mn": (20, 30), "k": 5},
+    "mediano": {"mn": (80, 120), "k": 10},
+    "grande": {"mn": (200, 300), "k": 15},
+}
+
+FAMILIAS: Dict[str, Callable[[str, np.random.Generator], ProblemaLP]] = {
+    "densa": lambda t, rng: densa(*TAMANOS[t]["mn"], rng),
+    "dispersa": lambda t, rng: dispersa(*TAMANOS[t]["mn"], rng),
+    "degenerada": lambda t, rng: degenerada(*TAMANOS[t]["mn"], rng),
+    "transporte": lambda t, rng: transporte(TAMANOS[t]["k"], rng),
+    "asignacion": lambda t, rng: asignacion(TAMANOS[t]["k"], rng),
+    "infactible": lambda t, rng: infactible(*TAMANOS[t]["mn"], rng),
+    "no_acotada": lambda t, rng: no_acotada(*TAMANOS[t]["mn"], rng),
+}
+
+
+def generar(familia: str, tamano: str, semilla: int = 0) -> ProblemaLP:
+    """Genera el problema de una familia y tamaño; la misma semilla da el mismo problema."""
+    problema = FAMILIAS[familia](tamano, np.random.default_rng(semilla))
+    m = len(problema.LD)
+    problema.dimensiones = {"filas": m, "columnas": len(problema.C)}
+    return problema
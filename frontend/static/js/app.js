@@ -75,13 +75,16 @@ function inicializarEventos() {
             try {
                 const data = prepareRequestData();
                 if (data.C.length !== 2) return; // Seguridad
-                const resp = await fetch("/simplex/generate-graph-html", {
+                // El servidor devuelve solo la geometría y el SVG se dibuja aquí (ver grafico.js)
+                const resp = await fetch("/simplex/graph-geometry", {
                     method: "POST",
                     headers: { "Content-Type": "application/json" },
                     body: JSON.stringify(data)
                 });
-                const html = await resp.text();
-                if (!resp.ok) throw new Error(html || "No se pudo generar gráfico");
+                if (!resp.ok) throw new Error((await resp.text()) || "No se pudo generar gráfico");
+                const svg = construirSVGGrafico(await resp.json());
+                const html = `<html><head><title>Gráfico Simplex</title></head>
+                    <body style='font-family: Arial; text-align: center; padding: 20px;'>${svg}</body></html>`;
                 const win = window.open("about:blank", "_blank");
                 if (win) {
                     win.document.write(html);
@@ -466,10 +469,11 @@ async function solveProblem() {
         const data = prepareRequestData();
         localStorage.setItem("simplex_inputs", JSON.stringify(data));
 
+        // Las tablas se transmiten aparte en la página de tablas: aquí solo el resultado
         const response = await fetch("/simplex/solve-tabular", {
             method: "POST",
             headers: { "Content-Type": "application/json" },
-            body: JSON.stringify(data)
+            body: JSON.stringify({ ...data, history: "none" })
         });
 
         const body = await response.text();
@@ -0,0 +1,114 @@
+/* ============================================================
+   GRÁFICO 2D EN EL CLIENTE (SVG)
+   Dibuja la geometría de POST /simplex/graph-geometry: región
+   factible, restricciones, recta del objetivo y punto óptimo.
+============================================================ */
+
+const GRAFICO_ANCHO = 900;
+const GRAFICO_ALTO = 540;
+const GRAFICO_MARGEN = { izq: 60, der: 20, sup: 40, inf: 50 };
+const GRAFICO_COLORES = ["#1f77b4", "#ff7f0e", "#2ca02c", "#9467bd", "#8c564b", "#e377c2", "#7f7f7f", "#bcbd22", "#17becf"];
+
+function _escaparSVG(texto) {
+    return String(texto).replace(/&/g, "&amp;").replace(/</g, "&lt;").replace(/>/g, "&gt;");
+}
+
+// Marcas "redondas" del eje (1, 2 o 5 × 10^k) entre min y max (el 0 es una marca)
+function _marcasEje(min, max, cantidad = 6) {
+    const crudo = (max - min) / cantidad;
+    const potencia = Math.pow(10, Math.floor(Math.log10(crudo)));
+    const paso = [1, 2, 5, 10].map(f => f * potencia).find(p => p >= crudo);
+    const marcas = [];
+    for (let k = Math.ceil(min / paso - 1e-9); k * paso <= max + paso * 1e-9; k++) marcas.push(Number((k * paso).toPrecision(12)));
+    return marcas;
+}
+
+function _etiquetaRestriccion(r, i) {
+    const [a, b] = r.coeficientes;
+    return `R${i + 1}: ${a}x1 + ${b}x2 ${r.operador} ${r.ld}`;
+}
+
+/**
+ * Construye el SVG (como texto) de la geometría recibida del servidor.
+ */
+function construirSVGGrafico(geom, titulo = "Gráfico de Restricciones y Función Objetivo") {
+    const m = GRAFICO_MARGEN;
+    const anchoUtil = GRAFICO_ANCHO - m.izq - m.der;
+    const altoUtil = GRAFICO_ALTO - m.sup - m.inf;
+    const [x0, x1] = geom.limites.x;
+    const [y0, y1] = geom.limites.y;
+    const px = x => m.izq + (x - x0) / (x1 - x0) * anchoUtil;
+    const py = y => m.sup + altoUtil - (y - y0) / (y1 - y0) * altoUtil;
+    const punto = ([x, y]) => `${px(x).toFixed(1)},${py(y).toFixed(1)}`;
+
+    const partes = [];
+    partes.push(`<svg xmlns="http://www.w3.org/2000/svg" width="${GRAFICO_ANCHO}" height="${GRAFICO_ALTO}" viewBox="0 0 ${GRAFICO_ANCHO} ${GRAFICO_ALTO}" font-family="Inter, Arial, sans-serif" font-size="12">`);
+    partes.push(`<defs><clipPath id="area"><rect x="${m.izq}" y="${m.sup}" width="${anchoUtil}" height="${altoUtil}"/></clipPath></defs>`);
+    partes.push(`<text x="${GRAFICO_ANCHO / 2}" y="24" text-anchor="middle" font-size="16" font-weight="600">${_escaparSVG(titulo)}</text>`);
+
+    // Cuadrícula y marcas de los ejes
+    for (const v of _marcasEje(x0, x1)) {
+        partes.push(`<line x1="${px(v)}" y1="${m.sup}" x2="${px(v)}" y2="${m.sup + altoUtil}" stroke="#ddd" stroke-dasharray="4 3"/>`);
+        partes.push(`<text x="${px(v)}" y="${m.sup + altoUtil + 16}" text-anchor="middle">${v}</text>`);
+    }
+    for (const v of _marcasEje(y0, y1)) {
+        partes.push(`<line x1="${m.izq}" y1="${py(v)}" x2="${m.izq + anchoUtil}" y2="${py(v)}" stroke="#ddd" stroke-dasharray="4 3"/>`);
+        partes.push(`<text x="${m.izq - 6}" y="${py(v) + 4}" text-anchor="end">${v}</text>`);
+    }
+    partes.push(`<rect x="${m.izq}" y="${m.sup}" width="${anchoUtil}" height="${altoUtil}" fill="none" stroke="#333"/>`);
+    partes.push(`<text x="${m.izq + anchoUtil / 2}" y="${GRAFICO_ALTO - 10}" text-anchor="middle">x1</text>`);
+    partes.push(`<text x="16" y="${m.sup + altoUtil / 2}" text-anchor="middle" transform="rotate(-90 16 ${m.sup + altoUtil / 2})">x2</text>`);
+
+    const leyenda = [];
+    partes.push(`<g clip-path="url(#area)">`);
+
+    // Región factible
+    if (geom.region.vertices.length >= 2) {
+        partes.push(`<polygon points="${geom.region.vertices.map(punto).join(" ")}" fill="rgba(44,160,44,0.18)" stroke="rgba(44,160,44,0.6)"/>`);
+        leyenda.push({ color: "rgba(44,160,44,0.4)", texto: geom.region.acotada ? "Región factible" : "Región factible (no acotada)", area: true });
+    }
+
+    // Restricciones
+    geom.restricciones.forEach((r, i) => {
+        const color = GRAFICO_COLORES[i % GRAFICO_COLORES.length];
+        if (r.segmento) {
+            const [p, q] = r.segmento;
+            partes.push(`<line x1="${px(p[0])}" y1="${py(p[1])}" x2="${px(q[0])}" y2="${py(q[1])}" stroke="${color}" stroke-width="2"/>`);
+        }
+        leyenda.push({ color, texto: _etiquetaRestriccion(r, i) });
+    });
+
+    // Recta de nivel del objetivo
+    if (geom.objetivo.segmento) {
+        const [p, q] = geom.objetivo.segmento;
+        partes.push(`<line x1="${px(p[0])}" y1="${py(p[1])}" x2="${px(q[0])}" y2="${py(q[1])}" stroke="#d62728" stroke-width="2" stroke-dasharray="8 5"/>`);
+        leyenda.push({ color: "#d62728", texto: `Función Objetivo (Z = ${geom.objetivo.valor})`, discontinua: true });
+    }
+
+    // Punto óptimo
+    if (geom.optimo) {
+        partes.push(`<circle cx="${px(geom.optimo[0])}" cy="${py(geom.optimo[1])}" r="6" fill="#000"><title>Óptimo (${geom.optimo[0]}, ${geom.optimo[1]})</title></circle>`);
+        leyenda.push({ color: "#000", texto: `Óptimo (${geom.optimo[0]}, ${geom.optimo[1]})`, punto: true });
+    }
+    partes.push(`</g>`);
+
+    // Leyenda (esquina superior derecha)
+    const anchoLeyenda = 250;
+    const lx = m.izq + anchoUtil - anchoLeyenda - 8;
+    let ly = m.sup + 8;
+    partes.push(`<rect x="${lx}" y="${ly}" width="${anchoLeyenda}" height="${leyenda.length * 18 + 8}" fill="#fff" fill-opacity="0.85" stroke="#ccc" rx="4"/>`);
+    for (const item of leyenda) {
+        ly += 18;
+        if (item.area) {
+            partes.push(`<rect x="${lx + 8}" y="${ly - 10}" width="20" height="10" fill="${item.color}"/>`);
+        } else if (item.punto) {
+            partes.push(`<circle cx="${lx + 18}" cy="${ly - 5}" r="4" fill="${item.color}"/>`);
+        } else {
+            partes.push(`<line x1="${lx + 8}" y1="${ly - 5}" x2="${lx + 28}" y2="${ly - 5}" stroke="${item.color}" stroke-width="2"${item.discontinua ? ' stroke-dasharray="6 3"' : ""}/>`);
+        }
+        partes.push(`<text x="${lx + 36}" y="${ly - 1}">${_escaparSVG(item.texto)}</text>`);
+    }
+
+    partes.push(`</svg>`);
+    return partes.join("");
+}
@@ -8,6 +8,23 @@ document.addEventListener('DOMContentLoaded', () => {
   btnLimpiar?.addEventListener('click', limpiarResultados);
 
   // --- Flujo principal ---
+  // Con los datos del problema las tablas se piden en streaming y se muestran
+  // a medida que llegan; si no, se usa el resultado almacenado.
+  const inputs = parseJsonSeguro(leerLocalStorage('simplex_inputs'));
+  if (inputs) {
+    contenedorTablas.innerHTML = '';
+    streamTablas(inputs, {
+      tabla: tabla => contenedorTablas.insertAdjacentHTML('beforeend', renderTabla(tabla)),
+      resultado: data => {
+        renderEstado(estadoDiv, data.status);
+        if (!contenedorTablas.children.length) renderTablas(contenedorTablas, []);
+        renderResumen(resumenDiv, data.solucion);
+      },
+      error: data => mostrarMensajeError(estadoDiv, 'Error al resolver.', data.detail || 'No se pudieron obtener las tablas.'),
+    }).catch(err => mostrarMensajeError(estadoDiv, 'Error al resolver.', err.message));
+    return;
+  }
+
   const raw = leerLocalStorage('simplex_result');
   if (!raw) return mostrarMensajeError(estadoDiv, 'No hay datos para mostrar.', 'Resuelve un problema primero y luego vuelve a esta página.');
 
@@ -33,6 +50,46 @@ function limpiarResultados() {
   });
 }
 
+/**
+ * Resuelve el problema en /simplex/solve-tabular/stream y llama al manejador
+ * de cada evento SSE ('tabla', 'resultado' o 'error') apenas llega.
+ */
+async function streamTablas(inputs, manejadores) {
+  const resp = await fetch('/simplex/solve-tabular/stream', {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json', 'Accept': 'text/event-stream' },
+    body: JSON.stringify(inputs),
+  });
+  if (!resp.ok) {
+    const body = parseJsonSeguro(await resp.text());
+    throw new Error(body?.detail || `Error ${resp.status}`);
+  }
+
+  const lector = resp.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = '';
+  while (true) {
+    const { value, done } = await lector.read();
+    if (done) break;
+    buffer += decoder.decode(value, { stream: true });
+
+    // Los eventos terminan con una línea en blanco
+    let fin;
+    while ((fin = buffer.indexOf('\n\n')) >= 0) {
+      const bloque = buffer.slice(0, fin);
+      buffer = buffer.slice(fin + 2);
+      let evento = 'message';
+      let datos = '';
+      bloque.split('\n').forEach(linea => {
+        if (linea.startsWith('event:')) evento = linea.slice(6).trim();
+        else if (linea.startsWith('data:')) datos += linea.slice(5).trim();
+      });
+      const data = parseJsonSeguro(datos);
+      if (data && manejadores[evento]) manejadores[evento](data);
+    }
+  }
+}
+
 function leerLocalStorage(clave) {
   try {
     return localStorage.getItem(clave);
@@ -2,10 +2,15 @@ from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.exceptions import RequestValidationError
+from contextlib import asynccontextmanager
 import logging
+import time
 
 # --- Importamos nuestros routers separados ---
-from routers import simplex_router, pages_router
+from routers import simplex_router, pages_router, metrics_router
+from services.executor_service import cerrar_pools
+from services.job_service import gestor_trabajos
+from services.metrics_service import duracion_requests
 
 # --- Configuración de Logging ---
 logging.basicConfig(
@@ -15,8 +20,16 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 logger.info("Iniciando aplicación FastAPI...")
 
+# --- Ciclo de vida: liberar los pools de ejecución al apagar ---
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    gestor_trabajos.cerrar()
+    cerrar_pools()
+
 # --- Creación de la App ---
 app = FastAPI(
+    lifespan=lifespan,
     title="Simplex Solver API",
     description="API para resolver problemas de Programación Lineal con el método Simplex Tabular.",
     version="1.0.0"
@@ -32,11 +45,24 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
         content={"detail": "Datos de entrada inválidos. Verifica el formato del JSON.", "errors": exc.errors()},
     )
 
+# --- Métricas de duración por ruta ---
+@app.middleware("http")
+async def medir_requests(request: Request, call_next):
+    """Observa la duración de cada request (hasta los headers) por ruta, método y código."""
+    inicio = time.perf_counter()
+    response = await call_next(request)
+    # La plantilla de la ruta (no la URL) acota la cantidad de series
+    ruta = getattr(request.scope.get("route"), "path", "sin_ruta")
+    duracion_requests.observar(time.perf_counter() - inicio, ruta, request.method, response.status_code)
+    return response
+
 # --- Montaje de Routers ---
 # Incluimos los endpoints de las páginas HTML
 app.include_router(pages_router.router) 
 # Incluimos los endpoints de la API del Simplex
 app.include_router(simplex_router.router)
+# Métricas para Prometheus en /metrics
+app.include_router(metrics_router.router)
 
 # --- Montaje de Archivos Estáticos ---
 # Esto sirve archivos como CSS y JS
@@ -0,0 +1,71 @@
+from fastapi import APIRouter
+from fastapi.responses import Response
+import logging
+
+from services.cache_service import cache_resultados
+from services.executor_service import ejecutor_resolucion, ejecutor_render
+from services.job_service import gestor_trabajos
+from services.metrics_service import MEDIA_TYPE_PROMETHEUS, registro
+
+router = APIRouter(tags=["Métricas"])
+logger = logging.getLogger(__name__)
+
+# --- Métricas leídas de otros componentes al momento de exponer ---
+
+_EJECUTORES = (ejecutor_resolucion, ejecutor_render)
+
+registro.medidor(
+    "simplex_executor_pending",
+    "Trabajos admitidos en cada ejecutor (en ejecución + en espera).",
+    lambda: {(e.nombre,): e.pendientes for e in _EJECUTORES},
+    ("executor",),
+)
+registro.medidor(
+    "simplex_executor_capacity",
+    "Trabajos admitidos a la vez por cada ejecutor antes de responder 503.",
+    lambda: {(e.nombre,): e.max_pendientes for e in _EJECUTORES},
+    ("executor",),
+)
+registro.medidor(
+    "simplex_jobs_pending",
+    "Trabajos en segundo plano sin terminar.",
+    lambda: {(): gestor_trabajos.pendientes},
+)
+def _consultas_cache() -> dict:
+    stats = cache_resultados.estadisticas()
+    return {("memory_hit",): stats["aciertos"], ("disk_hit",): stats["aciertos_disco"], ("miss",): stats["fallos"]}
+
+registro.medidor(
+    "simplex_cache_requests_total",
+    "Consultas a la caché de resultados, por resultado.",
+    _consultas_cache,
+    ("result",),
+    tipo="counter",
+)
+registro.medidor(
+    "simplex_cache_evictions_total",
+    "Entradas desalojadas de la caché en memoria.",
+    lambda: {(): cache_resultados.estadisticas()["desalojos"]},
+    tipo="counter",
+)
+registro.medidor(
+    "simplex_cache_entries",
+    "Entradas en la caché en memoria.",
+    lambda: {(): cache_resultados.estadisticas()["entradas"]},
+)
+registro.medidor(
+    "simplex_cache_bytes",
+    "Tamaño estimado de la caché en memoria, en bytes.",
+    lambda: {(): cache_resultados.estadisticas()["bytes"]},
+)
+
+
+@router.get("/metrics", response_class=Response)
+async def metrics():
+    """
+    Expone las métricas del servidor en el formato de texto de Prometheus:
+    duración de requests y de cada etapa, iteraciones por resolución, caché
+    y colas de los ejecutores. Los solves que corren en el pool de procesos
+    se cuentan aquí con los tiempos que devuelve cada worker.
+    """
+    return Response(content=registro.exponer(), media_type=MEDIA_TYPE_PROMETHEUS)
@@ -1,13 +1,40 @@
-from fastapi import APIRouter, HTTPException, BackgroundTasks
-from fastapi.responses import FileResponse, HTMLResponse
-from typing import Optional, Tuple
-from services import resolver_simplex_tabular, generar_grafico_2d
-from schemas import SimplexRequest, SimplexResponse 
-import uuid
-import tempfile
-import os
+from fastapi import APIRouter, Header, HTTPException, Query
+from fastapi.responses import HTMLResponse, Response, StreamingResponse
+from typing import Any, Callable, Dict, Optional, Tuple, List
+from services import resolver_desde_request, resolver_lote, iterar_desde_request, generar_grafico_2d
+from services.simplex_service import matriz_desde_request, metodo_de_request
+from services.graph_service import MEDIA_TYPES_GRAFICO, AjusteGrafico, FormatoGrafico
+from services.feasible_region import geometria_2d
+from services.scenario_service import resolver_escenarios_desde_request
+from services.executor_service import (
+    PROCESS_WORKERS,
+    ejecutor_resolucion,
+    ejecutor_render,
+    ServicioSaturadoError,
+    TiempoAgotadoError,
+    iterar_en_hilos,
+)
+from services.cache_service import cache_resultados, clave_canonica
+from services.job_service import gestor_trabajos
+from services.metrics_service import espera_ejecutores, formatear_tiempos, medir, registrar_etapas, registrar_resolucion
+from services.tableau_packing import MEDIA_TYPE_EMPAQUETADO, dtype_solicitado, empaquetar_resultado
+from schemas import (
+    SimplexRequest,
+    SimplexResponse,
+    SimplexBatchRequest,
+    SimplexBatchResponse,
+    SimplexScenariosRequest,
+    SimplexScenariosResponse,
+    JobStatus,
+    GraphGeometry,
+)
+import asyncio
+import functools
+import io
+import json
 import logging
 import base64
+import time
 from services.PDF_service.PDF_builder import SimplexPDFBuilder
 
 logger = logging.getLogger(__name__)
@@ -19,54 +46,201 @@ router = APIRouter(
 
 # --- Funciones Helper ---
 
-def _cleanup_file(path: str) -> None:
-    """Función de limpieza para borrar archivos temporales en background."""
-    try:
-        if os.path.exists(path):
-            os.remove(path)
-            logger.info(f"Archivo temporal eliminado: {path}")
-    except Exception as e:
-        logger.warning(f"No se pudo eliminar el archivo temporal {path}: {e}")
+def _LI_denso(request: SimplexRequest) -> list:
+    """LI como lista de listas (para el gráfico, que solo admite 2 variables)."""
+    if request.LI is not None:
+        return request.LI
+    return matriz_desde_request(request).toarray().tolist()
+
+def _error_ejecutor(e: Exception) -> HTTPException:
+    """Traduce los errores del ejecutor a 503 (saturado) o 504 (tiempo agotado)."""
+    if isinstance(e, ServicioSaturadoError):
+        return HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"})
+    return HTTPException(status_code=504, detail=str(e))
+
+def _construir_pdf(result: dict) -> bytes:
+    """Construye el PDF del resultado en memoria (se ejecuta en el pool de hilos)."""
+    buffer = io.BytesIO()
+    builder = SimplexPDFBuilder(result)
+    builder.set_empresa("Simplex Solver", subtitulo="Reporte del Método Simplex")
+    builder.build(buffer)
+    return buffer.getvalue()
+
+def _etag(clave: str) -> str:
+    """
+    ETag débil derivado de la clave canónica del request: dos respuestas con
+    la misma clave son equivalentes (el PDF cambia su fecha de creación en
+    cada render), así que un request condicional se responde sin renderizar.
+    """
+    return f'W/"{clave}"'
+
+def _coincide_etag(if_none_match: Optional[str], etag: str) -> bool:
+    """Comparación débil de If-None-Match (lista de ETags o '*')."""
+    if not if_none_match:
+        return False
+    candidatos = [c.strip() for c in if_none_match.split(",")]
+    return "*" in candidatos or etag.removeprefix("W/") in (c.removeprefix("W/") for c in candidatos)
+
+def _respuesta_archivo(contenido: bytes, media_type: str, nombre: str, etag: str) -> Response:
+    """Respuesta descargable con los bytes en memoria (Response agrega Content-Length)."""
+    return Response(
+        content=contenido,
+        media_type=media_type,
+        headers={
+            "Content-Disposition": f'attachment; filename="{nombre}"',
+            "ETag": etag,
+            "Cache-Control": "no-cache",
+        },
+    )
+
+async def _ejecutar_medido(ejecutor, fn: Callable[..., Any], *args: Any) -> Tuple[Any, Dict[str, float]]:
+    """
+    Ejecuta `fn(*args)` en el ejecutor midiendo sus etapas (ver `medir`).
+    Registra las etapas y la espera en la cola, y retorna (valor, tiempos).
+    """
+    inicio = time.perf_counter()
+    valor, tiempos = await ejecutor.ejecutar(medir, fn, *args)
+    espera_ejecutores.observar(max(0.0, time.perf_counter() - inicio - tiempos["total"]), ejecutor.nombre)
+    return valor, tiempos
+
+async def _resolver_con_tiempos(request: SimplexRequest) -> Tuple[dict, Optional[Dict[str, float]]]:
+    """
+    Resuelve el problema en el pool de procesos o reutiliza el resultado de un
+    request equivalente. Solve, gráfico y PDF del mismo problema comparten entrada.
+    Retorna (resultado, tiempos por etapa), con tiempos None si vino de la caché.
+    """
+    clave = clave_canonica(request, "solve")
+    result = cache_resultados.obtener(clave)
+    if result is not None:
+        return result, None
+    result, tiempos = await _ejecutar_medido(ejecutor_resolucion, resolver_desde_request, request)
+    registrar_resolucion(metodo_de_request(request), result, tiempos)
+    cache_resultados.guardar(clave, result)
+    return result, tiempos
+
+async def _resolver_cacheado(request: SimplexRequest) -> dict:
+    """Como `_resolver_con_tiempos`, sin los tiempos."""
+    result, _ = await _resolver_con_tiempos(request)
+    return result
+
+def _evento_sse(evento: str, datos: dict) -> str:
+    """Formatea un evento Server-Sent Events con los datos en JSON."""
+    return f"event: {evento}\ndata: {json.dumps(datos)}\n\n"
 
-def _solve_and_get_mark_point(request: SimplexRequest) -> Optional[Tuple[float, float]]:
+async def _eventos_cacheados(result: dict):
+    """Eventos ('tabla' y 'resultado') de un resultado completo tomado de la caché."""
+    for tabla in result["tablas"]:
+        yield "tabla", tabla
+    yield "resultado", dict(result, tablas=[])
+
+async def _solve_and_get_mark_point(request: SimplexRequest) -> Optional[Tuple[float, float]]:
     """Resuelve el simplex y retorna el punto óptimo (x1, x2) o None."""
     try:
-        solve = resolver_simplex_tabular(
-            problem_type=request.problem_type,
-            C=request.C,
-            LI=request.LI,
-            LD=request.LD,
-            O=request.O,
-        )
+        solve = await _resolver_cacheado(request)
         # Extraer punto óptimo si existe
         if solve.get("status") == "optimo" and solve.get("solucion"):
             vars_ = solve["solucion"]["variables"]
             mx = float(vars_.get("x1", 0.0))
             my = float(vars_.get("x2", 0.0))
             return (mx, my)
+    except (ServicioSaturadoError, TiempoAgotadoError):
+        raise
     except Exception as e:
         # Si falla la solución, al menos el gráfico se puede generar sin el punto
         logger.warning(f"Error al pre-resolver para el gráfico: {e}. Se graficará sin punto óptimo.")
     
     return None
 
+def _dividir_en_lotes(problems: List[SimplexRequest]) -> List[Tuple[int, List[SimplexRequest]]]:
+    """
+    Divide los problemas en bloques contiguos (índice inicial, problemas).
+    Agrupar reduce el costo de serialización entre procesos para LPs pequeños,
+    manteniendo varios bloques por worker para repartir la carga.
+    """
+    tam = max(1, min(256, -(-len(problems) // (PROCESS_WORKERS * 4))))
+    return [(i, problems[i:i + tam]) for i in range(0, len(problems), tam)]
+
+def _tipo_grafico(formato: FormatoGrafico, dpi: int, ajuste: AjusteGrafico) -> str:
+    return f"grafico:{formato}:{dpi}:{ajuste}"
+
+async def _grafico(request: SimplexRequest, formato: FormatoGrafico, dpi: int, ajuste: AjusteGrafico) -> bytes:
+    """Genera (o toma de la caché) el gráfico 2D con el punto óptimo marcado."""
+    clave = clave_canonica(request, _tipo_grafico(formato, dpi, ajuste))
+    imagen = cache_resultados.obtener(clave)
+    if imagen is not None:
+        return imagen
+
+    # Usamos el helper para obtener el punto óptimo
+    mark = await _solve_and_get_mark_point(request)
+
+    # Generar gráfico como bytes en memoria
+    imagen, tiempos = await _ejecutar_medido(ejecutor_render, functools.partial(
+        generar_grafico_2d,
+        request.C,
+        _LI_denso(request),
+        request.LD,
+        titulo="Gráfico de Restricciones y Función Objetivo",
+        mark_point=mark,
+        save_path=None,
+        formato=formato,
+        dpi=dpi,
+        ajuste=ajuste,
+        O=request.O,
+        lower=request.lower,
+        upper=request.upper,
+    ))
+    registrar_etapas(tiempos)
+    if not isinstance(imagen, (bytes, bytearray)):
+        raise RuntimeError("generar_grafico_2d no devolvió bytes.")
+
+    imagen = bytes(imagen)
+    cache_resultados.guardar(clave, imagen)
+    return imagen
+
 # --- Endpoints de la API ---
 
-@router.post("/solve-tabular", response_model=SimplexResponse)
-async def solve_tabular(request: SimplexRequest):
+@router.post(
+    "/solve-tabular",
+    response_model=SimplexResponse,
+    responses={200: {"content": {MEDIA_TYPE_EMPAQUETADO: {}}}},
+)
+async def solve_tabular(
+    request: SimplexRequest,
+    response: Response,
+    accept: Optional[str] = Header(None),
+    x_solve_timing: Optional[str] = Header(None),
+):
     """
     Resuelve un problema Simplex y devuelve todas las tablas (iteraciones).
+
+    Con `Accept: application/vnd.simplex.packed` (opcionalmente
+    `;dtype=float32`) responde en formato binario con las tablas como arreglos
+    NumPy (ver `empaquetar_resultado`), sin validar ni serializar celda por celda.
+
+    Si el request trae el header `X-Solve-Timing` (con cualquier valor), la
+    respuesta lo incluye con la duración de cada etapa de la resolución en ms.
     """
     try:
-        result = resolver_simplex_tabular(
-            problem_type=request.problem_type,
-            C=request.C,
-            LI=request.LI,
-            LD=request.LD,
-            O=request.O
-        )
+        dtype = dtype_solicitado(accept)
+    except ValueError as e:
+        raise HTTPException(status_code=406, detail=str(e))
+
+    try:
+        result, tiempos = await _resolver_con_tiempos(request)
         logger.info("Resolviendo problema simplex tabular.")
+        headers = {"Vary": "Accept"}
+        if x_solve_timing is not None:
+            headers["X-Solve-Timing"] = formatear_tiempos(tiempos)
+        if dtype is not None:
+            return Response(
+                content=empaquetar_resultado(result, dtype),
+                media_type=MEDIA_TYPE_EMPAQUETADO,
+                headers=headers,
+            )
+        response.headers.update(headers)
         return result
+    except (ServicioSaturadoError, TiempoAgotadoError) as e:
+        raise _error_ejecutor(e)
     except ValueError as e:
         logger.warning(f"Error de validación en /solve-tabular: {e}")
         raise HTTPException(status_code=400, detail=f"Datos inválidos: {e}")
@@ -74,129 +248,367 @@ async def solve_tabular(request: SimplexRequest):
         logger.exception("Error interno en /solve-tabular")        
         raise HTTPException(status_code=500, detail="Ocurrió un error interno al resolver el problema.")
 
+@router.post("/solve-tabular/stream")
+async def solve_tabular_stream(request: SimplexRequest):
+    """
+    Resuelve un problema Simplex y transmite las tablas como Server-Sent Events.
+
+    Cada tabla llega en un evento `tabla` en cuanto se forma y al final un
+    evento `resultado` trae status, solución, iteraciones y base (con `tablas`
+    vacío). Un error a mitad de la resolución se informa con un evento `error`.
+    El servidor retiene una sola tabla a la vez; si el problema ya está en la
+    caché se transmite desde allí.
+    """
+    cacheado = cache_resultados.obtener(clave_canonica(request, "solve"))
+    reservados = 0
+    if cacheado is not None:
+        eventos = _eventos_cacheados(cacheado)
+    else:
+        try:
+            reservados = ejecutor_resolucion.adquirir()
+        except ServicioSaturadoError as e:
+            raise _error_ejecutor(e)
+        eventos = iterar_en_hilos(iterar_desde_request(request))
+
+    # El primer evento se espera antes de responder: así los datos inválidos dan 400
+    try:
+        primero = await eventos.__anext__()
+    except Exception as e:
+        await eventos.aclose()
+        ejecutor_resolucion.liberar(reservados)
+        if isinstance(e, TiempoAgotadoError):
+            raise _error_ejecutor(e)
+        if isinstance(e, ValueError):
+            logger.warning(f"Error de validación en /solve-tabular/stream: {e}")
+            raise HTTPException(status_code=400, detail=f"Datos inválidos: {e}")
+        logger.exception("Error interno en /solve-tabular/stream")
+        raise HTTPException(status_code=500, detail="Ocurrió un error interno al resolver el problema.")
+
+    def _formatear(evento: str, datos: dict) -> str:
+        if evento == "resultado" and cacheado is None:
+            registrar_resolucion(metodo_de_request(request), datos)
+        return _evento_sse(evento, datos)
+
+    async def _generar():
+        try:
+            yield _formatear(*primero)
+            async for evento, datos in eventos:
+                yield _formatear(evento, datos)
+        except TiempoAgotadoError as e:
+            yield _evento_sse("error", {"detail": str(e)})
+        except ValueError as e:
+            logger.warning(f"Error de validación en /solve-tabular/stream: {e}")
+            yield _evento_sse("error", {"detail": f"Datos inválidos: {e}"})
+        except Exception:
+            logger.exception("Error interno en /solve-tabular/stream")
+            yield _evento_sse("error", {"detail": "Ocurrió un error interno al resolver el problema."})
+        finally:
+            await eventos.aclose()
+            ejecutor_resolucion.liberar(reservados)
+
+    logger.info("Transmitiendo tablas del problema simplex.")
+    return StreamingResponse(
+        _generar(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+@router.post("/solve-batch", response_model=SimplexBatchResponse)
+async def solve_batch(batch: SimplexBatchRequest, stream: bool = False):
+    """
+    Resuelve un lote de problemas en paralelo usando el pool de procesos.
+
+    Por defecto responde con todos los resultados en el orden del request.
+    Con `?stream=true` devuelve NDJSON, una línea por problema a medida que
+    terminan sus bloques (cada línea incluye su `index`).
+    """
+    lotes = _dividir_en_lotes(batch.problems)
+    logger.info(f"Resolviendo lote de {len(batch.problems)} problemas en {len(lotes)} bloques.")
+
+    # El lote se admite completo o se rechaza con 503: cada bloque ocupa un lugar en la cola
+    try:
+        reservados = ejecutor_resolucion.adquirir(len(lotes))
+    except ServicioSaturadoError as e:
+        raise _error_ejecutor(e)
+
+    async def _resolver_bloque(inicio: int, problems: List[SimplexRequest]):
+        salida = await ejecutor_resolucion.ejecutar_reservado(resolver_lote, problems)
+        for problem, item in zip(problems, salida):
+            if item["resultado"] is not None:
+                registrar_resolucion(metodo_de_request(problem), item["resultado"])
+        return [{"index": inicio + k, **item} for k, item in enumerate(salida)]
+
+    tareas = [asyncio.ensure_future(_resolver_bloque(inicio, problems)) for inicio, problems in lotes]
+
+    if stream:
+        async def _esperar_bloque(tarea: asyncio.Future, inicio: int, cantidad: int) -> List[dict]:
+            # La respuesta ya empezó con 200: un bloque que falla se informa en
+            # sus líneas (como error) y el resto del lote se sigue transmitiendo
+            try:
+                return await tarea
+            except TiempoAgotadoError as e:
+                error = str(e)
+            except Exception:
+                logger.exception("Error interno en /solve-batch")
+                error = "Ocurrió un error interno al resolver el lote."
+            return [{"index": inicio + k, "resultado": None, "error": error} for k in range(cantidad)]
+
+        async def _generar():
+            esperas = [
+                _esperar_bloque(tarea, inicio, len(problems))
+                for tarea, (inicio, problems) in zip(tareas, lotes)
+            ]
+            try:
+                for espera in asyncio.as_completed(esperas):
+                    for item in await espera:
+                        yield json.dumps(item) + "\n"
+            finally:
+                for tarea in tareas:
+                    tarea.cancel()
+                ejecutor_resolucion.liberar(reservados)
+
+        return StreamingResponse(_generar(), media_type="application/x-ndjson")
+
+    try:
+        bloques = await asyncio.gather(*tareas)
+    except TiempoAgotadoError as e:
+        raise _error_ejecutor(e)
+    except Exception:
+        logger.exception("Error interno en /solve-batch")
+        raise HTTPException(status_code=500, detail="Ocurrió un error interno al resolver el lote.")
+    finally:
+        ejecutor_resolucion.liberar(reservados)
+
+    return {"resultados": [item for bloque in bloques for item in bloque]}
+
+@router.post("/solve-scenarios", response_model=SimplexScenariosResponse)
+async def solve_scenarios(request: SimplexScenariosRequest):
+    """
+    Resuelve un mismo modelo con varios vectores de costos y/o lados derechos.
+
+    Los escenarios se resuelven en orden en el pool de procesos, cada uno
+    reoptimizando desde la base óptima del anterior (simplex primal si cambió
+    C, dual si cambió LD), sin volver a estandarizar el modelo ni repetir la
+    Fase 1. Devuelve un resultado por escenario, sin tablas.
+    """
+    try:
+        clave = clave_canonica(request, "escenarios")
+        resultados = cache_resultados.obtener(clave)
+        if resultados is None:
+            resultados, tiempos = await _ejecutar_medido(ejecutor_resolucion, resolver_escenarios_desde_request, request)
+            registrar_etapas(tiempos)
+            for item in resultados:
+                registrar_resolucion("scenarios", item)
+            cache_resultados.guardar(clave, resultados)
+        logger.info(f"Resueltos {len(resultados)} escenarios.")
+        return {"resultados": resultados}
+    except (ServicioSaturadoError, TiempoAgotadoError) as e:
+        raise _error_ejecutor(e)
+    except ValueError as e:
+        logger.warning(f"Error de validación en /solve-scenarios: {e}")
+        raise HTTPException(status_code=400, detail=f"Datos inválidos: {e}")
+    except Exception as e:
+        logger.exception("Error interno en /solve-scenarios")
+        raise HTTPException(status_code=500, detail="Ocurrió un error interno al resolver los escenarios.")
+
 @router.post("/generate-graph")
-async def generate_graph(request: SimplexRequest, background_tasks: BackgroundTasks):
+async def generate_graph(
+    request: SimplexRequest,
+    formato: FormatoGrafico = Query("png", alias="format"),
+    dpi: int = Query(100, ge=30, le=300),
+    ajuste: AjusteGrafico = Query("tight", alias="layout"),
+    if_none_match: Optional[str] = Header(None),
+):
     """
-    Genera un gráfico del problema (solo 2D) y lo devuelve como un archivo PNG.
+    Genera un gráfico del problema (solo 2D) y lo devuelve como archivo.
+
+    `?format=` elige 'png' (por defecto), 'svg' o 'webp'; `?dpi=` la
+    resolución de los formatos raster y `?layout=fixed` usa márgenes fijos
+    en lugar de recortar al contenido, lo que evita dibujar la figura dos veces.
+
+    La respuesta lleva ETag; con `If-None-Match` coincidente responde 304
+    sin resolver ni renderizar.
     """
     if len(request.C) != 2:
         raise HTTPException(status_code=400, detail="El gráfico solo puede generarse para problemas con exactamente 2 variables.")
 
-    try:
-        # Usamos el helper para obtener el punto óptimo
-        mark = _solve_and_get_mark_point(request)
+    etag = _etag(clave_canonica(request, _tipo_grafico(formato, dpi, ajuste)))
+    if _coincide_etag(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
 
-        # Generar gráfico como archivo temporal
-        tmp_dir = tempfile.gettempdir()
-        filename = f"simplex_graph_{uuid.uuid4().hex}.png"
-        graph_path = os.path.join(tmp_dir, filename)
-        
-        saved_path = generar_grafico_2d(
-            request.C,
-            request.LI,
-            request.LD,
-            titulo="Gráfico de Restricciones y Función Objetivo",
-            save_path=graph_path,
-            mark_point=mark,
-        )
-        
-        if not saved_path or not os.path.exists(saved_path):
-            raise HTTPException(status_code=500, detail="No se pudo generar el gráfico.")
-        
-        # Programar eliminación del archivo después de enviar
-        background_tasks.add_task(_cleanup_file, saved_path)
-        
-        logger.info(f"Generando gráfico como archivo: {filename}")
-        return FileResponse(saved_path, media_type="image/png", filename="graph.png")
+    try:
+        imagen = await _grafico(request, formato, dpi, ajuste)
+        logger.info(f"Generando gráfico como archivo {formato.upper()}.")
+        return _respuesta_archivo(imagen, MEDIA_TYPES_GRAFICO[formato], f"graph.{formato}", etag)
         
+    except (ServicioSaturadoError, TiempoAgotadoError) as e:
+        raise _error_ejecutor(e)
+    except ValueError as e:
+        logger.warning(f"Error de validación en /generate-graph: {e}")
+        raise HTTPException(status_code=400, detail=f"Datos inválidos: {e}")
     except Exception as e:
         logger.exception("Error interno en /generate-graph")
-        # Limpiar archivo si la respuesta falla antes de enviarse
-        if 'graph_path' in locals() and os.path.exists(graph_path):
-            _cleanup_file(graph_path)
         raise HTTPException(status_code=500, detail="Ocurrió un error al generar el gráfico.")
 
+@router.post("/graph-geometry", response_model=GraphGeometry)
+async def graph_geometry(request: SimplexRequest):
+    """
+    Devuelve la geometría del problema (solo 2D) como JSON para dibujarla en
+    el cliente: región factible (polígono), tramo visible de cada restricción,
+    recta de nivel del objetivo por el óptimo y límites de los ejes.
+
+    Es la alternativa liviana a /generate-graph: no usa Matplotlib (el cálculo
+    es O(n log n) en el número de restricciones) y la respuesta ocupa unos
+    cientos de bytes en lugar de decenas de KB.
+    """
+    if len(request.C) != 2:
+        raise HTTPException(status_code=400, detail="El gráfico solo puede generarse para problemas con exactamente 2 variables.")
+
+    try:
+        mark = await _solve_and_get_mark_point(request)
+        logger.info("Generando geometría del gráfico.")
+        return await ejecutor_render.ejecutar(
+            geometria_2d, request.C, _LI_denso(request), request.LD, request.O, mark, request.lower, request.upper
+        )
+    except (ServicioSaturadoError, TiempoAgotadoError) as e:
+        raise _error_ejecutor(e)
+    except ValueError as e:
+        logger.warning(f"Error de validación en /graph-geometry: {e}")
+        raise HTTPException(status_code=400, detail=f"Datos inválidos: {e}")
+    except Exception as e:
+        logger.exception("Error interno en /graph-geometry")
+        raise HTTPException(status_code=500, detail="Ocurrió un error al generar la geometría del gráfico.")
+
 @router.post("/generate-graph-html", response_class=HTMLResponse)
-async def generate_graph_html(request: SimplexRequest):
+async def generate_graph_html(
+    request: SimplexRequest,
+    formato: FormatoGrafico = Query("png", alias="format"),
+    dpi: int = Query(100, ge=30, le=300),
+    ajuste: AjusteGrafico = Query("tight", alias="layout"),
+):
     """
     Genera un gráfico del problema (solo 2D) y lo devuelve incrustado en HTML.
+    Admite los mismos parámetros que /generate-graph.
     """
     if len(request.C) != 2:
         raise HTTPException(status_code=400, detail="Solo se puede graficar con exactamente 2 variables.")
     
     try:
-        # Usamos el helper para obtener el punto óptimo
-        mark = _solve_and_get_mark_point(request)
-
-        # Generar gráfico como bytes en memoria
-        raw_png = generar_grafico_2d(
-            request.C,
-            request.LI,
-            request.LD,
-            titulo="Gráfico de Restricciones y Función Objetivo",
-            mark_point=mark,
-            save_path=None
-        )
-        
-        if not isinstance(raw_png, (bytes, bytearray)):
-            raise HTTPException(status_code=500, detail="Error generando imagen en memoria.")
+        imagen = await _grafico(request, formato, dpi, ajuste)
         
         # Convertir a Base64 para HTML
-        b64 = base64.b64encode(raw_png).decode("ascii")
+        b64 = base64.b64encode(imagen).decode("ascii")
         html = f"""
         <html><head><title>Gráfico Simplex</title></head>
         <body style='font-family: Arial; text-align: center; padding: 20px;'>
         <h2>Gráfico de Restricciones y Función Objetivo</h2>
-        <img src='data:image/png;base64,{b64}' alt='Grafico Simplex' style='max-width:90%;height:auto;border:1px solid #ccc;border-radius:8px;' />
+        <img src='data:{MEDIA_TYPES_GRAFICO[formato]};base64,{b64}' alt='Grafico Simplex' style='max-width:90%;height:auto;border:1px solid #ccc;border-radius:8px;' />
         </body></html>
         """
         logger.info("Generando gráfico en HTML.")
         return HTMLResponse(content=html)
         
+    except (ServicioSaturadoError, TiempoAgotadoError) as e:
+        raise _error_ejecutor(e)
+    except ValueError as e:
+        logger.warning(f"Error de validación en /generate-graph-html: {e}")
+        raise HTTPException(status_code=400, detail=f"Datos inválidos: {e}")
     except Exception as e:
         logger.exception("Error interno en /generate-graph-html")
         raise HTTPException(status_code=500, detail="Ocurrió un error al generar el gráfico en HTML.")
 
 
 @router.post("/generate-pdf")
-async def generate_pdf(request: SimplexRequest, background_tasks: BackgroundTasks):
+async def generate_pdf(request: SimplexRequest, if_none_match: Optional[str] = Header(None)):
     """
     Genera un PDF del resultado del método Simplex y lo devuelve como archivo descargable.
+    Con `If-None-Match` igual al ETag de una respuesta anterior responde 304.
     """
-    try:
-        result = resolver_simplex_tabular(
-            problem_type=request.problem_type,
-            C=request.C,
-            LI=request.LI,
-            LD=request.LD,
-            O=request.O,
-        )
+    clave = clave_canonica(request, "pdf")
+    etag = _etag(clave)
+    if _coincide_etag(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
 
-        # Crear ruta temporal para el PDF
-        tmp_dir = tempfile.gettempdir()
-        filename = f"simplex_result_{uuid.uuid4().hex}.pdf"
-        pdf_path = os.path.join(tmp_dir, filename)
-
-        # Construir el PDF
-        builder = SimplexPDFBuilder(result)
-        builder.set_empresa("Simplex Solver", subtitulo="Reporte del Método Simplex")
-        builder.build(pdf_path)
-
-        if not os.path.exists(pdf_path):
-            raise HTTPException(status_code=500, detail="No se pudo generar el PDF.")
+    try:
+        pdf = cache_resultados.obtener(clave)
+        if pdf is None:
+            result = await _resolver_cacheado(request)
 
-        # Programar limpieza
-        background_tasks.add_task(_cleanup_file, pdf_path)
+            # Construir el PDF en memoria
+            pdf, tiempos = await _ejecutar_medido(ejecutor_render, _construir_pdf, result)
+            registrar_etapas(tiempos)
+            cache_resultados.guardar(clave, pdf)
 
-        logger.info(f"PDF generado: {filename}")
-        return FileResponse(pdf_path, media_type="application/pdf", filename="simplex_resultado.pdf")
+        logger.info(f"PDF generado ({len(pdf)} bytes).")
+        return _respuesta_archivo(pdf, "application/pdf", "simplex_resultado.pdf", etag)
 
+    except (ServicioSaturadoError, TiempoAgotadoError) as e:
+        raise _error_ejecutor(e)
     except ValueError as e:
         logger.warning(f"Error de validación en /generate-pdf: {e}")
         raise HTTPException(status_code=400, detail=f"Datos inválidos: {e}")
     except Exception as e:
         logger.exception("Error interno en /generate-pdf")
-        # Limpieza si corresponde
-        if 'pdf_path' in locals() and os.path.exists(pdf_path):
-            _cleanup_file(pdf_path)
-        raise HTTPException(status_code=500, detail="Ocurrió un error al generar el PDF.")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail="Ocurrió un error al generar el PDF.")
+
+
+def _trabajo_o_404(id_trabajo: str) -> dict:
+    trabajo = gestor_trabajos.obtener(id_trabajo)
+    if trabajo is None:
+        raise HTTPException(status_code=404, detail="Trabajo no encontrado.")
+    return trabajo
+
+@router.post("/jobs", response_model=JobStatus, status_code=202)
+async def crear_trabajo(request: SimplexRequest, response: Response):
+    """
+    Encola un problema para resolverlo en segundo plano y devuelve su trabajo.
+    El estado se consulta en GET /simplex/jobs/{id} y el resultado en
+    GET /simplex/jobs/{id}/result, sin mantener abierta la conexión.
+    """
+    try:
+        trabajo = gestor_trabajos.enviar(request)
+    except ServicioSaturadoError as e:
+        raise _error_ejecutor(e)
+    logger.info(f"Trabajo {trabajo['id']} encolado.")
+    response.headers["Location"] = f"{router.prefix}/jobs/{trabajo['id']}"
+    return trabajo
+
+@router.get("/jobs/{id_trabajo}", response_model=JobStatus)
+async def estado_trabajo(id_trabajo: str):
+    """
+    Devuelve el estado de un trabajo ('pendiente', 'en_curso', 'completado',
+    'fallido' o 'cancelado') y su progreso: etapa, iteración y objetivo actual.
+    """
+    return _trabajo_o_404(id_trabajo)
+
+@router.get("/jobs/{id_trabajo}/result", response_model=SimplexResponse)
+async def resultado_trabajo(id_trabajo: str):
+    """
+    Devuelve el resultado de un trabajo completado (mismo formato que
+    /solve-tabular). Responde 409 si el trabajo no terminó, falló o se canceló.
+    """
+    trabajo = _trabajo_o_404(id_trabajo)
+    if trabajo["status"] != "completado":
+        detalle = trabajo["error"] or f"El trabajo está {trabajo['status'].replace('_', ' ')}."
+        raise HTTPException(status_code=409, detail=detalle)
+    return trabajo["resultado"]
+
+@router.delete("/jobs/{id_trabajo}", response_model=JobStatus)
+async def cancelar_trabajo(id_trabajo: str):
+    """
+    Cancela un trabajo: si está pendiente no llega a ejecutarse y si está en
+    curso se interrumpe en su próxima iteración (el estado pasa a 'cancelado'
+    cuando se detiene). Responde 409 si el trabajo ya había terminado.
+    """
+    trabajo = _trabajo_o_404(id_trabajo)
+    if trabajo["status"] in ("completado", "fallido", "cancelado"):
+        raise HTTPException(status_code=409, detail=f"El trabajo ya terminó ({trabajo['status']}).")
+    logger.info(f"Cancelando trabajo {id_trabajo}.")
+    return gestor_trabajos.cancelar(id_trabajo)
+
+@router.get("/cache-stats")
+async def cache_stats():
+    """
+    Devuelve las métricas de la caché de resultados (aciertos, fallos, desalojos y tamaño).
+    """
+    return cache_resultados.estadisticas()
@@ -1,17 +1,88 @@
-from pydantic import BaseModel
-from typing import List, Literal, Dict, Any, Optional
+from pydantic import BaseModel, Field, model_validator
+from typing import List, Literal, Dict, Any, Optional, Tuple
 
 # --- Modelos de Request ---
 
+class SparseMatrix(BaseModel):
+    """
+    Matriz de restricciones en formato disperso.
+
+    - format='coo': tripletas `row`, `col`, `data`.
+    - format='csr': punteros por fila `indptr`, columnas `indices` y valores `data`.
+    """
+    format: Literal['coo', 'csr']
+    shape: Tuple[int, int]
+    data: List[float]
+    row: Optional[List[int]] = None
+    col: Optional[List[int]] = None
+    indptr: Optional[List[int]] = None
+    indices: Optional[List[int]] = None
+
+    @model_validator(mode="after")
+    def _validar_campos(self):
+        if self.format == 'coo' and (self.row is None or self.col is None):
+            raise ValueError("El formato 'coo' requiere 'row' y 'col'.")
+        if self.format == 'csr' and (self.indptr is None or self.indices is None):
+            raise ValueError("El formato 'csr' requiere 'indptr' e 'indices'.")
+        return self
+
+class Tolerances(BaseModel):
+    """
+    Tolerancias numéricas del solver (se aplican sobre el modelo escalado).
+    """
+    pivot: float = Field(1e-9, gt=0, lt=1)
+    optimality: float = Field(1e-9, gt=0, lt=1)
+    feasibility: float = Field(1e-9, gt=0, lt=1)
+
 class SimplexRequest(BaseModel):
     """
     Define la entrada para cualquier endpoint del solver Simplex.
+
+    La matriz de restricciones se envía densa en `LI` o dispersa en `LI_sparse`
+    (exactamente una de las dos).
     """
     problem_type: Literal['minimization', 'maximization']
     C: List[float]
-    LI: List[List[float]]
+    LI: Optional[List[List[float]]] = None
+    LI_sparse: Optional[SparseMatrix] = None
     LD: List[float]
     O: List[Literal['<=', '>=', '=']]
+    # Motor de resolución: tableau completo, simplex revisado con base factorizada,
+    # simplex dual (sobre la misma base factorizada) o punto interior (barrera).
+    # Si se omite, se usa 'tabular' para LI denso y 'revised' para LI_sparse.
+    method: Optional[Literal['tabular', 'revised', 'dual', 'barrier']] = None
+    # Tablas a devolver: todas, una cada `history_every`, solo la final o ninguna.
+    # Si se omite: 'all' para el método tabular y 'none' para el revisado.
+    history: Optional[Literal['none', 'final', 'all', 'every_k']] = None
+    history_every: int = Field(1, ge=1)
+    # Regla de selección de la variable entrante (por defecto, Dantzig)
+    pricing: Optional[Literal['dantzig', 'bland', 'steepest_edge', 'devex', 'partial']] = None
+    # Límite de pivoteos sumando ambas fases. Si se omite: max(50, 10·(m+n))
+    max_iterations: Optional[int] = Field(None, ge=1)
+    # Variables básicas (campo `base` de una respuesta anterior) para arrancar en caliente
+    basis: Optional[List[str]] = None
+    # Reducir el modelo antes de resolverlo (filas vacías, duplicadas y singleton,
+    # variables fijas, filas forzantes y columnas dominadas)
+    presolve: bool = False
+    # Escalado de filas y columnas de LI. Si se omite: 'geometric' en el revisado
+    # y el dual; en el tabular solo si los coeficientes abarcan más de 1e4
+    scaling: Optional[Literal['none', 'geometric', 'equilibrate']] = None
+    # Test de razón mínima. Si se omite: 'textbook' en el tabular y 'harris' en el revisado y el dual
+    ratio_test: Optional[Literal['textbook', 'harris']] = None
+    tolerances: Optional[Tolerances] = None
+    # Solo con method='barrier': llevar la solución interior a una base (vértice)
+    crossover: bool = True
+    # Cotas de las variables de decisión (lower_j <= x_j <= upper_j); null en una
+    # posición = sin cota. Si se omiten: lower = 0 y upper sin cota. Solo en el
+    # método tabular (también con presolve), que las maneja sin agregar filas
+    lower: Optional[List[Optional[float]]] = None
+    upper: Optional[List[Optional[float]]] = None
+
+    @model_validator(mode="after")
+    def _validar_matriz(self):
+        if (self.LI is None) == (self.LI_sparse is None):
+            raise ValueError("Debe indicarse exactamente una de 'LI' o 'LI_sparse'.")
+        return self
     
     # Esto agrega un ejemplo en la documentación /docs
     model_config = {
@@ -28,6 +99,46 @@ class SimplexRequest(BaseModel):
         }
     }
 
+class SimplexBatchRequest(BaseModel):
+    """
+    Define la entrada del endpoint /solve-batch: una lista de problemas independientes.
+    """
+    problems: List[SimplexRequest] = Field(..., min_length=1, max_length=50000)
+
+class Scenario(BaseModel):
+    """
+    Un escenario de /solve-scenarios: reemplaza los costos y/o el lado derecho
+    del problema base (los que se omiten se mantienen).
+    """
+    C: Optional[List[float]] = None
+    LD: Optional[List[float]] = None
+
+class SimplexScenariosRequest(BaseModel):
+    """
+    Define la entrada del endpoint /solve-scenarios: un modelo (LI y O fijos)
+    y una lista de escenarios de C y/o LD que se resuelven en orden, cada uno
+    desde la base óptima del anterior (Simplex Revisado y Dual).
+    """
+    problem_type: Literal['minimization', 'maximization']
+    C: List[float]
+    LI: Optional[List[List[float]]] = None
+    LI_sparse: Optional[SparseMatrix] = None
+    LD: List[float]
+    O: List[Literal['<=', '>=', '=']]
+    scenarios: List[Scenario] = Field(..., min_length=1, max_length=10000)
+    pricing: Optional[Literal['dantzig', 'bland', 'steepest_edge', 'devex', 'partial']] = None
+    # Límite de pivoteos por escenario
+    max_iterations: Optional[int] = Field(None, ge=1)
+    # Si se omite: 'geometric'
+    scaling: Optional[Literal['none', 'geometric', 'equilibrate']] = None
+    tolerances: Optional[Tolerances] = None
+
+    @model_validator(mode="after")
+    def _validar_matriz(self):
+        if (self.LI is None) == (self.LI_sparse is None):
+            raise ValueError("Debe indicarse exactamente una de 'LI' o 'LI_sparse'.")
+        return self
+
 # --- Modelos de Response ---
 # Estos modelos aseguran que la salida de la API sea consistente
 # y esté bien documentada.
@@ -41,12 +152,34 @@ class Tableau(BaseModel):
     filas: List[List[Any]]
     fila_obj: List[Any]
 
+class SensitivityRange(BaseModel):
+    """
+    Intervalo de un dato (LD o costo) en el que la base óptima no cambia.
+    `minimo`/`maximo` son None si no hay límite en ese sentido.
+    """
+    actual: float
+    minimo: Optional[float] = None
+    maximo: Optional[float] = None
+
+class SensitivityAnalysis(BaseModel):
+    """
+    Análisis de sensibilidad de la base óptima (solo método tabular, sin presolve).
+    Restricciones indexadas como 'R1', 'R2', ... y variables como 'x1', 'x2', ...
+    """
+    # Precio sombra: variación de Z por unidad de LD de cada restricción
+    duales: Dict[str, float]
+    # C_j - yᵀA_j de cada variable de decisión (0 si es básica)
+    costos_reducidos: Dict[str, float]
+    rangos_ld: Dict[str, SensitivityRange]
+    rangos_costos: Dict[str, SensitivityRange]
+
 class SimplexSolution(BaseModel):
     """
     Define la estructura de la solución final óptima.
     """
     variables: Dict[str, float]
     valor_optimo: float
+    sensibilidad: Optional[SensitivityAnalysis] = None
 
 class SimplexResponse(BaseModel):
     """
@@ -54,4 +187,98 @@ class SimplexResponse(BaseModel):
     """
     status: Literal["optimo", "infactible", "no acotado", "max_iterations_reached"]
     tablas: List[Tableau]
-    solucion: Optional[SimplexSolution] = None
\ No newline at end of file
+    solucion: Optional[SimplexSolution] = None
+    iteraciones: Optional[int] = None
+    # Variables básicas finales por fila (reutilizable como `basis` en otro request)
+    base: Optional[List[str]] = None
+    # Si se envió `basis`: indica si se pudo arrancar desde ella
+    base_reutilizada: Optional[bool] = None
+    # Si se pidió `presolve`: dimensiones del modelo original y del reducido
+    presolve: Optional[Dict[str, int]] = None
+
+class SimplexBatchItem(BaseModel):
+    """
+    Resultado de un problema dentro de un lote. `index` es su posición en el request.
+    """
+    index: int
+    resultado: Optional[SimplexResponse] = None
+    error: Optional[str] = None
+
+class SimplexBatchResponse(BaseModel):
+    """
+    Define la respuesta completa del endpoint /solve-batch (en el orden del request).
+    """
+    resultados: List[SimplexBatchItem]
+
+class SimplexScenariosResponse(BaseModel):
+    """
+    Define la respuesta del endpoint /solve-scenarios: un resultado por
+    escenario, en el orden del request. `base_reutilizada` indica si el
+    escenario se reoptimizó desde la base del anterior.
+    """
+    resultados: List[SimplexResponse]
+
+class JobProgress(BaseModel):
+    """
+    Avance de un trabajo: etapa ('fase_1', 'fase_2', 'dual' o 'barrera'),
+    pivoteos (o iteraciones de barrera) realizados y objetivo actual.
+    """
+    etapa: Optional[str] = None
+    iteracion: int
+    objetivo: Optional[float] = None
+
+class JobStatus(BaseModel):
+    """
+    Estado de un trabajo de /simplex/jobs (sin el resultado, que se pide aparte).
+    Las marcas de tiempo son segundos desde epoch.
+    """
+    id: str
+    status: Literal["pendiente", "en_curso", "completado", "fallido", "cancelado"]
+    progreso: Optional[JobProgress] = None
+    error: Optional[str] = None
+    creado: float
+    iniciado: Optional[float] = None
+    terminado: Optional[float] = None
+
+class GraphLimits(BaseModel):
+    """
+    Rango visible de cada eje del gráfico 2D.
+    """
+    x: List[float]
+    y: List[float]
+
+class FeasibleRegion(BaseModel):
+    """
+    Región factible visible como polígono convexo (vértices en sentido
+    antihorario; vacía si el problema es infactible).
+    """
+    vertices: List[List[float]]
+    acotada: bool
+
+class GraphConstraint(BaseModel):
+    """
+    Una restricción y su tramo visible (None si no cruza el gráfico).
+    """
+    coeficientes: List[float]
+    operador: Literal["<=", ">=", "="]
+    ld: float
+    segmento: Optional[List[List[float]]] = None
+
+class GraphObjective(BaseModel):
+    """
+    Recta de nivel C·x = valor de la función objetivo (por el óptimo si existe).
+    """
+    coeficientes: List[float]
+    valor: float
+    segmento: Optional[List[List[float]]] = None
+
+class GraphGeometry(BaseModel):
+    """
+    Define la respuesta del endpoint /graph-geometry: lo necesario para dibujar
+    el gráfico 2D en el cliente.
+    """
+    limites: GraphLimits
+    region: FeasibleRegion
+    restricciones: List[GraphConstraint]
+    objetivo: GraphObjective
+    optimo: Optional[List[float]] = None
@@ -1,4 +1,4 @@
-from typing import List, Dict, Any, Optional
+from typing import Dict, Any, Iterable, Iterator, Optional
 from reportlab.lib.pagesizes import letter
 from reportlab.platypus import (
     SimpleDocTemplate,
@@ -6,12 +6,12 @@ from reportlab.platypus import (
     Spacer,
     Image,
 )
-from . import COLOR_SECUNDARIO_HEX, COLOR_PRIMARIO_HEX, SimplexStyles, TableBuilder
-from schemas import SimplexSolution, Tableau, SimplexResponse
+from . import COLOR_PRIMARIO_HEX, SimplexStyles, TableBuilder
+from services.metrics_service import etapa
 
 class SimplexPDFBuilder:
     """
-    Genera un PDF completo a partir de un SimplexResponse.
+    Genera un PDF completo a partir del resultado del solver (dict con la forma de SimplexResponse).
     """
 
     def __init__(self, resultado: Dict[str, Any]):
@@ -48,130 +48,149 @@ class SimplexPDFBuilder:
         if "status" not in self._raw:
             raise ValueError("El resultado no contiene 'status'.")
 
-    # Conversión de Dict utilizando schemas
-    def _parse_resultado(self) -> SimplexResponse:
-        self._validate()
+    def build(self, destino: Any = "resultado_simplex.pdf", tablas: Optional[Iterable[Dict[str, Any]]] = None):
+        """
+        Genera el PDF en `destino` (ruta o archivo binario abierto).
 
-        status = self._raw.get("status")
-
-        # Solución
-        solucion = None
-        raw_sol = self._raw.get("solucion")
-
-        if raw_sol:
-            solucion = SimplexSolution(
-                variables=raw_sol.get("variables", {}),
-                valor_optimo=raw_sol.get("valor_optimo"),
-            )
-
-        # Tablas
-        tablas = []
-        for t in self._raw.get("tablas", []):
-            tablas.append(
-                Tableau(
-                    titulo=t.get("titulo", ""),
-                    headers=t.get("headers", []),
-                    filas=t.get("filas", []),
-                    fila_obj=t.get("fila_obj", []),
-                )
-            )
-
-        return SimplexResponse(status=status, solucion=solucion, tablas=tablas)
-
-
-    def build(self, nombre_pdf: str = "resultado_simplex.pdf"):
-        resultado = self._parse_resultado()
+        Las tablas intermedias se toman de `tablas` (cualquier iterable, por
+        ejemplo un generador) o de resultado['tablas'], y se convierten en
+        flowables a medida que ReportLab llena las páginas: nunca se arma la
+        historia completa en memoria.
+        """
+        with etapa("pdf_validacion"):
+            self._validate()
 
         doc = SimpleDocTemplate(
-            nombre_pdf,
+            destino,
             pagesize=self.page_size,
             **self.margins,
         )
+        if tablas is None:
+            tablas = self._raw.get("tablas") or []
+
+        story = _HistoriaPerezosa(self._historia(tablas, doc.width))
 
-        story: List[Any] = []
+        # Generar (las tablas se arman dentro del render, a demanda)
+        with etapa("pdf_render"):
+            doc.build(story)
 
+    def _historia(self, tablas: Iterable[Dict[str, Any]], ancho: float) -> Iterator[Any]:
         # Header
-        self._add_header(story)
+        yield from self._header()
 
         # Resultado principal
-        self._add_result_section(story, resultado)
+        yield from self._result_section()
 
         # Tablas intermedias
-        self._add_intermediate_tables(story, resultado.tablas)
-
-        # Generar
-        doc.build(story)
+        yield from self._intermediate_tables(tablas, ancho)
 
     # Secciones del informe final
     
-    def _add_header(self, story: List[Any]):
+    def _header(self) -> Iterator[Any]:
         """Encabezado sin portada, todo en la primera página."""
         if self.logo_path:
             try:
                 img = Image(self.logo_path, width=150, height=70)
-                story.append(img)
-                story.append(Spacer(1, 8))
+                yield img
+                yield Spacer(1, 8)
             except Exception:
                 print("No se pudo cargar el logo.")
 
-        story.append(Paragraph(self.empresa, self.styles.titulo_empresa))
-        story.append(Paragraph(self.subtitulo, self.styles.subtitulo))
-        story.append(Spacer(1, 6))
+        yield Paragraph(self.empresa, self.styles.titulo_empresa)
+        yield Paragraph(self.subtitulo, self.styles.subtitulo)
+        yield Spacer(1, 6)
 
-    def _add_result_section(self, story: List[Any], resultado: SimplexResponse):
+    def _result_section(self) -> Iterator[Any]:
         """Muestra lo primero: estado, valor óptimo, variables."""
-        story.append(Paragraph("Resultado Final", self.styles.h2))
-        story.append(Spacer(1, 6))
+        status = str(self._raw.get("status"))
+        yield Paragraph("Resultado Final", self.styles.h2)
+        yield Spacer(1, 6)
 
-        story.append(Paragraph(f"<b>Estado del problema:</b> {resultado.status}", self.styles.texto))
-        story.append(Spacer(1, 6))
+        yield Paragraph(f"<b>Estado del problema:</b> {status}", self.styles.texto)
+        yield Spacer(1, 6)
 
-        if resultado.status.lower() == "optimo":
-            sol = resultado.solucion
+        if status.lower() == "optimo":
+            sol = self._raw.get("solucion")
 
-            if sol is not None:
-                story.append(
-                    Paragraph(f"<b>Valor Óptimo Z:</b> {sol.valor_optimo}", self.styles.texto)
-                )
-                story.append(Spacer(1, 8))
+            if sol:
+                yield Paragraph(f"<b>Valor Óptimo Z:</b> {sol.get('valor_optimo')}", self.styles.texto)
+                yield Spacer(1, 8)
 
                 # Variables
-                story.append(Paragraph("<b>Variables de decisión</b>:", self.styles.texto))
+                yield Paragraph("<b>Variables de decisión</b>:", self.styles.texto)
 
                 data_vars = [["Variable", "Valor"]]
-                for var, val in sorted(sol.variables.items()):
+                for var, val in sorted(sol.get("variables", {}).items()):
                     data_vars.append([var, str(val)])
 
-                tabla_vars = TableBuilder.build_table(data_vars, header_color=COLOR_PRIMARIO_HEX)
-                story.append(tabla_vars)
-
-                story.append(Spacer(1, 12))
+                yield TableBuilder.build_table(data_vars, header_color=COLOR_PRIMARIO_HEX)
+                yield Spacer(1, 12)
 
         else:
-            story.append(Paragraph("No se encontró una solución óptima.", self.styles.texto))
-            story.append(Spacer(1, 8))
-
-    def _add_intermediate_tables(self, story: List[Any], tablas: List[Tableau]):
-        """Agrega las tablas de todas las iteraciones."""
-        if not tablas:
-            return
-
-        story.append(Paragraph("Tablas Intermedias del Proceso Simplex", self.styles.h2))
-        story.append(Spacer(1, 8))
-
+            yield Paragraph("No se encontró una solución óptima.", self.styles.texto)
+            yield Spacer(1, 8)
+
+    def _intermediate_tables(self, tablas: Iterable[Dict[str, Any]], ancho: float) -> Iterator[Any]:
+        """
+        Agrega las tablas de todas las iteraciones, una a una. Las tablas más
+        anchas que la página se parten en grupos de columnas que repiten la
+        columna de la base.
+        """
+        primera = True
         for t in tablas:
-            story.append(Paragraph(t.titulo, self.styles.texto))
-            story.append(Spacer(1, 5))
-
-            # Construcción de datos
-            data = [t.headers]
-
-            for fila in t.filas:
-                data.append([str(x) for x in fila])
-
-            if t.fila_obj:
-                data.append([str(x) for x in t.fila_obj])
+            if primera:
+                yield Paragraph("Tablas Intermedias del Proceso Simplex", self.styles.h2)
+                yield Spacer(1, 8)
+                primera = False
+
+            with etapa("pdf_tablas"):
+                # Construcción de datos
+                headers = [str(h) for h in t.get("headers", [])]
+                data = [headers]
+
+                for fila in t.get("filas", []):
+                    data.append([str(x) for x in fila])
+
+                if t.get("fila_obj"):
+                    data.append([str(x) for x in t["fila_obj"]])
+
+                anchos = TableBuilder.anchos_columnas(data)
+                grupos = TableBuilder.partir_columnas(anchos, ancho) if headers else [[]]
+
+            titulo = t.get("titulo", "")
+            for columnas in grupos:
+                if len(grupos) > 1:
+                    subtitulo = f"{titulo} (columnas {headers[columnas[1]]} a {headers[columnas[-1]]})"
+                else:
+                    subtitulo = titulo
+                yield Paragraph(subtitulo, self.styles.texto)
+                yield Spacer(1, 5)
+
+                if len(grupos) > 1:
+                    parte = [[fila[j] for j in columnas] for fila in data]
+                    yield TableBuilder.build_table(parte, col_widths=[anchos[j] for j in columnas])
+                else:
+                    yield TableBuilder.build_table(data, col_widths=anchos)
+                yield Spacer(1, 12)
+
+
+class _HistoriaPerezosa(list):
+    """
+    Lista de flowables que se rellena desde un iterador a medida que
+    `doc.build` la consume (ReportLab la recorre con len() y del [0]).
+    Retiene unos pocos flowables por delante para keepWithNext.
+    """
 
-            tabla = TableBuilder.build_table(data, header_color=COLOR_SECUNDARIO_HEX)
-            story.append(tabla)
-            story.append(Spacer(1, 12))
+    def __init__(self, flowables: Iterator[Any], adelanto: int = 8):
+        super().__init__()
+        self._pendientes = flowables
+        self._adelanto = adelanto
+
+    def __len__(self) -> int:
+        while self._pendientes is not None and super().__len__() < self._adelanto:
+            siguiente = next(self._pendientes, None)
+            if siguiente is None:
+                self._pendientes = None
+            else:
+                self.append(siguiente)
+        return super().__len__()
@@ -1,32 +1,74 @@
-from typing import List,  Any
+from functools import lru_cache
+from typing import List, Any, Optional, Tuple
 from reportlab.lib import colors
+from reportlab.pdfbase.pdfmetrics import stringWidth
 from reportlab.platypus import (
     Table,
     TableStyle
 )
 from . import COLOR_SECUNDARIO_HEX, ZEBRA
 
+# Fuente y relleno horizontal de las celdas (los valores por defecto de Table)
+FUENTE_CELDA = ("Helvetica", 10)
+FUENTE_ENCABEZADO = ("Helvetica-Bold", 10)
+RELLENO_CELDA = 12
+
+
+@lru_cache(maxsize=None)
+def _estilo_tabla(header_color: str, zebra: Tuple = tuple(ZEBRA)) -> TableStyle:
+    """Estilo compartido por todas las tablas del mismo color (se crea una vez)."""
+    return TableStyle(
+        [
+            ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor(header_color)),
+            ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
+            ("ALIGN", (0, 0), (-1, -1), "CENTER"),
+            ("GRID", (0, 0), (-1, -1), 0.5, colors.black),
+            ("FONTNAME", (0, 0), (-1, 0), FUENTE_ENCABEZADO[0]),
+            ("ROWBACKGROUNDS", (0, 1), (-1, -1), list(zebra)),
+        ]
+    )
+
+
 class TableBuilder:
     @staticmethod
     def build_table(
         data: List[List[Any]],
         header_color: str = COLOR_SECUNDARIO_HEX,
         zebra: List = ZEBRA,
+        col_widths: Optional[List[float]] = None,
     ) -> Table:
 
-        tabla = Table(data)
-
-        tabla.setStyle(
-            TableStyle(
-                [
-                    ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor(header_color)),
-                    ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
-                    ("ALIGN", (0, 0), (-1, -1), "CENTER"),
-                    ("GRID", (0, 0), (-1, -1), 0.5, colors.black),
-                    ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                    ("ROWBACKGROUNDS", (0, 1), (-1, -1), zebra),
-                ]
-            )
-        )
-
-        return tabla
\ No newline at end of file
+        # Con anchos dados, Table no mide cada celda otra vez
+        tabla = Table(data, colWidths=col_widths, repeatRows=1)
+        tabla.setStyle(_estilo_tabla(header_color, tuple(zebra)))
+        return tabla
+
+    @staticmethod
+    def anchos_columnas(data: List[List[str]]) -> List[float]:
+        """Ancho necesario por columna (texto más ancho + relleno), en puntos."""
+        anchos = [stringWidth(str(h), *FUENTE_ENCABEZADO) for h in data[0]]
+        for fila in data[1:]:
+            for j, celda in enumerate(fila):
+                ancho = stringWidth(celda, *FUENTE_CELDA)
+                if ancho > anchos[j]:
+                    anchos[j] = ancho
+        return [a + RELLENO_CELDA for a in anchos]
+
+    @staticmethod
+    def partir_columnas(anchos: List[float], ancho_disponible: float) -> List[List[int]]:
+        """
+        Reparte las columnas en grupos que entran en `ancho_disponible`.
+        La primera columna (la base) se repite en cada grupo; un grupo tiene
+        al menos una columna más aunque no entre.
+        """
+        grupos: List[List[int]] = []
+        actual: List[int] = [0]
+        ancho = anchos[0]
+        for j in range(1, len(anchos)):
+            if len(actual) > 1 and ancho + anchos[j] > ancho_disponible:
+                grupos.append(actual)
+                actual, ancho = [0], anchos[0]
+            actual.append(j)
+            ancho += anchos[j]
+        grupos.append(actual)
+        return grupos
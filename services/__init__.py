@@ -1,7 +1,17 @@
-from .simplex_service import resolver_simplex_tabular
+from .simplex_service import (
+    resolver_simplex_tabular,
+    resolver_desde_request,
+    resolver_lote,
+    iterar_simplex_tabular,
+    iterar_desde_request,
+)
 from .graph_service import generar_grafico_2d
 
 __all__ = [
     "resolver_simplex_tabular",
+    "resolver_desde_request",
+    "resolver_lote",
+    "iterar_simplex_tabular",
+    "iterar_desde_request",
     "generar_grafico_2d",
 ]
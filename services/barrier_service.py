@@ -0,0 +1,289 @@
+import logging
+import numpy as np
+from typing import Any, Callable, Dict, List, Literal, Optional, Tuple, Union
+
+from .pricing import ReglaPrecios
+from .revised_simplex_service import ProblemaEstandar, SimplexRevisado, _solucion_desde_valores
+from .scaling import ScalingMethod
+from .sparse_matrix import Matriz
+from .tableau_history import PoliticaHistorial
+
+logger = logging.getLogger(__name__)
+
+# Límite de iteraciones del método de barrera si el request no indica uno
+ITERACIONES_BARRERA = 100
+# Tolerancia relativa de factibilidad primal, dual y de brecha de dualidad
+TOL_BARRERA = 1e-8
+# Fracción del paso máximo hasta la frontera del ortante positivo
+FRACCION_PASO = 0.995
+# Norma a partir de la cual se considera que las iteraciones divergen
+LIMITE_DIVERGENCIA = 1e12
+# Filas por bloque en las sustituciones triangulares y el crossover
+TAM_BLOQUE = 128
+
+
+def _resolver_triangular(L: np.ndarray, b: np.ndarray, traspuesta: bool = False) -> np.ndarray:
+    """
+    Resuelve L·x = b (o Lᵀ·x = b) con L triangular inferior, por bloques:
+    cada bloque diagonal se resuelve aparte y el resto se actualiza con un
+    producto matriz-vector, así el costo es O(m²) y no el de una factorización.
+    """
+    m = L.shape[0]
+    x = np.array(b, dtype=float)
+    bloques = range(0, m, TAM_BLOQUE)
+    if not traspuesta:
+        for ini in bloques:
+            fin = min(ini + TAM_BLOQUE, m)
+            x[ini:fin] = np.linalg.solve(L[ini:fin, ini:fin], x[ini:fin] - L[ini:fin, :ini] @ x[:ini])
+    else:
+        for ini in reversed(bloques):
+            fin = min(ini + TAM_BLOQUE, m)
+            x[ini:fin] = np.linalg.solve(L[ini:fin, ini:fin].T, x[ini:fin] - L[fin:, ini:fin].T @ x[fin:])
+    return x
+
+
+def _cholesky(M: np.ndarray) -> np.ndarray:
+    """
+    Factor de Cholesky de la matriz de ecuaciones normales. Cerca del óptimo (o
+    con filas redundantes) puede perder la definición positiva: se regulariza
+    sumando un múltiplo creciente de la identidad.
+    """
+    escala = max(float(np.trace(M)) / max(M.shape[0], 1), 1.0)
+    regularizacion = 0.0
+    while True:
+        try:
+            return np.linalg.cholesky(M + regularizacion * escala * np.eye(M.shape[0]))
+        except np.linalg.LinAlgError:
+            regularizacion = 1e-12 if regularizacion == 0.0 else regularizacion * 100
+            if regularizacion > 1e-2:
+                raise
+
+
+class _MatrizBarrera:
+    """
+    Matriz [A | holguras y excesos] del problema estándar sin artificiales:
+    min cᵀx s.a. Ax = b, x >= 0. Las ecuaciones normales A·D·Aᵀ son densas de
+    m×m aunque A sea dispersa, por lo que A se densifica una sola vez.
+    """
+
+    def __init__(self, problema: ProblemaEstandar):
+        self.m, self.n = problema.m, problema.n
+        self.A = problema.A.toarray()
+        # Columnas del problema estándar que usa la barrera (sin artificiales)
+        self.columnas = np.flatnonzero(~problema.es_artificial)
+        logicas = self.columnas[self.columnas >= self.n] - self.n
+        self.filas = problema.filas_logicas[logicas]
+        self.signos = problema.signos_logicos[logicas]
+
+    def producto(self, x: np.ndarray) -> np.ndarray:
+        return self.A @ x[:self.n] + np.bincount(self.filas, weights=self.signos * x[self.n:], minlength=self.m)
+
+    def producto_t(self, y: np.ndarray) -> np.ndarray:
+        return np.concatenate([self.A.T @ y, self.signos * y[self.filas]])
+
+    def normal(self, d: np.ndarray) -> np.ndarray:
+        """A·diag(d)·Aᵀ (las columnas lógicas solo suman a la diagonal)."""
+        M = (self.A * d[:self.n]) @ self.A.T
+        M[np.diag_indices(self.m)] += np.bincount(self.filas, weights=d[self.n:], minlength=self.m)
+        return M
+
+
+def _paso_maximo(v: np.ndarray, dv: np.ndarray) -> float:
+    """Mayor α tal que v + α·dv >= 0 (infinito si dv >= 0)."""
+    negativos = dv < 0
+    if not np.any(negativos):
+        return np.inf
+    return float(np.min(-v[negativos] / dv[negativos]))
+
+
+def _mehrotra(
+    A: _MatrizBarrera,
+    b: np.ndarray,
+    c: np.ndarray,
+    max_iteraciones: int,
+    tol: float = TOL_BARRERA,
+    informar: Optional[Callable[[int, float], None]] = None,
+) -> Tuple[str, np.ndarray, np.ndarray, np.ndarray, int]:
+    """
+    Método primal-dual de punto interior con predictor-corrector de Mehrotra.
+    `informar`, si se da, recibe la iteración y el objetivo primal c·x de cada una.
+    Retorna (status, x, y, s, iteraciones) con status 'optimo',
+    'max_iterations_reached' o 'sin_convergencia'. Lo último ocurre cuando el
+    problema primal o el dual no tienen solución factible: las iteraciones
+    divergen, o la complementariedad μ se anula sin que lo hagan los residuos.
+    Distinguir cuál de los dos es infactible sin una formulación homogénea no
+    es confiable, así que lo decide el simplex.
+    """
+    N = len(c)
+    norma_b, norma_c = 1.0 + np.linalg.norm(b), 1.0 + np.linalg.norm(c)
+
+    # Punto inicial de Mehrotra: mínimos cuadrados y corrimiento al interior
+    L = _cholesky(A.normal(np.ones(N)))
+    resolver = lambda r: _resolver_triangular(L, _resolver_triangular(L, r), traspuesta=True)
+    x = A.producto_t(resolver(b))
+    y = resolver(A.producto(c))
+    s = c - A.producto_t(y)
+    x += max(-1.5 * x.min(initial=0.0), 0.0)
+    s += max(-1.5 * s.min(initial=0.0), 0.0)
+    xs = float(x @ s)
+    x += 0.5 * xs / max(s.sum(), 1e-12) + 1e-8
+    s += 0.5 * xs / max(x.sum(), 1e-12) + 1e-8
+
+    for iteracion in range(max_iteraciones + 1):
+        rb = A.producto(x) - b
+        rc = A.producto_t(y) + s - c
+        mu = float(x @ s) / N
+        primal, dual = float(c @ x), float(b @ y)
+        if informar is not None:
+            informar(iteracion, primal)
+
+        if (np.linalg.norm(rb) / norma_b < tol and np.linalg.norm(rc) / norma_c < tol
+                and abs(primal - dual) / (1.0 + abs(primal)) < tol):
+            return "optimo", x, y, s, iteracion
+        if np.abs(x).max() > LIMITE_DIVERGENCIA * norma_b or np.abs(y).max() > LIMITE_DIVERGENCIA * norma_c:
+            return "sin_convergencia", x, y, s, iteracion
+        if mu < tol * tol * (1.0 + abs(primal)):
+            return "sin_convergencia", x, y, s, iteracion
+        if iteracion == max_iteraciones:
+            break
+
+        d = x / s
+        L = _cholesky(A.normal(d))
+
+        def direccion(r_xs: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+            # Sistema reducido: (A·D·Aᵀ)·dy = -rb + A·(r_xs/s - D·rc)
+            rhs = -rb + A.producto(r_xs / s - d * rc)
+            dy = _resolver_triangular(L, _resolver_triangular(L, rhs), traspuesta=True)
+            aty = A.producto_t(dy)
+            return -r_xs / s + d * (rc + aty), dy, -rc - aty
+
+        # Predictor (dirección afín) y parámetro de centrado σ = (μ_af / μ)³
+        dx_af, _, ds_af = direccion(x * s)
+        alfa_p, alfa_d = min(1.0, _paso_maximo(x, dx_af)), min(1.0, _paso_maximo(s, ds_af))
+        mu_af = float((x + alfa_p * dx_af) @ (s + alfa_d * ds_af)) / N
+        sigma = (mu_af / mu) ** 3
+
+        # Corrector: término de segundo orden y centrado
+        dx, dy, ds = direccion(x * s + dx_af * ds_af - sigma * mu)
+        alfa_p = min(1.0, FRACCION_PASO * _paso_maximo(x, dx))
+        alfa_d = min(1.0, FRACCION_PASO * _paso_maximo(s, ds))
+        x += alfa_p * dx
+        y += alfa_d * dy
+        s += alfa_d * ds
+
+    return "max_iterations_reached", x, y, s, max_iteraciones
+
+
+def _base_desde_punto(problema: ProblemaEstandar, A: _MatrizBarrera, x: np.ndarray, s: np.ndarray) -> List[int]:
+    """
+    Crossover: elige una base a partir de la solución de barrera. Recorre las
+    columnas de mayor a menor x_j/s_j (las que la barrera deja positivas primero)
+    y acepta las linealmente independientes de las ya elegidas (Gram-Schmidt por
+    bloques, reortogonalizado) hasta completar m. Las artificiales van al final:
+    solo entran en filas redundantes, donde quedan en nivel cero.
+    """
+    m = problema.m
+    orden = A.columnas[np.argsort(-(x / s), kind='stable')]
+    candidatas = np.concatenate([orden, np.flatnonzero(problema.es_artificial)])
+
+    Q = np.empty((m, m))
+    elegidas: List[int] = []
+    for ini in range(0, len(candidatas), TAM_BLOQUE):
+        bloque = candidatas[ini:ini + TAM_BLOQUE]
+        V = np.column_stack([problema.columna(j) for j in bloque])
+        normas = np.linalg.norm(V, axis=0)
+        r = len(elegidas)
+        for _ in range(2):
+            V -= Q[:, :r] @ (Q[:, :r].T @ V)
+        for k, j in enumerate(bloque):
+            v = V[:, k] - Q[:, r:len(elegidas)] @ (Q[:, r:len(elegidas)].T @ V[:, k])
+            norma = np.linalg.norm(v)
+            if normas[k] > 0 and norma > 1e-7 * normas[k]:
+                Q[:, len(elegidas)] = v / norma
+                elegidas.append(int(j))
+                if len(elegidas) == m:
+                    return elegidas
+    return elegidas
+
+
+def resolver_barrera(
+    problem_type: Literal['minimization', 'maximization'],
+    C: List[float],
+    LI: Union[List[List[float]], Matriz],
+    LD: List[float],
+    O: List[Literal["<=", ">=", "="]],
+    crossover: bool = True,
+    historial: Optional[PoliticaHistorial] = None,
+    regla: Optional[ReglaPrecios] = None,
+    max_iteraciones: Optional[int] = None,
+    escalado: ScalingMethod = 'geometric',
+) -> Dict[str, Any]:
+    """
+    Resuelve un problema de Programación Lineal con un método de punto interior
+    primal-dual (predictor-corrector de Mehrotra) sobre las ecuaciones normales
+    A·D·Aᵀ, factorizadas con Cholesky en cada iteración. Suele converger en unas
+    decenas de iteraciones sin importar el tamaño, cada una de costo O(m²·n).
+
+    Con `crossover` la solución interior se lleva a una base: se elige una base
+    con `_base_desde_punto` y el Simplex Revisado termina desde allí (en general
+    con pocos pivoteos), de modo que la solución es un vértice y se devuelve su
+    `base`. Sin crossover la solución puede estar en el interior de una cara
+    óptima y `base` es None. Si las iteraciones divergen (problema infactible o
+    no acotado) el estado lo determina el simplex desde cero, con o sin crossover.
+
+    `max_iteraciones` limita las iteraciones de barrera (por defecto
+    `ITERACIONES_BARRERA`) y, si se indica, el crossover usa lo que queda de
+    ese límite; `iteraciones` suma las de barrera y los pivoteos del
+    crossover. `regla` y `historial` se usan en el crossover.
+    """
+    if max_iteraciones is not None and max_iteraciones < 1:
+        raise ValueError("max_iterations debe ser mayor o igual a 1.")
+    problema = ProblemaEstandar(problem_type, C, LI, LD, O, escalado=escalado)
+    politica = historial or PoliticaHistorial('none')
+    matriz = _MatrizBarrera(problema)
+    c = problema.c[matriz.columnas]
+
+    signo = -1.0 if problem_type == 'maximization' else 1.0
+    status, x, y, s, iteraciones = _mehrotra(
+        matriz, problema.b, c, max_iteraciones or ITERACIONES_BARRERA,
+        informar=lambda iteracion, primal: politica.informar('barrera', iteracion, signo * primal),
+    )
+    logger.info(f"Barrera: {status} en {iteraciones} iteraciones.")
+
+    if status == "max_iterations_reached":
+        return {"status": status, "tablas": [], "solucion": None, "iteraciones": iteraciones, "base": None}
+
+    if status == "optimo" and not crossover:
+        valores = np.zeros(problema.num_total)
+        valores[matriz.columnas] = x
+        return {
+            "status": status,
+            "tablas": [],
+            "solucion": _solucion_desde_valores(problema, valores),
+            "iteraciones": iteraciones,
+            "base": None,
+        }
+
+    # Pivoteos que le quedan al crossover (None = límite por defecto del revisado)
+    restantes = None if max_iteraciones is None else max_iteraciones - iteraciones
+    solver = None
+    if status == "optimo":
+        try:
+            solver = SimplexRevisado(problema, max_iter=restantes, historial=politica, regla=regla, base=_base_desde_punto(problema, matriz, x, s))
+            if not solver.base_factible and not solver.dual_factible():
+                raise ValueError("la base del crossover no es primal ni dual factible")
+        except ValueError as e:
+            logger.info(f"Crossover sin base utilizable ({e}); se resuelve con el simplex desde cero.")
+            solver = None
+    if solver is None:
+        solver = SimplexRevisado(problema, max_iter=restantes, historial=politica, regla=regla)
+    status = solver.resolver(dual=True)
+
+    optimo = status == "optimo"
+    return {
+        "status": status,
+        "tablas": politica.recortar(solver.tablas),
+        "solucion": _solucion_desde_valores(problema, solver.valores()) if optimo else None,
+        "iteraciones": iteraciones + solver.iteraciones,
+        "base": [problema.var_names[j] for j in solver.base] if optimo else None,
+    }
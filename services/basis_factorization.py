@@ -0,0 +1,204 @@
+import numpy as np
+from typing import List, Tuple
+
+# Tamaño de bloque para la factorización LU y las sustituciones triangulares.
+# Los bloques permiten delegar el trabajo pesado en productos matriciales (BLAS).
+TAM_BLOQUE = 64
+
+
+class BaseSingularError(ValueError):
+    """Se lanza cuando la matriz base no es invertible."""
+
+
+def _lu_por_bloques(M: np.ndarray, tol: float = 1e-11) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Factorización LU con pivoteo parcial por filas: P·M = L·U.
+
+    Retorna (LU, perm) donde LU empaqueta L (diagonal unitaria implícita) y U,
+    y perm es la permutación de filas aplicada.
+    """
+    LU = np.array(M, dtype=float, copy=True)
+    n = LU.shape[0]
+    perm = np.arange(n)
+
+    for k0 in range(0, n, TAM_BLOQUE):
+        k1 = min(k0 + TAM_BLOQUE, n)
+
+        # a) Factorizar el panel [k0:, k0:k1] columna a columna
+        for k in range(k0, k1):
+            p = k + int(np.argmax(np.abs(LU[k:, k])))
+            if abs(LU[p, k]) < tol:
+                raise BaseSingularError("La matriz base es singular.")
+            if p != k:
+                LU[[k, p], :] = LU[[p, k], :]
+                perm[[k, p]] = perm[[p, k]]
+            LU[k + 1:, k] /= LU[k, k]
+            LU[k + 1:, k + 1:k1] -= np.outer(LU[k + 1:, k], LU[k, k + 1:k1])
+
+        if k1 < n:
+            # b) U12 = L11^-1 · A12
+            L11 = np.tril(LU[k0:k1, k0:k1], -1) + np.eye(k1 - k0)
+            LU[k0:k1, k1:] = np.linalg.solve(L11, LU[k0:k1, k1:])
+            # c) Actualización del complemento de Schur: A22 -= L21 · U12
+            LU[k1:, k1:] -= LU[k1:, k0:k1] @ LU[k0:k1, k1:]
+
+    return LU, perm
+
+
+class _FactoresLU:
+    """
+    Factores LU empaquetados junto con las inversas de sus bloques diagonales.
+
+    Precalcular las inversas de los bloques diagonales (de tamaño TAM_BLOQUE)
+    convierte cada sustitución triangular en una secuencia de productos
+    matriz-vector, evitando llamar a un solver general en cada iteración.
+    """
+
+    def __init__(self, M: np.ndarray):
+        self.LU, self.perm = _lu_por_bloques(M)
+        n = self.LU.shape[0]
+        self.bloques = [(k0, min(k0 + TAM_BLOQUE, n)) for k0 in range(0, n, TAM_BLOQUE)]
+        self.inv_L = []
+        self.inv_U = []
+        for k0, k1 in self.bloques:
+            D = self.LU[k0:k1, k0:k1]
+            self.inv_L.append(np.linalg.inv(np.tril(D, -1) + np.eye(k1 - k0)))
+            self.inv_U.append(np.linalg.inv(np.triu(D)))
+
+    def resolver(self, b: np.ndarray) -> np.ndarray:
+        """Resuelve M·x = b."""
+        LU = self.LU
+        x = np.array(b, dtype=float)[self.perm]
+        # L·z = P·b
+        for i, (k0, k1) in enumerate(self.bloques):
+            if k0 > 0:
+                x[k0:k1] -= LU[k0:k1, :k0] @ x[:k0]
+            x[k0:k1] = self.inv_L[i] @ x[k0:k1]
+        # U·x = z
+        for i in reversed(range(len(self.bloques))):
+            k0, k1 = self.bloques[i]
+            if k1 < len(x):
+                x[k0:k1] -= LU[k0:k1, k1:] @ x[k1:]
+            x[k0:k1] = self.inv_U[i] @ x[k0:k1]
+        return x
+
+    def resolver_t(self, b: np.ndarray) -> np.ndarray:
+        """Resuelve Mᵀ·x = b."""
+        LU = self.LU
+        z = np.array(b, dtype=float, copy=True)
+        # Uᵀ·w = b
+        for i, (k0, k1) in enumerate(self.bloques):
+            if k0 > 0:
+                z[k0:k1] -= LU[:k0, k0:k1].T @ z[:k0]
+            z[k0:k1] = self.inv_U[i].T @ z[k0:k1]
+        # Lᵀ·v = w
+        for i in reversed(range(len(self.bloques))):
+            k0, k1 = self.bloques[i]
+            if k1 < len(z):
+                z[k0:k1] -= LU[k1:, k0:k1].T @ z[k1:]
+            z[k0:k1] = self.inv_L[i].T @ z[k0:k1]
+        x = np.empty_like(z)
+        x[self.perm] = z
+        return x
+
+
+class FactorizacionBase:
+    """
+    Factorización de la matriz base B de un problema en forma estándar.
+
+    Aprovecha que las columnas lógicas (holgura, exceso, artificiales) de la base
+    son vectores unitarios: solo se factoriza en LU el "núcleo" formado por las
+    columnas estructurales restringidas a las filas no cubiertas por lógicas.
+    Los cambios de base se acumulan en forma producto (archivo de etas) hasta
+    alcanzar `refactorizar_cada` actualizaciones.
+    """
+
+    def __init__(
+        self,
+        columnas_estructurales: np.ndarray,
+        posiciones_estructurales: List[int],
+        filas_logicas: List[int],
+        signos_logicos: List[float],
+        posiciones_logicas: List[int],
+        num_filas: int,
+        refactorizar_cada: int = 50,
+    ):
+        """
+        Args:
+            columnas_estructurales: Matriz (m x k) con las columnas estructurales básicas.
+            posiciones_estructurales: Posición en la base de cada columna estructural.
+            filas_logicas: Fila del vector unitario de cada columna lógica básica.
+            signos_logicos: Signo (+1/-1) de cada columna lógica básica.
+            posiciones_logicas: Posición en la base de cada columna lógica.
+            num_filas: Cantidad de restricciones (m).
+            refactorizar_cada: Actualizaciones permitidas antes de refactorizar.
+        """
+        m = num_filas
+        self.m = m
+        self.refactorizar_cada = refactorizar_cada
+        self.etas: List[Tuple[int, np.ndarray]] = []
+
+        filas_logicas = np.asarray(filas_logicas, dtype=int)
+        if len(np.unique(filas_logicas)) != len(filas_logicas):
+            raise BaseSingularError("Dos columnas lógicas de la base comparten fila.")
+
+        cubiertas = np.zeros(m, dtype=bool)
+        cubiertas[filas_logicas] = True
+        self._filas_nucleo = np.flatnonzero(~cubiertas)
+        self._filas_logicas = filas_logicas
+        self._signos_logicos = np.asarray(signos_logicos, dtype=float)
+        self._pos_estructurales = np.asarray(posiciones_estructurales, dtype=int)
+        self._pos_logicas = np.asarray(posiciones_logicas, dtype=int)
+
+        if len(self._filas_nucleo) != len(self._pos_estructurales):
+            raise BaseSingularError("La base no tiene dimensión compatible con el problema.")
+
+        columnas = np.asarray(columnas_estructurales, dtype=float).reshape(m, -1)
+        # B11: filas no cubiertas x columnas estructurales; B21: filas lógicas x estructurales
+        self._B21 = columnas[filas_logicas, :]
+        self._lu = _FactoresLU(columnas[self._filas_nucleo, :]) if len(self._filas_nucleo) else None
+
+    @property
+    def necesita_refactorizar(self) -> bool:
+        return len(self.etas) >= self.refactorizar_cada
+
+    def _resolver_nucleo(self, v: np.ndarray) -> np.ndarray:
+        return self._lu.resolver(v) if self._lu is not None else v
+
+    def _resolver_nucleo_t(self, v: np.ndarray) -> np.ndarray:
+        return self._lu.resolver_t(v) if self._lu is not None else v
+
+    def ftran(self, a: np.ndarray) -> np.ndarray:
+        """Calcula B⁻¹·a (a indexado por filas, resultado por posición en la base)."""
+        a = np.asarray(a, dtype=float)
+        x = np.empty(self.m)
+        x_s = self._resolver_nucleo(a[self._filas_nucleo])
+        x[self._pos_estructurales] = x_s
+        x[self._pos_logicas] = (a[self._filas_logicas] - self._B21 @ x_s) / self._signos_logicos
+
+        # Aplicar las etas en el orden en que se generaron
+        for r, alpha in self.etas:
+            xr = x[r] / alpha[r]
+            x -= xr * alpha
+            x[r] = xr
+        return x
+
+    def btran(self, c: np.ndarray) -> np.ndarray:
+        """Calcula B⁻ᵀ·c (c indexado por posición en la base, resultado por filas)."""
+        c = np.array(c, dtype=float, copy=True)
+
+        # Aplicar las etas transpuestas en orden inverso
+        for r, alpha in reversed(self.etas):
+            c[r] = (c[r] - (alpha @ c - alpha[r] * c[r])) / alpha[r]
+
+        y = np.empty(self.m)
+        y_l = c[self._pos_logicas] / self._signos_logicos
+        y[self._filas_logicas] = y_l
+        y[self._filas_nucleo] = self._resolver_nucleo_t(
+            c[self._pos_estructurales] - self._B21.T @ y_l
+        )
+        return y
+
+    def actualizar(self, fila_pivote: int, alpha: np.ndarray) -> None:
+        """Registra el cambio de base en la posición `fila_pivote` (alpha = B⁻¹·a_entrante)."""
+        self.etas.append((fila_pivote, np.array(alpha, dtype=float, copy=True)))
@@ -0,0 +1,178 @@
+import math
+import numpy as np
+from typing import List, Optional, Sequence, Tuple
+
+ListaCotas = Optional[Sequence[Optional[float]]]
+
+
+def _cota(valores: ListaCotas, j: int, por_defecto: float, sin_cota: float) -> float:
+    """Cota j de la lista (por defecto si la lista se omite; None = sin cota)."""
+    if valores is None:
+        return por_defecto
+    valor = valores[j]
+    return sin_cota if valor is None else float(valor)
+
+
+def cotas_como_arreglos(lower: ListaCotas, upper: ListaCotas, n: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Cotas inferiores y superiores de las n variables de decisión como arreglos
+    (−inf/inf = sin cota; si se omite la lista, lower = 0 y upper = sin cota).
+    Lanza ValueError si las listas no tienen una cota por variable o si alguna
+    cota es inválida.
+    """
+    for nombre, valores in (("lower", lower), ("upper", upper)):
+        if valores is not None and len(valores) != n:
+            raise ValueError(f"{nombre} debe tener una cota por variable ({n}).")
+    inferiores = np.array([_cota(lower, j, 0.0, -math.inf) for j in range(n)])
+    superiores = np.array([_cota(upper, j, math.inf, math.inf) for j in range(n)])
+    for j in range(n):
+        inferior, superior = inferiores[j], superiores[j]
+        if math.isnan(inferior) or math.isnan(superior) or inferior == math.inf or superior == -math.inf:
+            raise ValueError(f"Las cotas de x{j+1} no son válidas.")
+        if inferior > superior:
+            raise ValueError(f"La cota inferior de x{j+1} es mayor que la superior.")
+    return inferiores, superiores
+
+
+class CotasVariables:
+    """
+    Cotas de las variables del Simplex tabular con variables acotadas.
+
+    Cada columna j del tableau representa una variable t_j con
+    x_j = origen_j + sentido_j·t_j (x_j en el modelo escalado): t_j vale 0
+    mientras la columna no es básica y debe quedar en [0, rango_j]. Las
+    holguras, excesos y artificiales tienen origen 0, sentido 1 y rango
+    infinito. Una variable libre no tiene cotas: cambia de sentido para entrar
+    disminuyendo y, una vez básica, no sale de la base.
+
+    Las cotas superiores no agregan filas: cuando una variable pasa a su otra
+    cota se complementa su columna (t_j ← rango_j − t_j), así todas las no
+    básicas siguen en t = 0 y la fila Z y las reglas de pricing no cambian.
+    """
+
+    def __init__(self, origen: np.ndarray, sentido: np.ndarray, rango: np.ndarray, libre: np.ndarray):
+        self.origen = origen
+        self.sentido = sentido
+        self.rango = rango
+        self.libre = libre
+        self.libres = np.flatnonzero(libre)
+
+    @classmethod
+    def desde_cotas(
+        cls,
+        lower: ListaCotas,
+        upper: ListaCotas,
+        factores_col: np.ndarray,
+    ) -> Optional["CotasVariables"]:
+        """
+        Cotas de las columnas de las variables de decisión a partir de `lower`
+        y `upper` (None en una posición = sin cota; si se omite la lista,
+        lower = 0 y upper = sin cota), llevadas al modelo escalado con
+        `factores_col`. Las demás columnas se agregan con `ampliar`.
+
+        Retorna None si todas las variables son simplemente x >= 0. Lanza
+        ValueError si las listas no tienen una cota por variable o si alguna
+        cota es inválida.
+        """
+        n = len(factores_col)
+        inferiores, superiores = cotas_como_arreglos(lower, upper, n)
+
+        origen = np.zeros(n)
+        sentido = np.ones(n)
+        rango = np.full(n, np.inf)
+        libre = np.zeros(n, dtype=bool)
+        for j in range(n):
+            inferior, superior = inferiores[j] / factores_col[j], superiores[j] / factores_col[j]
+            if math.isfinite(inferior):
+                origen[j] = inferior
+                rango[j] = superior - inferior
+            elif math.isfinite(superior):
+                # Solo cota superior: x = u - t con t >= 0
+                origen[j] = superior
+                sentido[j] = -1.0
+            else:
+                libre[j] = True
+
+        if not (libre.any() or np.any(sentido < 0) or np.any(origen != 0.0) or np.any(np.isfinite(rango))):
+            return None
+        return cls(origen, sentido, rango, libre)
+
+    def ampliar(self, num_columnas: int) -> None:
+        """Agrega hasta `num_columnas` las columnas de holgura, exceso y artificiales (t >= 0 sin cota superior)."""
+        extra = num_columnas - len(self.origen)
+        self.origen = np.concatenate([self.origen, np.zeros(extra)])
+        self.sentido = np.concatenate([self.sentido, np.ones(extra)])
+        self.rango = np.concatenate([self.rango, np.full(extra, np.inf)])
+        self.libre = np.concatenate([self.libre, np.zeros(extra, dtype=bool)])
+
+    def aplicar(self, A: np.ndarray, LD: np.ndarray) -> None:
+        """
+        Expresa el modelo escalado en las variables t (in-place): LD ← LD − A·origen
+        y cada columna de A multiplicada por su sentido. `LD` es un vector columna.
+        """
+        n = A.shape[1]
+        LD -= (A @ self.origen[:n])[:, None]
+        A *= self.sentido[None, :n]
+
+    def fila_objetivo(self, C: np.ndarray, largo: int) -> np.ndarray:
+        """
+        Fila Z (sin canonizar) de un tableau de `largo` columnas para los costos
+        `C` de las variables de decisión: −C_j·sentido_j y, en la esquina, el
+        valor del objetivo con todas las t en cero.
+        """
+        n = len(C)
+        fila = np.zeros(largo + 1)
+        fila[:n] = -C * self.sentido[:n]
+        fila[-1] = float(C @ self.origen[:n])
+        return fila
+
+    def complementar(self, tableau: np.ndarray, j: int) -> None:
+        """
+        Cambia la columna j por t_j' = rango_j − t_j (o −t_j si es libre) en
+        todas las filas, incluida la fila Z. Los valores de las básicas pasan a
+        ser los que tienen con x_j en su otra cota.
+        """
+        if not self.libre[j]:
+            tableau[:, -1] -= self.rango[j] * tableau[:, j]
+            self.origen[j] += self.sentido[j] * self.rango[j]
+        tableau[:, j] *= -1.0
+        self.sentido[j] = -self.sentido[j]
+
+    def orientar_libres(self, tableau: np.ndarray, basicas: np.ndarray, tol_optimalidad: float) -> None:
+        """
+        Da vuelta las libres no básicas cuyo costo reducido es positivo, para
+        que la regla de pricing las vea como columnas que mejoran al crecer.
+        """
+        if not len(self.libres):
+            return
+        fila_z = tableau[-1, self.libres]
+        candidatas = self.libres[(fila_z > tol_optimalidad) & ~np.isin(self.libres, basicas)]
+        if len(candidatas):
+            tableau[:, candidatas] *= -1.0
+            self.sentido[candidatas] *= -1.0
+
+    def razones(self, alpha: np.ndarray, rhs: np.ndarray, basicas: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Lleva el test de razón con cotas a la forma de `ReglaPrecios.saliente`
+        (filas con coeficiente positivo y distancia a la cota): una fila con
+        alpha > 0 limita el paso por la cota inferior de su básica (rhs / alpha)
+        y una con alpha < 0 por la superior ((rango − rhs) / −alpha). Las filas
+        de básicas libres no limitan el paso. `basicas` vale −1 en las filas
+        cuya básica no es una columna del tableau (artificial en Fase 2).
+        """
+        columnas = basicas >= 0
+        rango_b = np.full(len(basicas), np.inf)
+        rango_b[columnas] = self.rango[basicas[columnas]]
+        superior = (alpha < 0) & np.isfinite(rango_b)
+        alpha_razon = np.where(superior, -alpha, alpha)
+        alpha_razon[columnas] = np.where(self.libre[basicas[columnas]], 0.0, alpha_razon[columnas])
+        rhs_razon = np.where(superior, rango_b - rhs, rhs)
+        return alpha_razon, rhs_razon
+
+    def nombres(self, var_names: List[str]) -> List[str]:
+        """Nombres para las tablas: las columnas con sentido −1 se marcan con ' (x' = origen − x)."""
+        return [f"{v}'" if self.sentido[j] < 0 else v for j, v in enumerate(var_names)]
+
+    def valor(self, j: int, t: float) -> float:
+        """Valor de x_j (modelo escalado) para el valor t de su columna."""
+        return float(self.origen[j] + self.sentido[j] * t)
@@ -0,0 +1,189 @@
+import os
+import json
+import time
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+# --- Configuración (variables de entorno) ---
+# Cantidad máxima de entradas en memoria (0 desactiva la caché)
+CACHE_MAX_ENTRIES = int(os.getenv("SIMPLEX_CACHE_MAX_ENTRIES", "1024"))
+# Tamaño máximo en memoria, en bytes (serializado)
+CACHE_MAX_BYTES = int(os.getenv("SIMPLEX_CACHE_MAX_BYTES", str(256 * 1024 * 1024)))
+# Vida de cada entrada, en segundos
+CACHE_TTL = float(os.getenv("SIMPLEX_CACHE_TTL", "3600"))
+# Directorio opcional para persistir las entradas en disco (vacío = solo memoria)
+CACHE_DIR = os.getenv("SIMPLEX_CACHE_DIR", "")
+
+# Se incrementa cuando cambia el formato de los resultados para invalidar el disco
+VERSION_CACHE = 3
+
+
+def clave_canonica(request: BaseModel, tipo: str) -> str:
+    """
+    Clave de contenido de un request: SHA-256 de su JSON canónico (claves
+    ordenadas, sin campos con valor por defecto) más el tipo de artefacto
+    ('solve', 'grafico:png:100:tight', 'pdf'). Payloads equivalentes producen la misma clave,
+    p. ej. `3` y `3.0` en C, o un campo opcional omitido y enviado como null.
+    """
+    datos = request.model_dump(mode="json", exclude_defaults=True)
+    texto = json.dumps([VERSION_CACHE, tipo, datos], sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(texto.encode("utf-8")).hexdigest()
+
+
+class CacheResultados:
+    """
+    Caché LRU en memoria con expiración por TTL y límite de entradas y de bytes,
+    opcionalmente respaldada por un directorio en disco (un archivo por clave).
+
+    Guarda resultados del solver y bytes ya renderizados (PNG/PDF). Los valores
+    se comparten entre requests, por lo que no deben modificarse al leerlos.
+
+    En disco los resultados se guardan como JSON (`<clave>.json`) y los bytes
+    tal cual (`<clave>.bin`): leer una entrada nunca ejecuta código, aunque el
+    directorio sea compartido.
+    """
+
+    def __init__(self, max_entradas: int, max_bytes: int, ttl: float, directorio: Optional[str] = None):
+        self.max_entradas = max_entradas
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.directorio = directorio or None
+        self._entradas: "OrderedDict[str, Tuple[Any, float, int]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.aciertos = 0
+        self.aciertos_disco = 0
+        self.fallos = 0
+        self.desalojos = 0
+        if self.directorio:
+            os.makedirs(self.directorio, exist_ok=True)
+
+    @property
+    def habilitada(self) -> bool:
+        return self.max_entradas > 0
+
+    def obtener(self, clave: str) -> Optional[Any]:
+        """Retorna el valor guardado o None (fallo)."""
+        if not self.habilitada:
+            return None
+        ahora = time.monotonic()
+        with self._lock:
+            entrada = self._entradas.get(clave)
+            if entrada is not None:
+                valor, expira, _ = entrada
+                if expira > ahora:
+                    self._entradas.move_to_end(clave)
+                    self.aciertos += 1
+                    return valor
+                self._quitar(clave)
+
+        leido = self._leer_disco(clave)
+        with self._lock:
+            if leido is None:
+                self.fallos += 1
+                return None
+            self.aciertos_disco += 1
+        valor, tam = leido
+        self._guardar_memoria(clave, valor, tam)
+        return valor
+
+    def guardar(self, clave: str, valor: Any) -> None:
+        """Guarda bytes o un valor serializable como JSON (dict/list del solver)."""
+        if not self.habilitada:
+            return
+        if isinstance(valor, bytes):
+            datos, extension = valor, "bin"
+        else:
+            datos, extension = json.dumps(valor, separators=(",", ":")).encode("utf-8"), "json"
+        self._guardar_memoria(clave, valor, len(datos))
+        self._escribir_disco(clave, datos, extension)
+
+    def limpiar(self) -> None:
+        """Vacía la memoria (el disco se conserva hasta que expiren sus entradas)."""
+        with self._lock:
+            self._entradas.clear()
+            self._bytes = 0
+
+    def estadisticas(self) -> Dict[str, Any]:
+        with self._lock:
+            consultas = self.aciertos + self.aciertos_disco + self.fallos
+            return {
+                "habilitada": self.habilitada,
+                "entradas": len(self._entradas),
+                "bytes": self._bytes,
+                "aciertos": self.aciertos,
+                "aciertos_disco": self.aciertos_disco,
+                "fallos": self.fallos,
+                "desalojos": self.desalojos,
+                "tasa_aciertos": (self.aciertos + self.aciertos_disco) / consultas if consultas else 0.0,
+            }
+
+    # --- Memoria ---
+
+    def _quitar(self, clave: str) -> None:
+        _, _, tam = self._entradas.pop(clave)
+        self._bytes -= tam
+
+    def _guardar_memoria(self, clave: str, valor: Any, tam: int) -> None:
+        if tam > self.max_bytes:
+            return
+        with self._lock:
+            if clave in self._entradas:
+                self._quitar(clave)
+            self._entradas[clave] = (valor, time.monotonic() + self.ttl, tam)
+            self._bytes += tam
+            # Desalojar las menos usadas recientemente
+            while len(self._entradas) > self.max_entradas or self._bytes > self.max_bytes:
+                self._quitar(next(iter(self._entradas)))
+                self.desalojos += 1
+
+    # --- Disco ---
+
+    def _ruta(self, clave: str, extension: str) -> str:
+        return os.path.join(self.directorio, f"{clave}.{extension}")
+
+    def _leer_disco(self, clave: str) -> Optional[Tuple[Any, int]]:
+        """Retorna (valor, tamaño en bytes del archivo) o None si no está o expiró."""
+        if not self.directorio:
+            return None
+        for extension in ("json", "bin"):
+            ruta = self._ruta(clave, extension)
+            try:
+                if time.time() - os.path.getmtime(ruta) > self.ttl:
+                    os.remove(ruta)
+                    return None
+                with open(ruta, "rb") as f:
+                    datos = f.read()
+                valor = json.loads(datos) if extension == "json" else datos
+                return valor, len(datos)
+            except FileNotFoundError:
+                continue
+            except Exception as e:
+                logger.warning(f"No se pudo leer la entrada de caché {ruta}: {e}")
+                return None
+        return None
+
+    def _escribir_disco(self, clave: str, datos: bytes, extension: str) -> None:
+        if not self.directorio:
+            return
+        ruta = self._ruta(clave, extension)
+        temporal = f"{ruta}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(temporal, "wb") as f:
+                f.write(datos)
+            # Reemplazo atómico: un lector nunca ve un archivo a medio escribir
+            os.replace(temporal, ruta)
+        except Exception as e:
+            logger.warning(f"No se pudo escribir la entrada de caché {ruta}: {e}")
+            if os.path.exists(temporal):
+                os.remove(temporal)
+
+
+cache_resultados = CacheResultados(CACHE_MAX_ENTRIES, CACHE_MAX_BYTES, CACHE_TTL, CACHE_DIR)
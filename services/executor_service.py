@@ -0,0 +1,179 @@
+import os
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+# --- Configuración (variables de entorno) ---
+# Cantidad de procesos del pool de resolución
+PROCESS_WORKERS = int(os.getenv("SIMPLEX_PROCESS_WORKERS", str(os.cpu_count() or 1)))
+# Método de arranque de los procesos: 'spawn' es seguro aunque el servidor use hilos
+MP_START_METHOD = os.getenv("SIMPLEX_MP_START_METHOD", "spawn")
+# Dónde se ejecuta el solver: 'process' (pool de procesos) o 'thread' (pool de hilos)
+SOLVE_EXECUTOR = os.getenv("SIMPLEX_SOLVE_EXECUTOR", "process")
+# Cantidad de hilos para gráficos y PDFs (matplotlib / reportlab)
+THREAD_WORKERS = int(os.getenv("SIMPLEX_THREAD_WORKERS", "4"))
+# Trabajos admitidos a la vez (en ejecución + en espera) antes de responder 503
+SOLVE_QUEUE_DEPTH = int(os.getenv("SIMPLEX_SOLVE_QUEUE_DEPTH", str(PROCESS_WORKERS * 32)))
+RENDER_QUEUE_DEPTH = int(os.getenv("SIMPLEX_RENDER_QUEUE_DEPTH", str(THREAD_WORKERS * 8)))
+# Tiempo máximo de espera por trabajo, en segundos
+SOLVE_TIMEOUT = float(os.getenv("SIMPLEX_SOLVE_TIMEOUT", "60"))
+RENDER_TIMEOUT = float(os.getenv("SIMPLEX_RENDER_TIMEOUT", "60"))
+
+_pool_procesos: Optional[ProcessPoolExecutor] = None
+_pool_hilos: Optional[ThreadPoolExecutor] = None
+
+
+class ServicioSaturadoError(RuntimeError):
+    """Se lanza cuando la cola de un ejecutor está llena (se traduce a HTTP 503)."""
+
+
+class TiempoAgotadoError(TimeoutError):
+    """Se lanza cuando un trabajo supera su tiempo máximo (se traduce a HTTP 504)."""
+
+
+def _calentar_worker() -> None:
+    """
+    Inicializador de cada proceso: importa el solver y resuelve un problema
+    trivial para que la primera tarea real no pague el costo de importación.
+    """
+    from services.simplex_service import resolver_simplex_tabular
+
+    resolver_simplex_tabular("maximization", [1.0], [[1.0]], [1.0], ["<="])
+
+
+def obtener_pool_procesos() -> ProcessPoolExecutor:
+    """Retorna el pool de procesos compartido, creándolo en el primer uso."""
+    global _pool_procesos
+    # Si un worker murió abruptamente el pool queda inutilizable: se recrea
+    if _pool_procesos is not None and getattr(_pool_procesos, "_broken", False):
+        logger.warning("Pool de procesos roto; se crea uno nuevo.")
+        _pool_procesos.shutdown(wait=False, cancel_futures=True)
+        _pool_procesos = None
+    if _pool_procesos is None:
+        logger.info(f"Creando pool de {PROCESS_WORKERS} procesos ({MP_START_METHOD}).")
+        _pool_procesos = ProcessPoolExecutor(
+            max_workers=PROCESS_WORKERS,
+            mp_context=multiprocessing.get_context(MP_START_METHOD),
+            initializer=_calentar_worker,
+        )
+    return _pool_procesos
+
+
+def obtener_pool_hilos() -> ThreadPoolExecutor:
+    """Retorna el pool de hilos compartido, creándolo en el primer uso."""
+    global _pool_hilos
+    if _pool_hilos is None:
+        logger.info(f"Creando pool de {THREAD_WORKERS} hilos.")
+        _pool_hilos = ThreadPoolExecutor(max_workers=THREAD_WORKERS, thread_name_prefix="simplex-render")
+    return _pool_hilos
+
+
+class EjecutorAcotado:
+    """
+    Ejecuta funciones bloqueantes en un pool sin bloquear el event loop,
+    limitando la cantidad de trabajos admitidos y el tiempo de espera de cada uno.
+
+    Un trabajo que agota su tiempo deja de esperarse, pero si ya había comenzado
+    sigue ejecutándose en el pool hasta terminar.
+    """
+
+    def __init__(self, nombre: str, obtener_executor: Callable[[], Executor], max_pendientes: int, timeout: float):
+        self.nombre = nombre
+        self._obtener_executor = obtener_executor
+        self.max_pendientes = max_pendientes
+        self.timeout = timeout
+        self.pendientes = 0
+
+    def adquirir(self, cantidad: int = 1) -> int:
+        """
+        Reserva lugares en la cola o lanza ServicioSaturadoError si no hay espacio.
+        Retorna la cantidad efectivamente reservada (a devolver con `liberar`).
+        """
+        cantidad = min(cantidad, self.max_pendientes)
+        if self.pendientes + cantidad > self.max_pendientes:
+            logger.warning(f"Ejecutor '{self.nombre}' saturado ({self.pendientes}/{self.max_pendientes}).")
+            raise ServicioSaturadoError(f"El servicio de {self.nombre} está saturado. Reintente más tarde.")
+        self.pendientes += cantidad
+        return cantidad
+
+    def liberar(self, cantidad: int) -> None:
+        self.pendientes -= cantidad
+
+    @asynccontextmanager
+    async def reservar(self, cantidad: int = 1):
+        """Context manager sobre `adquirir`/`liberar`."""
+        reservados = self.adquirir(cantidad)
+        try:
+            yield
+        finally:
+            self.liberar(reservados)
+
+    async def ejecutar_reservado(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """Ejecuta `fn(*args)` en el pool (el llamador ya reservó su lugar)."""
+        loop = asyncio.get_running_loop()
+        futuro = loop.run_in_executor(self._obtener_executor(), fn, *args)
+        try:
+            return await asyncio.wait_for(futuro, self.timeout)
+        except asyncio.TimeoutError:
+            raise TiempoAgotadoError(f"El trabajo de {self.nombre} superó {self.timeout:g} segundos.")
+
+    async def ejecutar(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """Reserva un lugar y ejecuta `fn(*args)` en el pool."""
+        async with self.reservar():
+            return await self.ejecutar_reservado(fn, *args)
+
+
+_FIN = object()
+
+
+async def iterar_en_hilos(generador: Iterator[Any], timeout: float = SOLVE_TIMEOUT) -> AsyncIterator[Any]:
+    """
+    Recorre un generador bloqueante avanzándolo en el pool de hilos, de modo
+    que cada elemento llega al event loop en cuanto se produce (los generadores
+    no pueden cruzar al pool de procesos). `timeout` acota el tiempo total.
+    Si el consumidor abandona la iteración, el generador se cierra.
+    """
+    loop = asyncio.get_running_loop()
+    limite = loop.time() + timeout
+    try:
+        while True:
+            restante = limite - loop.time()
+            futuro = loop.run_in_executor(obtener_pool_hilos(), next, generador, _FIN)
+            try:
+                elemento = await asyncio.wait_for(futuro, max(restante, 0.0))
+            except asyncio.TimeoutError:
+                raise TiempoAgotadoError(f"La transmisión superó {timeout:g} segundos.")
+            if elemento is _FIN:
+                return
+            yield elemento
+    finally:
+        try:
+            generador.close()
+        except ValueError:
+            # El hilo sigue avanzando el generador (tiempo agotado): terminará solo
+            pass
+
+
+ejecutor_resolucion = EjecutorAcotado(
+    "resolución",
+    obtener_pool_procesos if SOLVE_EXECUTOR == "process" else obtener_pool_hilos,
+    SOLVE_QUEUE_DEPTH,
+    SOLVE_TIMEOUT,
+)
+ejecutor_render = EjecutorAcotado("renderizado", obtener_pool_hilos, RENDER_QUEUE_DEPTH, RENDER_TIMEOUT)
+
+
+def cerrar_pools() -> None:
+    """Detiene los pools creados (se invoca al apagar la aplicación)."""
+    global _pool_procesos, _pool_hilos
+    if _pool_procesos is not None:
+        _pool_procesos.shutdown(wait=True, cancel_futures=True)
+        _pool_procesos = None
+    if _pool_hilos is not None:
+        _pool_hilos.shutdown(wait=True, cancel_futures=True)
+        _pool_hilos = None
@@ -0,0 +1,280 @@
+import math
+from collections import deque
+from typing import Any, Dict, List, Literal, NamedTuple, Optional, Sequence, Tuple
+
+from .bounds import ListaCotas, cotas_como_arreglos
+
+Punto = Tuple[float, float]
+
+# Lado de la caja auxiliar que acota la región, relativo a la escala del problema
+_FACTOR_CAJA = 1e6
+# Cifras significativas de las coordenadas en la respuesta
+_CIFRAS = 6
+
+
+class Semiplano(NamedTuple):
+    """
+    Semiplano a la izquierda de la recta que pasa por `p` con dirección `d`
+    (a·x + b·y <= c equivale a p = c·(a, b)/(a² + b²) y d = (-b, a)).
+    `caja` marca los lados de la caja auxiliar.
+    """
+    p: Punto
+    d: Punto
+    caja: bool = False
+
+    @property
+    def angulo(self) -> float:
+        return math.atan2(self.d[1], self.d[0])
+
+    def afuera(self, q: Punto, eps: float) -> bool:
+        return _cruz(self.d, (q[0] - self.p[0], q[1] - self.p[1])) < -eps * math.hypot(*self.d)
+
+
+def _cruz(u: Punto, v: Punto) -> float:
+    return u[0] * v[1] - u[1] * v[0]
+
+
+def _semiplano(a: float, b: float, c: float, caja: bool = False) -> Semiplano:
+    norma = a * a + b * b
+    return Semiplano((a * c / norma, b * c / norma), (-b, a), caja)
+
+
+def _interseccion(s: Semiplano, t: Semiplano) -> Punto:
+    alfa = _cruz((t.p[0] - s.p[0], t.p[1] - s.p[1]), t.d) / _cruz(s.d, t.d)
+    return (s.p[0] + alfa * s.d[0], s.p[1] + alfa * s.d[1])
+
+
+def interseccion_semiplanos(semiplanos: Sequence[Semiplano], eps: float = 1e-9) -> Tuple[List[Punto], List[Semiplano]]:
+    """
+    Intersección de semiplanos por barrido angular con una deque, O(n log n)
+    por el ordenamiento. La intersección debe estar acotada (ver `_FACTOR_CAJA`).
+
+    Retorna los vértices del polígono convexo en sentido antihorario y los
+    semiplanos que forman sus lados; ambas listas vacías si es vacía.
+    """
+    ordenados = sorted(semiplanos, key=lambda s: s.angulo)
+    dq: deque = deque()
+    for s in ordenados:
+        while len(dq) > 1 and s.afuera(_interseccion(dq[-1], dq[-2]), eps):
+            dq.pop()
+        while len(dq) > 1 and s.afuera(_interseccion(dq[0], dq[1]), eps):
+            dq.popleft()
+        if dq and abs(_cruz(s.d, dq[-1].d)) <= eps * math.hypot(*s.d) * math.hypot(*dq[-1].d):
+            # Paralelos: con sentidos opuestos solo la separación importa; con el
+            # mismo sentido queda el más restrictivo
+            if s.d[0] * dq[-1].d[0] + s.d[1] * dq[-1].d[1] < 0:
+                if s.afuera(dq[-1].p, eps) or dq[-1].afuera(s.p, eps):
+                    return [], []
+            elif s.afuera(dq[-1].p, eps):
+                dq.pop()
+            else:
+                continue
+        dq.append(s)
+
+    while len(dq) > 2 and dq[0].afuera(_interseccion(dq[-1], dq[-2]), eps):
+        dq.pop()
+    while len(dq) > 2 and dq[-1].afuera(_interseccion(dq[0], dq[1]), eps):
+        dq.popleft()
+    if len(dq) < 3:
+        return [], []
+
+    lados = list(dq)
+    vertices = []
+    for i in range(len(lados)):
+        s, t = lados[i], lados[(i + 1) % len(lados)]
+        if abs(_cruz(s.d, t.d)) <= eps * math.hypot(*s.d) * math.hypot(*t.d):
+            # Dos lados paralelos consecutivos: la región es vacía o degenerada
+            return [], []
+        vertices.append(_interseccion(s, t))
+    return vertices, lados
+
+
+def _sin_repetidos(vertices: List[Punto], eps: float) -> List[Punto]:
+    """Quita vértices consecutivos coincidentes (regiones degeneradas o vértices degenerados)."""
+    salida: List[Punto] = []
+    for v in vertices:
+        if not salida or math.dist(v, salida[-1]) > eps:
+            salida.append(v)
+    while len(salida) > 1 and math.dist(salida[0], salida[-1]) <= eps:
+        salida.pop()
+    return salida
+
+
+def _recortar_poligono(vertices: List[Punto], eje: int, limite: float, signo: float = 1.0) -> List[Punto]:
+    """
+    Recorta un polígono convexo al semiplano coordenada[eje] <= limite (o >=
+    con signo = -1) por Sutherland-Hodgman.
+    """
+    salida: List[Punto] = []
+    for i, actual in enumerate(vertices):
+        previo = vertices[i - 1]
+        adentro_actual, adentro_previo = signo * actual[eje] <= signo * limite, signo * previo[eje] <= signo * limite
+        if adentro_actual != adentro_previo:
+            t = (limite - previo[eje]) / (actual[eje] - previo[eje])
+            corte = [previo[0] + t * (actual[0] - previo[0]), previo[1] + t * (actual[1] - previo[1])]
+            corte[eje] = limite
+            salida.append((corte[0], corte[1]))
+        if adentro_actual:
+            salida.append(actual)
+    return salida
+
+
+def _segmento_en_caja(a: float, b: float, c: float, limites_x: Punto, limites_y: Punto) -> Optional[List[Punto]]:
+    """Tramo de la recta a·x + b·y = c dentro de los límites del dibujo, o None si no la cruza."""
+    (x_min, x_max), (y_min, y_max) = limites_x, limites_y
+    puntos: List[Punto] = []
+    if b != 0:
+        for x in (x_min, x_max):
+            y = (c - a * x) / b
+            if y_min <= y <= y_max:
+                puntos.append((x, y))
+    if a != 0:
+        for y in (y_min, y_max):
+            x = (c - b * y) / a
+            if x_min <= x <= x_max:
+                puntos.append((x, y))
+    puntos = sorted(set(puntos))
+    if len(puntos) < 2:
+        return None
+    return [puntos[0], puntos[-1]]
+
+
+def _limites(valores: List[float]) -> Punto:
+    """
+    Rango de un eje que incluye el 0 y los `valores`, con un margen del 10%
+    del rango a cada lado (del lado negativo solo si hay valores negativos).
+    """
+    minimo, maximo = min([0.0] + valores), max([1.0] + valores)
+    margen = 0.1 * (maximo - minimo)
+    return (minimo - margen if minimo < 0 else 0.0, maximo + margen)
+
+
+def _redondear(valor: float) -> float:
+    # Sumar 0.0 convierte -0.0 en 0.0
+    return float(f"{valor:.{_CIFRAS}g}") + 0.0
+
+
+def _redondear_puntos(puntos: Optional[List[Punto]]) -> Optional[List[List[float]]]:
+    if puntos is None:
+        return None
+    return [[_redondear(x), _redondear(y)] for x, y in puntos]
+
+
+def geometria_2d(
+    C: List[float],
+    LI: List[List[float]],
+    LD: List[float],
+    O: List[Literal["<=", ">=", "="]],
+    mark_point: Optional[Tuple[float, float]] = None,
+    lower: ListaCotas = None,
+    upper: ListaCotas = None,
+) -> Dict[str, Any]:
+    """
+    Geometría de un problema de 2 variables para dibujarla en el cliente: la
+    región factible como polígono convexo, el tramo visible de cada
+    restricción y la recta de nivel del objetivo.
+
+    `lower` y `upper` son las cotas de x1 y x2 como en el solver (None en una
+    posición = sin cota; por defecto x >= 0): delimitan la región en lugar del
+    primer cuadrante.
+
+    Los límites del dibujo cubren el origen, las cotas finitas, los vértices
+    de la región, los cortes de las restricciones con los ejes (dentro de las
+    cotas inferiores) y el punto óptimo `mark_point`, con un margen del 10%
+    (sin calcular las intersecciones de todos los pares de rectas). La recta
+    del objetivo pasa por el óptimo si se da y por el origen si no.
+
+    Retorna un diccionario con:
+    - limites: {'x': [x_min, x_max], 'y': [y_min, y_max]} (el mínimo es 0
+      salvo que la región o las cotas lleguen a valores negativos).
+    - region: {'vertices': [[x, y], ...] en sentido antihorario (vacía si es
+      infactible), 'acotada': si la región es acotada}.
+    - restricciones: por cada una, 'coeficientes', 'operador', 'ld' y
+      'segmento' (extremos visibles, o None si no cruza el dibujo).
+    - objetivo: 'coeficientes', 'valor' de la recta y su 'segmento'.
+    - optimo: [x1, x2] o None.
+    """
+    if len(C) != 2:
+        raise ValueError("El gráfico solo puede generarse para problemas con exactamente 2 variables.")
+    if len(LI) != len(LD) or len(O) != len(LD) or any(len(fila) != 2 for fila in LI):
+        raise ValueError("LI, LD y O deben describir las mismas restricciones de 2 variables.")
+    inferiores, superiores = cotas_como_arreglos(lower, upper, 2)
+    cotas = [float(v) for v in (*inferiores, *superiores) if math.isfinite(v)]
+
+    # Escala del problema: cotas, cortes con los ejes y punto óptimo
+    cortes_x: List[float] = []
+    cortes_y: List[float] = []
+    for (a, b), r in zip(LI, LD):
+        if a != 0 and r / a >= inferiores[0]:
+            cortes_x.append(r / a)
+        if b != 0 and r / b >= inferiores[1]:
+            cortes_y.append(r / b)
+    optimo = None
+    if mark_point is not None and all(math.isfinite(v) for v in mark_point):
+        optimo = (float(mark_point[0]), float(mark_point[1]))
+    escala = max([1.0] + [abs(v) for v in cortes_x + cortes_y + cotas] + [abs(v) for v in (optimo or ())])
+
+    # Semiplanos: restricciones (una igualdad son dos), cotas y la caja auxiliar
+    semiplanos: List[Semiplano] = []
+    for (a, b), r, op in zip(LI, LD, O):
+        if a == 0 and b == 0:
+            if (op == "<=" and r < 0) or (op == ">=" and r > 0) or (op == "=" and r != 0):
+                semiplanos = []
+                break
+            continue
+        if op in ("<=", "="):
+            semiplanos.append(_semiplano(a, b, r))
+        if op in (">=", "="):
+            semiplanos.append(_semiplano(-a, -b, -r))
+    else:
+        for (a, b), inferior, superior in zip(((1.0, 0.0), (0.0, 1.0)), inferiores, superiores):
+            if math.isfinite(inferior):
+                semiplanos.append(_semiplano(-a, -b, -inferior))
+            if math.isfinite(superior):
+                semiplanos.append(_semiplano(a, b, superior))
+        caja = _FACTOR_CAJA * escala
+        semiplanos += [
+            _semiplano(-1.0, 0.0, caja, caja=True), _semiplano(0.0, -1.0, caja, caja=True),
+            _semiplano(1.0, 0.0, caja, caja=True), _semiplano(0.0, 1.0, caja, caja=True),
+        ]
+
+    eps = 1e-9 * escala
+    vertices, lados = interseccion_semiplanos(semiplanos, eps) if semiplanos else ([], [])
+    vertices = _sin_repetidos(vertices, eps)
+    acotada = not any(s.caja for s in lados)
+
+    # Límites del dibujo: los vértices sobre la caja auxiliar no cuentan
+    propios = [v for v in vertices if max(abs(v[0]), abs(v[1])) < _FACTOR_CAJA * escala * (1 - 1e-9)]
+    cotas_x = [float(v) for v in (inferiores[0], superiores[0]) if math.isfinite(v)]
+    cotas_y = [float(v) for v in (inferiores[1], superiores[1]) if math.isfinite(v)]
+    limites_x = _limites(cortes_x + cotas_x + [v[0] for v in propios] + ([optimo[0]] if optimo else []))
+    limites_y = _limites(cortes_y + cotas_y + [v[1] for v in propios] + ([optimo[1]] if optimo else []))
+
+    # Región visible: el polígono recortado a los límites
+    if not acotada:
+        for eje, (minimo, maximo) in enumerate((limites_x, limites_y)):
+            vertices = _recortar_poligono(_recortar_poligono(vertices, eje, maximo), eje, minimo, signo=-1.0)
+        vertices = _sin_repetidos(vertices, eps)
+
+    restricciones = [
+        {
+            "coeficientes": [a, b],
+            "operador": op,
+            "ld": r,
+            "segmento": _redondear_puntos(_segmento_en_caja(a, b, r, limites_x, limites_y)),
+        }
+        for (a, b), r, op in zip(LI, LD, O)
+    ]
+    valor = C[0] * optimo[0] + C[1] * optimo[1] if optimo else 0.0
+
+    return {
+        "limites": {"x": [_redondear(v) for v in limites_x], "y": [_redondear(v) for v in limites_y]},
+        "region": {"vertices": _redondear_puntos(vertices), "acotada": acotada and bool(vertices)},
+        "restricciones": restricciones,
+        "objetivo": {
+            "coeficientes": list(C),
+            "valor": _redondear(valor),
+            "segmento": _redondear_puntos(_segmento_en_caja(C[0], C[1], valor, limites_x, limites_y)),
+        },
+        "optimo": _redondear_puntos([optimo])[0] if optimo else None,
+    }
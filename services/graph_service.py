@@ -1,9 +1,76 @@
+import os
+import threading
+import time
 import numpy as np
-from typing import List, Tuple, Optional
+from typing import Dict, List, Literal, Optional, Tuple
 from io import BytesIO
-import matplotlib
-matplotlib.use("Agg")
-import matplotlib.pyplot as plt
+from matplotlib import rcParams
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from .feasible_region import geometria_2d
+from .metrics_service import etapa, sumar_etapa
+
+# --- Configuración (variables de entorno) ---
+# Figuras en reserva para reutilizar entre gráficos (una por hilo de render alcanza)
+GRAPH_FIGURE_POOL = int(os.getenv("SIMPLEX_GRAPH_FIGURE_POOL", os.getenv("SIMPLEX_THREAD_WORKERS", "4")))
+
+FormatoGrafico = Literal['png', 'svg', 'webp']
+AjusteGrafico = Literal['tight', 'fixed']
+
+MEDIA_TYPES_GRAFICO: Dict[str, str] = {
+    "png": "image/png",
+    "svg": "image/svg+xml",
+    "webp": "image/webp",
+}
+
+TAMANO_FIGURA = (10, 6)
+# Márgenes del ajuste 'fixed' (fracciones de la figura), con lugar para título y etiquetas
+_MARGENES_FIJOS = dict(left=0.07, right=0.98, bottom=0.09, top=0.93)
+# Los de matplotlib, para que una figura reutilizada no conserve los márgenes fijos
+_MARGENES_POR_DEFECTO = {lado: rcParams[f"figure.subplot.{lado}"] for lado in _MARGENES_FIJOS}
+
+
+class PoolFiguras:
+    """
+    Reserva de figuras de matplotlib con su canvas Agg y sus ejes, para
+    reutilizarlas entre gráficos: crear los ejes (con sus ticks y textos)
+    cuesta tanto como dibujarlos, así que al devolver una figura solo se
+    quitan las curvas y la leyenda.
+
+    Se usa `Figure` directamente, sin pyplot: cada figura pertenece a un solo
+    hilo mientras está prestada, así que varios gráficos pueden dibujarse en
+    paralelo sin compartir estado global.
+    """
+
+    def __init__(self, maximo: int = GRAPH_FIGURE_POOL):
+        self.maximo = maximo
+        self._libres: List[Figure] = []
+        self._lock = threading.Lock()
+
+    def tomar(self) -> Figure:
+        with self._lock:
+            if self._libres:
+                return self._libres.pop()
+        figura = Figure(figsize=TAMANO_FIGURA)
+        FigureCanvasAgg(figura)
+        return figura
+
+    def devolver(self, figura: Figure) -> None:
+        # Se limpia al devolverla para no retener los datos del gráfico anterior
+        for ax in figura.axes:
+            for artista in list(ax.lines) + list(ax.collections) + list(ax.patches):
+                artista.remove()
+            if ax.get_legend() is not None:
+                ax.get_legend().remove()
+            # Reinicia el ciclo de colores: el próximo gráfico usa los mismos
+            ax.set_prop_cycle(None)
+        with self._lock:
+            if len(self._libres) < self.maximo:
+                self._libres.append(figura)
+
+
+pool_figuras = PoolFiguras()
 
 
 def generar_grafico_2d(
@@ -16,6 +83,12 @@ def generar_grafico_2d(
     ylim: Optional[Tuple[float, float]] = None,
     show: bool = False,
     mark_point: Optional[Tuple[float, float]] = None,
+    formato: FormatoGrafico = 'png',
+    dpi: int = 100,
+    ajuste: AjusteGrafico = 'tight',
+    O: Optional[List[str]] = None,
+    lower: Optional[List[Optional[float]]] = None,
+    upper: Optional[List[Optional[float]]] = None,
 ):
     """
     Genera un gráfico que muestra las restricciones y la función objetivo.
@@ -31,141 +104,131 @@ def generar_grafico_2d(
         ylim: Límites del eje Y como tupla (min, max).
         show: Si es True, muestra el gráfico (usar solo en entornos interactivos).
         mark_point: Punto (x1, x2) a marcar como óptimo en el gráfico.
+        formato: 'png', 'svg' (vectorial, sin rasterizar) o 'webp'.
+        dpi: Resolución de los formatos raster; 100 da 1000x600 píxeles.
+        ajuste: 'tight' recorta los bordes al contenido (dibuja la figura dos
+            veces); 'fixed' usa márgenes fijos y la leyenda en una esquina
+            (dibuja una sola vez).
+        O: Operadores de las restricciones; si se dan, se sombrea la región factible.
+        lower: Cotas inferiores de x1 y x2 (None = sin cota; por defecto 0).
+        upper: Cotas superiores de x1 y x2 (None = sin cota; por defecto sin cota).
         
     Returns:
         str: Ruta del archivo si save_path fue especificado.
-        bytes: Contenido PNG en bytes si save_path es None.
+        bytes: Contenido en bytes en el `formato` pedido si save_path es None.
         
     Raises:
-        ValueError: Si el problema no tiene exactamente 2 variables.
+        ValueError: Si el problema no tiene exactamente 2 variables o el
+            formato o el ajuste no son válidos.
     """
     if len(C) != 2:
         raise ValueError("El gráfico solo puede generarse para problemas con exactamente 2 variables.")
+    if formato not in MEDIA_TYPES_GRAFICO:
+        raise ValueError(f"Formato de gráfico desconocido: {formato}")
+    if ajuste not in ('tight', 'fixed'):
+        raise ValueError(f"Ajuste de gráfico desconocido: {ajuste}")
 
-    def _finite_vals(vals: List[float]) -> List[float]:
-        """Filtra valores finitos de una lista."""
-        return [v for v in vals if v is not None and np.isfinite(v)]
-
-    xs: List[float] = []
-    ys: List[float] = []
-    
-    # Interceptos con ejes por cada restricción a*x1 + b*x2 = r
-    for coef, r in zip(LI, LD):
-        a, b = coef[0], coef[1]
-        if a != 0:
-            xs.append(r / a)
-            ys.append(0.0)
-        if b != 0:
-            xs.append(0.0)
-            ys.append(r / b)
-    
-    # Intersecciones entre pares de rectas
-    n = len(LI)
-    for i in range(n):
-        a1, b1 = LI[i]
-        r1 = LD[i]
-        for j in range(i + 1, n):
-            a2, b2 = LI[j]
-            r2 = LD[j]
-            det = a1 * b2 - a2 * b1
-            if abs(det) > 1e-12:
-                x_int = (r1 * b2 - r2 * b1) / det
-                y_int = (a1 * r2 - a2 * r1) / det
-                xs.append(x_int)
-                ys.append(y_int)
-
-    xs = _finite_vals(xs)
-    ys = _finite_vals(ys)
-
-    # Restringir a valores no negativos por convención (x1>=0, x2>=0)
-    xs_pos = [v for v in xs if v >= 0]
-    ys_pos = [v for v in ys if v >= 0]
-
-    # Límites con margen
-    if xlim is None:
-        if xs_pos:
-            xmax = max(xs_pos)
-            x_min, x_max = 0.0, max(1.0, xmax) * 1.1
-        else:
-            x_min, x_max = 0.0, 10.0
-    else:
-        x_min, x_max = xlim
+    inicio = time.perf_counter()
 
-    if ylim is None:
-        if ys_pos:
-            ymax = max(ys_pos)
-            y_min, y_max = 0.0, max(1.0, ymax) * 1.1
-        else:
-            y_min, y_max = 0.0, 10.0
-    else:
-        y_min, y_max = ylim
-
-    # Asegurar que el punto óptimo quede dentro de los límites
-    if mark_point is not None:
-        mx, my = mark_point
-        if np.isfinite(mx) and mx >= 0:
-            x_max = max(x_max, mx * 1.1 if mx > 0 else 1.0)
-        if np.isfinite(my) and my >= 0:
-            y_max = max(y_max, my * 1.1 if my > 0 else 1.0)
+    # Límites y región factible en O(n log n) (ver `geometria_2d`); sin operadores
+    # se asumen restricciones '<=' solo para los límites y la región no se sombrea
+    geometria = geometria_2d(C, LI, LD, O or ["<="] * len(LD), mark_point, lower, upper)
+    x_min, x_max = xlim if xlim is not None else geometria["limites"]["x"]
+    y_min, y_max = ylim if ylim is not None else geometria["limites"]["y"]
+    region = geometria["region"]["vertices"] if O is not None else None
 
     x = np.linspace(x_min, x_max, 400)
+    sumar_etapa("grafico_limites", inicio)
 
-    plt.figure(figsize=(10, 6))
+    if show:
+        # Solo en entornos interactivos: la ventana necesita una figura de pyplot
+        import matplotlib.pyplot as plt
+
+        figura = plt.figure(figsize=TAMANO_FIGURA)
+        _dibujar(figura, C, LI, LD, x, (x_min, x_max), (y_min, y_max), titulo, mark_point, ajuste, region)
+        result = _guardar(figura, save_path, formato, dpi, ajuste)
+        plt.show()
+        plt.close(figura)
+        return result
+
+    figura = pool_figuras.tomar()
+    try:
+        with etapa("grafico_dibujo"):
+            _dibujar(figura, C, LI, LD, x, (x_min, x_max), (y_min, y_max), titulo, mark_point, ajuste, region)
+        with etapa("grafico_render"):
+            return _guardar(figura, save_path, formato, dpi, ajuste)
+    finally:
+        pool_figuras.devolver(figura)
+
+
+def _dibujar(
+    figura: Figure,
+    C: List[float],
+    LI: List[List[float]],
+    LD: List[float],
+    x: np.ndarray,
+    xlim: Tuple[float, float],
+    ylim: Tuple[float, float],
+    titulo: str,
+    mark_point: Optional[Tuple[float, float]],
+    ajuste: AjusteGrafico,
+    region: Optional[List[List[float]]] = None,
+) -> None:
+    """Dibuja región factible, restricciones, función objetivo y punto óptimo en los ejes de `figura`."""
+    figura.subplots_adjust(**(_MARGENES_FIJOS if ajuste == 'fixed' else _MARGENES_POR_DEFECTO))
+    ax = figura.axes[0] if figura.axes else figura.add_subplot()
+
+    if region:
+        xs, ys = zip(*region)
+        ax.fill(xs, ys, facecolor='tab:green', edgecolor='none', alpha=0.15, label="Región factible")
 
     # Graficar restricciones
     for i, (coef, ld) in enumerate(zip(LI, LD)):
         if coef[1] != 0:
             y = (ld - coef[0] * x) / coef[1]
-            plt.plot(x, y, label=f"Restricción {i+1}")
+            ax.plot(x, y, label=f"Restricción {i+1}")
         else:
-            plt.axvline(x=ld / coef[0], label=f"Restricción {i+1}")
+            ax.axvline(x=ld / coef[0], label=f"Restricción {i+1}")
 
     # Graficar función objetivo
     if C[1] != 0:
         y_obj = (-C[0] * x) / C[1]
-        plt.plot(x, y_obj, 'r--', label="Función Objetivo")
+        ax.plot(x, y_obj, 'r--', label="Función Objetivo")
     else:
-        plt.axvline(x=0, color='r', linestyle='--', label="Función Objetivo")
+        ax.axvline(x=0, color='r', linestyle='--', label="Función Objetivo")
 
-    plt.xlim(x_min, x_max)
-    plt.ylim(y_min, y_max)
-    plt.xlabel("x1")
-    plt.ylabel("x2")
-    plt.title(titulo)
-    plt.legend()
-    plt.grid(True, linestyle='--', alpha=0.5)
+    ax.set_xlim(*xlim)
+    ax.set_ylim(*ylim)
+    ax.set_xlabel("x1")
+    ax.set_ylabel("x2")
+    ax.set_title(titulo)
+    ax.grid(True, linestyle='--', alpha=0.5)
 
     # Marcar punto óptimo si se proporciona
     if mark_point is not None:
         mx, my = mark_point
         if np.isfinite(mx) and np.isfinite(my):
-            plt.scatter([mx], [my], c='k', s=60, zorder=5, label='Óptimo')
-            # Asegurar que la leyenda muestre el punto (manejar duplicación)
-            handles, labels = plt.gca().get_legend_handles_labels()
-            seen = set()
-            new = []
-            for h, l in zip(handles, labels):
-                if l not in seen:
-                    new.append((h, l))
-                    seen.add(l)
-            if new:
-                plt.legend(*zip(*new))
-
-    # Guardar si se especifica ruta; si no, devolver bytes PNG
-    result = None
-    if save_path:
-        plt.savefig(save_path, bbox_inches='tight')
-        result = save_path
-    else:
-        buf = BytesIO()
-        plt.savefig(buf, format='png', bbox_inches='tight')
-        buf.seek(0)
-        result = buf.getvalue()
-        buf.close()
+            ax.scatter([mx], [my], c='k', s=60, zorder=5, label='Óptimo')
+
+    # Una sola leyenda al final; loc='best' prueba cada posición contra todas
+    # las curvas, por eso el ajuste 'fixed' la deja en una esquina
+    ax.legend(loc='best' if ajuste == 'tight' else 'upper right')
 
-    # Mostrar solo si se solicita (por defecto False en entorno servidor)
-    if show:
-        plt.show()
 
-    plt.close()
-    return result
+def _guardar(
+    figura: Figure,
+    save_path: Optional[str],
+    formato: FormatoGrafico,
+    dpi: int,
+    ajuste: AjusteGrafico,
+):
+    """Rasteriza (o exporta a SVG) la figura a `save_path` o a bytes."""
+    opciones = dict(format=formato, dpi=dpi)
+    if ajuste == 'tight':
+        opciones["bbox_inches"] = 'tight'
+    if save_path:
+        figura.savefig(save_path, **opciones)
+        return save_path
+    buf = BytesIO()
+    figura.savefig(buf, **opciones)
+    return buf.getvalue()
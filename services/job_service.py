@@ -0,0 +1,308 @@
+import os
+import json
+import time
+import uuid
+import sqlite3
+import logging
+import threading
+from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, Literal, Optional
+
+from schemas import SimplexRequest
+from .executor_service import ServicioSaturadoError
+from .metrics_service import medir, registrar_resolucion
+from .simplex_service import metodo_de_request, resolver_desde_request
+
+logger = logging.getLogger(__name__)
+
+# --- Configuración (variables de entorno) ---
+# Hilos que resuelven trabajos en segundo plano
+JOB_WORKERS = int(os.getenv("SIMPLEX_JOB_WORKERS", "2"))
+# Trabajos sin terminar admitidos a la vez (pendientes + en curso) antes de responder 503
+JOB_QUEUE_DEPTH = int(os.getenv("SIMPLEX_JOB_QUEUE_DEPTH", "64"))
+# Almacén de los trabajos: 'memory' o 'sqlite'
+JOB_STORE = os.getenv("SIMPLEX_JOB_STORE", "memory")
+# Archivo de la base SQLite (si JOB_STORE='sqlite')
+JOB_DB_PATH = os.getenv("SIMPLEX_JOB_DB", "simplex_jobs.sqlite3")
+# Segundos que se conservan los trabajos terminados
+JOB_TTL = float(os.getenv("SIMPLEX_JOB_TTL", "3600"))
+# Intervalo mínimo entre escrituras del progreso en el almacén, en segundos
+INTERVALO_PROGRESO = 0.25
+
+EstadoTrabajo = Literal['pendiente', 'en_curso', 'completado', 'fallido', 'cancelado']
+ESTADOS_FINALES = ('completado', 'fallido', 'cancelado')
+
+
+class TrabajoCanceladoError(RuntimeError):
+    """Se lanza desde el callback de progreso para interrumpir un trabajo cancelado."""
+
+
+class AlmacenTrabajos(ABC):
+    """
+    Interfaz del almacén de trabajos. Cada trabajo es un diccionario con
+    id, status, progreso, resultado, error y las marcas de tiempo
+    creado/iniciado/terminado (segundos desde epoch).
+    """
+
+    @abstractmethod
+    def crear(self, trabajo: Dict[str, Any]) -> None:
+        """Guarda un trabajo nuevo."""
+
+    @abstractmethod
+    def obtener(self, id_trabajo: str) -> Optional[Dict[str, Any]]:
+        """Retorna una copia del trabajo, o None si no existe."""
+
+    @abstractmethod
+    def actualizar(self, id_trabajo: str, **campos: Any) -> None:
+        """Actualiza los campos indicados del trabajo."""
+
+    @abstractmethod
+    def purgar(self, antes_de: float) -> int:
+        """Elimina los trabajos terminados antes de `antes_de`. Retorna cuántos eliminó."""
+
+
+class AlmacenMemoria(AlmacenTrabajos):
+    """Almacén en memoria del proceso (se pierde al reiniciar)."""
+
+    def __init__(self):
+        self._trabajos: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def crear(self, trabajo: Dict[str, Any]) -> None:
+        with self._lock:
+            self._trabajos[trabajo["id"]] = dict(trabajo)
+
+    def obtener(self, id_trabajo: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            trabajo = self._trabajos.get(id_trabajo)
+            return dict(trabajo) if trabajo is not None else None
+
+    def actualizar(self, id_trabajo: str, **campos: Any) -> None:
+        with self._lock:
+            if id_trabajo in self._trabajos:
+                self._trabajos[id_trabajo].update(campos)
+
+    def purgar(self, antes_de: float) -> int:
+        with self._lock:
+            viejos = [
+                id_trabajo for id_trabajo, t in self._trabajos.items()
+                if t["status"] in ESTADOS_FINALES and t["terminado"] is not None and t["terminado"] < antes_de
+            ]
+            for id_trabajo in viejos:
+                del self._trabajos[id_trabajo]
+        return len(viejos)
+
+
+class AlmacenSQLite(AlmacenTrabajos):
+    """
+    Almacén en un archivo SQLite: los trabajos terminados sobreviven a un
+    reinicio y pueden consultarse desde otros procesos del servidor. Los que
+    estaban sin terminar al abrir la base se marcan como fallidos.
+    """
+
+    # Columnas guardadas como JSON
+    _JSON = ("progreso", "resultado")
+
+    def __init__(self, ruta: str):
+        self.ruta = ruta
+        self._lock = threading.Lock()
+        self._conexion = sqlite3.connect(ruta, check_same_thread=False, isolation_level=None)
+        self._conexion.execute("PRAGMA journal_mode=WAL")
+        self._conexion.execute(
+            """
+            CREATE TABLE IF NOT EXISTS trabajos (
+                id TEXT PRIMARY KEY,
+                status TEXT NOT NULL,
+                progreso TEXT,
+                resultado TEXT,
+                error TEXT,
+                creado REAL NOT NULL,
+                iniciado REAL,
+                terminado REAL
+            )
+            """
+        )
+        self._conexion.execute(
+            "UPDATE trabajos SET status = 'fallido', error = ?, terminado = ? WHERE status IN ('pendiente', 'en_curso')",
+            ("El servidor se reinició antes de terminar el trabajo.", time.time()),
+        )
+
+    def crear(self, trabajo: Dict[str, Any]) -> None:
+        columnas = list(trabajo)
+        valores = [json.dumps(trabajo[c]) if c in self._JSON else trabajo[c] for c in columnas]
+        with self._lock:
+            self._conexion.execute(
+                f"INSERT INTO trabajos ({', '.join(columnas)}) VALUES ({', '.join('?' * len(columnas))})",
+                valores,
+            )
+
+    def obtener(self, id_trabajo: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            cursor = self._conexion.execute("SELECT * FROM trabajos WHERE id = ?", (id_trabajo,))
+            fila = cursor.fetchone()
+            nombres = [d[0] for d in cursor.description]
+        if fila is None:
+            return None
+        trabajo = dict(zip(nombres, fila))
+        for c in self._JSON:
+            trabajo[c] = json.loads(trabajo[c]) if trabajo[c] is not None else None
+        return trabajo
+
+    def actualizar(self, id_trabajo: str, **campos: Any) -> None:
+        columnas = list(campos)
+        valores = [json.dumps(campos[c]) if c in self._JSON else campos[c] for c in columnas]
+        with self._lock:
+            self._conexion.execute(
+                f"UPDATE trabajos SET {', '.join(f'{c} = ?' for c in columnas)} WHERE id = ?",
+                valores + [id_trabajo],
+            )
+
+    def purgar(self, antes_de: float) -> int:
+        with self._lock:
+            cursor = self._conexion.execute(
+                "DELETE FROM trabajos WHERE status IN ('completado', 'fallido', 'cancelado') AND terminado < ?",
+                (antes_de,),
+            )
+        return cursor.rowcount
+
+
+def crear_almacen(tipo: str = JOB_STORE, ruta: str = JOB_DB_PATH) -> AlmacenTrabajos:
+    """Crea el almacén configurado ('memory' o 'sqlite')."""
+    if tipo == "memory":
+        return AlmacenMemoria()
+    if tipo == "sqlite":
+        return AlmacenSQLite(ruta)
+    raise ValueError(f"Almacén de trabajos desconocido: {tipo}")
+
+
+class GestorTrabajos:
+    """
+    Cola de trabajos de resolución en segundo plano para problemas que no
+    terminan dentro de un request HTTP.
+
+    Los trabajos se resuelven en un pool de hilos local y su estado vive en el
+    almacén. El progreso (etapa, iteración y objetivo) llega por el callback
+    de `resolver_simplex_tabular`, que también corta un trabajo cancelado en la
+    iteración siguiente. Los hilos permiten cancelar y seguir el avance sin
+    comunicación entre procesos; el pool de procesos sigue atendiendo los
+    requests síncronos.
+    """
+
+    def __init__(self, almacen: AlmacenTrabajos, workers: int = JOB_WORKERS,
+                 max_pendientes: int = JOB_QUEUE_DEPTH, ttl: float = JOB_TTL):
+        self.almacen = almacen
+        self.workers = workers
+        self.max_pendientes = max_pendientes
+        self.ttl = ttl
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._futuros: Dict[str, Future] = {}
+        self._cancelados: set = set()
+        self._lock = threading.Lock()
+
+    def _obtener_pool(self) -> ThreadPoolExecutor:
+        if self._pool is None:
+            logger.info(f"Creando pool de {self.workers} hilos para trabajos.")
+            self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="simplex-job")
+        return self._pool
+
+    def enviar(self, request: SimplexRequest) -> Dict[str, Any]:
+        """Encola un problema y retorna su trabajo. Lanza ServicioSaturadoError si la cola está llena."""
+        self.almacen.purgar(time.time() - self.ttl)
+        with self._lock:
+            if len(self._futuros) >= self.max_pendientes:
+                logger.warning(f"Cola de trabajos saturada ({len(self._futuros)}/{self.max_pendientes}).")
+                raise ServicioSaturadoError("La cola de trabajos está llena. Reintente más tarde.")
+            trabajo = {
+                "id": uuid.uuid4().hex,
+                "status": "pendiente",
+                "progreso": None,
+                "resultado": None,
+                "error": None,
+                "creado": time.time(),
+                "iniciado": None,
+                "terminado": None,
+            }
+            self.almacen.crear(trabajo)
+            self._futuros[trabajo["id"]] = self._obtener_pool().submit(self._ejecutar, trabajo["id"], request)
+        return trabajo
+
+    def obtener(self, id_trabajo: str) -> Optional[Dict[str, Any]]:
+        return self.almacen.obtener(id_trabajo)
+
+    @property
+    def pendientes(self) -> int:
+        """Trabajos sin terminar (pendientes + en curso)."""
+        with self._lock:
+            return len(self._futuros)
+
+    def cancelar(self, id_trabajo: str) -> Optional[Dict[str, Any]]:
+        """
+        Cancela un trabajo sin terminar: si aún no empezó se descarta, y si está
+        en curso se interrumpe en su próxima iteración. Retorna el trabajo.
+        """
+        with self._lock:
+            futuro = self._futuros.get(id_trabajo)
+            if futuro is not None:
+                self._cancelados.add(id_trabajo)
+                if futuro.cancel():
+                    self._terminar(id_trabajo, "cancelado")
+        return self.almacen.obtener(id_trabajo)
+
+    def _terminar(self, id_trabajo: str, status: EstadoTrabajo, **campos: Any) -> None:
+        """Registra el estado final y libera el lugar en la cola (con `_lock` tomado)."""
+        self.almacen.actualizar(id_trabajo, status=status, terminado=time.time(), **campos)
+        self._futuros.pop(id_trabajo, None)
+        self._cancelados.discard(id_trabajo)
+
+    def _ejecutar(self, id_trabajo: str, request: SimplexRequest) -> None:
+        with self._lock:
+            # Cancelado entre que el pool lo tomó y este punto
+            if id_trabajo in self._cancelados:
+                self._terminar(id_trabajo, "cancelado")
+                return
+            self.almacen.actualizar(id_trabajo, status="en_curso", iniciado=time.time())
+
+        ultimo: Dict[str, Any] = {}
+        ultima_escritura = 0.0
+
+        def _progreso(etapa: str, iteracion: int, objetivo: float) -> None:
+            nonlocal ultimo, ultima_escritura
+            if id_trabajo in self._cancelados:
+                raise TrabajoCanceladoError()
+            ultimo = {"etapa": etapa, "iteracion": iteracion, "objetivo": objetivo}
+            # Escribir en cada pivoteo sería más caro que el pivoteo mismo
+            ahora = time.monotonic()
+            if ahora - ultima_escritura >= INTERVALO_PROGRESO:
+                ultima_escritura = ahora
+                self.almacen.actualizar(id_trabajo, progreso=ultimo)
+
+        try:
+            resultado, tiempos = medir(resolver_desde_request, request, _progreso)
+        except TrabajoCanceladoError:
+            logger.info(f"Trabajo {id_trabajo} cancelado.")
+            with self._lock:
+                self._terminar(id_trabajo, "cancelado")
+        except ValueError as e:
+            logger.warning(f"Datos inválidos en el trabajo {id_trabajo}: {e}")
+            with self._lock:
+                self._terminar(id_trabajo, "fallido", error=f"Datos inválidos: {e}")
+        except Exception:
+            logger.exception(f"Error interno en el trabajo {id_trabajo}")
+            with self._lock:
+                self._terminar(id_trabajo, "fallido", error="Ocurrió un error interno al resolver el problema.")
+        else:
+            registrar_resolucion(metodo_de_request(request), resultado, tiempos)
+            with self._lock:
+                self._terminar(id_trabajo, "completado", resultado=resultado, progreso=ultimo or None)
+
+    def cerrar(self) -> None:
+        """Cancela los trabajos en curso y detiene el pool (se invoca al apagar la aplicación)."""
+        with self._lock:
+            self._cancelados.update(self._futuros)
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+
+
+gestor_trabajos = GestorTrabajos(crear_almacen())
@@ -0,0 +1,299 @@
+import time
+import threading
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+# Límites (en segundos) de los buckets de duración, como los de Prometheus por defecto
+BUCKETS_SEGUNDOS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+# Límites de los buckets de cantidad de iteraciones (pivoteos)
+BUCKETS_ITERACIONES = (0, 1, 5, 10, 25, 50, 100, 250, 500, 1000, 5000, 10000, 100000)
+
+MEDIA_TYPE_PROMETHEUS = "text/plain; version=0.0.4; charset=utf-8"
+
+Etiquetas = Tuple[str, ...]
+
+# Tiempos por etapa de la operación en curso (None si nadie los está midiendo)
+_tiempos_etapas: ContextVar[Optional[Dict[str, float]]] = ContextVar("tiempos_etapas", default=None)
+
+
+def _escapar(valor: str) -> str:
+    return valor.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _formatear_etiquetas(nombres: Sequence[str], valores: Sequence[str], extra: str = "") -> str:
+    pares = [f'{n}="{_escapar(str(v))}"' for n, v in zip(nombres, valores)]
+    if extra:
+        pares.append(extra)
+    return "{" + ",".join(pares) + "}" if pares else ""
+
+
+def _formatear_valor(valor: float) -> str:
+    if valor == float("inf"):
+        return "+Inf"
+    return repr(float(valor)) if not float(valor).is_integer() else str(int(valor))
+
+
+class Metrica(ABC):
+    """
+    Base de las métricas: nombre, ayuda, nombres de etiquetas y lock propio.
+    Cada subclase define su `tipo` de Prometheus y sus `muestras`.
+    """
+
+    tipo: str
+
+    def __init__(self, nombre: str, ayuda: str, etiquetas: Sequence[str] = ()):
+        self.nombre = nombre
+        self.ayuda = ayuda
+        self.etiquetas = tuple(etiquetas)
+        self._lock = threading.Lock()
+
+    def _clave(self, valores: Sequence[Any]) -> Etiquetas:
+        if len(valores) != len(self.etiquetas):
+            raise ValueError(f"{self.nombre} espera las etiquetas {self.etiquetas}.")
+        return tuple(str(v) for v in valores)
+
+    @abstractmethod
+    def muestras(self) -> List[str]:
+        """Líneas de muestras en el formato de texto de Prometheus."""
+
+    def exponer(self) -> str:
+        lineas = [f"# HELP {self.nombre} {self.ayuda}", f"# TYPE {self.nombre} {self.tipo}"]
+        return "\n".join(lineas + self.muestras())
+
+
+class Contador(Metrica):
+    """Contador monótono por combinación de etiquetas."""
+
+    tipo = "counter"
+
+    def __init__(self, nombre: str, ayuda: str, etiquetas: Sequence[str] = ()):
+        super().__init__(nombre, ayuda, etiquetas)
+        self._valores: Dict[Etiquetas, float] = {}
+
+    def incrementar(self, *etiquetas: Any, cantidad: float = 1.0) -> None:
+        clave = self._clave(etiquetas)
+        with self._lock:
+            self._valores[clave] = self._valores.get(clave, 0.0) + cantidad
+
+    def valor(self, *etiquetas: Any) -> float:
+        with self._lock:
+            return self._valores.get(self._clave(etiquetas), 0.0)
+
+    def muestras(self) -> List[str]:
+        with self._lock:
+            valores = sorted(self._valores.items())
+        return [
+            f"{self.nombre}{_formatear_etiquetas(self.etiquetas, clave)} {_formatear_valor(v)}"
+            for clave, v in valores
+        ]
+
+
+class Histograma(Metrica):
+    """
+    Histograma acumulativo por combinación de etiquetas: cuenta las
+    observaciones menores o iguales a cada límite de `buckets`, más su suma.
+    """
+
+    tipo = "histogram"
+
+    def __init__(self, nombre: str, ayuda: str, etiquetas: Sequence[str] = (),
+                 buckets: Sequence[float] = BUCKETS_SEGUNDOS):
+        super().__init__(nombre, ayuda, etiquetas)
+        self.buckets = tuple(sorted(buckets)) + (float("inf"),)
+        # Por etiquetas: [conteos por bucket (no acumulados), suma, cantidad]
+        self._series: Dict[Etiquetas, List[Any]] = {}
+
+    def observar(self, valor: float, *etiquetas: Any) -> None:
+        clave = self._clave(etiquetas)
+        indice = bisect_left(self.buckets, valor)
+        with self._lock:
+            serie = self._series.get(clave)
+            if serie is None:
+                serie = self._series[clave] = [[0] * len(self.buckets), 0.0, 0]
+            serie[0][indice] += 1
+            serie[1] += valor
+            serie[2] += 1
+
+    def cantidad(self, *etiquetas: Any) -> int:
+        with self._lock:
+            serie = self._series.get(self._clave(etiquetas))
+            return serie[2] if serie is not None else 0
+
+    def muestras(self) -> List[str]:
+        with self._lock:
+            series = sorted((clave, (list(s[0]), s[1], s[2])) for clave, s in self._series.items())
+        lineas = []
+        for clave, (conteos, suma, cantidad) in series:
+            acumulado = 0
+            for limite, conteo in zip(self.buckets, conteos):
+                acumulado += conteo
+                etiquetas = _formatear_etiquetas(self.etiquetas, clave, f'le="{_formatear_valor(limite)}"')
+                lineas.append(f"{self.nombre}_bucket{etiquetas} {acumulado}")
+            etiquetas = _formatear_etiquetas(self.etiquetas, clave)
+            lineas.append(f"{self.nombre}_sum{etiquetas} {_formatear_valor(suma)}")
+            lineas.append(f"{self.nombre}_count{etiquetas} {cantidad}")
+        return lineas
+
+
+class Medidor(Metrica):
+    """
+    Valor calculado al exponer con `leer`, que retorna {etiquetas: valor}.
+    Sirve para estados que ya lleva otro componente (caché, colas) sin
+    duplicar su contabilidad; `tipo` puede ser 'gauge' o 'counter'.
+    """
+
+    def __init__(self, nombre: str, ayuda: str, leer: Callable[[], Dict[Etiquetas, float]],
+                 etiquetas: Sequence[str] = (), tipo: str = "gauge"):
+        super().__init__(nombre, ayuda, etiquetas)
+        self.leer = leer
+        self.tipo = tipo
+
+    def muestras(self) -> List[str]:
+        return [
+            f"{self.nombre}{_formatear_etiquetas(self.etiquetas, clave)} {_formatear_valor(v)}"
+            for clave, v in sorted(self.leer().items())
+        ]
+
+
+class RegistroMetricas:
+    """Conjunto de métricas del proceso, expuestas en el formato de texto de Prometheus."""
+
+    def __init__(self):
+        self._metricas: Dict[str, Metrica] = {}
+        self._lock = threading.Lock()
+
+    def registrar(self, metrica: Metrica) -> Metrica:
+        with self._lock:
+            if metrica.nombre in self._metricas:
+                raise ValueError(f"La métrica {metrica.nombre} ya está registrada.")
+            self._metricas[metrica.nombre] = metrica
+        return metrica
+
+    def contador(self, nombre: str, ayuda: str, etiquetas: Sequence[str] = ()) -> Contador:
+        return self.registrar(Contador(nombre, ayuda, etiquetas))
+
+    def histograma(self, nombre: str, ayuda: str, etiquetas: Sequence[str] = (),
+                   buckets: Sequence[float] = BUCKETS_SEGUNDOS) -> Histograma:
+        return self.registrar(Histograma(nombre, ayuda, etiquetas, buckets))
+
+    def medidor(self, nombre: str, ayuda: str, leer: Callable[[], Dict[Etiquetas, float]],
+                etiquetas: Sequence[str] = (), tipo: str = "gauge") -> Medidor:
+        return self.registrar(Medidor(nombre, ayuda, leer, etiquetas, tipo))
+
+    def exponer(self) -> str:
+        with self._lock:
+            metricas = list(self._metricas.values())
+        return "\n".join(m.exponer() for m in metricas) + "\n"
+
+
+# --- Tiempos por etapa ---
+
+@contextmanager
+def etapa(nombre: str) -> Iterator[None]:
+    """
+    Suma la duración del bloque a la etapa `nombre` de la medición en curso
+    (ver `medir`). Fuera de una medición no hace nada, así que los motores
+    pueden marcar sus etapas sin costo cuando nadie las mide.
+    """
+    tiempos = _tiempos_etapas.get()
+    if tiempos is None:
+        yield
+        return
+    inicio = time.perf_counter()
+    try:
+        yield
+    finally:
+        tiempos[nombre] = tiempos.get(nombre, 0.0) + time.perf_counter() - inicio
+
+
+def sumar_etapa(nombre: str, inicio: float) -> None:
+    """Como `etapa`, para un tramo que no forma un bloque: suma el tiempo desde `inicio` (de `time.perf_counter`)."""
+    tiempos = _tiempos_etapas.get()
+    if tiempos is not None:
+        tiempos[nombre] = tiempos.get(nombre, 0.0) + time.perf_counter() - inicio
+
+
+def medir(fn: Callable[..., Any], *args: Any) -> Tuple[Any, Dict[str, float]]:
+    """
+    Ejecuta `fn(*args)` y retorna (valor, tiempos), con los segundos de cada
+    etapa marcada con `etapa` y el total en 'total'.
+
+    Los tiempos viajan junto con el valor para que funcione también dentro
+    del pool de procesos, cuyas métricas no llegan al proceso del servidor.
+    """
+    tiempos: Dict[str, float] = {}
+    token = _tiempos_etapas.set(tiempos)
+    inicio = time.perf_counter()
+    try:
+        valor = fn(*args)
+    finally:
+        _tiempos_etapas.reset(token)
+    tiempos["total"] = time.perf_counter() - inicio
+    return valor, tiempos
+
+
+def formatear_tiempos(tiempos: Optional[Dict[str, float]]) -> str:
+    """
+    Valor del header X-Solve-Timing, con la sintaxis de Server-Timing y las
+    duraciones en milisegundos: "fase_1;dur=1.234, total;dur=2.5". Sin
+    tiempos (resultado tomado de la caché) retorna "cache;desc=hit".
+    """
+    if tiempos is None:
+        return "cache;desc=hit"
+    return ", ".join(f"{nombre};dur={segundos * 1000:.3f}" for nombre, segundos in tiempos.items())
+
+
+# --- Métricas de la aplicación ---
+
+registro = RegistroMetricas()
+
+duracion_requests = registro.histograma(
+    "simplex_http_request_duration_seconds",
+    "Duración de los requests HTTP hasta enviar los headers de la respuesta.",
+    ("route", "method", "code"),
+)
+duracion_etapas = registro.histograma(
+    "simplex_stage_duration_seconds",
+    "Duración de cada etapa de la resolución, el gráfico y el PDF.",
+    ("stage",),
+)
+duracion_resoluciones = registro.histograma(
+    "simplex_solve_duration_seconds",
+    "Duración de cada resolución dentro del worker (sin la espera en la cola).",
+    ("method",),
+)
+espera_ejecutores = registro.histograma(
+    "simplex_executor_wait_seconds",
+    "Tiempo de un trabajo en la cola del ejecutor más la comunicación con el pool.",
+    ("executor",),
+)
+iteraciones_resolucion = registro.histograma(
+    "simplex_solve_iterations",
+    "Pivoteos (o iteraciones de barrera) de cada resolución.",
+    ("method",),
+    buckets=BUCKETS_ITERACIONES,
+)
+resoluciones = registro.contador(
+    "simplex_solves_total",
+    "Resoluciones terminadas, por método y status.",
+    ("method", "status"),
+)
+
+
+def registrar_etapas(tiempos: Dict[str, float]) -> None:
+    """Observa en `duracion_etapas` cada etapa medida (sin el total)."""
+    for nombre, segundos in tiempos.items():
+        if nombre != "total":
+            duracion_etapas.observar(segundos, nombre)
+
+
+def registrar_resolucion(metodo: str, resultado: Dict[str, Any], tiempos: Optional[Dict[str, float]] = None) -> None:
+    """Registra el status, las iteraciones y, si se midieron, los tiempos de una resolución."""
+    resoluciones.incrementar(metodo, resultado["status"])
+    iteraciones_resolucion.observar(resultado["iteraciones"], metodo)
+    if tiempos is not None:
+        duracion_resoluciones.observar(tiempos["total"], metodo)
+        registrar_etapas(tiempos)
@@ -0,0 +1,120 @@
+import os
+import logging
+import numpy as np
+
+from .tolerances import TOL_FACTIBILIDAD, TOL_PIVOTE
+
+logger = logging.getLogger(__name__)
+
+try:
+    # Numba es opcional: si no está instalado se usa el kernel de numpy
+    import numba
+except ImportError:  # pragma: no cover - depende del entorno
+    numba = None
+
+NUMBA_DISPONIBLE = numba is not None
+# Permite desactivar Numba aunque esté instalado (p. ej. para comparar resultados)
+USAR_NUMBA = NUMBA_DISPONIBLE and os.getenv("SIMPLEX_USE_NUMBA", "1") != "0"
+
+
+def razon_minima(columna: np.ndarray, rhs: np.ndarray, tol_pivote: float = TOL_PIVOTE) -> int:
+    """
+    Test de razón mínima vectorizado sobre la columna pivote (sin la fila Z).
+    Retorna el índice de la fila pivote, o -1 si ningún coeficiente es positivo.
+    Ante empates gana la primera fila, igual que el recorrido fila por fila.
+    """
+    positivos = columna > tol_pivote
+    if not positivos.any():
+        return -1
+    ratios = np.full(columna.shape[0], np.inf)
+    np.divide(rhs, columna, out=ratios, where=positivos)
+    return int(np.argmin(ratios))
+
+
+def razon_minima_harris(
+    columna: np.ndarray,
+    rhs: np.ndarray,
+    tol_pivote: float = TOL_PIVOTE,
+    tol_factibilidad: float = TOL_FACTIBILIDAD,
+) -> int:
+    """
+    Test de razón de Harris en dos pasadas. La primera calcula el paso máximo
+    permitiendo que las básicas queden hasta `tol_factibilidad` por debajo de
+    cero; la segunda elige, entre las filas cuya razón no supera ese paso, la
+    de mayor coeficiente. Así se evitan pivotes diminutos cuando varias razones
+    están casi empatadas, a costa de infactibilidades dentro de la tolerancia.
+    """
+    positivos = columna > tol_pivote
+    if not positivos.any():
+        return -1
+    filas = np.flatnonzero(positivos)
+    alpha = columna[filas]
+    paso_maximo = np.min((np.maximum(rhs[filas], 0.0) + tol_factibilidad) / alpha)
+    candidatas = np.maximum(rhs[filas], 0.0) / alpha <= paso_maximo
+    return int(filas[candidatas][np.argmax(alpha[candidatas])])
+
+
+# Filas por bloque en la actualización densa: el temporal del bloque cabe en caché
+FILAS_POR_BLOQUE = 32
+
+
+def pivotear_numpy(tableau: np.ndarray, fila: int, col: int) -> None:
+    """
+    Pivoteo de Gauss-Jordan in-place como actualización de rango 1:
+    T ← T − (columna pivote) ⊗ (fila pivote normalizada).
+
+    El producto externo se aplica por bloques de filas para no materializar un
+    temporal del tamaño del tableau, y solo sobre las filas con factor no nulo
+    cuando la columna pivote es mayormente cero.
+    """
+    tableau[fila] /= tableau[fila, col]
+    factores = tableau[:, col].copy()
+    factores[fila] = 0.0  # La fila pivote no se modifica
+    fila_pivote = tableau[fila].copy()
+
+    no_nulas = np.flatnonzero(factores)
+    if 2 * no_nulas.size < factores.size:
+        for i in range(0, no_nulas.size, FILAS_POR_BLOQUE):
+            filas = no_nulas[i:i + FILAS_POR_BLOQUE]
+            tableau[filas] -= factores[filas, None] * fila_pivote
+        return
+
+    temporal = np.empty((FILAS_POR_BLOQUE, tableau.shape[1]))
+    for i in range(0, tableau.shape[0], FILAS_POR_BLOQUE):
+        j = min(i + FILAS_POR_BLOQUE, tableau.shape[0])
+        bloque = temporal[:j - i]
+        np.multiply(factores[i:j, None], fila_pivote, out=bloque)
+        tableau[i:j] -= bloque
+
+
+if NUMBA_DISPONIBLE:  # pragma: no cover - depende del entorno
+
+    @numba.njit(cache=True, fastmath=False)
+    def _pivotear_numba(tableau, fila, col):
+        filas, columnas = tableau.shape
+        pivote = tableau[fila, col]
+        for j in range(columnas):
+            tableau[fila, j] /= pivote
+        for i in range(filas):
+            if i == fila:
+                continue
+            factor = tableau[i, col]
+            if factor == 0.0:
+                continue
+            for j in range(columnas):
+                tableau[i, j] -= factor * tableau[fila, j]
+
+    def pivotear_numba(tableau: np.ndarray, fila: int, col: int) -> None:
+        """Pivoteo compilado con Numba: recorre el tableau una sola vez sin temporales."""
+        _pivotear_numba(tableau, fila, col)
+
+else:
+    pivotear_numba = None
+
+
+def pivotear(tableau: np.ndarray, fila: int, col: int) -> None:
+    """Pivotea el tableau in-place con el kernel disponible más rápido."""
+    if USAR_NUMBA:
+        pivotear_numba(tableau, fila, col)
+    else:
+        pivotear_numpy(tableau, fila, col)
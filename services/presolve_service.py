@@ -0,0 +1,519 @@
+import logging
+import numpy as np
+from typing import List, Dict, Any, Literal, Optional, Tuple, Union
+
+from .bounds import ListaCotas, cotas_como_arreglos
+from .sparse_matrix import MatrizDispersa
+
+logger = logging.getLogger(__name__)
+
+# Tolerancia (relativa al lado derecho) para comparar actividades de fila
+TOL_PRESOLVE = 1e-9
+# Cantidad máxima de pasadas sobre el modelo
+MAX_PASADAS = 20
+
+# Códigos de operador
+_LE, _GE, _EQ = 0, 1, 2
+_OPERADORES = {"<=": _LE, ">=": _GE, "=": _EQ}
+_SIMBOLOS = ["<=", ">=", "="]
+
+
+class Presolve:
+    """
+    Reduce un problema min/max cᵀx s.a. Ax (<=, >=, =) b, lower <= x <= upper
+    antes de resolverlo (por defecto x >= 0; ver `cotas_como_arreglos`).
+
+    Reducciones (se repiten hasta que ninguna cambia el modelo):
+    - filas vacías: se verifican y se eliminan;
+    - filas singleton: se convierten en cotas de su variable;
+    - variables fijas (cota inferior = superior): se sustituyen en el lado derecho;
+    - columnas vacías: se fijan en la cota que favorece al objetivo;
+    - filas forzantes (su actividad mínima o máxima posible iguala al lado
+      derecho, lo que fija todas sus variables) y filas redundantes;
+    - columnas dominadas: si aumentar la variable solo perjudica a sus filas y
+      al objetivo se fija en su cota inferior (y en la superior en el caso opuesto);
+    - filas duplicadas (proporcionales): se combinan en una sola restricción
+      (o dos si quedan cotas inferior y superior distintas).
+
+    La matriz se maneja como tripletas (fila, columna, valor) con máscaras de
+    filas y columnas activas, por lo que el costo es O(nnz) por pasada y una
+    `MatrizDispersa` de entrada produce un modelo reducido también disperso.
+
+    Las cotas que quedan se reescriben en el modelo reducido: la inferior
+    desplazando la variable (x = l + x') y la superior como una fila singleton,
+    o, para el método tabular con variables acotadas, como cotas del modelo
+    reducido (`problema(filas_cota=False)` y `cotas_reducidas`).
+    `postsolve` reconstruye el resultado en términos del problema original.
+    """
+
+    def __init__(
+        self,
+        problem_type: Literal['minimization', 'maximization'],
+        C: List[float],
+        LI: Union[List[List[float]], MatrizDispersa],
+        LD: List[float],
+        O: List[Literal["<=", ">=", "="]],
+        lower: ListaCotas = None,
+        upper: ListaCotas = None,
+    ):
+        b = np.array(LD, dtype=float)
+        m, n = len(b), len(C)
+        self.disperso = isinstance(LI, MatrizDispersa)
+        if self.disperso:
+            if LI.shape != (m, n):
+                raise ValueError(f"LI debe tener dimensión {m}x{n}.")
+            fil, col, val = LI.indices, LI._col_de_elemento, LI.data
+        else:
+            A = np.array(LI, dtype=float)
+            if A.shape != (m, n) or A.ndim != 2:
+                raise ValueError(f"LI debe tener dimensión {m}x{n}.")
+            fil, col = np.nonzero(A)
+            val = A[fil, col]
+        if len(O) != m:
+            raise ValueError("O debe tener un operador por restricción.")
+
+        # Entradas ordenadas por (fila, columna)
+        orden = np.lexsort((col, fil))
+        no_nulas = val[orden] != 0.0
+        self.fil = np.asarray(fil, dtype=np.int64)[orden][no_nulas]
+        self.col = np.asarray(col, dtype=np.int64)[orden][no_nulas]
+        self.val = np.asarray(val, dtype=float)[orden][no_nulas].copy()
+
+        self.problem_type = problem_type
+        self.m, self.n = m, n
+        self.C = np.array(C, dtype=float)
+        self.b_original = b.copy()
+        self.O_original = list(O)
+        self.A_original = (self.fil.copy(), self.col.copy(), self.val.copy())
+
+        # Estado del modelo reducido
+        self.b = b
+        self.op = np.array([_OPERADORES[o] for o in O], dtype=np.int64)
+        self.c = self.C if problem_type == 'minimization' else -self.C
+        self.lb, self.ub = cotas_como_arreglos(lower, upper, n)
+        self.fila_activa = np.ones(m, dtype=bool)
+        self.col_activa = np.ones(n, dtype=bool)
+        self.x_fijo = np.zeros(n)
+        # Columnas cuya cota superior se agregó como fila en `problema`
+        self.acotadas = np.zeros(0, dtype=np.int64)
+
+        self.status: Optional[str] = None
+        # Una columna que mejora el objetivo sin límite: el problema es no
+        # acotado si el resto es factible
+        self.no_acotado_si_factible = False
+
+        self._reducir()
+
+    # --- Utilidades ---
+
+    def _activas(self) -> np.ndarray:
+        """Máscara de las entradas cuyas fila y columna siguen activas."""
+        return self.fila_activa[self.fil] & self.col_activa[self.col]
+
+    def _tol(self, valor) -> np.ndarray:
+        return TOL_PRESOLVE * np.maximum(1.0, np.abs(valor))
+
+    def _infactible(self, motivo: str) -> bool:
+        logger.info(f"Presolve: problema infactible ({motivo}).")
+        self.status = "infactible"
+        return True
+
+    # --- Reducciones ---
+
+    def _filas_vacias(self, activas: np.ndarray) -> bool:
+        conteo = np.bincount(self.fil[activas], minlength=self.m)
+        vacias = np.flatnonzero(self.fila_activa & (conteo == 0))
+        if not len(vacias):
+            return False
+        b, op, tol = self.b[vacias], self.op[vacias], self._tol(self.b[vacias])
+        violada = ((op == _LE) & (b < -tol)) | ((op == _GE) & (b > tol)) | ((op == _EQ) & (np.abs(b) > tol))
+        if np.any(violada):
+            return self._infactible(f"fila vacía {vacias[violada][0] + 1} con lado derecho incompatible")
+        self.fila_activa[vacias] = False
+        return True
+
+    def _filas_singleton(self, activas: np.ndarray) -> bool:
+        conteo = np.bincount(self.fil[activas], minlength=self.m)
+        entradas = np.flatnonzero(activas & (conteo[self.fil] == 1))
+        if not len(entradas):
+            return False
+        for k in entradas:
+            i, j, a = self.fil[k], self.col[k], self.val[k]
+            cota = self.b[i] / a
+            op = self.op[i]
+            if op != _EQ and a < 0:
+                op = _GE if op == _LE else _LE
+            if op in (_LE, _EQ):
+                self.ub[j] = min(self.ub[j], cota)
+            if op in (_GE, _EQ):
+                self.lb[j] = max(self.lb[j], cota)
+            if self.lb[j] > self.ub[j] + self._tol(self.ub[j]):
+                return self._infactible(f"cotas incompatibles para x{j + 1}")
+            self.fila_activa[i] = False
+        return True
+
+    def _columnas_fijas(self, activas: np.ndarray) -> bool:
+        fijas = self.col_activa & np.isfinite(self.lb) & (self.ub - self.lb <= self._tol(self.lb))
+        if not np.any(fijas):
+            return False
+        valor = np.where(fijas, self.lb, 0.0)
+        self.x_fijo[fijas] = valor[fijas]
+        self.b -= np.bincount(self.fil[activas], weights=self.val[activas] * valor[self.col[activas]], minlength=self.m)
+        self.col_activa[fijas] = False
+        return True
+
+    def _columnas_vacias(self, activas: np.ndarray) -> bool:
+        conteo = np.bincount(self.col[activas], minlength=self.n)
+        vacias = np.flatnonzero(self.col_activa & (conteo == 0))
+        if not len(vacias):
+            return False
+        for j in vacias:
+            # La variable va a la cota que favorece al objetivo (sin costo, al
+            # punto de su intervalo más cercano a cero). Si esa cota es infinita
+            # también se la deja cerca de cero y el problema es no acotado
+            cota = self.ub[j] if self.c[j] < 0 else self.lb[j] if self.c[j] > 0 else 0.0
+            if np.isinf(cota):
+                self.no_acotado_si_factible = True
+                cota = 0.0
+            self.x_fijo[j] = min(max(cota, self.lb[j]), self.ub[j])
+        self.col_activa[vacias] = False
+        return True
+
+    def _actividades(self, activas: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Actividad mínima y máxima de cada fila según las cotas (y cuántos términos son infinitos)."""
+        f, j, a = self.fil[activas], self.col[activas], self.val[activas]
+        lb, ub = self.lb[j], self.ub[j]
+        lb_finita = np.where(np.isinf(lb), 0.0, lb)
+        ub_finita = np.where(np.isinf(ub), 0.0, ub)
+        positivo = a > 0
+        minimo = np.bincount(f, weights=np.where(positivo, a * lb_finita, a * ub_finita), minlength=self.m)
+        maximo = np.bincount(f, weights=np.where(positivo, a * ub_finita, a * lb_finita), minlength=self.m)
+        inf_min = np.bincount(f, weights=np.where(positivo, np.isinf(lb), np.isinf(ub)).astype(float), minlength=self.m)
+        inf_max = np.bincount(f, weights=np.where(positivo, np.isinf(ub), np.isinf(lb)).astype(float), minlength=self.m)
+        return minimo, maximo, inf_min, inf_max
+
+    def _filas_forzantes(self, activas: np.ndarray) -> bool:
+        minimo, maximo, inf_min, inf_max = self._actividades(activas)
+        b, op, tol = self.b, self.op, self._tol(self.b)
+        min_finito, max_finito = inf_min == 0, inf_max == 0
+        filas = self.fila_activa
+
+        infactible = filas & (
+            (min_finito & (op != _GE) & (minimo > b + tol)) | (max_finito & (op != _LE) & (maximo < b - tol))
+        )
+        if np.any(infactible):
+            return self._infactible(f"la fila {np.flatnonzero(infactible)[0] + 1} no puede cumplirse")
+
+        redundante = filas & (
+            ((op == _LE) & max_finito & (maximo <= b + tol)) | ((op == _GE) & min_finito & (minimo >= b - tol))
+        )
+        forzante_min = filas & ~redundante & (op != _GE) & min_finito & (np.abs(minimo - b) <= tol)
+        forzante_max = filas & ~redundante & ~forzante_min & (op != _LE) & max_finito & (np.abs(maximo - b) <= tol)
+        if not np.any(redundante | forzante_min | forzante_max):
+            return False
+
+        # En una fila forzante cada variable queda en la cota que da la actividad extrema
+        for i in np.flatnonzero(forzante_min | forzante_max):
+            entradas = np.flatnonzero(activas & (self.fil == i))
+            hacia_min = bool(forzante_min[i])
+            for k in entradas:
+                j = self.col[k]
+                objetivo = self.lb[j] if (self.val[k] > 0) == hacia_min else self.ub[j]
+                if objetivo < self.lb[j] - self._tol(self.lb[j]) or objetivo > self.ub[j] + self._tol(self.ub[j]):
+                    return self._infactible(f"cotas incompatibles para x{j + 1}")
+                self.lb[j] = self.ub[j] = objetivo
+        self.fila_activa[redundante | forzante_min | forzante_max] = False
+        return True
+
+    def _columnas_dominadas(self, activas: np.ndarray) -> bool:
+        f, j, a = self.fil[activas], self.col[activas], self.val[activas]
+        op = self.op[f]
+        perjudica = ((op == _LE) & (a > 0)) | ((op == _GE) & (a < 0))
+        favorece = ((op == _LE) & (a < 0)) | ((op == _GE) & (a > 0))
+        no_perjudica = np.bincount(j, weights=(~perjudica).astype(float), minlength=self.n) == 0
+        no_favorece = np.bincount(j, weights=(~favorece).astype(float), minlength=self.n) == 0
+
+        # Aumentar la variable empeora filas y objetivo: queda en su cota inferior
+        a_inferior = self.col_activa & no_perjudica & (self.c >= 0) & np.isfinite(self.lb)
+        # Aumentarla mejora filas y objetivo: queda en su cota superior (si es finita)
+        a_superior = self.col_activa & ~a_inferior & no_favorece & (self.c <= 0) & np.isfinite(self.ub)
+        if not np.any(a_inferior | a_superior):
+            return False
+        self.ub[a_inferior] = self.lb[a_inferior]
+        self.lb[a_superior] = self.ub[a_superior]
+        return True
+
+    def _filas_duplicadas(self, activas: np.ndarray) -> bool:
+        f, j, a = self.fil[activas], self.col[activas], self.val[activas]
+        if not len(f):
+            return False
+        # Normalizar cada fila por su primer coeficiente y agrupar por un hash
+        # aleatorio de (columnas, coeficientes); los candidatos se verifican exactos
+        filas, inicio = np.unique(f, return_index=True)
+        primero = np.zeros(self.m)
+        primero[filas] = a[inicio]
+        normal = a / primero[f]
+        rng = np.random.default_rng(0)
+        r1, r2 = rng.random(self.n), rng.random(self.n)
+        h1 = np.bincount(f, weights=r1[j] * normal, minlength=self.m)
+        h2 = np.bincount(f, weights=r2[j], minlength=self.m)
+        conteo = np.bincount(f, minlength=self.m)
+
+        claves: Dict[Tuple[int, float, float], List[int]] = {}
+        for i in filas:
+            claves.setdefault((int(conteo[i]), round(h1[i], 9), round(h2[i], 9)), []).append(int(i))
+
+        cambios = False
+        for grupo in claves.values():
+            if len(grupo) < 2:
+                continue
+            base = grupo[0]
+            sel_base = f == base
+            cols_base, coef_base = j[sel_base], normal[sel_base]
+            iguales = [base] + [
+                k for k in grupo[1:]
+                if np.array_equal(j[f == k], cols_base) and np.allclose(normal[f == k], coef_base, rtol=1e-12, atol=0.0)
+            ]
+            if len(iguales) < 2:
+                continue
+            cambios |= self._combinar_filas(iguales, primero)
+            if self.status:
+                return True
+        return cambios
+
+    def _combinar_filas(self, filas: List[int], primero: np.ndarray) -> bool:
+        """Combina filas proporcionales en cotas [L, U] sobre la actividad de la fila normalizada."""
+        L, U = -np.inf, np.inf
+        for i in filas:
+            escala = primero[i]
+            b = self.b[i] / escala
+            op = self.op[i]
+            if op != _EQ and escala < 0:
+                op = _GE if op == _LE else _LE
+            if op in (_LE, _EQ):
+                U = min(U, b)
+            if op in (_GE, _EQ):
+                L = max(L, b)
+        if L > U + self._tol(U):
+            return self._infactible(f"filas proporcionales incompatibles ({filas[0] + 1} y otras)")
+
+        # Las filas conservadas se reescriben normalizadas (coeficiente inicial 1)
+        conservadas = filas[:1] if (np.isinf(L) or np.isinf(U) or abs(U - L) <= self._tol(U)) else filas[:2]
+        for i in conservadas:
+            self.val[self.fil == i] /= primero[i]
+        if len(conservadas) == 2:
+            self.op[filas[0]], self.b[filas[0]] = _GE, L
+            self.op[filas[1]], self.b[filas[1]] = _LE, U
+        elif np.isinf(U):
+            self.op[filas[0]], self.b[filas[0]] = _GE, L
+        elif np.isinf(L):
+            self.op[filas[0]], self.b[filas[0]] = _LE, U
+        else:
+            self.op[filas[0]], self.b[filas[0]] = _EQ, U
+        self.fila_activa[filas[len(conservadas):]] = False
+        return True
+
+    def _reducir(self) -> None:
+        reducciones = (
+            self._filas_vacias,
+            self._filas_singleton,
+            self._columnas_fijas,
+            self._columnas_vacias,
+            self._filas_forzantes,
+            self._columnas_dominadas,
+            self._filas_duplicadas,
+        )
+        for _ in range(MAX_PASADAS):
+            cambios = False
+            for reduccion in reducciones:
+                cambios |= reduccion(self._activas())
+                if self.status:
+                    return
+            if not cambios:
+                break
+
+    # --- Modelo reducido ---
+
+    @property
+    def filas(self) -> np.ndarray:
+        return np.flatnonzero(self.fila_activa)
+
+    @property
+    def columnas(self) -> np.ndarray:
+        return np.flatnonzero(self.col_activa)
+
+    @property
+    def vacio(self) -> bool:
+        """Indica si el presolve resolvió todo el modelo."""
+        return not len(self.columnas)
+
+    @property
+    def desplazamiento(self) -> np.ndarray:
+        """x − x' de cada variable: su cota inferior, o 0 si no tiene."""
+        return np.where(np.isfinite(self.lb), self.lb, 0.0)
+
+    def problema(self, filas_cota: bool = True) -> Tuple[List[float], Union[List[List[float]], MatrizDispersa], List[float], List[str]]:
+        """
+        Retorna (C, LI, LD, O) del modelo reducido, con las variables desplazadas
+        a su cota inferior. LI es disperso si la entrada lo era.
+
+        Con `filas_cota` cada cota superior finita se agrega como una fila
+        singleton (así lo necesitan los motores sin cotas, y todas las
+        variables deben tener cota inferior). Sin ellas, las cotas que quedan
+        se piden con `cotas_reducidas`.
+        """
+        if filas_cota and not np.all(np.isfinite(self.lb[self.columnas])):
+            raise ValueError("Las variables sin cota inferior solo se admiten en el método tabular.")
+        filas, columnas = self.filas, self.columnas
+        nueva_fila = np.full(self.m, -1)
+        nueva_fila[filas] = np.arange(len(filas))
+        nueva_col = np.full(self.n, -1)
+        nueva_col[columnas] = np.arange(len(columnas))
+
+        activas = self._activas()
+        f, j, a = nueva_fila[self.fil[activas]], nueva_col[self.col[activas]], self.val[activas]
+        desplazamiento = self.desplazamiento
+        b = self.b - np.bincount(self.fil[activas], weights=self.val[activas] * desplazamiento[self.col[activas]], minlength=self.m)
+        LD = b[filas].tolist()
+        O = [_SIMBOLOS[o] for o in self.op[filas]]
+
+        # Cotas superiores finitas como filas x'_j <= u_j - l_j
+        acotadas = columnas[np.isfinite(self.ub[columnas])] if filas_cota else np.zeros(0, dtype=np.int64)
+        f = np.concatenate([f, len(filas) + np.arange(len(acotadas))])
+        j = np.concatenate([j, nueva_col[acotadas]])
+        a = np.concatenate([a, np.ones(len(acotadas))])
+        LD += (self.ub[acotadas] - self.lb[acotadas]).tolist()
+        O += ["<="] * len(acotadas)
+        self.acotadas = acotadas
+
+        forma = (len(LD), len(columnas))
+        LI = MatrizDispersa.desde_coo(f, j, a, forma)
+        if not self.disperso:
+            LI = LI.toarray().tolist()
+        return self.C[columnas].tolist(), LI, LD, O
+
+    def cotas_reducidas(self) -> Tuple[List[Optional[float]], List[Optional[float]]]:
+        """
+        (lower, upper) de las variables de `problema(filas_cota=False)`: 0 o
+        None (sin cota inferior) y u_j − l_j o None (sin cota superior).
+        """
+        columnas = self.columnas
+        lower = [0.0 if np.isfinite(l) else None for l in self.lb[columnas]]
+        upper = [float(u - d) if np.isfinite(u) else None for u, d in zip(self.ub[columnas], self.desplazamiento[columnas])]
+        return lower, upper
+
+    def resumen(self) -> Dict[str, int]:
+        filas_reducidas = len(self.filas) + len(self.acotadas)
+        return {
+            "filas_originales": self.m,
+            "columnas_originales": self.n,
+            "filas": filas_reducidas if self.status is None else 0,
+            "columnas": len(self.columnas) if self.status is None else 0,
+        }
+
+    # --- Nombres ---
+
+    def _nombres_reducidos(self) -> Dict[str, str]:
+        """Nombre en el modelo reducido → nombre en el original (variables y lógicas)."""
+        mapa = {f"x{k + 1}": f"x{j + 1}" for k, j in enumerate(self.columnas)}
+        for k, i in enumerate(self.filas):
+            for prefijo in ("s", "e", "a"):
+                mapa[f"{prefijo}{k + 1}"] = f"{prefijo}{i + 1}"
+        # Holguras de las filas de cota superior
+        desde = len(self.filas)
+        for k, j in enumerate(self.acotadas):
+            mapa[f"s{desde + k + 1}"] = f"u{j + 1}"
+        return mapa
+
+    def base_reducida(self, base: Optional[List[str]]) -> Optional[List[str]]:
+        """Traduce una base del modelo original al reducido (las variables eliminadas se descartan)."""
+        if base is None:
+            return None
+        inverso = {original: reducido for reducido, original in self._nombres_reducidos().items()}
+        return [inverso[v] for v in base if v in inverso]
+
+    # --- Postsolve ---
+
+    def valores(self, variables_reducidas: Optional[Dict[str, float]]) -> np.ndarray:
+        """Valores de x1..xn del problema original."""
+        x = self.x_fijo.copy()
+        if variables_reducidas is not None:
+            for k, j in enumerate(self.columnas):
+                x[j] = self.desplazamiento[j] + variables_reducidas.get(f"x{k + 1}", 0.0)
+        return x
+
+    def solucion(self, x: np.ndarray, valor_optimo: float) -> Dict[str, Any]:
+        """
+        Arma `SimplexSolution` del problema original: x1..xn y las holguras y
+        excesos de cada fila, recalculados con los datos originales.
+        """
+        fil, col, val = self.A_original
+        actividad = np.bincount(fil, weights=val * x[col], minlength=self.m)
+        variables = {f"x{j + 1}": round(float(x[j]), 6) for j in range(self.n)}
+        for i, op in enumerate(self.O_original):
+            holgura = float(self.b_original[i] - actividad[i])
+            # Igual que los motores: una fila con lado derecho negativo se invierte
+            if op != "=" and self.b_original[i] < 0:
+                op = ">=" if op == "<=" else "<="
+                holgura = -holgura
+            if op == ">=":
+                holgura = -holgura
+            # x llega redondeado a 6 decimales: un residuo negativo es ruido
+            holgura = round(max(holgura, 0.0), 6)
+            if op == "<=":
+                variables[f"s{i + 1}"] = holgura
+            elif op == ">=":
+                variables[f"e{i + 1}"] = holgura
+        return {"variables": variables, "valor_optimo": valor_optimo}
+
+    @property
+    def constante_objetivo(self) -> float:
+        """Parte del objetivo que no está en el modelo reducido: variables fijas y desplazamientos a la cota inferior."""
+        columnas = self.columnas
+        return float(self.C @ self.x_fijo + self.C[columnas] @ self.desplazamiento[columnas])
+
+    def renombrar_tabla(self, tabla: Dict[str, Any]) -> Dict[str, Any]:
+        """Copia de una tabla del modelo reducido con los nombres del original."""
+        mapa = self._nombres_reducidos()
+        def renombrar(nombre: str) -> str:
+            # Las columnas complementadas por sus cotas llevan un apóstrofo (x2')
+            base = nombre.rstrip("'")
+            return mapa.get(base, base) + nombre[len(base):]
+
+        return dict(
+            tabla,
+            headers=[renombrar(h) for h in tabla["headers"]],
+            filas=[[renombrar(fila[0])] + fila[1:] for fila in tabla["filas"]],
+        )
+
+    def postsolve(self, resultado: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Lleva el resultado del modelo reducido (None si el presolve lo resolvió
+        todo) al problema original: solución, nombres en tablas y base.
+        """
+        if self.status is not None:
+            return {"status": self.status, "tablas": [], "solucion": None, "iteraciones": 0, "presolve": self.resumen()}
+
+        resultado = dict(resultado) if resultado is not None else {"status": "optimo", "tablas": [], "iteraciones": 0}
+        status = resultado["status"]
+        if status == "optimo" and self.no_acotado_si_factible:
+            status = "no acotado"
+        resultado["status"] = status
+
+        if status == "optimo":
+            reducida = resultado.get("solucion")
+            # El valor óptimo se toma del modelo reducido (sin el redondeo de x)
+            # más la parte constante
+            valor = self.constante_objetivo + (reducida["valor_optimo"] if reducida else 0.0)
+            resultado["solucion"] = self.solucion(self.valores(reducida["variables"] if reducida else None), valor)
+        else:
+            resultado["solucion"] = None
+
+        mapa = self._nombres_reducidos()
+        resultado["tablas"] = [self.renombrar_tabla(tabla) for tabla in resultado.get("tablas", [])]
+        if resultado.get("base") is not None and status == "optimo":
+            resultado["base"] = [mapa.get(v, v) for v in resultado["base"]]
+        else:
+            resultado["base"] = None
+        resultado["presolve"] = self.resumen()
+        return resultado
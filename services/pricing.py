@@ -0,0 +1,234 @@
+import numpy as np
+from typing import Callable, Literal, Optional
+
+from .pivot_kernels import razon_minima, razon_minima_harris
+from .tolerances import TOLERANCIAS_POR_DEFECTO, RatioTest, Tolerancias
+
+PricingRule = Literal['dantzig', 'bland', 'steepest_edge', 'devex', 'partial']
+
+
+def max_iteraciones_por_defecto(num_restricciones: int, num_variables: int) -> int:
+    """Límite de pivoteos (sumando ambas fases) cuando el request no indica uno."""
+    return max(50, 10 * (num_restricciones + num_variables))
+
+
+class ReglaPrecios:
+    """
+    Regla de selección de la variable entrante (y de desempate de la saliente).
+
+    Los motores la usan con la misma convención: `d` son los costos reducidos
+    del problema de minimización (negativo = la columna mejora el objetivo) con
+    cero en las columnas básicas y en las no permitidas, y `alpha` es la columna
+    entrante actualizada B⁻¹·a_q.
+
+    Las reglas con pesos piden datos extra del pivoteo mediante
+    `requiere_fila_pivote` (fila r de B⁻¹A) y `requiere_proyeccion`
+    ((B⁻¹A)ᵀ·alpha); el motor solo los calcula si la regla los necesita.
+
+    La regla también lleva las `Tolerancias` del motor y el test de razón
+    ('textbook' o 'harris') con el que elige la fila saliente.
+
+    Si `parcial` es True, el motor que calcula los costos reducidos a partir de
+    los precios duales (el revisado) llama a `entrante_parcial` en lugar de
+    `entrante`, para calcular solo los bloques de columnas que la regla pide.
+
+    Esta clase base implementa la regla de Dantzig: el costo reducido más negativo.
+    """
+
+    nombre = 'dantzig'
+    requiere_fila_pivote = False
+    requiere_proyeccion = False
+    parcial = False
+
+    def __init__(self, tolerancias: Optional[Tolerancias] = None, ratio_test: RatioTest = 'textbook'):
+        if ratio_test not in ('textbook', 'harris'):
+            raise ValueError(f"Test de razón desconocido: {ratio_test}")
+        self.tolerancias = tolerancias or TOLERANCIAS_POR_DEFECTO
+        self.ratio_test = ratio_test
+
+    def iniciar(self, pesos: np.ndarray) -> None:
+        """
+        Se invoca al comenzar cada fase. `pesos` trae 1 + ‖B⁻¹a_j‖² para la
+        base inicial de la fase (los pesos exactos de steepest edge).
+        """
+
+    def entrante(self, d: np.ndarray) -> int:
+        """Retorna la columna entrante, o -1 si la base es óptima."""
+        q = int(np.argmin(d))
+        return q if d[q] < -self.tolerancias.optimalidad else -1
+
+    def saliente(self, alpha: np.ndarray, rhs: np.ndarray, basicas: np.ndarray) -> int:
+        """Retorna la fila pivote por el test de razón mínima (-1 si no acotado)."""
+        tol = self.tolerancias
+        if self.ratio_test == 'harris':
+            return razon_minima_harris(alpha, rhs, tol.pivote, tol.factibilidad)
+        return razon_minima(alpha, rhs, tol.pivote)
+
+    def actualizar(
+        self,
+        entrante: int,
+        saliente: int,
+        fila: int,
+        alpha: np.ndarray,
+        fila_pivote: Optional[np.ndarray],
+        proyeccion: Optional[np.ndarray],
+    ) -> None:
+        """
+        Se invoca antes de cada pivoteo para actualizar el estado de la regla.
+        `saliente` es la columna de la variable que deja la base, o -1 si esta
+        no pertenece a las columnas de la fase (una artificial en Fase 2).
+        """
+
+
+class ReglaBland(ReglaPrecios):
+    """
+    Regla de Bland: entra la primera columna con costo reducido negativo y, ante
+    empates en el test de razón mínima, sale la variable básica de menor índice.
+    No cicla en problemas degenerados, aunque suele necesitar más pivoteos.
+    Ignora `ratio_test`: el desempate de Harris anularía esa garantía.
+    """
+
+    nombre = 'bland'
+
+    def entrante(self, d: np.ndarray) -> int:
+        candidatas = np.flatnonzero(d < -self.tolerancias.optimalidad)
+        return int(candidatas[0]) if len(candidatas) else -1
+
+    def saliente(self, alpha: np.ndarray, rhs: np.ndarray, basicas: np.ndarray) -> int:
+        tol_pivote = self.tolerancias.pivote
+        positivos = alpha > tol_pivote
+        if not positivos.any():
+            return -1
+        ratios = np.full(alpha.shape[0], np.inf)
+        np.divide(rhs, alpha, out=ratios, where=positivos)
+        minimo = ratios.min()
+        empatadas = np.flatnonzero(ratios <= minimo + tol_pivote * max(1.0, abs(minimo)))
+        return int(empatadas[np.argmin(basicas[empatadas])])
+
+
+class ReglaSteepestEdge(ReglaPrecios):
+    """
+    Steepest edge: elige la columna que maximiza d_j² / γ_j con γ_j = 1 + ‖B⁻¹a_j‖²,
+    es decir, la arista de mayor descenso en el espacio de todas las variables.
+
+    Los pesos se actualizan en cada pivoteo con las fórmulas de Goldfarb-Reid,
+    que requieren la fila pivote y la proyección (B⁻¹A)ᵀ·alpha.
+    """
+
+    nombre = 'steepest_edge'
+    requiere_fila_pivote = True
+    requiere_proyeccion = True
+
+    def iniciar(self, pesos: np.ndarray) -> None:
+        self.pesos = np.array(pesos, dtype=float)
+
+    def entrante(self, d: np.ndarray) -> int:
+        mejorantes = d < -self.tolerancias.optimalidad
+        if not np.any(mejorantes):
+            return -1
+        puntaje = np.where(mejorantes, d * d / self.pesos, -1.0)
+        return int(np.argmax(puntaje))
+
+    def actualizar(self, entrante, saliente, fila, alpha, fila_pivote, proyeccion) -> None:
+        pivote = alpha[fila]
+        gamma_q = 1.0 + float(alpha @ alpha)
+        rho = fila_pivote / pivote
+        self.pesos = np.maximum(self.pesos - 2.0 * rho * proyeccion + rho * rho * gamma_q, 1.0 + rho * rho)
+        if saliente >= 0:
+            self.pesos[saliente] = max(gamma_q / (pivote * pivote), 1.0)
+
+
+class ReglaDevex(ReglaPrecios):
+    """
+    Devex (Harris): aproxima los pesos de steepest edge respecto de un marco de
+    referencia inicial con pesos unitarios. Solo necesita la fila pivote, por lo
+    que cada actualización cuesta mucho menos que en steepest edge.
+    """
+
+    nombre = 'devex'
+    requiere_fila_pivote = True
+
+    def iniciar(self, pesos: np.ndarray) -> None:
+        self.pesos = np.ones(len(pesos))
+
+    def entrante(self, d: np.ndarray) -> int:
+        mejorantes = d < -self.tolerancias.optimalidad
+        if not np.any(mejorantes):
+            return -1
+        puntaje = np.where(mejorantes, d * d / self.pesos, -1.0)
+        return int(np.argmax(puntaje))
+
+    def actualizar(self, entrante, saliente, fila, alpha, fila_pivote, proyeccion) -> None:
+        pivote = alpha[fila]
+        peso_q = self.pesos[entrante]
+        rho = fila_pivote / pivote
+        np.maximum(self.pesos, rho * rho * peso_q, out=self.pesos)
+        if saliente >= 0:
+            self.pesos[saliente] = max(peso_q / (pivote * pivote), 1.0)
+
+
+class ReglaParcial(ReglaPrecios):
+    """
+    Pricing parcial: las columnas se dividen en `segmentos` bloques y se aplica
+    Dantzig dentro del primer bloque (a partir del último usado) que tenga
+    alguna columna atractiva.
+
+    En el revisado los costos reducidos se calculan bloque por bloque
+    (`entrante_parcial`), así que una iteración solo paga Aᵀy de los bloques
+    que recorre; todas las columnas se calculan solo para probar optimalidad.
+    En el tabular la fila Z ya está calculada y la regla solo cambia qué
+    columna entra.
+    """
+
+    nombre = 'partial'
+    parcial = True
+
+    def __init__(self, segmentos: int = 8, **kwargs):
+        super().__init__(**kwargs)
+        self.segmentos = segmentos
+        self.actual = 0
+
+    def entrante(self, d: np.ndarray) -> int:
+        return self.entrante_parcial(lambda ini, fin: d[ini:fin], len(d))
+
+    def entrante_parcial(self, costos_reducidos: Callable[[int, int], np.ndarray], num_columnas: int) -> int:
+        """
+        Retorna la columna entrante (o -1 si la base es óptima) pidiendo los
+        costos reducidos de un bloque a la vez: `costos_reducidos(ini, fin)`
+        devuelve los de las columnas ini..fin-1, con cero en las básicas y en
+        las no permitidas.
+        """
+        tam = -(-num_columnas // self.segmentos)
+        for k in range(self.segmentos):
+            segmento = (self.actual + k) % self.segmentos
+            ini, fin = segmento * tam, min((segmento + 1) * tam, num_columnas)
+            if ini >= fin:
+                continue
+            d = costos_reducidos(ini, fin)
+            j = int(np.argmin(d))
+            if d[j] < -self.tolerancias.optimalidad:
+                self.actual = segmento
+                return ini + j
+        return -1
+
+
+_REGLAS = {
+    'dantzig': ReglaPrecios,
+    'bland': ReglaBland,
+    'steepest_edge': ReglaSteepestEdge,
+    'devex': ReglaDevex,
+    'partial': ReglaParcial,
+}
+
+
+def crear_regla(
+    nombre: Optional[PricingRule] = None,
+    tolerancias: Optional[Tolerancias] = None,
+    ratio_test: RatioTest = 'textbook',
+) -> ReglaPrecios:
+    """Crea una instancia nueva de la regla indicada (Dantzig por defecto)."""
+    if nombre is None:
+        nombre = 'dantzig'
+    if nombre not in _REGLAS:
+        raise ValueError(f"Regla de pricing desconocida: {nombre}")
+    return _REGLAS[nombre](tolerancias=tolerancias, ratio_test=ratio_test)
@@ -0,0 +1,603 @@
+import logging
+import numpy as np
+from typing import List, Dict, Any, Literal, Optional, Union
+
+from .basis_factorization import FactorizacionBase
+from .pricing import ReglaPrecios, max_iteraciones_por_defecto
+from .scaling import ScalingMethod, factores_escala
+from .sparse_matrix import Matriz, como_matriz
+from .tableau_history import Etapa, PoliticaHistorial, formatear_tableau
+
+logger = logging.getLogger(__name__)
+
+
+class ProblemaEstandar:
+    """
+    Problema en forma estándar: min cᵀx  s.a.  [A | lógicas]·x = b, x >= 0, b >= 0.
+
+    Las columnas lógicas (holgura, exceso y artificiales) no se materializan:
+    cada una queda descrita por su fila y su signo, ya que son vectores unitarios.
+    La matriz A puede ser densa o dispersa (`MatrizDispersa`); en el segundo caso
+    se mantiene dispersa durante toda la resolución.
+    El orden de las variables coincide con el del método tabular:
+    x1..xn, holguras, excesos y artificiales.
+
+    Con `escalado` distinto de 'none' se resuelve R·A·S·x' = R·b con costos S·c
+    (ver `factores_escala`); `escala` convierte los valores de todas las
+    variables del modelo escalado a los del original.
+    """
+
+    def __init__(
+        self,
+        problem_type: Literal['minimization', 'maximization'],
+        C: List[float],
+        LI: Union[List[List[float]], Matriz],
+        LD: List[float],
+        O: List[Literal["<=", ">=", "="]],
+        escalado: ScalingMethod = 'none',
+    ):
+        A = como_matriz(LI)
+        b = np.array(LD, dtype=float)
+        m = len(b)
+        n = len(C)
+
+        if A.shape != (m, n):
+            raise ValueError(f"LI debe tener dimensión {m}x{n}.")
+        if len(O) != m:
+            raise ValueError("O debe tener un operador por restricción.")
+
+        self.problem_type = problem_type
+        self.m = m
+        self.n = n
+        self.C = np.array(C, dtype=float)
+
+        # Escalado de filas y columnas (factores potencia de 2)
+        factores_fila, factores_col = factores_escala(A, escalado)
+        if np.any(factores_fila != 1.0) or np.any(factores_col != 1.0):
+            if A is LI:
+                A = A.copia()
+            A.escalar_filas(factores_fila)
+            A.escalar_columnas(factores_col)
+            b *= factores_fila
+
+        # Normalizar lados derechos negativos
+        operadores = list(O)
+        negativos = b < 0
+        if np.any(negativos):
+            if A is LI:
+                A = A.copia()
+            A.escalar_filas(np.where(negativos, -1.0, 1.0))
+        b[negativos] *= -1
+        for i in np.flatnonzero(negativos):
+            if operadores[i] == "<=":
+                operadores[i] = ">="
+            elif operadores[i] == ">=":
+                operadores[i] = "<="
+
+        self.A = A
+        self.b = b
+        self.O = operadores
+        # Transformación de los datos originales al modelo: b = σ·r·LD y c = ±s·C
+        self.factores_fila = factores_fila
+        self.factores_col = factores_col
+        self.signos_filas = np.where(negativos, -1.0, 1.0)
+
+        # Columnas lógicas: (nombre, fila, signo, es_artificial), en el orden del método tabular
+        holguras, excesos, artificiales = [], [], []
+        for i, op in enumerate(operadores):
+            if op == "<=":
+                holguras.append((f"s{i+1}", i, 1.0, False))
+            elif op == ">=":
+                excesos.append((f"e{i+1}", i, -1.0, False))
+                artificiales.append((f"a{i+1}", i, 1.0, True))
+            else:
+                artificiales.append((f"a{i+1}", i, 1.0, True))
+        logicas = holguras + excesos + artificiales
+
+        self.var_names = [f"x{j+1}" for j in range(n)] + [nombre for nombre, _, _, _ in logicas]
+        # Variable lógica de cada fila para el simplex dual: holgura (<=),
+        # exceso (>=) o artificial (=), que debe salir de la base
+        self.logica_dual = [-1] * m
+        for k, (nombre, fila, _, _) in enumerate(logicas):
+            if not nombre.startswith('a') or operadores[fila] == "=":
+                self.logica_dual[fila] = n + k
+        self.filas_logicas = np.array([fila for _, fila, _, _ in logicas], dtype=int)
+        self.signos_logicos = np.array([signo for _, _, signo, _ in logicas], dtype=float)
+        self.es_artificial = np.array([False] * n + [art for _, _, _, art in logicas], dtype=bool)
+        self.num_total = n + len(logicas)
+
+        # Costos del problema de minimización equivalente
+        self.c = np.zeros(self.num_total)
+        self.c[:n] = self.C if problem_type == 'minimization' else -self.C
+        self.c[:n] *= factores_col
+
+        # x = S·x' para las estructurales y lógica = lógica' / r_i para las de la fila i
+        self.escala = np.concatenate([factores_col, 1.0 / factores_fila[self.filas_logicas]])
+
+    def columna(self, j: int) -> np.ndarray:
+        """Columna j de la matriz completa [A | lógicas]."""
+        if j < self.n:
+            return self.A.columna(j)
+        col = np.zeros(self.m)
+        k = j - self.n
+        col[self.filas_logicas[k]] = self.signos_logicos[k]
+        return col
+
+    def producto_t(self, y: np.ndarray) -> np.ndarray:
+        """Calcula [A | lógicas]ᵀ·y para todas las columnas."""
+        return np.concatenate([self.A.producto_t(y), self.signos_logicos * y[self.filas_logicas]])
+
+    def producto_t_rango(self, y: np.ndarray, ini: int, fin: int) -> np.ndarray:
+        """Calcula [A | lógicas]ᵀ·y solo para las columnas ini..fin-1."""
+        partes = []
+        if ini < self.n:
+            partes.append(self.A.producto_t_rango(y, ini, min(fin, self.n)))
+        if fin > self.n:
+            k_ini, k_fin = max(ini, self.n) - self.n, fin - self.n
+            partes.append(self.signos_logicos[k_ini:k_fin] * y[self.filas_logicas[k_ini:k_fin]])
+        return np.concatenate(partes)
+
+    def normas_columnas(self) -> np.ndarray:
+        """‖a_j‖² de cada columna de [A | lógicas] (las lógicas son unitarias)."""
+        return np.concatenate([self.A.normas_columnas(), np.ones(self.num_total - self.n)])
+
+    def base_inicial(self) -> List[int]:
+        """Base formada por holguras (filas <=) y artificiales (filas >= y =)."""
+        base = [-1] * self.m
+        for k in range(self.num_total - self.n):
+            j = self.n + k
+            nombre = self.var_names[j]
+            if nombre.startswith('s') or nombre.startswith('a'):
+                base[self.filas_logicas[k]] = j
+        return base
+
+    def base_dual(self) -> List[int]:
+        """
+        Base lógica sin artificiales en las filas de desigualdad: los excesos
+        quedan en -b (infactibles) y la factibilidad primal la busca el simplex
+        dual. Es dual factible si todos los costos de minimización son >= 0.
+        """
+        return list(self.logica_dual)
+
+    def factorizar(self, base: List[int], refactorizar_cada: int = 50) -> FactorizacionBase:
+        """Construye la factorización de la base indicada (índice de columna por posición)."""
+        pos_e = [p for p, j in enumerate(base) if j < self.n]
+        pos_l = [p for p, j in enumerate(base) if j >= self.n]
+        cols_e = self.A.columnas([base[p] for p in pos_e])
+        ks = [base[p] - self.n for p in pos_l]
+        return FactorizacionBase(
+            cols_e,
+            pos_e,
+            self.filas_logicas[ks].tolist(),
+            self.signos_logicos[ks].tolist(),
+            pos_l,
+            self.m,
+            refactorizar_cada=refactorizar_cada,
+        )
+
+
+def indices_de_base(nombres: List[str], var_names: List[str], num_filas: int) -> List[int]:
+    """
+    Traduce una base por nombres (una variable básica por fila, como la devuelve
+    la respuesta en `base`) a índices de columna. Lanza ValueError si no es
+    utilizable para este problema: largo distinto, nombres desconocidos,
+    repetidos o artificiales.
+    """
+    if len(nombres) != num_filas:
+        raise ValueError(f"La base debe tener {num_filas} variables y tiene {len(nombres)}.")
+    if len(set(nombres)) != len(nombres):
+        raise ValueError("La base tiene variables repetidas.")
+    indice_de = {nombre: j for j, nombre in enumerate(var_names)}
+    desconocidas = [v for v in nombres if v not in indice_de or v.startswith('a')]
+    if desconocidas:
+        raise ValueError(f"Variables no válidas en la base: {', '.join(desconocidas)}.")
+    return [indice_de[v] for v in nombres]
+
+
+class SimplexRevisado:
+    """
+    Método Simplex Revisado (dos fases) sobre un `ProblemaEstandar`.
+
+    En cada iteración solo se calculan los precios duales y=B⁻ᵀc_B, los costos
+    reducidos y la columna entrante B⁻¹a_q; nunca se arrastra el tableau completo.
+    """
+
+    def __init__(
+        self,
+        problema: ProblemaEstandar,
+        max_iter: Optional[int] = None,
+        refactorizar_cada: int = 50,
+        historial: Optional[PoliticaHistorial] = None,
+        regla: Optional[ReglaPrecios] = None,
+        base: Optional[List[int]] = None,
+    ):
+        self.p = problema
+        self.max_iter = max_iter if max_iter is not None else max_iteraciones_por_defecto(problema.m, problema.n)
+        self.refactorizar_cada = refactorizar_cada
+        self.iteraciones = 0
+        self.historial = historial or PoliticaHistorial('none')
+        self.tablas: List[Dict[str, Any]] = []
+        # La base inicial es lógica (±e_i), así que ‖B⁻¹a_j‖ = ‖a_j‖. Los pesos
+        # dependen solo de la base y se conservan entre fases.
+        self.regla = regla or ReglaPrecios()
+        self.regla.iniciar(1.0 + problema.normas_columnas())
+        self.tol = self.regla.tolerancias
+
+        # Una base dada (arranque en caliente) se factoriza igual que la inicial;
+        # si es singular `factorizar` lanza BaseSingularError
+        self.base = list(base) if base is not None else problema.base_inicial()
+        self.factor = problema.factorizar(self.base, refactorizar_cada)
+        self.x_B = self.factor.ftran(problema.b)
+
+    def cambiar_datos(self, C: np.ndarray, LD: np.ndarray) -> None:
+        """
+        Reemplaza los costos y el lado derecho por los de otro escenario del
+        mismo modelo (en unidades originales) y conserva la base actual, para
+        reoptimizar desde ella con `resolver(dual=True)`.
+        El lado derecho puede quedar negativo: lo corrige el simplex dual.
+        """
+        p = self.p
+        signo = 1.0 if p.problem_type == 'minimization' else -1.0
+        p.C = np.array(C, dtype=float)
+        p.c[:p.n] = signo * p.C * p.factores_col
+        p.b = np.asarray(LD, dtype=float) * p.signos_filas * p.factores_fila
+        if self.factor.etas:
+            # Se parte de una factorización limpia de la misma base: así el
+            # archivo de etas no se arrastra de un escenario al siguiente
+            self._refactorizar()
+        else:
+            self.x_B = self.factor.ftran(p.b)
+        self.iteraciones = 0
+        self.tablas = []
+
+    def _refactorizar(self) -> None:
+        self.factor = self.p.factorizar(self.base, self.refactorizar_cada)
+        self.x_B = self.factor.ftran(self.p.b)
+
+    def _pivotear(self, fila: int, entrante: int, alpha: np.ndarray) -> None:
+        # Datos para la regla de pricing, calculados con la base anterior al cambio
+        fila_pivote = proyeccion = None
+        if self.regla.requiere_fila_pivote:
+            e_r = np.zeros(self.p.m)
+            e_r[fila] = 1.0
+            fila_pivote = self.p.producto_t(self.factor.btran(e_r))
+        if self.regla.requiere_proyeccion:
+            proyeccion = self.p.producto_t(self.factor.btran(alpha))
+        self.regla.actualizar(entrante, self.base[fila], fila, alpha, fila_pivote, proyeccion)
+
+        theta = self.x_B[fila] / alpha[fila]
+        self.x_B -= theta * alpha
+        self.x_B[fila] = theta
+        self.base[fila] = entrante
+        self.factor.actualizar(fila, alpha)
+        if self.factor.necesita_refactorizar:
+            self._refactorizar()
+
+    def _tabla(self, costos: np.ndarray, permitidas: np.ndarray, titulo: str) -> Dict[str, Any]:
+        """
+        Reconstruye el tableau de la base actual (B⁻¹A, B⁻¹b y costos reducidos).
+        Cuesta O(m²·n): solo se invoca si el historial pide la tabla.
+        """
+        p = self.p
+        B_inv = np.column_stack([self.factor.ftran(e) for e in np.eye(p.m)]) if p.m else np.zeros((0, 0))
+        cuerpo = np.hstack([B_inv @ p.A.toarray(), B_inv[:, p.filas_logicas] * p.signos_logicos])
+        y = self.factor.btran(costos[self.base])
+        d = costos - p.producto_t(y)
+
+        columnas = np.flatnonzero(permitidas)
+        tableau = np.vstack([
+            np.column_stack([cuerpo[:, columnas], self.x_B]),
+            np.append(d[columnas], -(costos[self.base] @ self.x_B)),
+        ])
+        return formatear_tableau(
+            tableau,
+            [p.var_names[j] for j in columnas],
+            [p.var_names[j] for j in self.base],
+            titulo,
+        )
+
+    def _informar(self, etapa: Etapa, costos: np.ndarray) -> None:
+        """Informa el progreso con el objetivo de la base actual (en el sentido original)."""
+        if self.historial.progreso is None:
+            return
+        valor = float(costos[self.base] @ self.x_B)
+        if etapa != 'fase_1' and self.p.problem_type == 'maximization':
+            valor = -valor
+        self.historial.informar(etapa, self.iteraciones, valor)
+
+    def _costos_reducidos(self, costos: np.ndarray, permitidas: np.ndarray, y: np.ndarray, ini: int, fin: int) -> np.ndarray:
+        """Costos reducidos de las columnas ini..fin-1, con cero en las básicas y en las no permitidas."""
+        if ini == 0 and fin == self.p.num_total:
+            d = costos - self.p.producto_t(y)
+        else:
+            d = costos[ini:fin] - self.p.producto_t_rango(y, ini, fin)
+        base = np.asarray(self.base)
+        d[base[(base >= ini) & (base < fin)] - ini] = 0.0
+        d[~permitidas[ini:fin]] = 0.0
+        return d
+
+    def _iterar(self, costos: np.ndarray, permitidas: np.ndarray, fase: int = 0, iter_offset: int = 0) -> str:
+        """Itera hasta optimalidad con los costos dados. Retorna el status."""
+        inicio = self.iteraciones
+        status = "max_iterations_reached"
+        registrada = False
+
+        while True:
+            iteracion = self.iteraciones - inicio + 1
+            registrada = self.historial.registrar_iteracion(iteracion)
+            if registrada:
+                titulo = f"Fase {fase} - Iteración {iteracion + iter_offset}"
+                self.tablas.append(self._tabla(costos, permitidas, titulo))
+            self._informar('fase_1' if fase == 1 else 'fase_2', costos)
+
+            # 1. Precios duales y costos reducidos (con pricing parcial, solo
+            # de los bloques de columnas que la regla recorre)
+            y = self.factor.btran(costos[self.base])
+            costos_reducidos = lambda ini, fin: self._costos_reducidos(costos, permitidas, y, ini, fin)
+
+            # 2. Columna entrante (según la regla de pricing)
+            if self.regla.parcial:
+                q = self.regla.entrante_parcial(costos_reducidos, self.p.num_total)
+            else:
+                q = self.regla.entrante(costos_reducidos(0, self.p.num_total))
+            if q < 0:
+                status = "optimo"
+                break
+            if self.iteraciones >= self.max_iter:
+                status = "max_iterations_reached"
+                break
+
+            # 3. Columna actualizada y test de razón mínima
+            alpha = self.factor.ftran(self.p.columna(q))
+            r = self.regla.saliente(alpha, self.x_B, np.asarray(self.base))
+            if r < 0:
+                status = "no acotado"
+                break
+
+            # 4. Cambio de base
+            self._pivotear(r, q, alpha)
+            self.iteraciones += 1
+            registrada = False
+
+        # Los modos 'final' y 'every_k' siempre incluyen la tabla con la que termina la fase
+        if self.historial.registrar_final and not registrada:
+            titulo = f"Fase {fase} - Iteración {self.iteraciones - inicio + 1 + iter_offset}"
+            self.tablas.append(self._tabla(costos, permitidas, titulo))
+        return status
+
+    def _expulsar_artificiales(self) -> None:
+        """Saca de la base las artificiales que quedaron en nivel cero tras la Fase 1."""
+        no_artificiales = ~self.p.es_artificial
+        for r in range(self.p.m):
+            if not self.p.es_artificial[self.base[r]]:
+                continue
+            e_r = np.zeros(self.p.m)
+            e_r[r] = 1.0
+            fila = self.p.producto_t(self.factor.btran(e_r))
+            fila[self.base] = 0.0
+            candidatas = np.flatnonzero(no_artificiales & (np.abs(fila) > self.tol.pivote))
+            if len(candidatas):
+                q = int(candidatas[np.argmax(np.abs(fila[candidatas]))])
+                self._pivotear(r, q, self.factor.ftran(self.p.columna(q)))
+            # Si no hay candidatas la fila es redundante: la artificial queda en cero
+
+    def _iterar_dual(self, costos: np.ndarray, permitidas: np.ndarray) -> str:
+        """
+        Simplex dual desde una base dual factible: en cada iteración sale la
+        básica más infactible (negativa, o una artificial distinta de cero) y
+        entra la columna que conserva la factibilidad dual (test de razón dual).
+        Termina cuando la base es primal factible, es decir, óptima.
+        """
+        inicio = self.iteraciones
+        status = "max_iterations_reached"
+        registrada = False
+
+        while True:
+            iteracion = self.iteraciones - inicio + 1
+            registrada = self.historial.registrar_iteracion(iteracion)
+            if registrada:
+                self.tablas.append(self._tabla(costos, permitidas, f"Simplex Dual - Iteración {iteracion}"))
+            self._informar('dual', costos)
+
+            # 1. Fila saliente: la variable básica más infactible
+            base = np.asarray(self.base)
+            infactibilidad = np.where(self.p.es_artificial[base], np.abs(self.x_B), -self.x_B)
+            r = int(np.argmax(infactibilidad))
+            if infactibilidad[r] <= self.tol.factibilidad:
+                status = "optimo"
+                break
+            if self.iteraciones >= self.max_iter:
+                break
+
+            # 2. Fila r de B⁻¹A y costos reducidos
+            e_r = np.zeros(self.p.m)
+            e_r[r] = 1.0
+            fila = self.p.producto_t(self.factor.btran(e_r))
+            y = self.factor.btran(costos[base])
+            d = costos - self.p.producto_t(y)
+
+            # 3. Test de razón dual. Una básica negativa sube a cero con columnas de
+            # coeficiente negativo en su fila; una artificial positiva baja con positivas
+            signo = -1.0 if self.x_B[r] < 0 else 1.0
+            candidatas = permitidas & (signo * fila > self.tol.pivote)
+            candidatas[base] = False
+            if not np.any(candidatas):
+                status = "infactible"
+                break
+            indices = np.flatnonzero(candidatas)
+            magnitudes = np.abs(fila[indices])
+            ratios = np.maximum(d[indices], 0.0) / magnitudes
+            if self.regla.ratio_test == 'harris':
+                # Harris: entre las razones que no superan el paso relajado por la
+                # tolerancia de optimalidad, el mayor coeficiente de la fila
+                paso_maximo = np.min((np.maximum(d[indices], 0.0) + self.tol.optimalidad) / magnitudes)
+                empatadas = ratios <= paso_maximo
+                q = int(indices[empatadas][np.argmax(magnitudes[empatadas])])
+            else:
+                q = int(indices[np.argmin(ratios)])
+
+            # 4. Cambio de base
+            self._pivotear(r, q, self.factor.ftran(self.p.columna(q)))
+            self.iteraciones += 1
+            registrada = False
+
+        if self.historial.registrar_final and not registrada:
+            titulo = f"Simplex Dual - Iteración {self.iteraciones - inicio + 1}"
+            self.tablas.append(self._tabla(costos, permitidas, titulo))
+        return status
+
+    @property
+    def base_factible(self) -> bool:
+        """Indica si la base actual es primal factible y no contiene artificiales."""
+        return not np.any(self.p.es_artificial[self.base]) and bool(np.all(self.x_B >= -self.tol.factibilidad))
+
+    def dual_factible(self) -> bool:
+        """Indica si la base actual es dual factible para el objetivo original."""
+        permitidas = ~self.p.es_artificial
+        y = self.factor.btran(self.p.c[self.base])
+        d = self.p.c - self.p.producto_t(y)
+        d[self.base] = 0.0
+        return bool(np.all(d[permitidas] >= -self.tol.optimalidad))
+
+    def resolver(self, dual: bool = False) -> str:
+        """
+        Resuelve desde la base actual. Con `dual=True` y una base dual factible
+        (pero no primal factible) usa el simplex dual en lugar de la Fase 1.
+        """
+        p = self.p
+        if self.base_factible:
+            # Base inicial sin artificiales o arranque en caliente factible: basta la Fase 2
+            self.x_B = np.maximum(self.x_B, 0.0)
+            return self._iterar(p.c, ~p.es_artificial, fase=0)
+
+        if dual and self.dual_factible():
+            status = self._iterar_dual(p.c, ~p.es_artificial)
+            if status != "optimo":
+                return status
+            # Verificación primal (sin pivoteos salvo errores de redondeo); si no
+            # pivotea, su tabla repetiría la última del dual y se descarta
+            tablas, pivoteos = len(self.tablas), self.iteraciones
+            status = self._iterar(p.c, ~p.es_artificial, fase=0, iter_offset=self.iteraciones)
+            if self.iteraciones == pivoteos:
+                del self.tablas[tablas:]
+            return status
+
+        costos_f1 = p.es_artificial.astype(float)
+        status = self._iterar(costos_f1, np.ones(p.num_total, dtype=bool), fase=1)
+        if status != "optimo":
+            return status
+        # La infactibilidad residual se compara en relación con la magnitud de b
+        if costos_f1[self.base] @ self.x_B > self.tol.factibilidad * max(1.0, float(np.abs(p.b).max(initial=0.0))):
+            return "infactible"
+        self._expulsar_artificiales()
+
+        # Las tablas de la Fase 2 continúan la numeración de la Fase 1
+        return self._iterar(p.c, ~p.es_artificial, fase=2, iter_offset=self.iteraciones + 1)
+
+    def valores(self) -> np.ndarray:
+        """Valores de todas las variables en la base actual."""
+        x = np.zeros(self.p.num_total)
+        x[self.base] = self.x_B
+        return x
+
+
+def _solucion_desde_valores(problema: ProblemaEstandar, x: np.ndarray) -> Dict[str, Any]:
+    """
+    Arma el diccionario de solución con el mismo formato que el método tabular.
+    `x` está en el modelo escalado: se desescala antes de redondear.
+    """
+    valor = float(problema.c @ x)
+    x = x * problema.escala
+    solucion = {
+        "variables": {},
+        "valor_optimo": -valor if problema.problem_type == 'maximization' else valor,
+    }
+    for j, nombre in enumerate(problema.var_names):
+        if not problema.es_artificial[j]:
+            solucion["variables"][nombre] = round(float(x[j]), 6)
+    return solucion
+
+
+def resolver_simplex_revisado(
+    problem_type: Literal['minimization', 'maximization'],
+    C: List[float],
+    LI: Union[List[List[float]], Matriz],
+    LD: List[float],
+    O: List[Literal["<=", ">=", "="]],
+    historial: Optional[PoliticaHistorial] = None,
+    regla: Optional[ReglaPrecios] = None,
+    max_iteraciones: Optional[int] = None,
+    base: Optional[List[str]] = None,
+    dual: bool = False,
+    escalado: ScalingMethod = 'none',
+) -> Dict[str, Any]:
+    """
+    Resuelve un problema de Programación Lineal con el Método Simplex Revisado.
+
+    Mantiene una factorización LU de la base con actualizaciones en forma
+    producto y calcula los costos reducidos bajo demanda. LI puede ser una
+    `MatrizDispersa`, que se conserva dispersa de punta a punta. Por defecto
+    no genera tablas; si `historial` las pide se reconstruyen desde la base
+    (con costo O(m²·n) por tabla). La respuesta tiene el mismo formato que el
+    método tabular. `regla` elige la variable entrante (Dantzig por defecto) y
+    `max_iteraciones` limita los pivoteos de ambas fases.
+
+    `base` (las variables básicas de una resolución anterior) permite arrancar
+    en caliente: si sigue siendo factible se omite la Fase 1, y si dejó de
+    serlo (p. ej. tras cambiar LD) pero sigue siendo dual factible se
+    reoptimiza con el simplex dual. Si tiene menos variables que filas, se
+    asume que las filas faltantes son restricciones agregadas al final (cortes)
+    y se completa con sus variables lógicas. Si no es utilizable se resuelve
+    desde la base inicial.
+
+    Con `dual=True` y sin base, arranca del simplex dual desde la base lógica
+    cuando esta es dual factible (costos de minimización >= 0, típico de
+    modelos de cobertura con restricciones >=) y evita así la Fase 1.
+
+    `escalado` ('geometric' o 'equilibrate') escala filas y columnas antes de
+    resolver; la solución se devuelve desescalada y las tablas, si se piden,
+    muestran el modelo escalado. Las tolerancias y el test de razón los lleva `regla`.
+    """
+    if max_iteraciones is not None and max_iteraciones < 1:
+        raise ValueError("max_iterations debe ser mayor o igual a 1.")
+    problema = ProblemaEstandar(problem_type, C, LI, LD, O, escalado=escalado)
+    politica = historial or PoliticaHistorial('none')
+
+    def _solver(base_inicial: Optional[List[int]] = None) -> SimplexRevisado:
+        return SimplexRevisado(problema, max_iter=max_iteraciones, historial=politica, regla=regla, base=base_inicial)
+
+    solver = None
+    if base is not None:
+        try:
+            nombres = list(base)
+            if len(nombres) > problema.m:
+                raise ValueError(f"La base debe tener a lo sumo {problema.m} variables.")
+            # Filas agregadas al final: se completan con su variable lógica
+            indices = indices_de_base(nombres, problema.var_names, len(nombres))
+            indices += problema.base_dual()[len(nombres):]
+            solver = _solver(indices)
+            if not solver.base_factible and not solver.dual_factible():
+                raise ValueError("la base no es primal ni dual factible para los nuevos datos")
+        except ValueError as e:
+            logger.info(f"No se usa la base recibida ({e}); se resuelve desde la base inicial.")
+            solver = None
+    base_reutilizada = solver is not None
+
+    if solver is None and dual:
+        solver = _solver(problema.base_dual())
+        if not solver.dual_factible():
+            logger.info("La base lógica no es dual factible; se usa el simplex primal en dos fases.")
+            solver = None
+    if solver is None:
+        solver = _solver()
+    status = solver.resolver(dual=dual or base_reutilizada)
+
+    optimo = status == "optimo"
+    return {
+        "status": status,
+        "tablas": politica.recortar(solver.tablas),
+        "solucion": _solucion_desde_valores(problema, solver.valores()) if optimo else None,
+        "iteraciones": solver.iteraciones,
+        "base": [problema.var_names[j] for j in solver.base] if optimo else None,
+        "base_reutilizada": base_reutilizada if base is not None else None,
+    }
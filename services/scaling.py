@@ -0,0 +1,72 @@
+import numpy as np
+from typing import Literal, Tuple
+
+from .sparse_matrix import Matriz
+
+ScalingMethod = Literal['none', 'geometric', 'equilibrate']
+
+# Pasadas alternadas filas/columnas del escalado geométrico
+PASADAS_GEOMETRICAS = 4
+# Rango de coeficientes (mayor/menor) a partir del cual el tabular escala por defecto
+RANGO_SIN_ESCALAR = 1e4
+
+
+def _extremos(grupos: np.ndarray, valores: np.ndarray, cantidad: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Máximo y mínimo de `valores` por grupo (0 en los grupos vacíos)."""
+    maximo = np.full(cantidad, -np.inf)
+    minimo = np.full(cantidad, np.inf)
+    np.maximum.at(maximo, grupos, valores)
+    np.minimum.at(minimo, grupos, valores)
+    vacios = np.isinf(maximo)
+    maximo[vacios] = 0.0
+    minimo[vacios] = 0.0
+    return maximo, minimo
+
+
+def factores_escala(A: Matriz, metodo: ScalingMethod = 'geometric') -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Calcula factores de fila r y de columna s tales que R·A·S tenga sus
+    coeficientes cerca de 1 en magnitud (R = diag(r), S = diag(s)).
+
+    - 'geometric': alterna pasadas que dividen cada fila y cada columna por la
+      media geométrica de su mayor y su menor coeficiente, y termina
+      equilibrando las columnas (mayor coeficiente = 1).
+    - 'equilibrate': divide cada fila por su mayor coeficiente y luego cada columna.
+    - 'none': factores unitarios.
+
+    Se trabaja en escala logarítmica y los factores se redondean a potencias de
+    2, de modo que escalar y desescalar no introduce errores de redondeo.
+    """
+    m, n = A.shape
+    if metodo == 'none':
+        return np.ones(m), np.ones(n)
+    if metodo not in ('geometric', 'equilibrate'):
+        raise ValueError(f"Método de escalado desconocido: {metodo}")
+
+    filas, columnas, valores = A.elementos()
+    log_a = np.log2(np.abs(valores))
+    log_r = np.zeros(m)
+    log_s = np.zeros(n)
+
+    if metodo == 'geometric':
+        for _ in range(PASADAS_GEOMETRICAS):
+            maximo, minimo = _extremos(filas, log_a + log_s[columnas], m)
+            log_r = -0.5 * (maximo + minimo)
+            maximo, minimo = _extremos(columnas, log_a + log_r[filas], n)
+            log_s = -0.5 * (maximo + minimo)
+    else:
+        maximo, _ = _extremos(filas, log_a, m)
+        log_r = -maximo
+
+    maximo, _ = _extremos(columnas, log_a + log_r[filas], n)
+    log_s = -maximo
+    return np.exp2(np.round(log_r)), np.exp2(np.round(log_s))
+
+
+def rango_coeficientes(A: Matriz) -> float:
+    """Cociente entre el mayor y el menor coeficiente no nulo (en magnitud) de A."""
+    _, _, valores = A.elementos()
+    if not len(valores):
+        return 1.0
+    magnitudes = np.abs(valores)
+    return float(magnitudes.max() / magnitudes.min())
@@ -0,0 +1,148 @@
+import logging
+import numpy as np
+from typing import Any, Dict, List, Literal, Optional, Sequence, Tuple, Union
+
+from .metrics_service import etapa
+from .pricing import PricingRule, ReglaPrecios, crear_regla
+from .revised_simplex_service import ProblemaEstandar, SimplexRevisado, _solucion_desde_valores
+from .scaling import ScalingMethod
+from .sparse_matrix import Matriz, MatrizDispersa, como_matriz
+from .simplex_service import matriz_desde_request, tolerancias_desde_request
+from .tolerances import Tolerancias
+from schemas import SimplexScenariosRequest
+
+logger = logging.getLogger(__name__)
+
+
+def _datos_escenarios(
+    base: Sequence[float], escenarios: Sequence[Dict[str, Any]], campo: str
+) -> np.ndarray:
+    """
+    Matriz (escenarios × largo) con el vector `campo` de cada escenario; los
+    que lo omiten repiten el del problema base.
+    """
+    datos = np.tile(np.asarray(base, dtype=float), (len(escenarios), 1))
+    for k, escenario in enumerate(escenarios):
+        valor = escenario.get(campo)
+        if valor is None:
+            continue
+        if len(valor) != datos.shape[1]:
+            raise ValueError(
+                f"El escenario {k} tiene {len(valor)} valores en {campo} y se esperaban {datos.shape[1]}."
+            )
+        datos[k] = valor
+    return datos
+
+
+def _resolver_en_frio(
+    problem_type: Literal['minimization', 'maximization'],
+    C: np.ndarray,
+    LI: Matriz,
+    LD: np.ndarray,
+    O: List[Literal["<=", ">=", "="]],
+    escalado: ScalingMethod,
+    regla: ReglaPrecios,
+    max_iterations: Optional[int],
+) -> Tuple[SimplexRevisado, str]:
+    """
+    Resuelve un escenario desde cero: simplex dual desde la base lógica si es
+    dual factible (como `resolver_simplex_revisado` con dual=True) y, si no,
+    dos fases. Retorna (solver, status).
+    """
+    problema = ProblemaEstandar(problem_type, C.tolist(), LI, LD.tolist(), O, escalado=escalado)
+    solver = SimplexRevisado(problema, max_iter=max_iterations, regla=regla, base=problema.base_dual())
+    if solver.dual_factible():
+        return solver, solver.resolver(dual=True)
+    solver = SimplexRevisado(problema, max_iter=max_iterations, regla=regla)
+    return solver, solver.resolver()
+
+
+def resolver_escenarios(
+    problem_type: Literal['minimization', 'maximization'],
+    C: List[float],
+    LI: Union[List[List[float]], MatrizDispersa],
+    LD: List[float],
+    O: List[Literal["<=", ">=", "="]],
+    escenarios: Sequence[Dict[str, Any]],
+    pricing: Optional[PricingRule] = None,
+    max_iterations: Optional[int] = None,
+    scaling: Optional[ScalingMethod] = None,
+    tolerances: Optional[Tolerancias] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Resuelve el mismo modelo (LI y O fijos) con varios vectores de costos y/o
+    lados derechos. Cada escenario es un dict con 'C' y/o 'LD'; los omitidos
+    se toman del problema base.
+
+    El modelo se estandariza y escala una sola vez, y cada escenario se
+    reoptimiza desde la base óptima del anterior conservando su
+    factorización: si solo cambió C la base sigue siendo factible y basta el
+    simplex primal; si cambió LD sigue siendo dual factible y se usa el
+    simplex dual. Solo si la base no es primal ni dual factible (cambiaron
+    ambos, o el escenario anterior no fue óptimo) se resuelve desde cero.
+
+    Retorna un resultado por escenario, en orden, con el formato de
+    `resolver_simplex_tabular` (sin tablas). `base_reutilizada` indica si el
+    escenario se reoptimizó desde la base del anterior.
+    """
+    if max_iterations is not None and max_iterations < 1:
+        raise ValueError("max_iterations debe ser mayor o igual a 1.")
+    if not escenarios:
+        raise ValueError("Debe indicarse al menos un escenario.")
+
+    # Vectores de todos los escenarios en una sola matriz cada uno
+    costos = _datos_escenarios(C, escenarios, 'C')
+    lados_derechos = _datos_escenarios(LD, escenarios, 'LD')
+
+    # La matriz se convierte una sola vez (se copia solo si hay que escalarla)
+    matriz = como_matriz(LI)
+    regla = crear_regla(pricing, tolerances, 'harris')
+    escalado = scaling or 'geometric'
+    solver: Optional[SimplexRevisado] = None
+    resultados = []
+
+    with etapa("escenarios"):
+        for k in range(len(escenarios)):
+            reutilizada = False
+            if solver is not None:
+                solver.cambiar_datos(costos[k], lados_derechos[k])
+                reutilizada = solver.base_factible or solver.dual_factible()
+            if reutilizada:
+                status = solver.resolver(dual=True)
+            else:
+                solver, status = _resolver_en_frio(
+                    problem_type, costos[k], matriz, lados_derechos[k], O, escalado, regla, max_iterations
+                )
+
+            optimo = status == "optimo"
+            problema = solver.p
+            resultados.append({
+                "status": status,
+                "tablas": [],
+                "solucion": _solucion_desde_valores(problema, solver.valores()) if optimo else None,
+                "iteraciones": solver.iteraciones,
+                "base": [problema.var_names[j] for j in solver.base] if optimo else None,
+                "base_reutilizada": reutilizada,
+            })
+            # Tras un escenario no óptimo la base no sirve de punto de partida
+            # (y una artificial básica no se puede conservar)
+            if not optimo or np.any(problema.es_artificial[solver.base]):
+                solver = None
+
+    return resultados
+
+
+def resolver_escenarios_desde_request(request: SimplexScenariosRequest) -> List[Dict[str, Any]]:
+    """Invoca a `resolver_escenarios` con todos los parámetros de un SimplexScenariosRequest."""
+    return resolver_escenarios(
+        problem_type=request.problem_type,
+        C=request.C,
+        LI=matriz_desde_request(request),
+        LD=request.LD,
+        O=request.O,
+        escenarios=[escenario.model_dump() for escenario in request.scenarios],
+        pricing=request.pricing,
+        max_iterations=request.max_iterations,
+        scaling=request.scaling,
+        tolerances=tolerancias_desde_request(request),
+    )
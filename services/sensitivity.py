@@ -0,0 +1,181 @@
+import numpy as np
+from typing import Any, Dict, List, Optional, Sequence
+
+from .bounds import CotasVariables
+from .tolerances import TOLERANCIAS_POR_DEFECTO
+
+# Cifras significativas de los valores de sensibilidad. Se cuentan respecto
+# del valor (o del dato en los rangos) y no en decimales fijos: el dual de una
+# fila con coeficientes 1e5 es del orden de 1e-5
+_CIFRAS = 9
+
+
+def _redondear(valor: float, referencia: Optional[float] = None) -> Optional[float]:
+    """
+    Redondea a `_CIFRAS` cifras significativas de max(|valor|, |referencia|);
+    los extremos infinitos de un rango se devuelven como None.
+    """
+    if not np.isfinite(valor):
+        return None
+    magnitud = max(abs(valor), abs(referencia or 0.0))
+    if magnitud == 0.0:
+        return 0.0
+    return round(float(valor), _CIFRAS - 1 - int(np.floor(np.log10(magnitud)))) + 0.0
+
+
+def _rango(actual: float, baja: float, sube: float) -> Dict[str, Optional[float]]:
+    return {
+        "actual": float(actual),
+        "minimo": _redondear(actual + baja, actual),
+        "maximo": _redondear(actual + sube, actual),
+    }
+
+
+def _intervalo(valores: np.ndarray, pendientes: np.ndarray, tol: float) -> tuple:
+    """
+    Mayor intervalo [baja, sube] de t que mantiene valores + t·pendientes >= 0
+    (se asume valores >= 0). Es el test de razón en ambos sentidos.
+    """
+    baja, sube = -np.inf, np.inf
+    positivas = pendientes > tol
+    negativas = pendientes < -tol
+    if positivas.any():
+        baja = float(np.max(-valores[positivas] / pendientes[positivas]))
+    if negativas.any():
+        sube = float(np.min(valores[negativas] / -pendientes[negativas]))
+    return baja, sube
+
+
+def analisis_sensibilidad(
+    tableau: np.ndarray,
+    var_names: List[str],
+    basicas: List[str],
+    cuerpo: np.ndarray,
+    nombres_cuerpo: List[str],
+    C: Sequence[float],
+    LD: Sequence[float],
+    problem_type: str,
+    factores_fila: np.ndarray,
+    factores_col: np.ndarray,
+    signos: np.ndarray,
+    tol: float = TOLERANCIAS_POR_DEFECTO.pivote,
+    cotas: Optional[CotasVariables] = None,
+) -> Optional[Dict[str, Any]]:
+    """
+    Análisis de sensibilidad a partir del tableau óptimo del método tabular,
+    sin volver a resolver.
+
+    `tableau` es el tableau final (B⁻¹A | B⁻¹b y fila Z, forma de
+    maximización) con columnas `var_names`; `basicas` sus variables básicas por
+    fila. `cuerpo` es la matriz estandarizada [A | holguras | excesos |
+    artificiales] con columnas `nombres_cuerpo`, de la que se toma B para
+    obtener B⁻¹ (las filas de igualdad no tienen holgura cuya columna la
+    muestre). `C` y `LD` son los datos originales; `factores_fila`,
+    `factores_col` y `signos` deshacen el escalado y el cambio de signo de las
+    filas con LD negativo.
+
+    Con `cotas` (variables acotadas) las columnas del tableau representan
+    x = origen + sentido·t: `cuerpo` debe venir en las variables x, los rangos
+    de LD respetan también las cotas superiores de las básicas y una variable
+    libre no básica solo sigue fuera de la base con su costo actual.
+
+    Todo se expresa en las unidades y el sentido del problema original:
+    - duales: precio sombra de cada restricción (variación de Z por unidad de LD).
+    - costos_reducidos: C_j - yᵀA_j de cada variable de decisión (0 si es básica).
+    - rangos_ld / rangos_costos: intervalo de cada LD / costo en el que la base
+      actual sigue siendo óptima (None si no hay límite en ese sentido).
+
+    Con degeneración los duales no son únicos: se informan los de la base final.
+    Retorna None si la base no se puede invertir.
+    """
+    m = len(basicas)
+    n = len(C)
+    signo_obj = -1.0 if problem_type == 'minimization' else 1.0
+    indice_cuerpo = {nombre: j for j, nombre in enumerate(nombres_cuerpo)}
+    indice_tableau = {nombre: j for j, nombre in enumerate(var_names)}
+
+    # B⁻¹ de la base final y precios duales del modelo interno y = c_B·B⁻¹
+    B = cuerpo[:, [indice_cuerpo[v] for v in basicas]]
+    try:
+        B_inv = np.linalg.inv(B)
+    except np.linalg.LinAlgError:
+        return None
+    costos_internos = np.zeros(len(nombres_cuerpo))
+    costos_internos[:n] = signo_obj * np.asarray(C, dtype=float) * factores_col
+    y_interno = costos_internos[[indice_cuerpo[v] for v in basicas]] @ B_inv
+    # Residuos numéricos del modelo interno (bien escalado) se llevan a cero
+    y_interno[np.abs(y_interno) <= tol] = 0.0
+
+    # Filas escaladas por r_i y con signo σ_i: y_i = signo_obj·σ_i·r_i·y'_i
+    escala_filas = signos * factores_fila
+    duales = signo_obj * escala_filas * y_interno
+
+    x_B = tableau[:m, -1]
+    fila_z = tableau[-1, :-1].copy()
+    fila_z[fila_z <= tol] = 0.0
+    es_basica = np.zeros(len(var_names), dtype=bool)
+    for v in basicas:
+        if v in indice_tableau:
+            es_basica[indice_tableau[v]] = True
+    fila_de = {v: i for i, v in enumerate(basicas)}
+
+    # Sentido, rango y si es libre cada columna del tableau y cada básica
+    # (una artificial básica de una fila redundante no tiene columna)
+    sentido = np.ones(len(var_names))
+    rango = np.full(len(var_names), np.inf)
+    libre = np.zeros(len(var_names), dtype=bool)
+    if cotas is not None:
+        sentido, rango, libre = (a[:len(var_names)] for a in (cotas.sentido, cotas.rango, cotas.libre))
+    columna_basica = np.array([indice_tableau.get(v, -1) for v in basicas], dtype=int)
+    con_columna = columna_basica >= 0
+    sentido_B = np.where(con_columna, sentido[columna_basica], 1.0)
+    rango_B = np.where(con_columna, rango[columna_basica], np.inf)
+    acotada_B = ~np.where(con_columna, libre[columna_basica], False)
+    superior_B = np.isfinite(rango_B)
+
+    # Rango de LD_i: t_B + δ·(sentido_B·σ_i·r_i·B⁻¹e_i) dentro de [0, rango_B]
+    rangos_ld = {}
+    for i in range(m):
+        pendiente = sentido_B * escala_filas[i] * B_inv[:, i]
+        baja, sube = _intervalo(x_B[acotada_B], pendiente[acotada_B], tol)
+        if superior_B.any():
+            baja_sup, sube_sup = _intervalo(rango_B[superior_B] - x_B[superior_B], -pendiente[superior_B], tol)
+            baja, sube = max(baja, baja_sup), min(sube, sube_sup)
+        rangos_ld[f"R{i+1}"] = _rango(LD[i], baja, sube)
+
+    costos_reducidos = {}
+    rangos_costos = {}
+    for j in range(n):
+        nombre = f"x{j+1}"
+        columna = indice_tableau[nombre]
+        # Un cambio δ en C_j es un cambio signo_obj·s_j·sentido_j·δ en el
+        # costo interno de la columna
+        factor = signo_obj * factores_col[j] * sentido[columna]
+        costos_reducidos[nombre] = _redondear(-fila_z[columna] / factor)
+
+        if nombre in fila_de:
+            # Básica: la fila Z de las no básicas pasa a fila_z + δ'·α_k (la de
+            # una libre no básica debe seguir en cero, en ambos sentidos)
+            alfa = tableau[fila_de[nombre], :-1]
+            no_basicas = ~es_basica
+            libres = no_basicas & libre
+            baja, sube = _intervalo(
+                np.concatenate([fila_z[no_basicas], fila_z[libres]]),
+                np.concatenate([alfa[no_basicas], -alfa[libres]]),
+                tol,
+            )
+        else:
+            # No básica: sigue fuera de la base mientras δ' <= fila_z_j (una
+            # libre, mientras su costo reducido siga en cero)
+            baja, sube = -fila_z[columna] if libre[columna] else -np.inf, fila_z[columna]
+        baja, sube = baja / factor, sube / factor
+        if factor < 0:
+            baja, sube = sube, baja
+        rangos_costos[nombre] = _rango(C[j], baja, sube)
+
+    return {
+        "duales": {f"R{i+1}": _redondear(duales[i]) for i in range(m)},
+        "costos_reducidos": costos_reducidos,
+        "rangos_ld": rangos_ld,
+        "rangos_costos": rangos_costos,
+    }
@@ -1,43 +1,39 @@
+import time
+import logging
 import numpy as np
-from typing import List, Dict, Any, Tuple, Literal
+from typing import Any, Callable, Dict, Generator, Iterator, List, Literal, Optional, Tuple, Union
 
-def _formatear_tableau(
-    tableau: np.ndarray, 
-    var_names: List[str], 
-    basic_vars: List[str], 
-    titulo: str
-) -> Dict[str, Any]:
-    """Formatea un tableau de numpy en un diccionario legible."""
-    
-    # Encabezados de las columnas
-    headers = ["Base"] + var_names + ["LD (RHS)"]
-    
-    # Fila de la Función Objetivo (Fila Z)
-    fila_obj_vals = [round(val, 6) for val in tableau[-1, :]]
-    fila_obj = ["Z"] + list(fila_obj_vals)
-    
-    # Filas de las restricciones
-    filas_restricciones = []
-    for i, var_basica in enumerate(basic_vars):
-        fila_vals = [round(val, 6) for val in tableau[i, :]]
-        fila = [var_basica] + list(fila_vals)
-        filas_restricciones.append(fila)
-        
-    return {
-        "titulo": titulo,
-        "headers": headers,
-        "filas": filas_restricciones,
-        "fila_obj": fila_obj
-    }
+from .barrier_service import resolver_barrera
+from .bounds import CotasVariables, ListaCotas
+from .metrics_service import etapa, sumar_etapa
+from .revised_simplex_service import indices_de_base, resolver_simplex_revisado
+from .sensitivity import analisis_sensibilidad
+from .scaling import RANGO_SIN_ESCALAR, ScalingMethod, factores_escala, rango_coeficientes
+from .sparse_matrix import MatrizDensa, MatrizDispersa
+from .pivot_kernels import pivotear
+from .presolve_service import Presolve
+from .pricing import PricingRule, ReglaPrecios, crear_regla, max_iteraciones_por_defecto
+from .tableau_history import HistoryMode, PoliticaHistorial, Progreso, formatear_tableau as _formatear_tableau
+from .tolerances import TOLERANCIAS_POR_DEFECTO, RatioTest, Tolerancias
+from schemas import SimplexRequest, SimplexScenariosRequest
+
+logger = logging.getLogger(__name__)
 
 def _obtener_solucion_final(
     tableau: np.ndarray, 
     var_names: List[str], 
     basic_vars: List[str], 
     num_vars_originales: int,
-    problem_type: str
+    problem_type: str,
+    escala: Optional[Dict[str, float]] = None,
+    cotas: Optional[CotasVariables] = None,
 ) -> Dict[str, Any]:
-    """Extrae los valores finales del último tableau."""
+    """
+    Extrae los valores finales del último tableau. `escala` (si el modelo se
+    escaló) lleva cada variable a las unidades originales antes de redondear.
+    Con `cotas`, las variables de decisión se obtienen de sus columnas
+    (x = origen + sentido·t) y las no básicas quedan en la cota en la que están.
+    """
     
     solucion = {"variables": {}, "valor_optimo": 0.0}
     
@@ -45,13 +41,16 @@ def _obtener_solucion_final(
     
     # Se revierte el signo en caso de problema de minimización
     if problem_type == 'minimization':
-        solucion["valor_optimo"] = -valor_optimo_raw
+        solucion["valor_optimo"] = -float(valor_optimo_raw)
     else:
-        solucion["valor_optimo"] = valor_optimo_raw
+        solucion["valor_optimo"] = float(valor_optimo_raw)
 
-    # Inicializar todas las variables originales a 0
+    # Inicializar todas las variables originales a 0 (o a su cota si hay cotas)
     for i in range(num_vars_originales):
         solucion["variables"][f"x{i+1}"] = 0.0
+        if cotas is not None:
+            valor = cotas.valor(i, 0.0) * (escala.get(f"x{i+1}", 1.0) if escala else 1.0)
+            solucion["variables"][f"x{i+1}"] = round(valor, 6)
         
     # Variables de holgura/exceso 
     for var in var_names:
@@ -61,7 +60,11 @@ def _obtener_solucion_final(
     # Sobrescribir con los valores de las variables básicas
     for i, var_basica in enumerate(basic_vars):
         if var_basica in solucion["variables"]:
-            solucion["variables"][var_basica] = round(tableau[i, -1], 6)
+            valor = float(tableau[i, -1])
+            if cotas is not None and var_basica.startswith('x'):
+                valor = cotas.valor(int(var_basica[1:]) - 1, valor)
+            valor *= escala.get(var_basica, 1.0) if escala else 1.0
+            solucion["variables"][var_basica] = round(valor, 6)
             
     return solucion
 
@@ -70,108 +73,470 @@ def _ejecutar_iteraciones_simplex(
     var_names: List[str], 
     basic_vars: List[str],
     fase: int,
-    iter_offset: int = 0
-) -> Tuple[str, np.ndarray, List[Dict[str, Any]], List[str]]:
+    iter_offset: int = 0,
+    historial: Optional[PoliticaHistorial] = None,
+    regla: Optional[ReglaPrecios] = None,
+    max_iteraciones: int = 50,
+    informar: Optional[Callable[[int, float], None]] = None,
+    cotas: Optional[CotasVariables] = None,
+) -> Generator[Dict[str, Any], None, Tuple[str, np.ndarray, List[str], int]]:
     """
     Ejecuta el bucle de iteraciones del Simplex sobre un tableau dado.
-    Retorna (status, tableau_final, historial_tablas, basic_vars_finales)
+
+    Es un generador: emite cada tabla registrada en cuanto se forma (así se
+    puede transmitir sin acumular el historial) y al terminar retorna
+    (status, tableau_final, basic_vars_finales, pivoteos), que se obtiene con
+    `yield from`.
+
+    `historial` decide qué tablas se formatean; por defecto se guardan todas.
+    `regla` elige la variable entrante (Dantzig por defecto) y `max_iteraciones`
+    limita la cantidad de pivoteos de la fase. `informar`, si se da, recibe en
+    cada iteración los pivoteos de la fase y el valor de la esquina de la fila Z.
+
+    Con `cotas` las variables acotadas se manejan sin filas extra (ver
+    `CotasVariables`): el test de razón considera también las cotas superiores
+    de las básicas y la de la entrante, y si la entrante llega primero a su
+    otra cota se complementa su columna sin pivotear (ese cambio de cota cuenta
+    como una iteración). Una básica que sale por su cota superior se
+    complementa tras el pivoteo.
     """
     
-    historial_tablas = []
-    num_restricciones = tableau.shape[0] - 1
+    historial = historial or PoliticaHistorial()
+    regla = regla or ReglaPrecios()
     
     # Copiamos las variables básicas para no modificar la lista original en el scope superior
     current_basic_vars = list(basic_vars)
+    # Índice de columna de cada básica (-1 para una artificial que quedó en la base en Fase 2)
+    indice_de = {nombre: j for j, nombre in enumerate(var_names)}
+    basicas = np.array([indice_de.get(v, -1) for v in current_basic_vars], dtype=int)
 
-    # Límite de iteraciones para evitar bucles infinitos (degeneración)
-    for iteracion in range(1, 51):
-        titulo = f"Fase {fase} - Iteración {iteracion + iter_offset}"
-        historial_tablas.append(
-            _formatear_tableau(tableau, var_names, current_basic_vars, titulo)
-        )
+    # Pesos exactos de steepest edge para la base inicial de la fase: 1 + ‖columna‖²
+    cuerpo = tableau[:-1, :-1]
+    regla.iniciar(1.0 + np.einsum('ij,ij->j', cuerpo, cuerpo))
+
+    def _tabla(titulo: str) -> Dict[str, Any]:
+        with etapa("formato_tablas"):
+            if cotas is None:
+                return _formatear_tableau(tableau, var_names, current_basic_vars, titulo)
+            nombres = cotas.nombres(var_names)
+            mostrados = dict(zip(var_names, nombres))
+            return _formatear_tableau(tableau, nombres, [mostrados.get(v, v) for v in current_basic_vars], titulo)
 
-        # 1. Comprobar optimalidad:
+    def _terminar(status: str, iteracion: int, registrada: bool):
+        # Los modos 'final' y 'every_k' siempre incluyen la tabla con la que termina la fase
+        if historial.registrar_final and not registrada:
+            yield _tabla(f"Fase {fase} - Iteración {iteracion + iter_offset}")
+        return status, tableau, current_basic_vars, iteracion - 1
+
+    # La última vuelta solo verifica optimalidad: el límite cuenta pivoteos
+    for iteracion in range(1, max_iteraciones + 2):
+        registrada = historial.registrar_iteracion(iteracion)
+        if registrada:
+            yield _tabla(f"Fase {fase} - Iteración {iteracion + iter_offset}")
+        if informar is not None:
+            informar(iteracion - 1, float(tableau[-1, -1]))
+
+        # 1. Comprobar optimalidad y elegir la Columna Pivote (variable entrante):
         # Fila Z (última fila), sin incluir la columna RHS (última columna)
         fila_obj = tableau[-1, :-1]
+        if cotas is not None:
+            cotas.orientar_libres(tableau, basicas, regla.tolerancias.optimalidad)
+        pivot_col = regla.entrante(fila_obj)
         
-        # Tolerancia para comparaciones de punto flotante
-        TOL = -1e-9
-        
-        if np.all(fila_obj >= TOL):
+        if pivot_col < 0:
             # ÓPTIMO ENCONTRADO
-            return "optimo", tableau, historial_tablas, current_basic_vars
+            return (yield from _terminar("optimo", iteracion, registrada))
+
+        # Límite de iteraciones para evitar bucles infinitos (degeneración)
+        if iteracion > max_iteraciones:
+            return (yield from _terminar("max_iterations_reached", iteracion, registrada))
 
-        # 2. Encontrar Columna Pivote (variable entrante)
-        # La columna con el valor más negativo en la fila Z
-        pivot_col = np.argmin(fila_obj)
         columna_pivote_vals = tableau[:-1, pivot_col] # Valores de la columna, sin fila Z
 
+        # 2. Encontrar Fila Pivote (Test de Razón Mínima, vectorizado)
+        rhs = tableau[:-1, -1] # Lado derecho (RHS)
+        if cotas is None:
+            pivot_row = regla.saliente(columna_pivote_vals, rhs, basicas)
+        else:
+            alpha_razon, rhs_razon = cotas.razones(columna_pivote_vals, rhs, basicas)
+            pivot_row = regla.saliente(alpha_razon, rhs_razon, basicas)
+            paso = max(rhs_razon[pivot_row], 0.0) / alpha_razon[pivot_row] if pivot_row >= 0 else np.inf
+            if np.isfinite(cotas.rango[pivot_col]) and cotas.rango[pivot_col] <= paso:
+                # La entrante llega a su otra cota antes que cualquier básica a las suyas
+                cotas.complementar(tableau, pivot_col)
+                continue
+
         # 3. Comprobar si es No Acotado 
-        if np.all(columna_pivote_vals <= 1e-9):
+        if pivot_row < 0:
             # Todos los coeficientes en la columna pivote son <= 0
-            return "no acotado", tableau, historial_tablas, current_basic_vars
+            return (yield from _terminar("no acotado", iteracion, registrada))
 
-        # 4. Encontrar Fila Pivote (Test de Razón Mínima)
-        rhs = tableau[:-1, -1] # Lado derecho (RHS)
-        
-        # Ignorar filas donde el elemento de la columna pivote es <= 0
-        # Usamos np.inf para valores no válidos
-        ratios = np.full(num_restricciones, np.inf)
-        for i in range(num_restricciones):
-            if columna_pivote_vals[i] > 1e-9:
-                ratios[i] = rhs[i] / columna_pivote_vals[i]
-
-        pivot_row = np.argmin(ratios)
+        # 4. Actualizar la regla con los datos del pivoteo (antes de modificar el tableau)
+        regla.actualizar(
+            pivot_col,
+            basicas[pivot_row],
+            pivot_row,
+            columna_pivote_vals.copy(),
+            tableau[pivot_row, :-1].copy() if regla.requiere_fila_pivote else None,
+            cuerpo.T @ columna_pivote_vals if regla.requiere_proyeccion else None,
+        )
         
         # 5. Realizar Pivoteo (Gauss-Jordan)
         
         # Actualizar la variable básica de la fila
+        saliente = basicas[pivot_row]
+        sale_por_cota_superior = cotas is not None and columna_pivote_vals[pivot_row] < 0
         current_basic_vars[pivot_row] = var_names[pivot_col]
+        basicas[pivot_row] = pivot_col
         
-        pivot_element = tableau[pivot_row, pivot_col]
-        
-        # a) Normalizar la fila pivote
-        tableau[pivot_row, :] = tableau[pivot_row, :] / pivot_element
-        
-        # b) Hacer cero los otros elementos de la columna pivote
-        for i in range(tableau.shape[0]): # Incluye la fila Z
-            if i != pivot_row:
-                factor = tableau[i, pivot_col]
-                tableau[i, :] = tableau[i, :] - factor * tableau[pivot_row, :]
+        # Actualización de rango 1 sobre todo el tableau (incluye la fila Z)
+        pivotear(tableau, pivot_row, pivot_col)
+        if sale_por_cota_superior:
+            cotas.complementar(tableau, saliente)
 
-    # Si llega aquí, excedió el límite de iteraciones
-    return "max_iterations_reached", tableau, historial_tablas, current_basic_vars
+def _fila_objetivo(C_interno: np.ndarray, largo: int, cotas: Optional[CotasVariables]) -> np.ndarray:
+    """Fila Z sin canonizar (−C en las variables de decisión) de un tableau de `largo` columnas."""
+    if cotas is not None:
+        return cotas.fila_objetivo(C_interno, largo)
+    fila = np.zeros(largo + 1)
+    fila[:len(C_interno)] = -C_interno
+    return fila
+
+def _tableau_desde_base(
+    tableau_cuerpo: np.ndarray,
+    LD_vector: np.ndarray,
+    fila_obj: np.ndarray,
+    var_names: List[str],
+    base: List[str],
+    tol_factibilidad: float = TOLERANCIAS_POR_DEFECTO.factibilidad,
+    cotas: Optional[CotasVariables] = None,
+) -> Tuple[np.ndarray, List[str]]:
+    """
+    Arma el tableau de Fase 2 expresado en una base dada (arranque en caliente):
+    cuerpo y RHS multiplicados por B⁻¹ y fila Z en forma canónica.
+    Con `cotas` la base no dice en qué cota está cada no básica: se ponen en
+    la superior las que tienen costo reducido negativo (como en una base
+    óptima) y en la inicial las demás, y las básicas deben respetar también
+    su cota superior.
+    Retorna (tableau, var_names_sin_artificiales). Lanza ValueError si la base
+    no es utilizable o no es factible para estos datos.
+    """
+    columnas = [j for j, nombre in enumerate(var_names) if not nombre.startswith('a')]
+    var_names_f2 = [var_names[j] for j in columnas]
+    indices = indices_de_base(base, var_names_f2, tableau_cuerpo.shape[0])
+
+    cuerpo = np.hstack([tableau_cuerpo[:, columnas], LD_vector])
+    try:
+        cuerpo = np.linalg.solve(cuerpo[:, indices], cuerpo)
+    except np.linalg.LinAlgError:
+        raise ValueError("la base es singular")
+    if not np.all(np.isfinite(cuerpo)):
+        raise ValueError("la base es singular")
+
+    valores = cuerpo[:, -1]
+    a_superior = np.zeros(0, dtype=int)
+    if cotas is not None:
+        reducidos = fila_obj[:-1] - fila_obj[indices] @ cuerpo[:, :-1]
+        no_basicas = np.ones(len(var_names_f2), dtype=bool)
+        no_basicas[indices] = False
+        acotadas_arriba = np.isfinite(cotas.rango[:len(var_names_f2)])
+        a_superior = np.flatnonzero(
+            no_basicas & acotadas_arriba & (reducidos < -TOLERANCIAS_POR_DEFECTO.optimalidad)
+        )
+        valores = valores - cuerpo[:, a_superior] @ cotas.rango[a_superior]
+    # Las básicas libres pueden tomar cualquier valor
+    acotadas = np.ones(len(indices), dtype=bool) if cotas is None else ~cotas.libre[indices]
+    if np.any(valores[acotadas] < -tol_factibilidad):
+        raise ValueError("la base no es factible para los nuevos datos")
+    if cotas is not None and np.any(valores > cotas.rango[indices] + tol_factibilidad):
+        raise ValueError("la base no es factible para los nuevos datos")
+
+    tableau = np.vstack([cuerpo, fila_obj])
+    for j in a_superior:
+        cotas.complementar(tableau, j)
+    tableau[:-1, -1][acotadas] = np.maximum(tableau[:-1, -1][acotadas], 0.0)
+
+    # Fila Z canónica: z - z_B·(B⁻¹[A | b])
+    tableau[-1] -= tableau[-1, indices] @ tableau[:-1]
+    return tableau, var_names_f2
 
 def resolver_simplex_tabular(
     problem_type: Literal['minimization', 'maximization'],
     C: List[float],
-    LI: List[List[float]],
+    LI: Union[List[List[float]], MatrizDispersa],
     LD: List[float],
-    O: List[Literal["<=", ">=", "="]]
+    O: List[Literal["<=", ">=", "="]],
+    method: Optional[Literal['tabular', 'revised', 'dual', 'barrier']] = None,
+    history: Optional[HistoryMode] = None,
+    history_every: int = 1,
+    pricing: Optional[PricingRule] = None,
+    max_iterations: Optional[int] = None,
+    basis: Optional[List[str]] = None,
+    presolve: bool = False,
+    scaling: Optional[ScalingMethod] = None,
+    ratio_test: Optional[RatioTest] = None,
+    tolerances: Optional[Tolerancias] = None,
+    crossover: bool = True,
+    progreso: Optional[Progreso] = None,
+    lower: ListaCotas = None,
+    upper: ListaCotas = None,
 ) -> Dict[str, Any]:
     """
     Resuelve un problema de Programación Lineal usando el Método Simplex Tabular
     (Dos Fases si es necesario).
 
+    Con method='revised' delega en el Simplex Revisado con base factorizada,
+    pensado para problemas grandes (no genera tablas intermedias). Si LI es una
+    `MatrizDispersa` y no se indica método, se usa el revisado para no densificarla.
+    Con method='dual' usa el Simplex Dual sobre la misma base factorizada: evita
+    la Fase 1 cuando la base lógica es dual factible y reoptimiza tras cambios
+    en LD o restricciones agregadas a partir de `basis`.
+    Con method='barrier' usa el método de punto interior (ver `resolver_barrera`)
+    y, si `crossover` es True, termina con el Simplex Revisado desde una base
+    construida con la solución interior; `basis` no se usa en este método.
+
+    `history` controla qué tablas se devuelven ('none', 'final', 'all' o
+    'every_k' con `history_every`). Por defecto 'all' en el método tabular y
+    'none' en el revisado.
+
+    `pricing` elige la regla de la variable entrante ('dantzig', 'bland',
+    'steepest_edge', 'devex' o 'partial') y `max_iterations` limita los
+    pivoteos sumando ambas fases (por defecto max(50, 10·(m+n))).
+
+    `basis` son las variables básicas devueltas en `base` por una resolución
+    anterior del mismo modelo: si siguen formando una base factible se omite
+    la Fase 1 y solo se pivotea desde allí (arranque en caliente). Si no, se
+    resuelve desde cero e `base_reutilizada` es False.
+
+    Con `presolve` el modelo se reduce antes de resolverlo (ver `Presolve`) y la
+    solución se lleva de vuelta al original; las tablas y la base usan los
+    nombres originales, pero solo contienen las filas y columnas que quedaron.
+
+    `scaling` ('none', 'geometric' o 'equilibrate') escala filas y columnas de
+    LI antes de resolver y desescala la solución; las tablas muestran el modelo
+    escalado. `ratio_test` elige entre el test de razón de libro ('textbook') y
+    el de Harris ('harris'), y `tolerances` fija las tolerancias de pivote,
+    optimalidad y factibilidad. Por defecto el revisado y el dual escalan con
+    'geometric' y usan Harris; el tabular usa el test de libro y solo escala si
+    los coeficientes de LI abarcan más de `RANGO_SIN_ESCALAR` (así las tablas
+    de los modelos didácticos no cambian).
+
+    `progreso`, si se da, se invoca en cada iteración con la etapa, los
+    pivoteos realizados y el objetivo actual (ver `PoliticaHistorial.informar`);
+    si lanza una excepción, la resolución se interrumpe con ella.
+
+    `lower` y `upper` son las cotas de las variables de decisión (None en una
+    posición = sin cota; por defecto x >= 0). El método tabular las maneja sin
+    agregar filas (ver `CotasVariables`): una cota superior no agranda el
+    tableau y una variable libre no se divide en dos columnas. Solo se admiten
+    en el método tabular; con `presolve`, las cotas que este deduce de las
+    filas singleton también se pasan al tabular como cotas y no como filas.
+
     Retorna un diccionario con:
-    - status: 'optimo', 'infactible', 'no acotado'
+    - status: 'optimo', 'infactible', 'no acotado' o 'max_iterations_reached'
     - tablas: Una lista de todas las tablas intermedias y finales.
-    - solucion: (si es óptimo) Un diccionario con 'valor_optimo' y 'variables'.
+    - solucion: (si es óptimo) Un diccionario con 'valor_optimo' y 'variables'
+      y, en el método tabular sin presolve, 'sensibilidad' (duales, costos
+      reducidos y rangos de LD y de costos).
+    - iteraciones: Cantidad total de pivoteos realizados.
+    - base: (si es óptimo) Variables básicas finales, por fila.
+    - base_reutilizada: (si se envió `basis`) Si se pudo arrancar desde ella.
+    - presolve: (con `presolve`) Dimensiones del modelo original y del reducido.
+    """
+    tablas = []
+    for evento, datos in iterar_simplex_tabular(
+        problem_type, C, LI, LD, O,
+        method=method, history=history, history_every=history_every, pricing=pricing,
+        max_iterations=max_iterations, basis=basis, presolve=presolve,
+        scaling=scaling, ratio_test=ratio_test, tolerances=tolerances, crossover=crossover,
+        progreso=progreso, lower=lower, upper=upper,
+    ):
+        if evento == "tabla":
+            tablas.append(datos)
+        else:
+            resultado = datos
+    resultado["tablas"] = tablas
+    return resultado
+
+
+def iterar_simplex_tabular(
+    problem_type: Literal['minimization', 'maximization'],
+    C: List[float],
+    LI: Union[List[List[float]], MatrizDispersa],
+    LD: List[float],
+    O: List[Literal["<=", ">=", "="]],
+    method: Optional[Literal['tabular', 'revised', 'dual', 'barrier']] = None,
+    history: Optional[HistoryMode] = None,
+    history_every: int = 1,
+    pricing: Optional[PricingRule] = None,
+    max_iterations: Optional[int] = None,
+    basis: Optional[List[str]] = None,
+    presolve: bool = False,
+    scaling: Optional[ScalingMethod] = None,
+    ratio_test: Optional[RatioTest] = None,
+    tolerances: Optional[Tolerancias] = None,
+    crossover: bool = True,
+    progreso: Optional[Progreso] = None,
+    lower: ListaCotas = None,
+    upper: ListaCotas = None,
+) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """
+    Versión incremental de `resolver_simplex_tabular` (mismos parámetros).
+
+    Emite ('tabla', tabla) por cada tabla del historial en cuanto se forma y
+    termina con ('resultado', resultado), cuyo 'tablas' queda vacío. En el
+    método tabular solo se retiene una tabla a la vez; el revisado, el dual y
+    el de barrera reconstruyen sus tablas al final y se emiten al terminar.
     """
+    method = method or ('revised' if isinstance(LI, MatrizDispersa) else 'tabular')
+    if (lower is not None or upper is not None) and method != 'tabular':
+        raise ValueError("Las cotas de las variables (lower/upper) solo se admiten en el método tabular.")
+
+    if presolve:
+        with etapa("presolve"):
+            reducido = Presolve(problem_type, C, LI, LD, O, lower=lower, upper=upper)
+            if reducido.status is None and not reducido.vacio:
+                # El tabular recibe las cotas que quedan como cotas y no como filas
+                C_red, LI_red, LD_red, O_red = reducido.problema(filas_cota=method != 'tabular')
+                lower_red, upper_red = reducido.cotas_reducidas() if method == 'tabular' else (None, None)
+        if reducido.status is not None or reducido.vacio:
+            yield "resultado", reducido.postsolve(None)
+            return
+        progreso_reducido = None
+        if progreso is not None:
+            constante = reducido.constante_objetivo
+            progreso_reducido = lambda etapa, iteracion, objetivo: progreso(
+                etapa, iteracion, objetivo if etapa == 'fase_1' else objetivo + constante
+            )
+        for evento, datos in iterar_simplex_tabular(
+            problem_type, C_red, LI_red, LD_red, O_red,
+            method=method, history=history, history_every=history_every, pricing=pricing,
+            max_iterations=max_iterations, basis=reducido.base_reducida(basis),
+            scaling=scaling, ratio_test=ratio_test, tolerances=tolerances, crossover=crossover,
+            progreso=progreso_reducido, lower=lower_red, upper=upper_red,
+        ):
+            if evento == "tabla":
+                yield evento, reducido.renombrar_tabla(datos)
+            else:
+                with etapa("postsolve"):
+                    datos = reducido.postsolve(datos)
+                yield evento, datos
+        return
+
+    if method in ('revised', 'dual'):
+        politica = PoliticaHistorial(history or 'none', history_every, progreso)
+        with etapa("simplex_dual" if method == 'dual' else "simplex_revisado"):
+            resultado = resolver_simplex_revisado(
+                problem_type, C, LI, LD, O,
+                historial=politica, regla=crear_regla(pricing, tolerances, ratio_test or 'harris'),
+                max_iteraciones=max_iterations, base=basis, dual=method == 'dual',
+                escalado=scaling or 'geometric',
+            )
+    elif method == 'barrier':
+        with etapa("barrera"):
+            resultado = resolver_barrera(
+                problem_type, C, LI, LD, O, crossover=crossover,
+                historial=PoliticaHistorial(history or 'none', history_every, progreso),
+                regla=crear_regla(pricing, tolerances, ratio_test or 'harris'),
+                max_iteraciones=max_iterations, escalado=scaling or 'geometric',
+            )
+        resultado["base_reutilizada"] = False if basis is not None else None
+    elif method == 'tabular':
+        politica = PoliticaHistorial(history or 'all', history_every, progreso)
+        tablas = _iterar_tabular(
+            problem_type, C, LI, LD, O, politica,
+            crear_regla(pricing, tolerances, ratio_test or 'textbook'),
+            max_iterations, basis, scaling, lower, upper,
+        )
+        # En modo 'final' solo se emite la última tabla: se retiene la más reciente
+        ultima = None
+        while True:
+            try:
+                tabla = next(tablas)
+            except StopIteration as fin:
+                resultado = fin.value
+                break
+            if politica.modo == 'final':
+                ultima = tabla
+            else:
+                yield "tabla", tabla
+        if ultima is not None:
+            yield "tabla", ultima
+        yield "resultado", resultado
+        return
+    else:
+        raise ValueError(f"Método desconocido: {method}")
+
+    for tabla in resultado["tablas"]:
+        yield "tabla", tabla
+    yield "resultado", dict(resultado, tablas=[])
+
+
+def _iterar_tabular(
+    problem_type: Literal['minimization', 'maximization'],
+    C: List[float],
+    LI: Union[List[List[float]], MatrizDispersa],
+    LD: List[float],
+    O: List[Literal["<=", ">=", "="]],
+    politica: PoliticaHistorial,
+    regla: ReglaPrecios,
+    max_iterations: Optional[int],
+    basis: Optional[List[str]],
+    scaling: Optional[ScalingMethod],
+    lower: ListaCotas = None,
+    upper: ListaCotas = None,
+) -> Generator[Dict[str, Any], None, Dict[str, Any]]:
+    """
+    Método tabular (Dos Fases si es necesario). Emite las tablas que pide
+    `politica` a medida que se forman y retorna el resultado sin ellas.
+    """
+    inicio = time.perf_counter()
+    tol = regla.tolerancias
+    if max_iterations is not None and max_iterations < 1:
+        raise ValueError("max_iterations debe ser mayor o igual a 1.")
+    limite = max_iterations or max_iteraciones_por_defecto(len(LD), len(C))
+
+    # Copia local: la normalización de signos no debe modificar la lista del llamador
+    O = list(O)
 
     num_vars_originales = len(C)
-    num_restricciones = len(LI)
+    num_restricciones = len(LD)
     
     # Estandarización del problema
     
     C_interno = np.array(C, dtype=float)
-    A_matrix = np.array(LI, dtype=float)
+    A_matrix = LI.toarray() if isinstance(LI, MatrizDispersa) else np.array(LI, dtype=float)
     LD_vector = np.array(LD, dtype=float).reshape(-1, 1) # Vector columna
+
+    if A_matrix.shape != (num_restricciones, num_vars_originales):
+        raise ValueError(f"LI debe tener dimensión {num_restricciones}x{num_vars_originales}.")
+
+    # Escalado de filas y columnas (factores potencia de 2, ver `factores_escala`)
+    matriz = MatrizDensa(A_matrix)
+    if scaling is None:
+        scaling = 'geometric' if rango_coeficientes(matriz) > RANGO_SIN_ESCALAR else 'none'
+    factores_fila, factores_col = factores_escala(matriz, scaling)
+    A_matrix *= factores_fila[:, None] * factores_col[None, :]
+    LD_vector *= factores_fila[:, None]
+    C_interno *= factores_col
+    # Factor que lleva cada variable del modelo escalado al original
+    escala = {f"x{j+1}": factores_col[j] for j in range(num_vars_originales)}
+    for i in range(num_restricciones):
+        for prefijo in ("s", "e"):
+            escala[f"{prefijo}{i+1}"] = 1.0 / factores_fila[i]
     
+    # Cotas de las variables: se resuelve en t (x = origen + sentido·t), sin filas extra
+    cotas = CotasVariables.desde_cotas(lower, upper, factores_col)
+    if cotas is not None:
+        cotas.aplicar(A_matrix, LD_vector)
+
+    # Signo de cada fila tras normalizar LD >= 0 (para el análisis de sensibilidad)
+    signos = np.ones(num_restricciones)
     for i in range(num_restricciones):
         if LD_vector[i] < 0:
             LD_vector[i] *= -1
             A_matrix[i, :] *= -1
+            signos[i] = -1.0
             if O[i] == "<=":
                 O[i] = ">="
             elif O[i] == ">=":
@@ -255,11 +620,51 @@ def resolver_simplex_tabular(
     # Ahora filtramos los None 
     basic_vars_fase1 = [v for v in basic_vars_por_fila if v is not None]
 
-    historial_tablas_completo = []
+    if cotas is not None:
+        cotas.ampliar(tableau_cuerpo.shape[1])
+        # Sentido de las columnas de `tableau_cuerpo` (el de cotas cambia al complementar)
+        sentido_cuerpo = cotas.sentido.copy()
+
+    iteraciones_totales = 0
+
+    def _resultado(
+        status: str,
+        solucion: Optional[Dict[str, Any]] = None,
+        base: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        return {
+            "status": status,
+            "tablas": [],
+            "solucion": solucion,
+            "iteraciones": iteraciones_totales,
+            "base": base,
+            "base_reutilizada": base_reutilizada if basis is not None else None,
+        }
+
+    # ARRANQUE EN CALIENTE (si se recibió una base)
+
+    tableau_caliente = None
+    if basis is not None:
+        fila_obj_caliente = _fila_objetivo(C_interno, tableau_cuerpo.shape[1] - len(artificial_names), cotas)
+        try:
+            tableau_caliente, var_names_caliente = _tableau_desde_base(
+                tableau_cuerpo, LD_vector, fila_obj_caliente, var_names, basis, tol.factibilidad, cotas
+            )
+        except ValueError as e:
+            logger.info(f"No se usa la base recibida ({e}); se resuelve desde la base inicial.")
+    base_reutilizada = tableau_caliente is not None
+    sumar_etapa("estandarizacion", inicio)
     
     # FASE 1 (Si es necesaria) 
     
-    if necesita_fase_1:
+    if base_reutilizada:
+        tableau_para_iterar = tableau_caliente
+        var_names_para_iterar = var_names_caliente
+        basic_vars_para_iterar = list(basis)
+        fase_actual = 0
+        iter_offset = 0
+
+    elif necesita_fase_1:
         
         fila_obj_fase1 = np.zeros(tableau_cuerpo.shape[1] + 1)
         indices_a = [i for i, nombre in enumerate(var_names) if nombre.startswith('a')]
@@ -276,28 +681,49 @@ def resolver_simplex_tabular(
                 tableau_fase1[-1, :] -= tableau_fase1[i, :]
         
         # Ejecutar Simplex Fase 1
-        status_f1, tableau_f1_final, tablas_f1, basic_vars_f1 = \
-            _ejecutar_iteraciones_simplex(
-                tableau_fase1, var_names, basic_vars_fase1, fase=1 # Usar la lista limpia
-            )
+        with etapa("fase_1"):
+            status_f1, tableau_f1_final, basic_vars_f1, iteraciones_f1 = \
+                yield from _ejecutar_iteraciones_simplex(
+                    tableau_fase1, var_names, basic_vars_fase1, fase=1, # Usar la lista limpia
+                    historial=politica, regla=regla, max_iteraciones=limite,
+                    # La esquina de la fila Z de la Fase 1 es -(suma de artificiales)
+                    informar=lambda pivoteos, z: politica.informar('fase_1', pivoteos, -z),
+                    cotas=cotas,
+                )
         
-        historial_tablas_completo.extend(tablas_f1)
+        iteraciones_totales += iteraciones_f1
         
         if status_f1 != 'optimo':
-            return {"status": status_f1, "tablas": historial_tablas_completo, "solucion": None}
+            return _resultado(status_f1)
 
-        if abs(tableau_f1_final[-1, -1]) > 1e-9:
-            return {"status": "infactible", "tablas": historial_tablas_completo, "solucion": None}
+        # La infactibilidad residual se compara en relación con la magnitud de LD
+        if abs(tableau_f1_final[-1, -1]) > tol.factibilidad * max(1.0, float(np.abs(LD_vector).max(initial=0.0))):
+            return _resultado("infactible")
 
         # Preparación FASE 2 ---
 
         indices_a = [i for i, nombre in enumerate(var_names) if nombre.startswith('a')]
+
+        # Una artificial que quedó básica en nivel cero debe salir de la base: si
+        # no, al quitar su columna la Fase 2 podría volverla positiva y violar su fila
+        basic_vars_f1 = list(basic_vars_f1)
+        no_artificiales = np.ones(len(var_names), dtype=bool)
+        no_artificiales[indices_a] = False
+        for i, var_basica in enumerate(basic_vars_f1):
+            if not var_basica.startswith('a'):
+                continue
+            fila = tableau_f1_final[i, :-1]
+            candidatas = np.flatnonzero(no_artificiales & (np.abs(fila) > tol.pivote))
+            if len(candidatas):
+                col = int(candidatas[np.argmax(np.abs(fila[candidatas]))])
+                pivotear(tableau_f1_final, i, col)
+                basic_vars_f1[i] = var_names[col]
+            # Si no hay candidatas la fila es redundante: la artificial queda en cero
         
         tableau_cuerpo_f2 = np.delete(tableau_f1_final[:-1, :], indices_a, axis=1)
         var_names_f2 = [v for v in var_names if not v.startswith('a')]
         
-        fila_obj_f2 = np.zeros(len(var_names_f2) + 1) 
-        fila_obj_f2[:num_vars_originales] = -C_interno
+        fila_obj_f2 = _fila_objetivo(C_interno, len(var_names_f2), cotas)
         
         tableau_fase2 = np.vstack([
             tableau_cuerpo_f2,
@@ -316,13 +742,13 @@ def resolver_simplex_tabular(
         var_names_para_iterar = var_names_f2
         basic_vars_para_iterar = basic_vars_f1
         fase_actual = 2
-        iter_offset = len(historial_tablas_completo)
+        # Las tablas de la Fase 2 continúan la numeración de la Fase 1
+        iter_offset = iteraciones_f1 + 1
 
     else:
         # Problema Estándar (Sin Fase 1) 
         
-        fila_obj_f_std = np.zeros(tableau_cuerpo.shape[1] + 1)
-        fila_obj_f_std[:num_vars_originales] = -C_interno
+        fila_obj_f_std = _fila_objetivo(C_interno, tableau_cuerpo.shape[1], cotas)
         
         tableau_std = np.vstack([
             np.hstack([tableau_cuerpo, LD_vector]), 
@@ -337,32 +763,126 @@ def resolver_simplex_tabular(
 
     # FASE 2 (o Fase Única) 
     
-    status_f2, tableau_f2_final, tablas_f2, basic_vars_f2 = \
-        _ejecutar_iteraciones_simplex(
-            tableau_para_iterar, 
-            var_names_para_iterar, 
-            basic_vars_para_iterar, 
-            fase=fase_actual,
-            iter_offset=iter_offset
-        )
+    with etapa("fase_2"):
+        status_f2, tableau_f2_final, basic_vars_f2, iteraciones_f2 = \
+            yield from _ejecutar_iteraciones_simplex(
+                tableau_para_iterar, 
+                var_names_para_iterar, 
+                basic_vars_para_iterar, 
+                fase=fase_actual,
+                iter_offset=iter_offset,
+                historial=politica,
+                regla=regla,
+                max_iteraciones=limite - iteraciones_totales,
+                informar=lambda pivoteos, z: politica.informar(
+                    'fase_2', iteraciones_totales + pivoteos, -z if problem_type == 'minimization' else z
+                ),
+                cotas=cotas,
+            )
 
-    historial_tablas_completo.extend(tablas_f2)
+    iteraciones_totales += iteraciones_f2
     
     # Preparar Resultados Finales 
     
     if status_f2 != 'optimo':
-        return {"status": status_f2, "tablas": historial_tablas_completo, "solucion": None}
+        return _resultado(status_f2)
 
     solucion_final = _obtener_solucion_final(
         tableau_f2_final,
         var_names_para_iterar,
         basic_vars_f2,
         num_vars_originales,
-        problem_type
+        problem_type,
+        escala,
+        cotas,
     )
+    with etapa("sensibilidad"):
+        solucion_final["sensibilidad"] = analisis_sensibilidad(
+            tableau_f2_final, var_names_para_iterar, basic_vars_f2,
+            tableau_cuerpo if cotas is None else tableau_cuerpo * sentido_cuerpo,
+            var_names, C, LD, problem_type,
+            factores_fila, factores_col, signos, tol.pivote, cotas,
+        )
     
-    return {
-        "status": "optimo",
-        "tablas": historial_tablas_completo,
-        "solucion": solucion_final
-    }
+    return _resultado("optimo", solucion_final, basic_vars_f2)
+
+
+def matriz_desde_request(request: Union[SimplexRequest, SimplexScenariosRequest]) -> Union[List[List[float]], MatrizDispersa]:
+    """Retorna LI denso tal cual o construye la `MatrizDispersa` de LI_sparse."""
+    if request.LI_sparse is None:
+        return request.LI
+    sp = request.LI_sparse
+    if sp.format == 'coo':
+        return MatrizDispersa.desde_coo(sp.row, sp.col, sp.data, sp.shape)
+    return MatrizDispersa.desde_csr(sp.indptr, sp.indices, sp.data, sp.shape)
+
+
+def tolerancias_desde_request(request: Union[SimplexRequest, SimplexScenariosRequest]) -> Optional[Tolerancias]:
+    """`Tolerancias` del request, o None para usar las de cada motor."""
+    if request.tolerances is None:
+        return None
+    return Tolerancias(
+        pivote=request.tolerances.pivot,
+        optimalidad=request.tolerances.optimality,
+        factibilidad=request.tolerances.feasibility,
+    )
+
+
+def _argumentos_desde_request(request: SimplexRequest) -> Dict[str, Any]:
+    """Parámetros de `resolver_simplex_tabular` tomados de un SimplexRequest."""
+    return dict(
+        problem_type=request.problem_type,
+        C=request.C,
+        LI=matriz_desde_request(request),
+        LD=request.LD,
+        O=request.O,
+        method=request.method,
+        history=request.history,
+        history_every=request.history_every,
+        pricing=request.pricing,
+        max_iterations=request.max_iterations,
+        basis=request.basis,
+        presolve=request.presolve,
+        scaling=request.scaling,
+        ratio_test=request.ratio_test,
+        tolerances=tolerancias_desde_request(request),
+        crossover=request.crossover,
+        lower=request.lower,
+        upper=request.upper,
+    )
+
+
+def metodo_de_request(request: SimplexRequest) -> str:
+    """Método con el que se resuelve el request (el explícito o el que elige `iterar_simplex_tabular`)."""
+    if request.method is not None:
+        return request.method
+    return 'revised' if request.LI_sparse is not None else 'tabular'
+
+
+def resolver_desde_request(request: SimplexRequest, progreso: Optional[Progreso] = None) -> Dict[str, Any]:
+    """Invoca a `resolver_simplex_tabular` con todos los parámetros de un SimplexRequest."""
+    return resolver_simplex_tabular(**_argumentos_desde_request(request), progreso=progreso)
+
+
+def iterar_desde_request(request: SimplexRequest) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """Invoca a `iterar_simplex_tabular` con todos los parámetros de un SimplexRequest."""
+    return iterar_simplex_tabular(**_argumentos_desde_request(request))
+
+
+def resolver_lote(requests: List[SimplexRequest]) -> List[Dict[str, Any]]:
+    """
+    Resuelve una lista de problemas de forma secuencial.
+
+    Pensada como unidad de trabajo de un proceso del pool: cada elemento del
+    resultado contiene 'resultado' o, si los datos eran inválidos, 'error'.
+    """
+    salida = []
+    for request in requests:
+        try:
+            salida.append({"resultado": resolver_desde_request(request), "error": None})
+        except ValueError as e:
+            salida.append({"resultado": None, "error": f"Datos inválidos: {e}"})
+        except Exception:
+            logger.exception("Error interno resolviendo un problema del lote")
+            salida.append({"resultado": None, "error": "Ocurrió un error interno al resolver el problema."})
+    return salida
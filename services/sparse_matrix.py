@@ -0,0 +1,189 @@
+import numpy as np
+from typing import List, Sequence, Tuple, Union
+
+
+class MatrizDensa:
+    """
+    Envoltorio mínimo sobre un `np.ndarray` con la misma interfaz que `MatrizDispersa`,
+    para que los motores trabajen igual con ambos formatos.
+    """
+
+    def __init__(self, valores):
+        self.valores = np.array(valores, dtype=float)
+        if self.valores.ndim != 2:
+            raise ValueError("LI debe ser una matriz (lista de listas).")
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return self.valores.shape
+
+    def copia(self) -> "MatrizDensa":
+        return MatrizDensa(self.valores)
+
+    def escalar_filas(self, factores: np.ndarray) -> None:
+        self.valores *= np.asarray(factores, dtype=float)[:, None]
+
+    def escalar_columnas(self, factores: np.ndarray) -> None:
+        self.valores *= np.asarray(factores, dtype=float)[None, :]
+
+    def elementos(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Tripletas (fila, columna, valor) de los elementos no nulos."""
+        filas, columnas = np.nonzero(self.valores)
+        return filas, columnas, self.valores[filas, columnas]
+
+    def columna(self, j: int) -> np.ndarray:
+        return self.valores[:, j]
+
+    def columnas(self, js: Sequence[int]) -> np.ndarray:
+        return self.valores[:, list(js)]
+
+    def producto(self, x: np.ndarray) -> np.ndarray:
+        return self.valores @ x
+
+    def producto_t(self, y: np.ndarray) -> np.ndarray:
+        return self.valores.T @ y
+
+    def producto_t_rango(self, y: np.ndarray, ini: int, fin: int) -> np.ndarray:
+        """Aᵀ·y solo para las columnas ini..fin-1."""
+        return self.valores[:, ini:fin].T @ y
+
+    def normas_columnas(self) -> np.ndarray:
+        """Norma euclídea al cuadrado de cada columna."""
+        return np.einsum('ij,ij->j', self.valores, self.valores)
+
+    def toarray(self) -> np.ndarray:
+        return self.valores
+
+
+class MatrizDispersa:
+    """
+    Matriz dispersa almacenada por columnas (CSC) usando solo NumPy.
+
+    Los motores solo necesitan extraer columnas y calcular Aᵀ·y (pricing),
+    operaciones que el formato por columnas resuelve en O(nnz).
+    """
+
+    def __init__(self, indptr, indices, data, shape: Tuple[int, int]):
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.indices = np.asarray(indices, dtype=np.int64)
+        self.data = np.asarray(data, dtype=float)
+        m, n = int(shape[0]), int(shape[1])
+        self._shape = (m, n)
+
+        if len(self.indptr) != n + 1 or self.indptr[0] != 0 or self.indptr[-1] != len(self.data):
+            raise ValueError("Punteros de columna inválidos para la matriz dispersa.")
+        if len(self.indices) != len(self.data):
+            raise ValueError("indices y data deben tener la misma longitud.")
+        if np.any(np.diff(self.indptr) < 0):
+            raise ValueError("Los punteros de la matriz dispersa deben ser no decrecientes.")
+        if len(self.indices) and (self.indices.min() < 0 or self.indices.max() >= m):
+            raise ValueError("Índice de fila fuera de rango en la matriz dispersa.")
+
+        # Columna de cada elemento almacenado (para Aᵀ·y vectorizado)
+        self._col_de_elemento = np.repeat(np.arange(n), np.diff(self.indptr))
+
+    @classmethod
+    def desde_coo(cls, filas, columnas, valores, shape: Tuple[int, int]) -> "MatrizDispersa":
+        """Construye la matriz desde tripletas (fila, columna, valor). Los duplicados se suman."""
+        filas = np.asarray(filas, dtype=np.int64)
+        columnas = np.asarray(columnas, dtype=np.int64)
+        valores = np.asarray(valores, dtype=float)
+        m, n = int(shape[0]), int(shape[1])
+
+        if not (len(filas) == len(columnas) == len(valores)):
+            raise ValueError("row, col y data deben tener la misma longitud.")
+        if len(filas) and (filas.min() < 0 or filas.max() >= m or columnas.min() < 0 or columnas.max() >= n):
+            raise ValueError("Índice fuera de rango en las tripletas de la matriz dispersa.")
+
+        # Ordenar por (columna, fila) y sumar duplicados
+        orden = np.lexsort((filas, columnas))
+        filas, columnas, valores = filas[orden], columnas[orden], valores[orden]
+        if len(filas):
+            clave = columnas * m + filas
+            nuevo = np.concatenate([[True], clave[1:] != clave[:-1]])
+            grupos = np.cumsum(nuevo) - 1
+            valores = np.bincount(grupos, weights=valores)
+            filas, columnas = filas[nuevo], columnas[nuevo]
+
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(columnas, minlength=n), out=indptr[1:])
+        return cls(indptr, filas, valores, (m, n))
+
+    @classmethod
+    def desde_csr(cls, indptr, indices, data, shape: Tuple[int, int]) -> "MatrizDispersa":
+        """Construye la matriz desde arreglos CSR (punteros por fila)."""
+        indptr = np.asarray(indptr, dtype=np.int64)
+        m = int(shape[0])
+        if len(indptr) != m + 1 or indptr[0] != 0 or indptr[-1] != len(data):
+            raise ValueError("Punteros de fila inválidos para la matriz dispersa.")
+        if np.any(np.diff(indptr) < 0):
+            raise ValueError("Los punteros de la matriz dispersa deben ser no decrecientes.")
+        filas = np.repeat(np.arange(m), np.diff(indptr))
+        return cls.desde_coo(filas, indices, data, shape)
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return self._shape
+
+    @property
+    def nnz(self) -> int:
+        return len(self.data)
+
+    def copia(self) -> "MatrizDispersa":
+        return MatrizDispersa(self.indptr.copy(), self.indices.copy(), self.data.copy(), self._shape)
+
+    def escalar_filas(self, factores: np.ndarray) -> None:
+        self.data *= np.asarray(factores, dtype=float)[self.indices]
+
+    def escalar_columnas(self, factores: np.ndarray) -> None:
+        self.data *= np.asarray(factores, dtype=float)[self._col_de_elemento]
+
+    def elementos(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Tripletas (fila, columna, valor) de los elementos almacenados no nulos."""
+        no_nulos = self.data != 0.0
+        return self.indices[no_nulos], self._col_de_elemento[no_nulos], self.data[no_nulos]
+
+    def columna(self, j: int) -> np.ndarray:
+        col = np.zeros(self._shape[0])
+        ini, fin = self.indptr[j], self.indptr[j + 1]
+        col[self.indices[ini:fin]] = self.data[ini:fin]
+        return col
+
+    def columnas(self, js: Sequence[int]) -> np.ndarray:
+        resultado = np.zeros((self._shape[0], len(js)))
+        for k, j in enumerate(js):
+            ini, fin = self.indptr[j], self.indptr[j + 1]
+            resultado[self.indices[ini:fin], k] = self.data[ini:fin]
+        return resultado
+
+    def producto(self, x: np.ndarray) -> np.ndarray:
+        return np.bincount(self.indices, weights=self.data * x[self._col_de_elemento], minlength=self._shape[0])
+
+    def producto_t(self, y: np.ndarray) -> np.ndarray:
+        return np.bincount(self._col_de_elemento, weights=self.data * y[self.indices], minlength=self._shape[1])
+
+    def producto_t_rango(self, y: np.ndarray, ini: int, fin: int) -> np.ndarray:
+        """Aᵀ·y solo para las columnas ini..fin-1 (recorre solo sus elementos)."""
+        a, b = self.indptr[ini], self.indptr[fin]
+        return np.bincount(
+            self._col_de_elemento[a:b] - ini, weights=self.data[a:b] * y[self.indices[a:b]], minlength=fin - ini
+        )
+
+    def normas_columnas(self) -> np.ndarray:
+        """Norma euclídea al cuadrado de cada columna."""
+        return np.bincount(self._col_de_elemento, weights=self.data * self.data, minlength=self._shape[1])
+
+    def toarray(self) -> np.ndarray:
+        denso = np.zeros(self._shape)
+        denso[self.indices, self._col_de_elemento] = self.data
+        return denso
+
+
+Matriz = Union[MatrizDensa, MatrizDispersa]
+
+
+def como_matriz(LI: Union[List[List[float]], np.ndarray, MatrizDensa, MatrizDispersa]) -> Matriz:
+    """Normaliza la matriz de restricciones a una de las dos representaciones soportadas."""
+    if isinstance(LI, (MatrizDensa, MatrizDispersa)):
+        return LI
+    return MatrizDensa(LI)
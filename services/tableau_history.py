@@ -0,0 +1,91 @@
+import numpy as np
+from typing import List, Dict, Any, Callable, Literal, Optional
+
+HistoryMode = Literal['none', 'final', 'all', 'every_k']
+# Etapa de la resolución informada en el progreso
+Etapa = Literal['fase_1', 'fase_2', 'dual', 'barrera']
+# Recibe (etapa, iteración, valor del objetivo) en cada iteración de los motores
+Progreso = Callable[[Etapa, int, float], None]
+
+
+def formatear_tableau(
+    tableau: np.ndarray, 
+    var_names: List[str], 
+    basic_vars: List[str], 
+    titulo: str
+) -> Dict[str, Any]:
+    """Formatea un tableau de numpy en un diccionario legible."""
+    
+    # Encabezados de las columnas
+    headers = ["Base"] + var_names + ["LD (RHS)"]
+    
+    # Redondeo vectorizado; tolist() devuelve floats nativos, baratos de
+    # serializar (JSON o pickle entre procesos)
+    valores = np.round(tableau, 6).tolist()
+
+    # Fila de la Función Objetivo (Fila Z)
+    fila_obj = ["Z"] + valores[-1]
+    
+    # Filas de las restricciones
+    filas_restricciones = []
+    for i, var_basica in enumerate(basic_vars):
+        fila = [var_basica] + valores[i]
+        filas_restricciones.append(fila)
+        
+    return {
+        "titulo": titulo,
+        "headers": headers,
+        "filas": filas_restricciones,
+        "fila_obj": fila_obj
+    }
+
+
+class PoliticaHistorial:
+    """
+    Decide qué tablas (iteraciones) se guardan en la respuesta.
+
+    - 'all': todas las iteraciones.
+    - 'every_k': una de cada `cada` iteraciones, más la tabla final.
+    - 'final': solo la última tabla del proceso.
+    - 'none': ninguna (solo status y solución).
+
+    Formatear una tabla cuesta O(m·n) y su tamaño domina la respuesta, por lo
+    que los modos reducidos evitan ese trabajo en lugar de descartarlo después.
+
+    Como todos los motores la reciben, también lleva el callback `progreso`
+    opcional, que se invoca en cada iteración sin importar el modo (ver `informar`).
+    """
+
+    def __init__(self, modo: HistoryMode = 'all', cada: int = 1, progreso: Optional[Progreso] = None):
+        if modo not in ('none', 'final', 'all', 'every_k'):
+            raise ValueError(f"Modo de historial desconocido: {modo}")
+        if cada < 1:
+            raise ValueError("history_every debe ser mayor o igual a 1.")
+        self.modo = modo
+        self.cada = cada
+        self.progreso = progreso
+
+    def informar(self, etapa: Etapa, iteracion: int, objetivo: float) -> None:
+        """
+        Informa el avance: `iteracion` cuenta los pivoteos (o las iteraciones
+        de barrera) realizados y `objetivo` es el valor del objetivo original
+        en el punto actual ('fase_1' informa la suma de las artificiales).
+        Una excepción del callback interrumpe la resolución (cancelación).
+        """
+        if self.progreso is not None:
+            self.progreso(etapa, iteracion, objetivo)
+
+    def registrar_iteracion(self, iteracion: int) -> bool:
+        """Indica si la tabla de la iteración (numerada desde 1) se guarda."""
+        if self.modo == 'all':
+            return True
+        return self.modo == 'every_k' and (iteracion - 1) % self.cada == 0
+
+    @property
+    def registrar_final(self) -> bool:
+        """Indica si la tabla con la que termina una fase se guarda siempre."""
+        return self.modo in ('final', 'every_k')
+
+    def recortar(self, tablas: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Aplica el modo al historial completo de todas las fases."""
+        return tablas[-1:] if self.modo == 'final' else tablas
@@ -0,0 +1,104 @@
+import json
+import struct
+import numpy as np
+from itertools import chain, islice
+from typing import Any, Dict, List, Literal, Optional
+
+# Tipo MIME del formato empaquetado (se elige con el header Accept)
+MEDIA_TYPE_EMPAQUETADO = "application/vnd.simplex.packed"
+
+PackedDtype = Literal['float64', 'float32']
+
+# Prefijo con la longitud del encabezado JSON (uint32 little-endian)
+_LONGITUD = struct.Struct("<I")
+
+
+def dtype_solicitado(accept: Optional[str]) -> Optional[PackedDtype]:
+    """
+    Interpreta el header Accept. Retorna el dtype del formato empaquetado
+    ('float64' por defecto, 'float32' con `;dtype=float32`) o None si el
+    cliente no lo pidió y corresponde el JSON habitual.
+    """
+    for rango in (accept or "").split(","):
+        partes = [p.strip() for p in rango.split(";")]
+        if partes[0].lower() != MEDIA_TYPE_EMPAQUETADO:
+            continue
+        parametros = dict(p.split("=", 1) for p in partes[1:] if "=" in p)
+        dtype = parametros.get("dtype", "float64").strip().lower()
+        if dtype not in ("float64", "float32"):
+            raise ValueError(f"dtype no soportado en Accept: {dtype}")
+        return dtype
+    return None
+
+
+def _bloques(tablas: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+    """Agrupa tablas consecutivas con los mismos encabezados (una fase)."""
+    bloques: List[List[Dict[str, Any]]] = []
+    for tabla in tablas:
+        if bloques and bloques[-1][0]["headers"] == tabla["headers"] and len(bloques[-1][0]["filas"]) == len(tabla["filas"]):
+            bloques[-1].append(tabla)
+        else:
+            bloques.append([tabla])
+    return bloques
+
+
+def empaquetar_resultado(resultado: Dict[str, Any], dtype: PackedDtype = 'float64') -> bytes:
+    """
+    Serializa el resultado del solver en el formato empaquetado:
+
+        uint32 LE (longitud del encabezado) | encabezado JSON | buffers
+
+    El encabezado es el resultado con `tablas` reemplazado por una lista de
+    bloques de tablas consecutivas con los mismos encabezados. Cada bloque
+    envía una sola vez `headers`, y por tabla su título y su base; los valores
+    van en `buffers` como un arreglo little-endian de forma `shape`
+    (tablas, filas + 1, columnas) a partir de `offset` (la última fila de cada
+    tabla es la fila Z), alineados a 8 bytes para leerlos sin copiar (p. ej.
+    con un `Float64Array` en el navegador). Así no se valida ni se codifica
+    cada celda en JSON.
+    """
+    tipo = np.dtype(dtype).newbyteorder("<")
+    bloques, buffers, offset = [], [], 0
+    for tablas in _bloques(resultado.get("tablas", [])):
+        filas, columnas = len(tablas[0]["filas"]) + 1, len(tablas[0]["headers"]) - 1
+        valores = np.empty((len(tablas), filas, columnas), dtype=tipo)
+        for k, tabla in enumerate(tablas):
+            celdas = chain.from_iterable(islice(fila, 1, None) for fila in chain(tabla["filas"], [tabla["fila_obj"]]))
+            valores[k] = np.fromiter(celdas, dtype=float, count=filas * columnas).reshape(filas, columnas)
+        bloques.append({
+            "headers": tablas[0]["headers"],
+            "titulos": [tabla["titulo"] for tabla in tablas],
+            "base": [[fila[0] for fila in tabla["filas"]] for tabla in tablas],
+            "shape": list(valores.shape),
+            "offset": offset,
+        })
+        buffers.append(valores.tobytes())
+        offset += valores.nbytes
+
+    encabezado = json.dumps(dict(resultado, tablas={"dtype": dtype, "bloques": bloques})).encode("utf-8")
+    # Espacios al final (JSON válido) para que los buffers queden alineados a 8 bytes
+    encabezado += b" " * (-(_LONGITUD.size + len(encabezado)) % 8)
+    return b"".join([_LONGITUD.pack(len(encabezado)), encabezado, *buffers])
+
+
+def desempaquetar_resultado(contenido: bytes) -> Dict[str, Any]:
+    """Inversa de `empaquetar_resultado`: reconstruye las tablas como en `formatear_tableau`."""
+    (longitud,) = _LONGITUD.unpack_from(contenido)
+    inicio = _LONGITUD.size + longitud
+    resultado = json.loads(contenido[_LONGITUD.size:inicio])
+    tipo = np.dtype(resultado["tablas"]["dtype"]).newbyteorder("<")
+
+    tablas = []
+    for bloque in resultado["tablas"]["bloques"]:
+        cantidad = int(np.prod(bloque["shape"]))
+        valores = np.frombuffer(contenido, dtype=tipo, count=cantidad, offset=inicio + bloque["offset"])
+        valores = valores.reshape(bloque["shape"]).astype(float).tolist()
+        for titulo, base, tabla in zip(bloque["titulos"], bloque["base"], valores):
+            tablas.append({
+                "titulo": titulo,
+                "headers": bloque["headers"],
+                "filas": [[nombre] + fila for nombre, fila in zip(base, tabla[:-1])],
+                "fila_obj": ["Z"] + tabla[-1],
+            })
+    resultado["tablas"] = tablas
+    return resultado
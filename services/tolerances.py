@@ -0,0 +1,39 @@
+from dataclasses import dataclass
+from typing import Literal
+
+# Valores por defecto de las tolerancias numéricas de los motores
+TOL_PIVOTE = 1e-9
+TOL_OPTIMALIDAD = 1e-9
+TOL_FACTIBILIDAD = 1e-9
+
+# Test de razón mínima: el de libro (primera fila ante empates) o el de Harris
+RatioTest = Literal['textbook', 'harris']
+
+
+@dataclass(frozen=True)
+class Tolerancias:
+    """
+    Tolerancias numéricas de un motor Simplex.
+
+    - pivote: un coeficiente de la columna entrante por debajo de este valor no
+      se considera para pivotear (evita pivotes diminutos).
+    - optimalidad: un costo reducido debe ser menor que -optimalidad para que
+      la columna se considere mejorante.
+    - factibilidad: cuánto puede violarse una cota (x >= 0) por redondeo; el test
+      de Harris la aprovecha para elegir pivotes más grandes entre razones casi empatadas.
+
+    Se aplican sobre el modelo ya escalado, donde los coeficientes son de orden 1.
+    """
+
+    pivote: float = TOL_PIVOTE
+    optimalidad: float = TOL_OPTIMALIDAD
+    factibilidad: float = TOL_FACTIBILIDAD
+
+    def __post_init__(self):
+        for nombre in ("pivote", "optimalidad", "factibilidad"):
+            valor = getattr(self, nombre)
+            if not 0 < valor < 1:
+                raise ValueError(f"La tolerancia de {nombre} debe estar entre 0 y 1.")
+
+
+TOLERANCIAS_POR_DEFECTO = Tolerancias()
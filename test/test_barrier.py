@@ -0,0 +1,115 @@
+import unittest
+import numpy as np
+from services import resolver_simplex_tabular
+from services.barrier_service import _cholesky, _resolver_triangular
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from routers.simplex_router import router
+
+
+class TestBarrera(unittest.TestCase):
+
+    def test_problema_clasico(self):
+        """
+        Max Z = 3x1 + 2x2
+            x1 + x2 <= 4
+            x1 - x2 <= 2
+        """
+        args = ("maximization", [3, 2], [[1, 1], [1, -1]], [4, 2], ["<=", "<="])
+        res = resolver_simplex_tabular(*args, method="barrier")
+        self.assertEqual(res["status"], "optimo")
+        self.assertAlmostEqual(res["solucion"]["valor_optimo"], 11.0, places=6)
+        self.assertEqual(res["solucion"]["variables"], {"x1": 3.0, "x2": 1.0, "s1": 0.0, "s2": 0.0})
+        self.assertEqual(sorted(res["base"]), ["x1", "x2"])
+
+        interior = resolver_simplex_tabular(*args, method="barrier", crossover=False)
+        self.assertEqual(interior["status"], "optimo")
+        self.assertAlmostEqual(interior["solucion"]["valor_optimo"], 11.0, places=6)
+        self.assertIsNone(interior["base"])
+        # Sin crossover solo cuentan las iteraciones de barrera
+        self.assertLessEqual(interior["iteraciones"], res["iteraciones"])
+
+    def test_coincide_con_el_simplex(self):
+        rng = np.random.default_rng(2)
+        for k in range(60):
+            m, n = rng.integers(2, 10), rng.integers(2, 10)
+            A = rng.integers(-3, 6, (m, n)) * (rng.random((m, n)) < 0.7)
+            b = rng.integers(-2, 12, m)
+            O = [str(o) for o in rng.choice(["<=", ">=", "="], m, p=[0.6, 0.3, 0.1])]
+            if k % 5 == 0:
+                # Fila de igualdad redundante
+                A, b, O = np.vstack([A, A[0]]), np.append(b, b[0]), O + ["="]
+            C = rng.integers(-3, 6, n).tolist()
+            problem_type = ["minimization", "maximization"][k % 2]
+            args = (problem_type, C, A.tolist(), b.tolist(), O)
+
+            ref = resolver_simplex_tabular(*args, method="revised")
+            for crossover in (True, False):
+                res = resolver_simplex_tabular(*args, method="barrier", crossover=crossover)
+                self.assertEqual(res["status"], ref["status"], f"{k} / crossover={crossover}")
+                if ref["status"] == "optimo":
+                    self.assertAlmostEqual(res["solucion"]["valor_optimo"], ref["solucion"]["valor_optimo"], places=5)
+
+    def test_infactible_y_no_acotado(self):
+        infactible = resolver_simplex_tabular("maximization", [1, 1], [[1, 1], [1, 1]], [2, 5], ["<=", ">="], method="barrier")
+        self.assertEqual(infactible["status"], "infactible")
+        no_acotado = resolver_simplex_tabular("maximization", [1, 1], [[1, -1]], [2], ["<="], method="barrier", crossover=False)
+        self.assertEqual(no_acotado["status"], "no acotado")
+
+    def test_limite_de_iteraciones_incluye_el_crossover(self):
+        # Si la barrera diverge, el simplex desde cero solo usa lo que queda del límite
+        rng = np.random.default_rng(2)
+        for k in range(6):
+            m, n = rng.integers(2, 10), rng.integers(2, 10)
+            A = rng.integers(-3, 6, (m, n)) * (rng.random((m, n)) < 0.7)
+            b = rng.integers(-2, 12, m)
+            O = [str(o) for o in rng.choice(["<=", ">=", "="], m, p=[0.6, 0.3, 0.1])]
+            C = rng.integers(-3, 6, n).tolist()
+            args = (["minimization", "maximization"][k % 2], C, A.tolist(), b.tolist(), O)
+            for limite in range(1, 25):
+                res = resolver_simplex_tabular(*args, method="barrier", max_iterations=limite)
+                self.assertLessEqual(res["iteraciones"], limite, f"{k} / max_iterations={limite}")
+
+    def test_modelo_denso_converge_en_pocas_iteraciones(self):
+        rng = np.random.default_rng(0)
+        m, n = 120, 160
+        A = rng.random((m, n)) * 10
+        args = ("maximization", (rng.random(n) * 10 + 1).tolist(), A.tolist(), (rng.random(m) * 100 + 50).tolist(), ["<="] * m)
+        ref = resolver_simplex_tabular(*args, method="revised")
+        res = resolver_simplex_tabular(*args, method="barrier", crossover=False)
+        self.assertAlmostEqual(res["solucion"]["valor_optimo"], ref["solucion"]["valor_optimo"], places=5)
+        self.assertLess(res["iteraciones"], 40)
+
+    def test_cholesky_y_sustitucion_por_bloques(self):
+        rng = np.random.default_rng(1)
+        A = rng.random((300, 400))
+        M = A @ A.T
+        L = _cholesky(M)
+        b = rng.random(300)
+        x = _resolver_triangular(L, _resolver_triangular(L, b), traspuesta=True)
+        np.testing.assert_allclose(M @ x, b, rtol=1e-8, atol=1e-8)
+
+
+class TestBarreraEndpoint(unittest.TestCase):
+
+    def test_solve_tabular_con_barrera(self):
+        app = FastAPI()
+        app.include_router(router)
+        client = TestClient(app)
+        payload = {
+            "problem_type": "maximization",
+            "C": [3, 2],
+            "LI": [[1, 1], [1, -1]],
+            "LD": [4, 2],
+            "O": ["<=", "<="],
+            "method": "barrier",
+        }
+        response = client.post("/simplex/solve-tabular", json=payload)
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data["status"], "optimo")
+        self.assertAlmostEqual(data["solucion"]["valor_optimo"], 11.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
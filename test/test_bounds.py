@@ -0,0 +1,204 @@
+import unittest
+import numpy as np
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from routers.simplex_router import router
+from services import resolver_simplex_tabular
+from services.cache_service import cache_resultados
+
+
+def _con_filas(problem_type, C, LI, LD, O, lower, upper):
+    """
+    Resuelve el mismo problema como antes de las cotas: x = lower + y (o
+    upper - y sin cota inferior, o y+ - y- si es libre) y cada cota superior
+    como una fila <= extra.
+    """
+    A = np.array(LI, dtype=float)
+    columnas, desplazamiento, filas = [], np.zeros(len(C)), []
+    for j in range(len(C)):
+        if lower[j] is not None:
+            desplazamiento[j] = lower[j]
+            columnas.append((j, 1.0))
+            if upper[j] is not None:
+                filas.append((len(columnas) - 1, upper[j] - lower[j]))
+        elif upper[j] is not None:
+            desplazamiento[j] = upper[j]
+            columnas.append((j, -1.0))
+        else:
+            columnas += [(j, 1.0), (j, -1.0)]
+    LI_filas = [[A[i, j] * s for j, s in columnas] for i in range(len(LD))]
+    LD_filas = (np.array(LD, dtype=float) - A @ desplazamiento).tolist()
+    for k, cota in filas:
+        LI_filas.append([1.0 if c == k else 0.0 for c in range(len(columnas))])
+        LD_filas.append(cota)
+    res = resolver_simplex_tabular(
+        problem_type, [C[j] * s for j, s in columnas], LI_filas, LD_filas, list(O) + ["<="] * len(filas),
+        history="none",
+    )
+    if res["status"] == "optimo":
+        res["solucion"]["valor_optimo"] += float(np.dot(C, desplazamiento))
+    return res
+
+
+class TestVariablesAcotadas(unittest.TestCase):
+
+    def test_cotas_superiores_sin_filas(self):
+        # Wyndor con x1 <= 4 y x2 <= 6 como cotas: el tableau tiene una sola fila
+        res = resolver_simplex_tabular("maximization", [3, 5], [[3, 2]], [18], ["<="], upper=[4, 6])
+        self.assertEqual(res["status"], "optimo")
+        self.assertEqual(res["solucion"]["valor_optimo"], 36.0)
+        self.assertEqual(res["solucion"]["variables"], {"x1": 2.0, "x2": 6.0, "s1": 0.0})
+        self.assertTrue(all(len(t["filas"]) == 1 for t in res["tablas"]))
+        # x2 quedó en su cota superior: su columna se muestra complementada
+        self.assertIn("x2'", res["tablas"][-1]["headers"])
+
+        sensibilidad = res["solucion"]["sensibilidad"]
+        self.assertEqual(sensibilidad["duales"], {"R1": 1.0})
+        # El costo reducido de x2 es el precio sombra de su cota (3 en la versión con filas)
+        self.assertEqual(sensibilidad["costos_reducidos"], {"x1": 0.0, "x2": 3.0})
+        self.assertEqual(sensibilidad["rangos_ld"]["R1"], {"actual": 18.0, "minimo": 12.0, "maximo": 24.0})
+
+    def test_libres_y_cotas_negativas(self):
+        # min x1 + 2x2, x1 + x2 >= -5, x1 libre, -1 <= x2 <= 3
+        res = resolver_simplex_tabular(
+            "minimization", [1, 2], [[1, 1]], [-5], [">="], lower=[None, -1], upper=[None, 3]
+        )
+        self.assertEqual(res["status"], "optimo")
+        self.assertEqual(res["solucion"]["valor_optimo"], -6.0)
+        self.assertEqual(res["solucion"]["variables"]["x1"], -4.0)
+        self.assertEqual(res["solucion"]["variables"]["x2"], -1.0)
+
+        # Solo cota superior (x1 <= 7) y una variable fija (x2 = 2)
+        res = resolver_simplex_tabular(
+            "maximization", [1, 1], [[1, 1]], [20], ["<="], lower=[None, 2], upper=[7, 2]
+        )
+        self.assertEqual(res["solucion"]["variables"]["x1"], 7.0)
+        self.assertEqual(res["solucion"]["variables"]["x2"], 2.0)
+
+        # Una libre sin otra restricción que la limite hace el problema no acotado
+        res = resolver_simplex_tabular("minimization", [1], [[1]], [3], ["<="], lower=[None])
+        self.assertEqual(res["status"], "no acotado")
+
+    def test_coincide_con_el_modelo_con_filas(self):
+        rng = np.random.default_rng(11)
+        reglas = ["dantzig", "bland", "steepest_edge", "devex", "partial"]
+        for caso in range(250):
+            m, n = int(rng.integers(1, 6)), int(rng.integers(1, 6))
+            LI = rng.integers(-5, 6, (m, n)).astype(float).tolist()
+            LD = rng.integers(-10, 20, m).astype(float).tolist()
+            O = list(rng.choice(["<=", ">=", "="], m, p=[0.6, 0.25, 0.15]))
+            C = rng.integers(-5, 6, n).astype(float).tolist()
+            lower, upper = [], []
+            for _ in range(n):
+                tipo = int(rng.integers(0, 5))
+                inferior = float(rng.integers(-5, 5))
+                lower.append([0.0, inferior, None, None, inferior][tipo])
+                upper.append([None, inferior + float(rng.integers(0, 8)), None, inferior, None][tipo])
+            problem_type = str(rng.choice(["minimization", "maximization"]))
+            res = resolver_simplex_tabular(
+                problem_type, C, LI, LD, O, lower=lower, upper=upper, history="none",
+                pricing=reglas[caso % len(reglas)], ratio_test="harris" if caso % 2 else "textbook",
+            )
+            esperado = _con_filas(problem_type, C, LI, LD, O, lower, upper)
+            self.assertEqual(res["status"], esperado["status"], caso)
+            if res["status"] == "optimo":
+                self.assertAlmostEqual(res["solucion"]["valor_optimo"], esperado["solucion"]["valor_optimo"], places=6)
+                x = np.array([res["solucion"]["variables"][f"x{j+1}"] for j in range(n)])
+                self.assertAlmostEqual(float(np.dot(C, x)), res["solucion"]["valor_optimo"], places=5)
+                for j in range(n):
+                    self.assertGreaterEqual(x[j], (lower[j] if lower[j] is not None else -np.inf) - 1e-6)
+                    self.assertLessEqual(x[j], (upper[j] if upper[j] is not None else np.inf) + 1e-6)
+
+    def test_arranque_en_caliente(self):
+        args = ("maximization", [3, 5, 4], [[3, 2, 1], [1, 1, 2]], [18, 10], ["<=", "<="])
+        res = resolver_simplex_tabular(*args, upper=[4, 3, 2])
+        caliente = resolver_simplex_tabular(*args, upper=[4, 3, 2], basis=res["base"])
+        self.assertTrue(caliente["base_reutilizada"])
+        self.assertEqual(caliente["solucion"]["valor_optimo"], res["solucion"]["valor_optimo"])
+
+    def test_cotas_invalidas(self):
+        args = ("maximization", [3, 5], [[3, 2]], [18], ["<="])
+        with self.assertRaises(ValueError):
+            resolver_simplex_tabular(*args, lower=[0, 5], upper=[4, 3])
+        with self.assertRaises(ValueError):
+            resolver_simplex_tabular(*args, upper=[4])
+        with self.assertRaises(ValueError):
+            resolver_simplex_tabular(*args, upper=[4, 6], method="revised")
+        with self.assertRaises(ValueError):
+            resolver_simplex_tabular(*args, upper=[4], presolve=True)
+
+    def test_presolve_con_cotas(self):
+        rng = np.random.default_rng(4)
+        for caso in range(150):
+            m, n = int(rng.integers(1, 6)), int(rng.integers(1, 6))
+            A = rng.integers(-5, 6, (m, n)).astype(float) * (rng.random((m, n)) < 0.7)
+            # Una fila singleton que el presolve convierte en cota
+            LI = np.vstack([A, np.eye(n)[rng.integers(n)]]).tolist()
+            LD = rng.integers(-10, 20, m + 1).astype(float).tolist()
+            O = list(rng.choice(["<=", ">=", "="], m + 1, p=[0.6, 0.25, 0.15]))
+            C = rng.integers(-5, 6, n).astype(float).tolist()
+            lower, upper = [], []
+            for _ in range(n):
+                tipo = int(rng.integers(0, 5))
+                inferior = float(rng.integers(-5, 5))
+                lower.append([0.0, inferior, None, None, inferior][tipo])
+                upper.append([None, inferior + float(rng.integers(0, 8)), None, inferior, None][tipo])
+            problem_type = str(rng.choice(["minimization", "maximization"]))
+            esperado = resolver_simplex_tabular(problem_type, C, LI, LD, O, lower=lower, upper=upper, history="none")
+            res = resolver_simplex_tabular(problem_type, C, LI, LD, O, lower=lower, upper=upper, presolve=True)
+            self.assertEqual(res["status"], esperado["status"], caso)
+            if res["status"] == "optimo":
+                self.assertAlmostEqual(res["solucion"]["valor_optimo"], esperado["solucion"]["valor_optimo"], places=6)
+                x = np.array([res["solucion"]["variables"][f"x{j+1}"] for j in range(n)])
+                for j in range(n):
+                    self.assertGreaterEqual(x[j], (lower[j] if lower[j] is not None else -np.inf) - 1e-6)
+                    self.assertLessEqual(x[j], (upper[j] if upper[j] is not None else np.inf) + 1e-6)
+                # El tableau reducido no tiene filas de cota
+                self.assertLessEqual(res["presolve"]["filas"], m)
+
+
+class TestEndpointsConCotas(unittest.TestCase):
+
+    def setUp(self):
+        app = FastAPI()
+        app.include_router(router)
+        self.client = TestClient(app)
+        cache_resultados.limpiar()
+
+    def test_solve_y_geometria(self):
+        payload = {
+            "problem_type": "maximization", "C": [3, 5], "LI": [[3, 2]], "LD": [18], "O": ["<="],
+            "upper": [4, 6],
+        }
+        r = self.client.post("/simplex/solve-tabular", json=payload)
+        self.assertEqual(r.status_code, 200)
+        self.assertEqual(r.json()["solucion"]["valor_optimo"], 36.0)
+
+        # Las cotas delimitan la región del gráfico: es la de Wyndor
+        g = self.client.post("/simplex/graph-geometry", json=payload).json()
+        self.assertEqual(
+            sorted(map(tuple, g["region"]["vertices"])),
+            [(0.0, 0.0), (0.0, 6.0), (2.0, 6.0), (4.0, 0.0), (4.0, 3.0)],
+        )
+
+        r = self.client.post("/simplex/solve-tabular", json=dict(payload, upper=[4, None, 1]))
+        self.assertEqual(r.status_code, 400)
+        for ruta in ("/simplex/graph-geometry", "/simplex/generate-graph"):
+            self.assertEqual(self.client.post(ruta, json=dict(payload, upper=[4, None, 1])).status_code, 400)
+
+    def test_geometria_con_cota_inferior_negativa(self):
+        payload = {
+            "problem_type": "minimization", "C": [1, 1], "LI": [[1, 1]], "LD": [-2], "O": [">="],
+            "lower": [-5, None], "upper": [None, 3],
+        }
+        r = self.client.post("/simplex/solve-tabular", json=payload)
+        self.assertEqual(r.json()["solucion"]["variables"]["x1"], -5.0)
+        g = self.client.post("/simplex/graph-geometry", json=payload).json()
+        self.assertEqual(g["optimo"], [-5.0, 3.0])
+        self.assertIn([-5.0, 3.0], g["region"]["vertices"])
+        self.assertLess(g["limites"]["x"][0], -5.0)
+        self.assertLess(g["limites"]["y"][0], 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,136 @@
+import unittest
+import os
+import time
+import tempfile
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from routers.simplex_router import router
+from schemas import SimplexRequest
+from services.cache_service import CacheResultados, cache_resultados, clave_canonica
+
+PAYLOAD = {
+    "problem_type": "maximization",
+    "C": [3, 5],
+    "LI": [[1, 0], [0, 2], [3, 2]],
+    "LD": [4, 12, 18],
+    "O": ["<=", "<=", "<="]
+}
+
+
+class TestClaveCanonica(unittest.TestCase):
+
+    def test_payloads_equivalentes_misma_clave(self):
+        a = SimplexRequest(**PAYLOAD)
+        b = SimplexRequest(**dict(PAYLOAD, C=[3.0, 5.0], method=None, history_every=1))
+        self.assertEqual(clave_canonica(a, "solve"), clave_canonica(b, "solve"))
+        self.assertNotEqual(clave_canonica(a, "solve"), clave_canonica(a, "pdf"))
+
+        c = SimplexRequest(**dict(PAYLOAD, LD=[4, 12, 19]))
+        self.assertNotEqual(clave_canonica(a, "solve"), clave_canonica(c, "solve"))
+
+
+class TestCacheResultados(unittest.TestCase):
+
+    def test_desaloja_la_menos_usada(self):
+        cache = CacheResultados(max_entradas=2, max_bytes=10**6, ttl=60)
+        cache.guardar("a", 1)
+        cache.guardar("b", 2)
+        cache.obtener("a")
+        cache.guardar("c", 3)
+        self.assertIsNone(cache.obtener("b"))
+        self.assertEqual(cache.obtener("a"), 1)
+        self.assertEqual(cache.estadisticas()["desalojos"], 1)
+
+    def test_limite_de_bytes_y_ttl(self):
+        cache = CacheResultados(max_entradas=10, max_bytes=300, ttl=0.05)
+        cache.guardar("grande", b"x" * 1000)
+        self.assertIsNone(cache.obtener("grande"))
+        cache.guardar("chico", b"x")
+        self.assertEqual(cache.obtener("chico"), b"x")
+        time.sleep(0.06)
+        self.assertIsNone(cache.obtener("chico"))
+
+    def test_respaldo_en_disco(self):
+        with tempfile.TemporaryDirectory() as directorio:
+            CacheResultados(10, 10**6, 60, directorio).guardar("k", {"status": "optimo"})
+            self.assertEqual(len(os.listdir(directorio)), 1)
+
+            # Una instancia nueva (p. ej. otro proceso) la encuentra en disco
+            otra = CacheResultados(10, 10**6, 60, directorio)
+            self.assertEqual(otra.obtener("k"), {"status": "optimo"})
+            self.assertEqual(otra.estadisticas()["aciertos_disco"], 1)
+
+    def test_disco_sin_pickle(self):
+        with tempfile.TemporaryDirectory() as directorio:
+            cache = CacheResultados(10, 10**6, 60, directorio)
+            cache.guardar("resultado", {"status": "optimo", "base": ["x1", "s2"]})
+            cache.guardar("imagen", b"\x89PNG")
+            self.assertEqual(sorted(os.listdir(directorio)), ["imagen.bin", "resultado.json"])
+            with open(os.path.join(directorio, "imagen.bin"), "rb") as f:
+                self.assertEqual(f.read(), b"\x89PNG")
+
+            otra = CacheResultados(10, 10**6, 60, directorio)
+            self.assertEqual(otra.obtener("resultado"), {"status": "optimo", "base": ["x1", "s2"]})
+            self.assertEqual(otra.obtener("imagen"), b"\x89PNG")
+            self.assertEqual(otra.estadisticas()["bytes"], os.path.getsize(os.path.join(directorio, "resultado.json")) + 4)
+
+            # Un archivo que no es JSON válido se descarta como fallo
+            with open(os.path.join(directorio, "roto.json"), "wb") as f:
+                f.write(b"\x80\x04pickle")
+            self.assertIsNone(otra.obtener("roto"))
+
+
+class TestCacheEndpoints(unittest.TestCase):
+
+    def setUp(self):
+        app = FastAPI()
+        app.include_router(router)
+        self.client = TestClient(app)
+        cache_resultados.limpiar()
+
+    def test_solve_grafico_y_pdf_comparten_resolucion(self):
+        antes = cache_resultados.estadisticas()
+
+        r1 = self.client.post("/simplex/solve-tabular", json=PAYLOAD)
+        r2 = self.client.post("/simplex/solve-tabular", json=dict(PAYLOAD, C=[3.0, 5.0]))
+        self.assertEqual(r1.json(), r2.json())
+
+        png = self.client.post("/simplex/generate-graph", json=PAYLOAD)
+        self.assertEqual(png.status_code, 200)
+        pdf = self.client.post("/simplex/generate-pdf", json=PAYLOAD)
+        self.assertEqual(pdf.status_code, 200)
+        self.assertTrue(pdf.content.startswith(b"%PDF"))
+        self.assertEqual(self.client.post("/simplex/generate-pdf", json=PAYLOAD).content, pdf.content)
+
+        despues = self.client.get("/simplex/cache-stats").json()
+        # Fallos: solve, png y pdf una vez cada uno; el resto son aciertos
+        self.assertEqual(despues["fallos"] - antes["fallos"], 3)
+        self.assertEqual(despues["aciertos"] - antes["aciertos"], 4)
+
+    def test_etag_y_304(self):
+        for ruta in ("/simplex/generate-pdf", "/simplex/generate-graph?format=svg"):
+            r = self.client.post(ruta, json=PAYLOAD)
+            self.assertEqual(r.status_code, 200)
+            self.assertEqual(int(r.headers["Content-Length"]), len(r.content))
+            etag = r.headers["ETag"]
+            self.assertTrue(etag.startswith('W/"'))
+
+            antes = cache_resultados.estadisticas()
+            r = self.client.post(ruta, json=PAYLOAD, headers={"If-None-Match": f'"otro", {etag}'})
+            self.assertEqual(r.status_code, 304)
+            self.assertEqual(r.content, b"")
+            self.assertEqual(r.headers["ETag"], etag)
+            # El 304 no consulta la caché ni renderiza
+            self.assertEqual(cache_resultados.estadisticas()["aciertos"], antes["aciertos"])
+
+            r = self.client.post(ruta, json=PAYLOAD, headers={"If-None-Match": '"otro"'})
+            self.assertEqual(r.status_code, 200)
+
+        # Otro formato es otra representación
+        svg = self.client.post("/simplex/generate-graph?format=svg", json=PAYLOAD).headers["ETag"]
+        png = self.client.post("/simplex/generate-graph", json=PAYLOAD).headers["ETag"]
+        self.assertNotEqual(svg, png)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+import unittest
+import numpy as np
+from services import resolver_simplex_tabular
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from routers.simplex_router import router
+
+
+def _cobertura(seed: int, m: int = 60, n: int = 45):
+    """Modelo de cobertura: min cᵀx s.a. Ax >= 1, con c > 0 (base lógica dual factible)."""
+    rng = np.random.default_rng(seed)
+    A = (rng.random((m, n)) < 0.15).astype(float)
+    A[np.arange(m), rng.integers(0, n, m)] = 1.0
+    C = rng.random(n) + 0.5
+    return C.tolist(), A, [1.0] * m, [">="] * m
+
+
+class TestSimplexDual(unittest.TestCase):
+
+    def test_cobertura_sin_fase_1(self):
+        C, A, b, O = _cobertura(0)
+        primal = resolver_simplex_tabular("minimization", C, A.tolist(), b, O, method="revised")
+        dual = resolver_simplex_tabular("minimization", C, A.tolist(), b, O, method="dual", history="final")
+
+        self.assertEqual(dual["status"], "optimo")
+        self.assertAlmostEqual(dual["solucion"]["valor_optimo"], primal["solucion"]["valor_optimo"], places=6)
+        self.assertLess(dual["iteraciones"], primal["iteraciones"])
+        self.assertTrue(dual["tablas"][0]["titulo"].startswith("Simplex Dual"))
+
+    def test_reoptimiza_tras_cambiar_ld(self):
+        """
+        Min Z = 2x1 + 3x2
+            x1 + x2 >= 4
+            x1 + 3x2 >= 6
+        Al subir LD1 a 8 la base óptima anterior queda primal infactible.
+        """
+        args = ("minimization", [2, 3], [[1, 1], [1, 3]])
+        O = [">=", ">="]
+        inicial = resolver_simplex_tabular(*args, [4, 6], O, method="dual")
+        res = resolver_simplex_tabular(*args, [8, 6], O, method="dual", basis=inicial["base"])
+        frio = resolver_simplex_tabular(*args, [8, 6], O)
+
+        self.assertTrue(res["base_reutilizada"])
+        self.assertAlmostEqual(res["solucion"]["valor_optimo"], frio["solucion"]["valor_optimo"], places=6)
+        self.assertLessEqual(res["iteraciones"], 2)
+
+    def test_corte_agregado(self):
+        """Una restricción nueva al final se completa con su exceso y se reoptimiza."""
+        C, A, b, O = _cobertura(1)
+        inicial = resolver_simplex_tabular("minimization", C, A.tolist(), b, O, method="dual")
+        x = np.array([inicial["solucion"]["variables"][f"x{j+1}"] for j in range(len(C))])
+
+        A2 = np.vstack([A, np.ones(len(C))]).tolist()
+        b2 = b + [float(np.floor(x.sum())) + 1.0]
+        res = resolver_simplex_tabular("minimization", C, A2, b2, O + [">="], method="dual", basis=inicial["base"])
+        frio = resolver_simplex_tabular("minimization", C, A2, b2, O + [">="], method="revised")
+
+        self.assertTrue(res["base_reutilizada"])
+        self.assertAlmostEqual(res["solucion"]["valor_optimo"], frio["solucion"]["valor_optimo"], places=6)
+        self.assertLess(res["iteraciones"], frio["iteraciones"])
+
+    def test_coincide_con_primal(self):
+        """Problemas aleatorios con igualdades, costos de cualquier signo e infactibles."""
+        rng = np.random.default_rng(2)
+        for k in range(60):
+            m, n = rng.integers(2, 8), rng.integers(2, 8)
+            A = rng.integers(-2, 6, (m, n)).tolist()
+            b = rng.integers(-3, 10, m).tolist()
+            C = rng.integers(-2 if k % 3 == 0 else 0, 6, n).tolist()
+            O = [str(o) for o in rng.choice(['<=', '>=', '='], m, p=[.4, .45, .15])]
+            problem_type = "minimization" if k % 2 else "maximization"
+
+            ref = resolver_simplex_tabular(problem_type, C, A, b, O, method="revised")
+            res = resolver_simplex_tabular(problem_type, C, A, b, O, method="dual")
+            self.assertEqual(res["status"], ref["status"], k)
+            if ref["status"] == "optimo":
+                self.assertAlmostEqual(res["solucion"]["valor_optimo"], ref["solucion"]["valor_optimo"], places=6)
+
+    def test_endpoint_method_dual(self):
+        app = FastAPI()
+        app.include_router(router)
+        client = TestClient(app)
+        payload = {
+            "problem_type": "minimization",
+            "C": [2, 3],
+            "LI": [[1, 1], [1, 3]],
+            "LD": [4, 6],
+            "O": [">=", ">="],
+            "method": "dual"
+        }
+        response = client.post("/simplex/solve-tabular", json=payload)
+        self.assertEqual(response.status_code, 200)
+        self.assertAlmostEqual(response.json()["solucion"]["valor_optimo"], 9, places=6)
+
+
+if __name__ == "__main__":
+    unittest.main()
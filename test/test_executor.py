@@ -0,0 +1,108 @@
+import unittest
+import asyncio
+import json
+import time
+from unittest import mock
+from concurrent.futures import ThreadPoolExecutor
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from routers.simplex_router import router
+from services.executor_service import (
+    EjecutorAcotado,
+    ServicioSaturadoError,
+    TiempoAgotadoError,
+    ejecutor_resolucion,
+)
+from services.cache_service import cache_resultados
+
+
+class TestEjecutorAcotado(unittest.TestCase):
+
+    def setUp(self):
+        self.pool = ThreadPoolExecutor(max_workers=2)
+
+    def tearDown(self):
+        self.pool.shutdown(wait=True)
+
+    def test_rechaza_trabajos_cuando_la_cola_esta_llena(self):
+        ejecutor = EjecutorAcotado("prueba", lambda: self.pool, max_pendientes=1, timeout=5)
+
+        async def escenario():
+            lento = asyncio.ensure_future(ejecutor.ejecutar(time.sleep, 0.2))
+            await asyncio.sleep(0.01)
+            with self.assertRaises(ServicioSaturadoError):
+                await ejecutor.ejecutar(sum, [1, 2])
+            await lento
+            # Al terminar se libera el lugar
+            self.assertEqual(await ejecutor.ejecutar(sum, [1, 2]), 3)
+            self.assertEqual(ejecutor.pendientes, 0)
+
+        asyncio.run(escenario())
+
+    def test_tiempo_agotado(self):
+        ejecutor = EjecutorAcotado("prueba", lambda: self.pool, max_pendientes=4, timeout=0.05)
+
+        async def escenario():
+            with self.assertRaises(TiempoAgotadoError):
+                await ejecutor.ejecutar(time.sleep, 0.3)
+            self.assertEqual(ejecutor.pendientes, 0)
+
+        asyncio.run(escenario())
+
+
+class TestEndpointSaturado(unittest.TestCase):
+
+    def setUp(self):
+        app = FastAPI()
+        app.include_router(router)
+        self.client = TestClient(app)
+        # Un resultado en caché se respondería sin pasar por el ejecutor
+        cache_resultados.limpiar()
+
+    def test_responde_503_si_no_hay_lugar(self):
+        payload = {
+            "problem_type": "maximization",
+            "C": [3, 5],
+            "LI": [[1, 0], [0, 2], [3, 2]],
+            "LD": [4, 12, 18],
+            "O": ["<=", "<=", "<="]
+        }
+        ocupados = ejecutor_resolucion.adquirir(ejecutor_resolucion.max_pendientes)
+        try:
+            response = self.client.post("/simplex/solve-tabular", json=payload)
+        finally:
+            ejecutor_resolucion.liberar(ocupados)
+
+        self.assertEqual(response.status_code, 503)
+        self.assertIn("Retry-After", response.headers)
+
+        response = self.client.post("/simplex/solve-tabular", json=payload)
+        self.assertEqual(response.status_code, 200)
+
+    def test_lote_transmitido_informa_el_tiempo_agotado(self):
+        problema = {
+            "problem_type": "maximization",
+            "C": [3, 5],
+            "LI": [[1, 0], [0, 2], [3, 2]],
+            "LD": [4, 12, 18],
+            "O": ["<=", "<=", "<="]
+        }
+
+        async def agotado(fn, *args):
+            raise TiempoAgotadoError("El trabajo de resolucion superó 1 segundos.")
+
+        with mock.patch.object(ejecutor_resolucion, "ejecutar_reservado", agotado):
+            response = self.client.post("/simplex/solve-batch?stream=true", json={"problems": [problema] * 3})
+
+        # La transmisión termina con una línea de error por cada problema
+        self.assertEqual(response.status_code, 200)
+        lineas = [json.loads(l) for l in response.text.splitlines() if l]
+        self.assertEqual(sorted(l["index"] for l in lineas), [0, 1, 2])
+        for linea in lineas:
+            self.assertIsNone(linea["resultado"])
+            self.assertIn("superó", linea["error"])
+        self.assertEqual(ejecutor_resolucion.pendientes, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+import unittest
+import numpy as np
+from services.feasible_region import Semiplano, geometria_2d, interseccion_semiplanos
+
+
+def _area(vertices):
+    """Área con signo (positiva si los vértices van en sentido antihorario)."""
+    x, y = np.array(vertices).T
+    return 0.5 * float(np.dot(x, np.roll(y, -1)) - np.dot(y, np.roll(x, -1)))
+
+
+class TestRegionFactible(unittest.TestCase):
+
+    def test_poligono_acotado(self):
+        g = geometria_2d([3, 5], [[1, 0], [0, 2], [3, 2]], [4, 12, 18], ["<="] * 3, mark_point=(2, 6))
+        self.assertTrue(g["region"]["acotada"])
+        self.assertEqual(
+            sorted(map(tuple, g["region"]["vertices"])),
+            [(0.0, 0.0), (0.0, 6.0), (2.0, 6.0), (4.0, 0.0), (4.0, 3.0)],
+        )
+        self.assertGreater(_area(g["region"]["vertices"]), 0)
+        self.assertEqual(g["limites"], {"x": [0.0, 6.6], "y": [0.0, 9.9]})
+        self.assertEqual(g["objetivo"]["valor"], 36.0)
+        self.assertEqual(g["optimo"], [2.0, 6.0])
+        # La restricción 3x1 + 2x2 <= 18 cruza el gráfico de (0, 9) a (6, 0)
+        self.assertEqual(g["restricciones"][2]["segmento"], [[0.0, 9.0], [6.0, 0.0]])
+
+    def test_no_acotada_se_recorta_a_los_limites(self):
+        g = geometria_2d([1, 1], [[1, -1]], [1], ["<="])
+        self.assertFalse(g["region"]["acotada"])
+        x_max, y_max = g["limites"]["x"][1], g["limites"]["y"][1]
+        for x, y in g["region"]["vertices"]:
+            self.assertTrue(0 <= x <= x_max and 0 <= y <= y_max)
+        self.assertIn([1.0, 0.0], g["region"]["vertices"])
+
+    def test_infactible_y_degenerada(self):
+        g = geometria_2d([1, 1], [[1, 1], [1, 1]], [1, 2], ["<=", ">="])
+        self.assertEqual(g["region"]["vertices"], [])
+        self.assertFalse(g["region"]["acotada"])
+
+        # Una igualdad deja un segmento
+        g = geometria_2d([1, 1], [[1, 1], [1, 0]], [4, 3], ["=", "<="])
+        self.assertEqual(sorted(map(tuple, g["region"]["vertices"])), [(0.0, 4.0), (3.0, 1.0)])
+
+    def test_vertice_lejano_entra_en_los_limites(self):
+        # Rectas casi paralelas: el vértice (201, 200) está lejos de los cortes con los ejes
+        g = geometria_2d([1, 1], [[1, -1], [-1, 1.01]], [1, 1], ["<=", "<="])
+        self.assertTrue(g["region"]["acotada"])
+        self.assertIn([201.0, 200.0], g["region"]["vertices"])
+        self.assertGreaterEqual(g["limites"]["x"][1], 201.0)
+
+    def test_coincide_con_el_casco_de_los_vertices_factibles(self):
+        # Con muchas restricciones aleatorias, cada vértice es factible y el área es positiva
+        rng = np.random.default_rng(0)
+        A = rng.uniform(0.1, 5.0, (500, 2))
+        b = rng.uniform(5.0, 50.0, 500)
+        g = geometria_2d([1, 1], A.tolist(), b.tolist(), ["<="] * 500)
+        vertices = np.array(g["region"]["vertices"])
+        self.assertTrue(np.all(A @ vertices.T <= b[:, None] * (1 + 1e-5)))
+        self.assertGreater(_area(vertices), 0)
+
+    def test_semiplanos_paralelos_opuestos(self):
+        # 0 <= x <= 1 y 0 <= y <= 1 como semiplanos explícitos
+        cuadrado = [
+            Semiplano((0.0, 0.0), (1.0, 0.0)), Semiplano((1.0, 0.0), (0.0, 1.0)),
+            Semiplano((1.0, 1.0), (-1.0, 0.0)), Semiplano((0.0, 1.0), (0.0, -1.0)),
+        ]
+        vertices, lados = interseccion_semiplanos(cuadrado)
+        self.assertEqual(len(vertices), 4)
+        self.assertAlmostEqual(_area(vertices), 1.0)
+        # x >= 2 lo vacía
+        vertices, _ = interseccion_semiplanos(cuadrado + [Semiplano((2.0, 0.0), (0.0, -1.0))])
+        self.assertEqual(vertices, [])
+
+    def test_cotas_libres_y_negativas(self):
+        # x1 >= -5, x2 <= 3 y libre hacia abajo: la región sale del primer cuadrante
+        g = geometria_2d([1, 1], [[1, 1]], [-2], [">="], mark_point=(-5, 3), lower=[-5, None], upper=[None, 3])
+        self.assertFalse(g["region"]["acotada"])
+        self.assertIn([-5.0, 3.0], g["region"]["vertices"])
+        (x_min, x_max), (y_min, y_max) = g["limites"]["x"], g["limites"]["y"]
+        self.assertLess(x_min, -5.0)
+        self.assertLess(y_min, 0.0)
+        for x, y in g["region"]["vertices"]:
+            self.assertTrue(x_min <= x <= x_max and y_min <= y <= y_max)
+            self.assertTrue(x >= -5.0 and y <= 3.0 and x + y >= -2.0 - 1e-9)
+
+        # Cotas positivas: la región es la caja recortada por la restricción
+        g = geometria_2d([3, 5], [[3, 2]], [18], ["<="], lower=[1, 0], upper=[4, 6])
+        self.assertTrue(g["region"]["acotada"])
+        self.assertEqual(
+            sorted(map(tuple, g["region"]["vertices"])),
+            [(1.0, 0.0), (1.0, 6.0), (2.0, 6.0), (4.0, 0.0), (4.0, 3.0)],
+        )
+        with self.assertRaises(ValueError):
+            geometria_2d([1, 1], [[1, 1]], [1], ["<="], upper=[1])
+
+    def test_error_mas_de_2_variables(self):
+        with self.assertRaises(ValueError):
+            geometria_2d([1, 1, 1], [[1, 0, 0]], [1], ["<="])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,8 @@
 import unittest
 import os
 import tempfile
-from services.graph_service import generar_grafico_2d
+from concurrent.futures import ThreadPoolExecutor
+from services.graph_service import PoolFiguras, generar_grafico_2d
 
 
 class TestGraphService(unittest.TestCase):
@@ -67,6 +68,55 @@ class TestGraphService(unittest.TestCase):
         
         self.assertIn("exactamente 2 variables", str(context.exception))
 
+    def test_formatos_y_ajuste_fijo(self):
+        """
+        Verifica los formatos SVG y WebP, el ajuste 'fixed' y que un DPI
+        menor produce una imagen más chica.
+        """
+        C = [1, 1]
+        LI = [[1, 0], [0, 1], [1, 1]]
+        LD = [5, 6, 10]
+
+        svg = generar_grafico_2d(C, LI, LD, formato='svg', ajuste='fixed')
+        self.assertIn(b"<svg", svg[:500])
+        webp = generar_grafico_2d(C, LI, LD, formato='webp')
+        self.assertEqual(webp[:4], b"RIFF")
+        self.assertEqual(webp[8:12], b"WEBP")
+        png = generar_grafico_2d(C, LI, LD)
+        self.assertLess(len(generar_grafico_2d(C, LI, LD, dpi=50)), len(png))
+
+        with self.assertRaises(ValueError):
+            generar_grafico_2d(C, LI, LD, formato='gif')
+
+    def test_figura_reutilizada_da_la_misma_imagen(self):
+        """
+        Verifica que reutilizar una figura del pool (aun después de otro
+        gráfico con ajuste fijo) produce exactamente los mismos bytes.
+        """
+        C = [3, 5]
+        LI = [[1, 0], [0, 2], [3, 2]]
+        LD = [4, 12, 18]
+
+        primero = generar_grafico_2d(C, LI, LD, mark_point=(2.0, 6.0))
+        generar_grafico_2d([1, 2], [[1, 1], [2, 1]], [5, 8], ajuste='fixed')
+        self.assertEqual(generar_grafico_2d(C, LI, LD, mark_point=(2.0, 6.0)), primero)
+
+        pool = PoolFiguras(maximo=1)
+        figura = pool.tomar()
+        pool.devolver(figura)
+        self.assertIs(pool.tomar(), figura)
+
+    def test_grafico_en_paralelo(self):
+        """
+        Verifica que varios hilos pueden generar gráficos a la vez (sin pyplot
+        ni locks globales) y que cada uno obtiene su propia imagen.
+        """
+        problemas = [([1, k], [[1, 0], [0, 1], [1, 1]], [5, 6, 10]) for k in range(1, 5)]
+        esperados = [generar_grafico_2d(*p) for p in problemas]
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            obtenidos = list(pool.map(lambda p: generar_grafico_2d(*p), problemas * 2))
+        self.assertEqual(obtenidos, esperados * 2)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -51,6 +51,55 @@ class TestGraphRoutes(unittest.TestCase):
         self.assertEqual(response.headers["content-type"], "image/png")
         self.assertGreater(len(response.content), 0)
 
+    def test_generate_graph_svg(self):
+        """
+        Verifica que /generate-graph responde SVG con `?format=svg` y que el
+        HTML incrusta el mismo formato.
+        """
+        payload = {
+            "problem_type": "maximization",
+            "C": [3, 5],
+            "LI": [[1, 0], [0, 2], [3, 2]],
+            "LD": [4, 12, 18],
+            "O": ["<=", "<=", "<="]
+        }
+
+        response = self.client.post("/simplex/generate-graph?format=svg&layout=fixed", json=payload)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers["content-type"], "image/svg+xml")
+        self.assertIn('filename="graph.svg"', response.headers["content-disposition"])
+
+        response = self.client.post("/simplex/generate-graph-html?format=svg", json=payload)
+        self.assertIn("data:image/svg+xml;base64", response.text)
+
+        response = self.client.post("/simplex/generate-graph?format=gif", json=payload)
+        self.assertEqual(response.status_code, 422)
+
+    def test_graph_geometry(self):
+        """
+        Verifica que /graph-geometry devuelve la región factible, las
+        restricciones y el óptimo como JSON liviano.
+        """
+        payload = {
+            "problem_type": "maximization",
+            "C": [3, 5],
+            "LI": [[1, 0], [0, 2], [3, 2]],
+            "LD": [4, 12, 18],
+            "O": ["<=", "<=", "<="]
+        }
+
+        response = self.client.post("/simplex/graph-geometry", json=payload)
+        self.assertEqual(response.status_code, 200)
+        geom = response.json()
+        self.assertEqual(geom["optimo"], [2.0, 6.0])
+        self.assertEqual(len(geom["region"]["vertices"]), 5)
+        self.assertEqual(len(geom["restricciones"]), 3)
+        self.assertLess(len(response.content), 1000)
+
+        payload["C"] = [3, 5, 1]
+        response = self.client.post("/simplex/graph-geometry", json=payload)
+        self.assertEqual(response.status_code, 400)
+
     def test_generate_graph_error_mas_de_2_variables(self):
         """
         Verifica que el endpoint retorna error 400 cuando
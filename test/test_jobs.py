@@ -0,0 +1,159 @@
+import os
+import time
+import tempfile
+import unittest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from routers.simplex_router import router
+from schemas import SimplexRequest
+from services.job_service import AlmacenMemoria, AlmacenSQLite, AlmacenTrabajos, GestorTrabajos
+
+
+def _klee_minty(n: int) -> dict:
+    """Cubo de Klee-Minty: Dantzig recorre sus 2ⁿ vértices (resolución larga)."""
+    return {
+        "problem_type": "maximization",
+        "C": [2 ** (n - 1 - j) for j in range(n)],
+        "LI": [[2 ** (i - j + 1) if j < i else (1 if j == i else 0) for j in range(n)] for i in range(n)],
+        "LD": [5 ** (i + 1) for i in range(n)],
+        "O": ["<="] * n,
+        "history": "none",
+        "scaling": "none",
+        "max_iterations": 10 ** 6,
+    }
+
+
+def _esperar(gestor: GestorTrabajos, id_trabajo: str, estados, limite: float = 30.0) -> dict:
+    fin = time.monotonic() + limite
+    while time.monotonic() < fin:
+        trabajo = gestor.obtener(id_trabajo)
+        if trabajo["status"] in estados:
+            return trabajo
+        time.sleep(0.01)
+    raise AssertionError(f"El trabajo no llegó a {estados}: {trabajo}")
+
+
+class TestGestorTrabajos(unittest.TestCase):
+
+    PROBLEMA = {
+        "problem_type": "maximization",
+        "C": [3, 5],
+        "LI": [[1, 0], [0, 2], [3, 2]],
+        "LD": [4, 12, 18],
+        "O": ["<=", "<=", "<="],
+    }
+
+    def _comprobar_gestor(self, gestor: GestorTrabajos):
+        trabajo = gestor.enviar(SimplexRequest(**self.PROBLEMA))
+        trabajo = _esperar(gestor, trabajo["id"], ("completado",))
+        self.assertAlmostEqual(trabajo["resultado"]["solucion"]["valor_optimo"], 36, places=6)
+        self.assertEqual(trabajo["progreso"], {"etapa": "fase_2", "iteracion": 2, "objetivo": 36.0})
+
+        invalido = gestor.enviar(SimplexRequest(**dict(self.PROBLEMA, LI=[[1, 0]])))
+        invalido = _esperar(gestor, invalido["id"], ("fallido",))
+        self.assertIn("Datos inválidos", invalido["error"])
+
+    def test_memoria(self):
+        gestor = GestorTrabajos(AlmacenMemoria(), workers=1)
+        try:
+            self._comprobar_gestor(gestor)
+        finally:
+            gestor.cerrar()
+
+    def test_almacen_incompleto(self):
+        # Un almacén que no implementa toda la interfaz falla al construirse
+        class SinPurgar(AlmacenTrabajos):
+            def crear(self, trabajo): pass
+            def obtener(self, id_trabajo): return None
+            def actualizar(self, id_trabajo, **campos): pass
+
+        with self.assertRaises(TypeError):
+            SinPurgar()
+        with self.assertRaises(TypeError):
+            AlmacenTrabajos()
+
+    def test_sqlite(self):
+        with tempfile.TemporaryDirectory() as directorio:
+            ruta = os.path.join(directorio, "trabajos.sqlite3")
+            gestor = GestorTrabajos(AlmacenSQLite(ruta), workers=1)
+            try:
+                self._comprobar_gestor(gestor)
+                trabajo = gestor.enviar(SimplexRequest(**self.PROBLEMA))
+                _esperar(gestor, trabajo["id"], ("completado",))
+            finally:
+                gestor.cerrar()
+
+            # Los trabajos terminados se conservan al reabrir la base
+            reabierto = AlmacenSQLite(ruta).obtener(trabajo["id"])
+            self.assertEqual(reabierto["status"], "completado")
+            self.assertEqual(reabierto["resultado"]["base"], ["s1", "x2", "x1"])
+
+    def test_cancelar_en_curso_y_pendiente(self):
+        gestor = GestorTrabajos(AlmacenMemoria(), workers=1)
+        try:
+            largo = gestor.enviar(SimplexRequest(**_klee_minty(18)))
+            pendiente = gestor.enviar(SimplexRequest(**self.PROBLEMA))
+
+            # Pendiente: se descarta sin ejecutarse
+            self.assertEqual(gestor.cancelar(pendiente["id"])["status"], "cancelado")
+
+            # En curso: se interrumpe en la iteración siguiente, con el progreso informado
+            en_curso = _esperar(gestor, largo["id"], ("en_curso",))
+            fin = time.monotonic() + 30
+            while (en_curso["progreso"] or {}).get("iteracion", 0) == 0 and time.monotonic() < fin:
+                time.sleep(0.05)
+                en_curso = gestor.obtener(largo["id"])
+            self.assertEqual(en_curso["status"], "en_curso")
+            self.assertEqual(en_curso["progreso"]["etapa"], "fase_2")
+            self.assertGreater(en_curso["progreso"]["iteracion"], 0)
+
+            gestor.cancelar(largo["id"])
+            cancelado = _esperar(gestor, largo["id"], ("cancelado", "completado"), limite=5.0)
+            self.assertEqual(cancelado["status"], "cancelado")
+            self.assertIsNone(cancelado["resultado"])
+        finally:
+            gestor.cerrar()
+
+
+class TestJobsEndpoints(unittest.TestCase):
+
+    def setUp(self):
+        app = FastAPI()
+        app.include_router(router)
+        self.client = TestClient(app)
+
+    def test_ciclo_de_un_trabajo(self):
+        payload = dict(TestGestorTrabajos.PROBLEMA)
+        response = self.client.post("/simplex/jobs", json=payload)
+        self.assertEqual(response.status_code, 202)
+        trabajo = response.json()
+        self.assertEqual(response.headers["location"], f"/simplex/jobs/{trabajo['id']}")
+
+        fin = time.monotonic() + 30
+        while trabajo["status"] != "completado" and time.monotonic() < fin:
+            time.sleep(0.01)
+            trabajo = self.client.get(f"/simplex/jobs/{trabajo['id']}").json()
+        self.assertEqual(trabajo["status"], "completado")
+        self.assertNotIn("resultado", trabajo)
+
+        response = self.client.get(f"/simplex/jobs/{trabajo['id']}/result")
+        self.assertEqual(response.status_code, 200)
+        self.assertAlmostEqual(response.json()["solucion"]["valor_optimo"], 36, places=3)
+
+        self.assertEqual(self.client.delete(f"/simplex/jobs/{trabajo['id']}").status_code, 409)
+        self.assertEqual(self.client.get("/simplex/jobs/no-existe").status_code, 404)
+
+    def test_resultado_de_trabajo_cancelado(self):
+        response = self.client.post("/simplex/jobs", json=_klee_minty(18))
+        id_trabajo = response.json()["id"]
+        self.assertEqual(self.client.delete(f"/simplex/jobs/{id_trabajo}").status_code, 200)
+
+        fin = time.monotonic() + 5
+        while self.client.get(f"/simplex/jobs/{id_trabajo}").json()["status"] != "cancelado" and time.monotonic() < fin:
+            time.sleep(0.01)
+        response = self.client.get(f"/simplex/jobs/{id_trabajo}/result")
+        self.assertEqual(response.status_code, 409)
+
+
+if __name__ == "__main__":
+    unittest.main()
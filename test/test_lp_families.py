@@ -0,0 +1,31 @@
+import unittest
+from benchmarks.bench_solver import comparar
+from benchmarks.lp_families import FAMILIAS, generar
+from services import resolver_simplex_tabular
+
+
+class TestFamiliasLP(unittest.TestCase):
+
+    def test_status_esperado(self):
+        """Cada familia generada tiene el status que declara, con ambos motores."""
+        for familia in FAMILIAS:
+            problema = generar(familia, "chico", semilla=3)
+            for metodo in ("tabular", "revised"):
+                resultado = resolver_simplex_tabular(*problema.argumentos(), method=metodo, history="none")
+                self.assertEqual(resultado["status"], problema.esperado, f"{familia}/{metodo}")
+
+    def test_reproducible(self):
+        a, b = generar("densa", "chico", semilla=1), generar("densa", "chico", semilla=1)
+        self.assertEqual((a.C, a.LI, a.LD, a.O), (b.C, b.LI, b.LD, b.O))
+        self.assertNotEqual(a.C, generar("densa", "chico", semilla=2).C)
+
+    def test_comparar_con_baseline(self):
+        base = {"densa/chico/tabular": {"status": "optimo", "iteraciones": 10, "segundos": 0.1}}
+        self.assertEqual(comparar(base, base, 0.25), [])
+        lento = {"densa/chico/tabular": {"status": "optimo", "iteraciones": 12, "segundos": 0.2}}
+        regresiones = comparar(lento, base, 0.25)
+        self.assertEqual(len(regresiones), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
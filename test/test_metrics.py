@@ -0,0 +1,113 @@
+import unittest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from routers import metrics_router, simplex_router
+from services.cache_service import cache_resultados
+from services.metrics_service import (
+    Contador,
+    Histograma,
+    Metrica,
+    etapa,
+    formatear_tiempos,
+    medir,
+    resoluciones,
+)
+from services.simplex_service import resolver_simplex_tabular
+
+
+class TestMetricas(unittest.TestCase):
+
+    def test_histograma_acumulativo(self):
+        h = Histograma("prueba_segundos", "Prueba.", ("stage",), buckets=(0.1, 1.0))
+        for valor in (0.05, 0.1, 0.5, 3.0):
+            h.observar(valor, "fase_1")
+        texto = h.exponer()
+        self.assertIn("# TYPE prueba_segundos histogram", texto)
+        self.assertIn('prueba_segundos_bucket{stage="fase_1",le="0.1"} 2', texto)
+        self.assertIn('prueba_segundos_bucket{stage="fase_1",le="1"} 3', texto)
+        self.assertIn('prueba_segundos_bucket{stage="fase_1",le="+Inf"} 4', texto)
+        self.assertIn('prueba_segundos_count{stage="fase_1"} 4', texto)
+        self.assertIn('prueba_segundos_sum{stage="fase_1"} 3.65', texto)
+
+    def test_contador_valida_y_escapa_etiquetas(self):
+        c = Contador("prueba_total", "Prueba.", ("status",))
+        c.incrementar('no "acotado"')
+        c.incrementar('no "acotado"', cantidad=2)
+        self.assertIn('prueba_total{status="no \\"acotado\\""} 3', c.exponer())
+        with self.assertRaises(ValueError):
+            c.incrementar("a", "b")
+
+    def test_metrica_base_es_abstracta(self):
+        with self.assertRaises(TypeError):
+            Metrica("prueba", "Prueba.")
+
+    def test_etapa_sin_medicion_no_registra(self):
+        with etapa("fase_1"):
+            pass
+        _, tiempos = medir(lambda: None)
+        self.assertEqual(set(tiempos), {"total"})
+
+    def test_medir_etapas_del_tabular(self):
+        # Con '>=' hay Fase 1; las etapas no superan el total
+        resultado, tiempos = medir(
+            resolver_simplex_tabular, "minimization", [2, 3], [[1, 1], [1, 3]], [4, 6], [">=", ">="]
+        )
+        self.assertEqual(resultado["status"], "optimo")
+        for nombre in ("estandarizacion", "fase_1", "fase_2", "formato_tablas"):
+            self.assertIn(nombre, tiempos)
+            self.assertLessEqual(tiempos[nombre], tiempos["total"])
+        self.assertEqual(formatear_tiempos(None), "cache;desc=hit")
+        self.assertIn("fase_1;dur=", formatear_tiempos(tiempos))
+
+
+class TestEndpointMetricas(unittest.TestCase):
+
+    PROBLEMA = {
+        "problem_type": "maximization",
+        "C": [3, 5],
+        "LI": [[1, 0], [0, 2], [3, 2]],
+        "LD": [4, 12, 17],
+        "O": ["<=", "<=", "<="],
+    }
+
+    def setUp(self):
+        app = FastAPI()
+        app.include_router(simplex_router.router)
+        app.include_router(metrics_router.router)
+        self.client = TestClient(app)
+        cache_resultados.limpiar()
+
+    def test_solve_con_x_solve_timing(self):
+        antes = resoluciones.valor("tabular", "optimo")
+        r = self.client.post("/simplex/solve-tabular", json=self.PROBLEMA, headers={"X-Solve-Timing": "1"})
+        self.assertEqual(r.status_code, 200)
+        self.assertIn("total;dur=", r.headers["X-Solve-Timing"])
+
+        # La segunda vez sale de la caché
+        r = self.client.post("/simplex/solve-tabular", json=self.PROBLEMA, headers={"X-Solve-Timing": "1"})
+        self.assertEqual(r.headers["X-Solve-Timing"], "cache;desc=hit")
+        self.assertEqual(resoluciones.valor("tabular", "optimo"), antes + 1)
+
+        # Sin el header del request, la respuesta no lo incluye
+        r = self.client.post("/simplex/solve-tabular", json=self.PROBLEMA)
+        self.assertNotIn("X-Solve-Timing", r.headers)
+
+    def test_metrics_formato_prometheus(self):
+        self.client.post("/simplex/solve-tabular", json=self.PROBLEMA)
+        r = self.client.get("/metrics")
+        self.assertEqual(r.status_code, 200)
+        self.assertTrue(r.headers["content-type"].startswith("text/plain; version=0.0.4"))
+        for nombre in (
+            "simplex_stage_duration_seconds",
+            "simplex_solve_iterations",
+            "simplex_solves_total",
+            "simplex_cache_requests_total",
+            "simplex_executor_pending",
+            "simplex_jobs_pending",
+        ):
+            self.assertIn(f"# TYPE {nombre} ", r.text)
+        self.assertIn('simplex_executor_pending{executor="resolución"} 0', r.text)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+import io
+import unittest
+from reportlab.platypus import Table
+from services.PDF_service import SimplexPDFBuilder, TableBuilder
+from services.PDF_service.table_builder import _estilo_tabla
+
+
+def _tabla(i: int, columnas: int = 3):
+    headers = ["Base"] + [f"x{j}" for j in range(1, columnas + 1)] + ["LD"]
+    return {
+        "titulo": f"Iteración {i}",
+        "headers": headers,
+        "filas": [["s1"] + [1.234567] * (columnas + 1)],
+        "fila_obj": ["Z"] + [-0.5] * (columnas + 1),
+    }
+
+
+class TestPDFBuilder(unittest.TestCase):
+
+    def _construir(self, resultado, **kwargs) -> bytes:
+        buffer = io.BytesIO()
+        SimplexPDFBuilder(resultado).build(buffer, **kwargs)
+        return buffer.getvalue()
+
+    def test_pdf_con_tablas_desde_generador(self):
+        consumidas = []
+
+        def tablas():
+            for i in range(30):
+                consumidas.append(i)
+                yield _tabla(i)
+
+        resultado = {"status": "optimo", "solucion": {"variables": {"x1": 2.0}, "valor_optimo": 6.0}}
+        pdf = self._construir(resultado, tablas=tablas())
+        self.assertTrue(pdf.startswith(b"%PDF"))
+        self.assertEqual(len(consumidas), 30)
+
+    def test_estilo_compartido(self):
+        a = TableBuilder.build_table([["a"], ["1"]])
+        b = TableBuilder.build_table([["b"], ["2"]])
+        self.assertIs(_estilo_tabla("#6699CC"), _estilo_tabla("#6699CC"))
+        self.assertEqual(a._cellStyles[0][0].background, b._cellStyles[0][0].background)
+
+    def test_partir_columnas_repite_la_base(self):
+        grupos = TableBuilder.partir_columnas([50, 100, 100, 100, 100], 260)
+        self.assertEqual(grupos, [[0, 1, 2], [0, 3, 4]])
+        # Una columna que no entra sola forma su propio grupo
+        self.assertEqual(TableBuilder.partir_columnas([50, 500, 10], 100), [[0, 1], [0, 2]])
+
+    def test_tabla_ancha_se_parte(self):
+        builder = SimplexPDFBuilder({"status": "optimo"})
+        story = list(builder._intermediate_tables([_tabla(0, columnas=60)], 552))
+        tablas = [f for f in story if isinstance(f, Table)]
+        self.assertGreater(len(tablas), 1)
+        for tabla in tablas:
+            self.assertLessEqual(sum(tabla._colWidths), 552)
+            self.assertEqual(tabla._cellvalues[0][0], "Base")
+        self.assertTrue(self._construir({"status": "optimo", "tablas": [_tabla(0, columnas=60)]}).startswith(b"%PDF"))
+
+    def test_resultado_sin_status(self):
+        with self.assertRaises(ValueError):
+            self._construir({"tablas": []})
+
+
+if __name__ == "__main__":
+    unittest.main()
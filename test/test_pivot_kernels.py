@@ -0,0 +1,40 @@
+import unittest
+import numpy as np
+from services.pivot_kernels import razon_minima, pivotear_numpy, pivotear_numba, NUMBA_DISPONIBLE
+
+
+def _pivotear_referencia(tableau, fila, col):
+    tableau[fila, :] = tableau[fila, :] / tableau[fila, col]
+    for i in range(tableau.shape[0]):
+        if i != fila:
+            tableau[i, :] = tableau[i, :] - tableau[i, col] * tableau[fila, :]
+
+
+class TestKernelsPivoteo(unittest.TestCase):
+
+    def test_razon_minima(self):
+        columna = np.array([2.0, -1.0, 1.0, 0.0, 4.0])
+        rhs = np.array([4.0, 1.0, 2.0, 0.0, 8.0])
+        # Empate entre las filas 0, 2 y 4: gana la primera
+        self.assertEqual(razon_minima(columna, rhs), 0)
+        self.assertEqual(razon_minima(np.array([-1.0, 0.0]), np.array([1.0, 1.0])), -1)
+
+    def test_pivoteo_coincide_con_referencia(self):
+        rng = np.random.default_rng(3)
+        for densidad in (1.0, 0.1):
+            tableau = rng.random((70, 120))
+            tableau[tableau > densidad] = 0.0
+            tableau += np.eye(70, 120)
+            esperado = tableau.copy()
+            _pivotear_referencia(esperado, 5, 5)
+
+            kernels = [pivotear_numpy] + ([pivotear_numba] if NUMBA_DISPONIBLE else [])
+            for kernel in kernels:
+                obtenido = tableau.copy()
+                kernel(obtenido, 5, 5)
+                np.testing.assert_allclose(obtenido, esperado, atol=1e-12)
+                np.testing.assert_array_equal(obtenido[:, 5], np.eye(70)[:, 5])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+import unittest
+import numpy as np
+from services import resolver_simplex_tabular
+from services.presolve_service import Presolve
+from services.sparse_matrix import MatrizDispersa
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from routers.simplex_router import router
+
+
+class TestPresolve(unittest.TestCase):
+
+    def test_filas_duplicadas_y_singleton(self):
+        """
+        Max Z = 3x1 + 2x2
+            x1 + x2 <= 4
+            2x1 + 2x2 <= 10   (proporcional a la primera, redundante)
+            x1 <= 3           (singleton: cota superior de x1)
+        """
+        presolve = Presolve("maximization", [3, 2], [[1, 1], [2, 2], [1, 0]], [4, 10, 3], ["<=", "<=", "<="])
+        C, LI, LD, O = presolve.problema()
+
+        # Queda x1 + x2 <= 4 y la cota x1 <= 3 reescrita como fila
+        self.assertEqual(LI, [[1.0, 1.0], [1.0, 0.0]])
+        self.assertEqual(LD, [4.0, 3.0])
+        self.assertEqual(O, ["<=", "<="])
+
+        res = resolver_simplex_tabular("maximization", [3, 2], [[1, 1], [2, 2], [1, 0]], [4, 10, 3], ["<=", "<=", "<="], presolve=True)
+        self.assertEqual(res["status"], "optimo")
+        self.assertAlmostEqual(res["solucion"]["valor_optimo"], 11.0)
+        self.assertEqual(res["solucion"]["variables"], {"x1": 3.0, "x2": 1.0, "s1": 0.0, "s2": 2.0, "s3": 0.0})
+        # En el tabular la cota x1 <= 3 no agrega fila
+        self.assertEqual(res["presolve"], {"filas_originales": 3, "columnas_originales": 2, "filas": 1, "columnas": 2})
+        revisado = resolver_simplex_tabular("maximization", [3, 2], [[1, 1], [2, 2], [1, 0]], [4, 10, 3], ["<=", "<=", "<="], presolve=True, method="revised")
+        self.assertAlmostEqual(revisado["solucion"]["valor_optimo"], 11.0)
+        self.assertEqual(revisado["presolve"]["filas"], 2)
+
+    def test_fila_forzante_fija_sus_variables(self):
+        """x1 + x2 + x3 <= 0 fuerza x1 = x2 = x3 = 0 y el resto se resuelve sin ellas."""
+        res = resolver_simplex_tabular(
+            "maximization", [1, 1, 1, 2, 3],
+            [[1, 1, 1, 0, 0], [1, 0, 1, 1, 1], [0, 0, 0, 1, 2]], [0, 5, 8], ["<=", "<=", "<="],
+            presolve=True, history="all",
+        )
+        self.assertEqual(res["status"], "optimo")
+        self.assertAlmostEqual(res["solucion"]["valor_optimo"], 13.0)
+        self.assertEqual(res["solucion"]["variables"]["x4"], 2.0)
+        self.assertEqual(res["solucion"]["variables"]["x5"], 3.0)
+        # Las tablas usan los nombres originales de lo que quedó en el modelo
+        self.assertEqual(res["tablas"][0]["headers"], ["Base", "x4", "x5", "s2", "s3", "LD (RHS)"])
+        self.assertEqual(sorted(res["base"]), ["x4", "x5"])
+
+    def test_infactibilidad_detectada_sin_resolver(self):
+        res = resolver_simplex_tabular("minimization", [1, 1], [[1, 0], [1, 0]], [5, 3], [">=", "<="], presolve=True)
+        self.assertEqual(res["status"], "infactible")
+        self.assertEqual(res["iteraciones"], 0)
+        self.assertIsNone(res["solucion"])
+
+    def test_columna_vacia_no_acotada(self):
+        res = resolver_simplex_tabular("maximization", [1, 1], [[1, 0]], [4], ["<="], presolve=True)
+        self.assertEqual(res["status"], "no acotado")
+
+    def test_coincide_con_el_modelo_original(self):
+        rng = np.random.default_rng(7)
+        for _ in range(150):
+            m, n = rng.integers(2, 7), rng.integers(2, 7)
+            A = rng.integers(-3, 5, (m, n)).astype(float) * (rng.random((m, n)) < 0.6)
+            A = np.vstack([A, 2 * A[0], np.eye(n)[rng.integers(n)]])
+            b = np.append(rng.integers(-2, 12, m), [2 * rng.integers(0, 12), rng.integers(0, 5)]).astype(float)
+            O = list(rng.choice(["<=", ">=", "="], len(b), p=[0.6, 0.25, 0.15]))
+            C = rng.integers(-3, 6, n).astype(float).tolist()
+            filas, columnas = np.nonzero(A)
+            dispersa = MatrizDispersa.desde_coo(filas, columnas, A[filas, columnas], A.shape)
+
+            original = resolver_simplex_tabular("maximization", C, A.tolist(), b.tolist(), O)
+            for LI in (A.tolist(), dispersa):
+                reducido = resolver_simplex_tabular("maximization", C, LI, b.tolist(), O, presolve=True)
+                self.assertEqual(reducido["status"], original["status"])
+                if original["status"] == "optimo":
+                    self.assertAlmostEqual(reducido["solucion"]["valor_optimo"], original["solucion"]["valor_optimo"], places=6)
+                    self.assertEqual(set(reducido["solucion"]["variables"]), set(original["solucion"]["variables"]))
+
+
+class TestPresolveEndpoint(unittest.TestCase):
+
+    def setUp(self):
+        app = FastAPI()
+        app.include_router(router)
+        self.client = TestClient(app)
+
+    def test_solve_tabular_con_presolve(self):
+        payload = {
+            "problem_type": "maximization",
+            "C": [3, 2],
+            "LI": [[1, 1], [2, 2], [1, 0]],
+            "LD": [4, 10, 3],
+            "O": ["<=", "<=", "<="],
+            "presolve": True,
+        }
+        response = self.client.post("/simplex/solve-tabular", json=payload)
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data["status"], "optimo")
+        self.assertAlmostEqual(data["solucion"]["valor_optimo"], 11.0)
+        self.assertEqual(data["presolve"]["filas"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,130 @@
+import unittest
+from unittest import mock
+import numpy as np
+from services import resolver_simplex_tabular
+from services.pricing import crear_regla, ReglaBland
+from services.revised_simplex_service import ProblemaEstandar
+from services.sparse_matrix import MatrizDensa, MatrizDispersa
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from routers.simplex_router import router
+
+REGLAS = ['dantzig', 'bland', 'steepest_edge', 'devex', 'partial']
+
+# Ejemplo de Beale: con Dantzig y desempate por la primera fila el simplex cicla
+BEALE = (
+    "minimization",
+    [-0.75, 20, -0.5, 6],
+    [[0.25, -8, -1, 9], [0.5, -12, -0.5, 3], [0, 0, 1, 0]],
+    [0, 0, 1],
+    ["<=", "<=", "<="],
+)
+
+
+class TestReglasDePricing(unittest.TestCase):
+
+    def test_bland_y_steepest_edge_no_ciclan(self):
+        for method in ('tabular', 'revised'):
+            # Dantzig con el test de razón de libro y sin escalar cicla
+            res = resolver_simplex_tabular(
+                *BEALE, method=method, max_iterations=100, scaling="none", ratio_test="textbook"
+            )
+            self.assertEqual(res["status"], "max_iterations_reached")
+            self.assertEqual(res["iteraciones"], 100)
+
+            for pricing in ('bland', 'steepest_edge', 'devex'):
+                res = resolver_simplex_tabular(*BEALE, method=method, pricing=pricing)
+                self.assertEqual(res["status"], "optimo", f"{method}/{pricing}")
+                self.assertAlmostEqual(res["solucion"]["valor_optimo"], -1.25, places=6)
+
+    def test_todas_las_reglas_coinciden(self):
+        """Problemas aleatorios con las tres clases de restricción."""
+        rng = np.random.default_rng(11)
+        for k in range(25):
+            m, n = rng.integers(2, 9), rng.integers(2, 9)
+            A = rng.integers(-3, 6, (m, n)).tolist()
+            b = rng.integers(-2, 10, m).tolist()
+            C = rng.integers(-3, 6, n).tolist()
+            O = [str(o) for o in rng.choice(['<=', '>=', '='], m, p=[.6, .3, .1])]
+            problem_type = ['minimization', 'maximization'][k % 2]
+
+            ref = resolver_simplex_tabular(problem_type, C, A, b, O, history="none")
+            for method in ('tabular', 'revised'):
+                for pricing in REGLAS:
+                    res = resolver_simplex_tabular(problem_type, C, A, b, O, method=method, pricing=pricing, history="none")
+                    self.assertEqual(res["status"], ref["status"], f"{k} {method}/{pricing}")
+                    if ref["status"] == "optimo":
+                        self.assertAlmostEqual(res["solucion"]["valor_optimo"], ref["solucion"]["valor_optimo"], places=6)
+
+    def test_artificial_degenerada_sale_de_la_base(self):
+        """
+        La artificial de la fila >= queda básica en cero tras la Fase 1; la
+        Fase 2 no debe poder volverla positiva (antes daba Z=13.2, infactible).
+        """
+        res = resolver_simplex_tabular(
+            "maximization",
+            [1, 5, -3, 5, -3, 5],
+            [[5, -2, -2, 2, 2, -2], [-2, 0, 0, -3, -1, 0], [4, 1, 2, 1, -1, 2], [1, 4, 1, -3, 1, 5]],
+            [0, 0, 2, 9],
+            ["<=", ">=", "<=", "<="],
+        )
+        self.assertEqual(res["status"], "optimo")
+        self.assertAlmostEqual(res["solucion"]["valor_optimo"], 10, places=6)
+
+    def test_parcial_solo_calcula_bloques_de_columnas(self):
+        """En el revisado, el pricing parcial nunca calcula Aᵀy completo."""
+        rng = np.random.default_rng(5)
+        m, n = 30, 80
+        args = ("maximization", (rng.random(n) * 10).tolist(), (rng.random((m, n)) * 5).tolist(), (rng.random(m) * 50 + 10).tolist(), ["<="] * m)
+        ref = resolver_simplex_tabular(*args, method="revised")
+        with mock.patch.object(ProblemaEstandar, "producto_t", side_effect=AssertionError("Aᵀy completo")):
+            res = resolver_simplex_tabular(*args, method="revised", pricing="partial")
+        self.assertEqual(res["status"], "optimo")
+        self.assertAlmostEqual(res["solucion"]["valor_optimo"], ref["solucion"]["valor_optimo"], places=6)
+
+    def test_producto_t_rango(self):
+        rng = np.random.default_rng(3)
+        A = rng.integers(-2, 3, (6, 9)) * (rng.random((6, 9)) < 0.5)
+        y = rng.random(6)
+        filas, columnas = np.nonzero(A)
+        for matriz in (MatrizDensa(A), MatrizDispersa.desde_coo(filas, columnas, A[filas, columnas], A.shape)):
+            for ini, fin in ((0, 9), (2, 5), (8, 9)):
+                np.testing.assert_allclose(matriz.producto_t_rango(y, ini, fin), (A.T @ y)[ini:fin])
+
+    def test_bland_desempata_por_menor_indice(self):
+        regla = ReglaBland()
+        fila = regla.saliente(np.array([1.0, 2.0, 1.0]), np.array([1.0, 2.0, 1.0]), np.array([7, 5, 3]))
+        self.assertEqual(fila, 2)
+
+    def test_regla_desconocida(self):
+        with self.assertRaises(ValueError):
+            crear_regla('newton')
+
+
+class TestPricingEndpoint(unittest.TestCase):
+
+    def test_pricing_y_max_iterations_en_request(self):
+        app = FastAPI()
+        app.include_router(router)
+        client = TestClient(app)
+        payload = {
+            "problem_type": "maximization",
+            "C": [3, 5],
+            "LI": [[1, 0], [0, 2], [3, 2]],
+            "LD": [4, 12, 18],
+            "O": ["<=", "<=", "<="],
+            "pricing": "steepest_edge",
+        }
+        response = client.post("/simplex/solve-tabular", json=payload)
+        self.assertEqual(response.status_code, 200)
+        self.assertAlmostEqual(response.json()["solucion"]["valor_optimo"], 36, places=3)
+
+        response = client.post("/simplex/solve-tabular", json=dict(payload, max_iterations=1))
+        self.assertEqual(response.json()["status"], "max_iterations_reached")
+
+        response = client.post("/simplex/solve-tabular", json=dict(payload, max_iterations=0))
+        self.assertEqual(response.status_code, 422)
+
+
+if __name__ == "__main__":
+    unittest.main()
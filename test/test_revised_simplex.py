@@ -0,0 +1,140 @@
+import unittest
+import numpy as np
+from services import resolver_simplex_tabular
+from services.basis_factorization import FactorizacionBase, BaseSingularError
+from services.sparse_matrix import MatrizDispersa
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from routers.simplex_router import router
+
+
+class TestFactorizacionBase(unittest.TestCase):
+
+    def test_ftran_btran_con_actualizaciones(self):
+        """
+        Verifica B⁻¹·a y B⁻ᵀ·c contra numpy luego de varios cambios de base
+        acumulados en forma producto.
+        """
+        rng = np.random.default_rng(0)
+        m = 80
+        A = rng.random((m, m)) + np.eye(m)
+        # Base mixta: 70 columnas estructurales y 10 holguras
+        B = np.hstack([A[:, :70], np.eye(m)[:, 70:]])
+        factor = FactorizacionBase(A[:, :70], list(range(70)), list(range(70, 80)), [1.0] * 10, list(range(70, 80)), m)
+
+        for r in (3, 75, 40):
+            a = rng.random(m)
+            alpha = factor.ftran(a)
+            factor.actualizar(r, alpha)
+            B[:, r] = a
+
+        v = rng.random(m)
+        np.testing.assert_allclose(B @ factor.ftran(v), v, atol=1e-9)
+        np.testing.assert_allclose(B.T @ factor.btran(v), v, atol=1e-9)
+
+    def test_base_singular(self):
+        with self.assertRaises(BaseSingularError):
+            FactorizacionBase(np.zeros((2, 1)), [0], [1], [1.0], [1], 2)
+
+
+class TestSimplexRevisado(unittest.TestCase):
+
+    def test_coincide_con_tabular(self):
+        """
+        Caso con igualdad y restricciones >=
+            Min Z = 2x1 + 3x2 + x3
+            x1 + x2 + x3 >= 4
+            x1 - x2 = 1
+            2x1 + x3 <= 10
+        """
+        args = ("minimization", [2, 3, 1], [[1, 1, 1], [1, -1, 0], [2, 0, 1]], [4, 1, 10], [">=", "=", "<="])
+        tabular = resolver_simplex_tabular(*args)
+        revisado = resolver_simplex_tabular(*args, method="revised")
+
+        self.assertEqual(revisado["status"], "optimo")
+        self.assertEqual(revisado["tablas"], [])
+        self.assertAlmostEqual(revisado["solucion"]["valor_optimo"], tabular["solucion"]["valor_optimo"], places=6)
+        self.assertEqual(set(revisado["solucion"]["variables"]), set(tabular["solucion"]["variables"]))
+
+    def test_infactible_y_no_acotado(self):
+        res = resolver_simplex_tabular("maximization", [1, 1], [[1, 1], [1, 1]], [2, 5], ["<=", ">="], method="revised")
+        self.assertEqual(res["status"], "infactible")
+
+        res = resolver_simplex_tabular("maximization", [1, 1], [[1, -1]], [2], ["<="], method="revised")
+        self.assertEqual(res["status"], "no acotado")
+
+    def test_problema_mediano_aleatorio(self):
+        """Un problema con cientos de filas se resuelve y respeta las restricciones."""
+        rng = np.random.default_rng(42)
+        m, n = 200, 150
+        A = rng.random((m, n))
+        A[A < 0.9] = 0.0
+        b = rng.random(m) * 10 + 1
+        C = rng.random(n)
+
+        res = resolver_simplex_tabular("maximization", C.tolist(), A.tolist(), b.tolist(), ["<="] * m, method="revised")
+        self.assertEqual(res["status"], "optimo")
+        x = np.array([res["solucion"]["variables"][f"x{j+1}"] for j in range(n)])
+        self.assertTrue(np.all(A @ x <= b + 1e-5))
+        self.assertAlmostEqual(res["solucion"]["valor_optimo"], C @ x, places=4)
+
+
+class TestMatrizDispersa(unittest.TestCase):
+
+    def test_coo_y_csr_equivalentes(self):
+        denso = np.array([[1.0, 0.0, 2.0], [0.0, 0.0, 3.0]])
+        coo = MatrizDispersa.desde_coo([0, 0, 1, 1], [0, 2, 2, 2], [1.0, 2.0, 1.0, 2.0], (2, 3))
+        csr = MatrizDispersa.desde_csr([0, 2, 3], [0, 2, 2], [1.0, 2.0, 3.0], (2, 3))
+
+        for A in (coo, csr):
+            np.testing.assert_allclose(A.toarray(), denso)
+            np.testing.assert_allclose(A.producto_t(np.array([1.0, 2.0])), denso.T @ [1.0, 2.0])
+            np.testing.assert_allclose(A.columnas([2, 1]), denso[:, [2, 1]])
+
+    def test_indices_fuera_de_rango(self):
+        with self.assertRaises(ValueError):
+            MatrizDispersa.desde_coo([0, 5], [0, 1], [1.0, 1.0], (2, 2))
+
+    def test_resolver_disperso_coincide_con_denso(self):
+        rng = np.random.default_rng(7)
+        m, n = 120, 90
+        A = rng.random((m, n))
+        A[A < 0.95] = 0.0
+        b = rng.random(m) * 5 + 1
+        b[:10] *= -1  # filas con LD negativo (se convierten en >=)
+        C = rng.random(n)
+        filas, cols = np.nonzero(A)
+        dispersa = MatrizDispersa.desde_coo(filas, cols, A[filas, cols], (m, n))
+
+        O = ["<="] * m
+        res_denso = resolver_simplex_tabular("minimization", C.tolist(), A.tolist(), b.tolist(), O, method="revised")
+        res_disperso = resolver_simplex_tabular("minimization", C.tolist(), dispersa, b.tolist(), O)
+
+        self.assertEqual(res_disperso["status"], res_denso["status"])
+        if res_denso["status"] == "optimo":
+            self.assertAlmostEqual(res_disperso["solucion"]["valor_optimo"], res_denso["solucion"]["valor_optimo"], places=6)
+        # La matriz original no se modifica al normalizar signos
+        np.testing.assert_allclose(dispersa.toarray(), A)
+
+    def test_endpoint_con_li_sparse(self):
+        app = FastAPI()
+        app.include_router(router)
+        client = TestClient(app)
+        payload = {
+            "problem_type": "maximization",
+            "C": [3, 5],
+            "LI_sparse": {"format": "coo", "shape": [3, 2], "row": [0, 1, 2, 2], "col": [0, 1, 0, 1], "data": [1, 2, 3, 2]},
+            "LD": [4, 12, 18],
+            "O": ["<=", "<=", "<="]
+        }
+        response = client.post("/simplex/solve-tabular", json=payload)
+        self.assertEqual(response.status_code, 200)
+        self.assertAlmostEqual(response.json()["solucion"]["valor_optimo"], 36, places=3)
+
+        payload["LI"] = [[1, 0], [0, 2], [3, 2]]
+        response = client.post("/simplex/solve-tabular", json=payload)
+        self.assertEqual(response.status_code, 422)
+
+
+if __name__ == "__main__":
+    unittest.main()
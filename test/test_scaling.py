@@ -0,0 +1,110 @@
+import unittest
+import numpy as np
+from services import resolver_simplex_tabular
+from services.pivot_kernels import razon_minima, razon_minima_harris
+from services.scaling import factores_escala, rango_coeficientes
+from services.sparse_matrix import MatrizDensa, MatrizDispersa
+from services.tolerances import Tolerancias
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from routers.simplex_router import router
+
+
+def _mal_escalado(seed: int):
+    """
+    Modelo aleatorio bien condicionado y su versión con unidades mezcladas:
+    filas y columnas multiplicadas por factores entre 1e-4 y 1e6.
+    """
+    rng = np.random.default_rng(seed)
+    m, n = rng.integers(4, 12), rng.integers(4, 12)
+    A = rng.integers(-2, 6, (m, n)).astype(float) * (rng.random((m, n)) < 0.7)
+    b = rng.integers(1, 20, m).astype(float)
+    O = [str(o) for o in rng.choice(["<=", ">=", "="], m, p=[0.6, 0.3, 0.1])]
+    C = rng.integers(-2, 8, n).astype(float)
+    r, s = 10 ** rng.uniform(-4, 6, m), 10 ** rng.uniform(-4, 6, n)
+    original = (C.tolist(), A.tolist(), b.tolist(), O)
+    escalado = ((C * s).tolist(), (r[:, None] * A * s).tolist(), (r * b).tolist(), O)
+    return original, escalado
+
+
+class TestEscalado(unittest.TestCase):
+
+    def test_factores_potencia_de_2_reducen_el_rango(self):
+        A = np.array([[1e-4, 2e3, 0.0], [5e2, 0.0, 3e6], [0.0, 7e-2, 1.0]])
+        filas, columnas = np.nonzero(A)
+        for matriz in (MatrizDensa(A), MatrizDispersa.desde_coo(filas, columnas, A[filas, columnas], A.shape)):
+            for metodo in ("geometric", "equilibrate"):
+                r, s = factores_escala(matriz, metodo)
+                np.testing.assert_array_equal(np.log2(r), np.round(np.log2(r)))
+                np.testing.assert_array_equal(np.log2(s), np.round(np.log2(s)))
+                self.assertLess(rango_coeficientes(MatrizDensa(r[:, None] * A * s)), rango_coeficientes(matriz) / 1e3)
+
+    def test_metodo_desconocido(self):
+        with self.assertRaises(ValueError):
+            factores_escala(MatrizDensa([[1.0]]), "log")
+
+    def test_modelos_con_unidades_mezcladas(self):
+        """Con los valores por defecto ambos motores coinciden con el modelo bien escalado."""
+        for seed in range(40):
+            original, escalado = _mal_escalado(seed)
+            ref = resolver_simplex_tabular("maximization", *original, history="none")
+            for method in ("tabular", "revised", "dual"):
+                res = resolver_simplex_tabular("maximization", *escalado, method=method, history="none")
+                self.assertEqual(res["status"], ref["status"], f"seed {seed} / {method}")
+                if ref["status"] == "optimo":
+                    esperado = ref["solucion"]["valor_optimo"]
+                    self.assertAlmostEqual(res["solucion"]["valor_optimo"] / max(1.0, abs(esperado)), esperado / max(1.0, abs(esperado)), places=6)
+
+    def test_solucion_en_unidades_originales(self):
+        """
+        Max Z = 3x1 + 2x2 con la segunda fila expresada en milésimas.
+            x1 + x2 <= 4
+            1000x1 - 1000x2 <= 2000
+        """
+        res = resolver_simplex_tabular(
+            "maximization", [3, 2], [[1, 1], [1000, -1000]], [4, 2000], ["<=", "<="], scaling="geometric"
+        )
+        self.assertAlmostEqual(res["solucion"]["valor_optimo"], 11.0)
+        self.assertEqual(res["solucion"]["variables"], {"x1": 3.0, "x2": 1.0, "s1": 0.0, "s2": 0.0})
+
+
+class TestTolerancias(unittest.TestCase):
+
+    def test_harris_prefiere_el_pivote_mayor(self):
+        columna = np.array([1e-6, 1.0, 0.5])
+        rhs = np.array([1e-15, 1.0005e-9, 3.0])
+        self.assertEqual(razon_minima(columna, rhs), 0)
+        self.assertEqual(razon_minima_harris(columna, rhs, tol_factibilidad=1e-9), 1)
+        self.assertEqual(razon_minima_harris(-columna, rhs), -1)
+
+    def test_tolerancias_invalidas(self):
+        with self.assertRaises(ValueError):
+            Tolerancias(pivote=0.0)
+        with self.assertRaises(ValueError):
+            resolver_simplex_tabular("maximization", [1], [[1]], [1], ["<="], ratio_test="otro")
+
+    def test_endpoint_acepta_tolerancias(self):
+        app = FastAPI()
+        app.include_router(router)
+        client = TestClient(app)
+        payload = {
+            "problem_type": "maximization",
+            "C": [3, 2],
+            "LI": [[1, 1], [1, -1]],
+            "LD": [4, 2],
+            "O": ["<=", "<="],
+            "method": "revised",
+            "ratio_test": "harris",
+            "scaling": "equilibrate",
+            "tolerances": {"pivot": 1e-10, "feasibility": 1e-8},
+        }
+        response = client.post("/simplex/solve-tabular", json=payload)
+        self.assertEqual(response.status_code, 200)
+        self.assertAlmostEqual(response.json()["solucion"]["valor_optimo"], 11.0)
+
+        payload["tolerances"] = {"pivot": 0}
+        self.assertEqual(client.post("/simplex/solve-tabular", json=payload).status_code, 422)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+import unittest
+import numpy as np
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from routers.simplex_router import router
+from services import resolver_simplex_tabular
+from services.cache_service import cache_resultados
+from services.scenario_service import resolver_escenarios
+
+LI = [[1, 0], [0, 2], [3, 2]]
+O = ["<=", "<=", "<="]
+
+
+class TestEscenarios(unittest.TestCase):
+
+    def _comparar(self, problem_type, C, A, LD, O, escenarios):
+        resultados = resolver_escenarios(problem_type, C, A, LD, O, escenarios)
+        self.assertEqual(len(resultados), len(escenarios))
+        for escenario, resultado in zip(escenarios, resultados):
+            independiente = resolver_simplex_tabular(
+                problem_type, escenario.get("C") or C, A, escenario.get("LD") or LD, O, history="none"
+            )
+            self.assertEqual(resultado["status"], independiente["status"])
+            if resultado["status"] == "optimo":
+                self.assertAlmostEqual(
+                    resultado["solucion"]["valor_optimo"], independiente["solucion"]["valor_optimo"], places=6
+                )
+        return resultados
+
+    def test_wyndor_con_ld_y_c(self):
+        escenarios = [{"LD": [4, 12, 18]}, {"LD": [4, 12, 20]}, {"C": [3, 1]}, {"LD": [4, 12, 24], "C": [3, 5]}]
+        resultados = self._comparar("maximization", [3, 5], LI, [4, 12, 18], O, escenarios)
+        self.assertEqual(resultados[1]["solucion"]["variables"]["x1"], 2.666667)
+        self.assertEqual(resultados[2]["solucion"]["variables"], {"x1": 4.0, "x2": 3.0, "s1": 0.0, "s2": 6.0, "s3": 0.0})
+        # El primero se resuelve desde cero; los que cambian solo C o LD reoptimizan
+        self.assertEqual([r["base_reutilizada"] for r in resultados[:3]], [False, True, True])
+        self.assertEqual(resultados[0]["tablas"], [])
+
+    def test_barrido_aleatorio(self):
+        rng = np.random.default_rng(7)
+        m, n = 8, 10
+        A = rng.uniform(0, 5, (m, n)).round(2)
+        O = ["<="] * 5 + [">="] * 2 + ["="]
+        x0 = rng.uniform(0.5, 2, n)
+        LD = (A @ x0 + np.array([1.0] * 5 + [-1.0] * 2 + [0.0])).round(3)
+        C = rng.uniform(1, 5, n).round(2).tolist()
+        escenarios = [{"LD": (LD * rng.uniform(0.9, 1.1, m)).round(3).tolist()} for _ in range(6)]
+        escenarios += [{"C": (np.array(C) * rng.uniform(0.8, 1.2, n)).round(2).tolist()} for _ in range(6)]
+        # LD que vuelve infactible el problema (fila >= imposible) y luego uno normal
+        imposible = LD.copy()
+        imposible[5] = 1e6
+        escenarios += [{"LD": imposible.tolist()}, {"LD": LD.tolist()}]
+        for problem_type in ("maximization", "minimization"):
+            resultados = self._comparar(problem_type, C, A.tolist(), LD.tolist(), O, escenarios)
+            self.assertEqual(resultados[-2]["status"], "infactible")
+            self.assertFalse(resultados[-1]["base_reutilizada"])
+            self.assertTrue(any(r["base_reutilizada"] for r in resultados))
+
+    def test_ld_negativo(self):
+        # Cambiar el signo de un LD invierte la orientación de la fila en el modelo
+        escenarios = [{"LD": [4, 12, 18]}, {"LD": [-1, 12, 18]}, {"LD": [4, -2, 18]}]
+        self._comparar("maximization", [3, 5], [[-1, 0], [0, 2], [3, 2]], [4, 12, 18], ["<=", ">=", "<="], escenarios)
+
+    def test_largo_invalido(self):
+        with self.assertRaises(ValueError):
+            resolver_escenarios("maximization", [3, 5], LI, [4, 12, 18], O, [{"LD": [1, 2]}])
+        with self.assertRaises(ValueError):
+            resolver_escenarios("maximization", [3, 5], LI, [4, 12, 18], O, [])
+
+
+class TestEndpointEscenarios(unittest.TestCase):
+
+    def setUp(self):
+        app = FastAPI()
+        app.include_router(router)
+        self.client = TestClient(app)
+        cache_resultados.limpiar()
+
+    def test_solve_scenarios(self):
+        payload = {
+            "problem_type": "maximization", "C": [3, 5], "LI": LI, "LD": [4, 12, 18], "O": O,
+            "scenarios": [{}, {"LD": [4, 12, 20]}, {"C": [3, 1]}],
+        }
+        r = self.client.post("/simplex/solve-scenarios", json=payload)
+        self.assertEqual(r.status_code, 200)
+        resultados = r.json()["resultados"]
+        self.assertEqual([x["solucion"]["valor_optimo"] for x in resultados], [36.0, 38.0, 15.0])
+
+        payload["scenarios"] = [{"C": [1, 2, 3]}]
+        self.assertEqual(self.client.post("/simplex/solve-scenarios", json=payload).status_code, 400)
+        payload["scenarios"] = []
+        self.assertEqual(self.client.post("/simplex/solve-scenarios", json=payload).status_code, 422)
+
+
+if __name__ == "__main__":
+    unittest.main()
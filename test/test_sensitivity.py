@@ -0,0 +1,101 @@
+import unittest
+import numpy as np
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from routers.simplex_router import router
+from services import resolver_simplex_tabular
+
+
+class TestSensibilidad(unittest.TestCase):
+
+    def test_wyndor(self):
+        """
+        Max Z = 3x1 + 5x2 con x1 <= 4, 2x2 <= 12, 3x1 + 2x2 <= 18.
+        Duales (0, 1.5, 1); LD2 en [6, 18], LD3 en [12, 24]; C1 en [0, 7.5], C2 >= 2.
+        """
+        res = resolver_simplex_tabular(
+            "maximization", [3, 5], [[1, 0], [0, 2], [3, 2]], [4, 12, 18], ["<=", "<=", "<="]
+        )
+        s = res["solucion"]["sensibilidad"]
+        self.assertEqual(s["duales"], {"R1": 0.0, "R2": 1.5, "R3": 1.0})
+        self.assertEqual(s["costos_reducidos"], {"x1": 0.0, "x2": 0.0})
+        self.assertEqual(s["rangos_ld"]["R1"], {"actual": 4.0, "minimo": 2.0, "maximo": None})
+        self.assertEqual(s["rangos_ld"]["R2"], {"actual": 12.0, "minimo": 6.0, "maximo": 18.0})
+        self.assertEqual(s["rangos_ld"]["R3"], {"actual": 18.0, "minimo": 12.0, "maximo": 24.0})
+        self.assertEqual(s["rangos_costos"]["x1"], {"actual": 3.0, "minimo": 0.0, "maximo": 7.5})
+        self.assertEqual(s["rangos_costos"]["x2"], {"actual": 5.0, "minimo": 2.0, "maximo": None})
+
+    def test_minimizacion_con_dos_fases(self):
+        # Min Z = 2x1 + 3x2 con x1 + x2 >= 4, x1 + 3x2 >= 6: óptimo (3, 1)
+        res = resolver_simplex_tabular("minimization", [2, 3], [[1, 1], [1, 3]], [4, 6], [">=", ">="])
+        s = res["solucion"]["sensibilidad"]
+        self.assertEqual(s["duales"], {"R1": 1.5, "R2": 0.5})
+        self.assertEqual(s["rangos_costos"]["x1"], {"actual": 2.0, "minimo": 1.0, "maximo": 3.0})
+        self.assertEqual(s["rangos_ld"]["R2"], {"actual": 6.0, "minimo": 4.0, "maximo": 12.0})
+
+    def test_variable_no_basica(self):
+        # x3 no conviene: costo reducido -1 y puede subir hasta 4 sin entrar
+        res = resolver_simplex_tabular("maximization", [3, 2, 3], [[1, 1, 1]], [4], ["<="])
+        s = res["solucion"]["sensibilidad"]
+        self.assertEqual(res["solucion"]["variables"]["x3"], 0.0)
+        self.assertEqual(s["costos_reducidos"]["x2"], -1.0)
+        self.assertEqual(s["rangos_costos"]["x2"], {"actual": 2.0, "minimo": None, "maximo": 3.0})
+
+    def test_coincide_con_resolver_de_nuevo(self):
+        """
+        En problemas aleatorios (con igualdades, LD negativos y escalado) el dual
+        coincide con la derivada de Z respecto de LD, y los costos reducidos
+        cumplen d = C - Aᵀy.
+        """
+        rng = np.random.default_rng(3)
+        verificados = 0
+        for caso in range(60):
+            m, n = 3, 4
+            A = rng.uniform(-2, 5, (m, n)).round(2)
+            if caso % 3 == 0:
+                A[0] *= 1e5
+            O = list(rng.choice(["<=", ">=", "="], m, p=[0.6, 0.25, 0.15]))
+            b = A @ rng.uniform(0, 3, n)
+            b += np.where(np.array(O) == "<=", 1.0, np.where(np.array(O) == ">=", -1.0, 0.0))
+            C = rng.uniform(-1, 5, n).round(2)
+            problem_type = ("maximization", "minimization")[caso % 2]
+            res = resolver_simplex_tabular(problem_type, C.tolist(), A.tolist(), b.tolist(), O)
+            if res["status"] != "optimo":
+                continue
+            s = res["solucion"]["sensibilidad"]
+            y = np.array([s["duales"][f"R{i+1}"] for i in range(m)])
+            d = np.array([s["costos_reducidos"][f"x{j+1}"] for j in range(n)])
+            np.testing.assert_allclose(d, C - A.T @ y, atol=1e-4)
+
+            for i in range(m):
+                rango = s["rangos_ld"][f"R{i+1}"]
+                h = 1e-4 * max(1.0, abs(b[i]))
+                if rango["maximo"] is not None and rango["maximo"] - b[i] < 2 * h:
+                    continue
+                b2 = b.copy()
+                b2[i] += h
+                otro = resolver_simplex_tabular(problem_type, C.tolist(), A.tolist(), b2.tolist(), O)
+                derivada = (otro["solucion"]["valor_optimo"] - res["solucion"]["valor_optimo"]) / h
+                self.assertAlmostEqual(derivada, y[i], delta=1e-3 * max(1.0, abs(derivada)))
+            verificados += 1
+        self.assertGreater(verificados, 30)
+
+    def test_otros_metodos_y_presolve_no_la_incluyen(self):
+        args = ("maximization", [3, 5], [[1, 0], [0, 2], [3, 2]], [4, 12, 18], ["<=", "<=", "<="])
+        self.assertIsNone(resolver_simplex_tabular(*args, method="revised")["solucion"].get("sensibilidad"))
+        self.assertIsNone(resolver_simplex_tabular(*args, presolve=True)["solucion"].get("sensibilidad"))
+
+    def test_endpoint(self):
+        app = FastAPI()
+        app.include_router(router)
+        client = TestClient(app)
+        r = client.post("/simplex/solve-tabular", json={
+            "problem_type": "maximization", "C": [3, 5], "LI": [[1, 0], [0, 2], [3, 2]],
+            "LD": [4, 12, 18], "O": ["<=", "<=", "<="],
+        })
+        self.assertEqual(r.status_code, 200)
+        self.assertEqual(r.json()["solucion"]["sensibilidad"]["rangos_ld"]["R1"]["maximo"], None)
+
+
+if __name__ == "__main__":
+    unittest.main()
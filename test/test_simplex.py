@@ -1,5 +1,6 @@
 import unittest
-from services import resolver_simplex_tabular 
+import json
+from services import resolver_simplex_tabular, iterar_simplex_tabular
 from fastapi.testclient import TestClient
 from routers.simplex_router import router
 
@@ -196,6 +197,58 @@ class TestSimplexTabular(unittest.TestCase):
         self.assertAlmostEqual(res["solucion"]["variables"]["x1"], 2, places=3)
         self.assertAlmostEqual(res["solucion"]["variables"]["x2"], 0, places=3)
 
+    def test_modos_de_historial(self):
+        """
+        Los modos reducidos no alteran la solución, solo las tablas devueltas.
+            Min Z = 2x1 + 3x2 (dos fases)
+        """
+        args = ("minimization", [2, 3], [[1, 1], [1, 2]], [4, 6], [">=", ">="])
+        completo = resolver_simplex_tabular(*args)
+        total = len(completo["tablas"])
+        self.assertGreater(total, 2)
+
+        sin_tablas = resolver_simplex_tabular(*args, history="none")
+        self.assertEqual(sin_tablas["tablas"], [])
+        self.assertAlmostEqual(sin_tablas["solucion"]["valor_optimo"], completo["solucion"]["valor_optimo"], places=6)
+        self.assertEqual(sin_tablas["iteraciones"], completo["iteraciones"])
+
+        final = resolver_simplex_tabular(*args, history="final")
+        self.assertEqual(final["tablas"], completo["tablas"][-1:])
+
+        cada_dos = resolver_simplex_tabular(*args, history="every_k", history_every=2)
+        titulos = [t["titulo"] for t in cada_dos["tablas"]]
+        self.assertLess(len(titulos), total)
+        self.assertEqual(titulos[-1], completo["tablas"][-1]["titulo"])
+
+        with self.assertRaises(ValueError):
+            resolver_simplex_tabular(*args, history="every_k", history_every=0)
+
+    def test_historial_revisado(self):
+        """El método revisado reconstruye la tabla final a pedido."""
+        args = ("maximization", [3, 5], [[1, 0], [0, 2], [3, 2]], [4, 12, 18], ["<=", "<=", "<="])
+        tabular = resolver_simplex_tabular(*args, history="final")
+        revisado = resolver_simplex_tabular(*args, method="revised", history="final")
+
+        self.assertEqual(len(revisado["tablas"]), 1)
+        tabla = revisado["tablas"][0]
+        self.assertEqual(tabla["headers"], tabular["tablas"][0]["headers"])
+        self.assertAlmostEqual(tabla["fila_obj"][-1], 36, places=6)
+        self.assertEqual(revisado["iteraciones"], tabular["iteraciones"])
+
+    def test_iteracion_incremental(self):
+        """`iterar_simplex_tabular` emite las mismas tablas que el historial completo."""
+        args = ("minimization", [2, 3], [[1, 1], [1, 2]], [4, 6], [">=", ">="])
+        completo = resolver_simplex_tabular(*args)
+        for history in ("all", "final", "every_k"):
+            eventos = list(iterar_simplex_tabular(*args, history=history, history_every=2))
+            esperado = resolver_simplex_tabular(*args, history=history, history_every=2)
+            self.assertEqual([datos for evento, datos in eventos if evento == "tabla"], esperado["tablas"])
+            evento, resultado = eventos[-1]
+            self.assertEqual(evento, "resultado")
+            self.assertEqual(resultado["tablas"], [])
+            self.assertEqual(resultado["solucion"], completo["solucion"])
+
+
 class TestSimplexRoutes(unittest.TestCase):
 
     def setUp(self):
@@ -221,6 +274,68 @@ class TestSimplexRoutes(unittest.TestCase):
         self.assertAlmostEqual(data["solucion"]["variables"]["x1"], 2, places=3)
         self.assertAlmostEqual(data["solucion"]["variables"]["x2"], 6, places=3)
 
+        response = self.client.post("/simplex/solve-tabular", json=dict(payload, history="none"))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["tablas"], [])
+
+    def test_solve_tabular_stream(self):
+        payload = {
+            "problem_type": "maximization",
+            "C": [3, 5],
+            "LI": [[1, 0], [0, 2], [3, 2]],
+            "LD": [4, 12, 18],
+            "O": ["<=", "<=", "<="]
+        }
+
+        response = self.client.post("/simplex/solve-tabular/stream", json=payload)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.headers["content-type"].startswith("text/event-stream"))
+        eventos = []
+        for bloque in response.text.strip().split("\n\n"):
+            evento, datos = bloque.split("\n")
+            eventos.append((evento[len("event: "):], json.loads(datos[len("data: "):])))
+
+        completo = self.client.post("/simplex/solve-tabular", json=payload).json()
+        self.assertEqual([d for e, d in eventos if e == "tabla"], completo["tablas"])
+        self.assertEqual(eventos[-1][0], "resultado")
+        self.assertAlmostEqual(eventos[-1][1]["solucion"]["valor_optimo"], 36, places=3)
+
+        response = self.client.post("/simplex/solve-tabular/stream", json=dict(payload, LI=[[1, 0], [0, 2]]))
+        self.assertEqual(response.status_code, 400)
+
+    def test_solve_batch(self):
+        problema = {
+            "problem_type": "maximization",
+            "C": [3, 5],
+            "LI": [[1, 0], [0, 2], [3, 2]],
+            "LD": [4, 12, 18],
+            "O": ["<=", "<=", "<="]
+        }
+        infactible = {
+            "problem_type": "maximization",
+            "C": [1, 1],
+            "LI": [[1, 1], [1, 1]],
+            "LD": [2, 5],
+            "O": ["<=", ">="]
+        }
+        invalido = dict(problema, LI=[[1, 0], [0, 2]])
+
+        response = self.client.post("/simplex/solve-batch", json={"problems": [problema, infactible, invalido, problema]})
+        self.assertEqual(response.status_code, 200)
+        resultados = response.json()["resultados"]
+
+        self.assertEqual([r["index"] for r in resultados], [0, 1, 2, 3])
+        self.assertAlmostEqual(resultados[0]["resultado"]["solucion"]["valor_optimo"], 36, places=3)
+        self.assertEqual(resultados[1]["resultado"]["status"], "infactible")
+        self.assertIsNone(resultados[2]["resultado"])
+        self.assertIn("Datos inválidos", resultados[2]["error"])
+        self.assertAlmostEqual(resultados[3]["resultado"]["solucion"]["valor_optimo"], 36, places=3)
+
+        response = self.client.post("/simplex/solve-batch?stream=true", json={"problems": [problema, infactible]})
+        self.assertEqual(response.status_code, 200)
+        lineas = [json.loads(l) for l in response.text.splitlines() if l]
+        self.assertEqual(sorted(l["index"] for l in lineas), [0, 1])
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
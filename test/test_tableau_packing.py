@@ -0,0 +1,76 @@
+import unittest
+import numpy as np
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from routers.simplex_router import router
+from services import resolver_simplex_tabular
+from services.tableau_packing import (
+    MEDIA_TYPE_EMPAQUETADO,
+    dtype_solicitado,
+    empaquetar_resultado,
+    desempaquetar_resultado,
+)
+
+
+class TestEmpaquetado(unittest.TestCase):
+
+    def test_ida_y_vuelta(self):
+        """Dos fases: bloques con distintos encabezados se reconstruyen igual."""
+        resultado = resolver_simplex_tabular("minimization", [2, 3], [[1, 1], [1, 2]], [4, 6], [">=", ">="])
+        contenido = empaquetar_resultado(resultado)
+        self.assertEqual(desempaquetar_resultado(contenido), resultado)
+
+        sin_tablas = resolver_simplex_tabular("minimization", [2, 3], [[1, 1], [1, 2]], [4, 6], [">=", ">="], history="none")
+        self.assertEqual(desempaquetar_resultado(empaquetar_resultado(sin_tablas)), sin_tablas)
+
+    def test_float32(self):
+        resultado = resolver_simplex_tabular("maximization", [3, 5], [[1, 0], [0, 2], [3, 2]], [4, 12, 18], ["<=", "<=", "<="])
+        completo = empaquetar_resultado(resultado)
+        reducido = empaquetar_resultado(resultado, "float32")
+        self.assertLess(len(reducido), len(completo))
+
+        tablas = desempaquetar_resultado(reducido)["tablas"]
+        for tabla, original in zip(tablas, resultado["tablas"]):
+            self.assertEqual([f[0] for f in tabla["filas"]], [f[0] for f in original["filas"]])
+            np.testing.assert_allclose([f[1:] for f in tabla["filas"]], [f[1:] for f in original["filas"]], rtol=1e-6)
+
+    def test_accept(self):
+        self.assertIsNone(dtype_solicitado(None))
+        self.assertIsNone(dtype_solicitado("application/json"))
+        self.assertEqual(dtype_solicitado(f"application/json, {MEDIA_TYPE_EMPAQUETADO}"), "float64")
+        self.assertEqual(dtype_solicitado(f"{MEDIA_TYPE_EMPAQUETADO}; dtype=float32"), "float32")
+        with self.assertRaises(ValueError):
+            dtype_solicitado(f"{MEDIA_TYPE_EMPAQUETADO};dtype=int8")
+
+
+class TestEmpaquetadoEndpoint(unittest.TestCase):
+
+    def setUp(self):
+        app = FastAPI()
+        app.include_router(router)
+        self.client = TestClient(app)
+        self.payload = {
+            "problem_type": "maximization",
+            "C": [3, 5],
+            "LI": [[1, 0], [0, 2], [3, 2]],
+            "LD": [4, 12, 18],
+            "O": ["<=", "<=", "<="],
+        }
+
+    def test_solve_tabular_empaquetado(self):
+        json_ = self.client.post("/simplex/solve-tabular", json=self.payload).json()
+        response = self.client.post("/simplex/solve-tabular", json=self.payload, headers={"Accept": MEDIA_TYPE_EMPAQUETADO})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers["content-type"], MEDIA_TYPE_EMPAQUETADO)
+        self.assertEqual(response.headers["vary"], "Accept")
+
+        data = desempaquetar_resultado(response.content)
+        self.assertEqual(data["tablas"], json_["tablas"])
+        self.assertEqual(data["solucion"], json_["solucion"])
+
+        response = self.client.post("/simplex/solve-tabular", json=self.payload, headers={"Accept": f"{MEDIA_TYPE_EMPAQUETADO};dtype=int8"})
+        self.assertEqual(response.status_code, 406)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+import unittest
+import numpy as np
+from services import resolver_simplex_tabular
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from routers.simplex_router import router
+
+
+def _modelo(seed: int):
+    """Modelo con restricciones <= y >= (necesita Fase 1 en frío)."""
+    rng = np.random.default_rng(seed)
+    m, n = 40, 30
+    A = rng.random((m, n))
+    b = rng.random(m) * 10 + 1
+    b[-4:] = 0.5
+    C = rng.random(n)
+    O = ["<="] * (m - 4) + [">="] * 4
+    return C, A.tolist(), b.tolist(), O
+
+
+class TestArranqueEnCaliente(unittest.TestCase):
+
+    def test_cambio_de_costos_reutiliza_la_base(self):
+        C, A, b, O = _modelo(5)
+        C2 = (C * 1.03).tolist()
+        C2[0] *= 1.2
+        for method in ('tabular', 'revised'):
+            inicial = resolver_simplex_tabular("maximization", C.tolist(), A, b, O, method=method)
+            self.assertEqual(len(inicial["base"]), len(b))
+
+            frio = resolver_simplex_tabular("maximization", C2, A, b, O, method=method, history="none")
+            caliente = resolver_simplex_tabular(
+                "maximization", C2, A, b, O, method=method, history="none", basis=inicial["base"]
+            )
+            self.assertTrue(caliente["base_reutilizada"])
+            self.assertIsNone(frio["base_reutilizada"])
+            self.assertAlmostEqual(caliente["solucion"]["valor_optimo"], frio["solucion"]["valor_optimo"], places=6)
+            self.assertLess(caliente["iteraciones"], frio["iteraciones"])
+
+    def test_misma_base_no_pivotea(self):
+        C, A, b, O = _modelo(8)
+        inicial = resolver_simplex_tabular("maximization", C.tolist(), A, b, O)
+        res = resolver_simplex_tabular("maximization", C.tolist(), A, b, O, basis=inicial["base"])
+        self.assertEqual(res["iteraciones"], 0)
+        self.assertEqual(res["base"], inicial["base"])
+
+    def test_base_invalida_resuelve_en_frio(self):
+        C, A, b, O = _modelo(3)
+        frio = resolver_simplex_tabular("maximization", C.tolist(), A, b, O)
+        for method in ('tabular', 'revised'):
+            for basis in (["x1"], ["x1"] * len(b), ["z9"] + frio["base"][1:]):
+                res = resolver_simplex_tabular("maximization", C.tolist(), A, b, O, method=method, basis=basis)
+                self.assertFalse(res["base_reutilizada"])
+                self.assertAlmostEqual(res["solucion"]["valor_optimo"], frio["solucion"]["valor_optimo"], places=6)
+
+    def test_base_infactible_para_el_nuevo_ld(self):
+        """
+        Max Z = 3x1 + 5x2 con base óptima {s1, x2, x1}; al achicar LD3 el
+        punto de esa base sale negativo y se resuelve desde cero.
+        """
+        args = ("maximization", [3, 5], [[1, 0], [0, 2], [3, 2]])
+        O = ["<=", "<=", "<="]
+        inicial = resolver_simplex_tabular(*args, [4, 12, 18], O)
+        res = resolver_simplex_tabular(*args, [4, 12, 6], O, basis=inicial["base"])
+        self.assertFalse(res["base_reutilizada"])
+        self.assertAlmostEqual(res["solucion"]["valor_optimo"], 15, places=6)
+
+    def test_endpoint_devuelve_y_acepta_base(self):
+        app = FastAPI()
+        app.include_router(router)
+        client = TestClient(app)
+        payload = {
+            "problem_type": "maximization",
+            "C": [3, 5],
+            "LI": [[1, 0], [0, 2], [3, 2]],
+            "LD": [4, 12, 18],
+            "O": ["<=", "<=", "<="]
+        }
+        base = client.post("/simplex/solve-tabular", json=payload).json()["base"]
+        data = client.post("/simplex/solve-tabular", json=dict(payload, C=[3, 6], basis=base)).json()
+        self.assertTrue(data["base_reutilizada"])
+        self.assertAlmostEqual(data["solucion"]["valor_optimo"], 42, places=3)
+
+
+if __name__ == "__main__":
+    unittest.main()